@@ -9,6 +9,7 @@ do not apply).
 Usage:
     make app_batch_run ARGS="--paper-ids 1105.1072"
     make app_batch_run ARGS="--paper-ids 1105.1072 --parallel 4 --chat-provider cerebras"
+    make app_batch_run ARGS="--paper-ids 1105.1072 --parallel 4 --shared-bertscore"
     make app_batch_run ARGS="--paper-ids 1105.1072 --compositions manager-only"
     make app_batch_run ARGS="--paper-ids 1105.1072 --engine cc"
     make app_batch_run ARGS="--paper-ids 1105.1072 --engine cc --compositions cc-solo"
@@ -17,6 +18,7 @@ Usage:
 
 import argparse
 import json
+import os
 import subprocess
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -27,6 +29,7 @@ from typing import Any
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from app.data_models.app_models import PROVIDER_REGISTRY
+from app.judge.bertscore_server import default_bertscore_socket, stop_bertscore_server
 
 _AGENT_TOGGLES = ("researcher", "analyst", "synthesiser")
 
@@ -292,6 +295,11 @@ def _parse_args() -> argparse.Namespace:
         metavar="N",
         help="Concurrent subprocess count (default: 1, sequential)",
     )
+    parser.add_argument(
+        "--shared-bertscore",
+        action="store_true",
+        help="Share one BERTScore model server across all runs instead of one model per run",
+    )
     parser.add_argument(
         "--compositions",
         default=None,
@@ -349,6 +357,12 @@ def main() -> None:
 
     results: list[dict[str, Any]] = []
 
+    if args.shared_bertscore:
+        # Reason: subprocesses inherit the env; the first run spawns the server
+        socket_path = default_bertscore_socket()
+        os.environ["JUDGE_TIER1_BERTSCORE_SERVER_SOCKET"] = socket_path
+        os.environ["JUDGE_TIER1_BERTSCORE_WARMUP"] = "true"
+
     if args.parallel > 1:
         with ThreadPoolExecutor(max_workers=args.parallel) as executor:
             futures = {
@@ -382,6 +396,9 @@ def main() -> None:
                     )
                 )
 
+    if args.shared_bertscore:
+        stop_bertscore_server(socket_path)
+
     _print_summary(results)
 
     if args.output:
@@ -6,6 +6,7 @@ with appropriate models, tools, and configurations. It separates agent creation
 logic from model creation and orchestration.
 """
 
+from httpx import AsyncClient
 from pydantic_ai import Agent
 from pydantic_ai.models import Model
 
@@ -103,36 +104,29 @@ class AgentFactory:
         return agent
 
 
-def create_evaluation_agent(
-    provider: str,
-    model_name: str,
+def resolve_evaluation_system_prompt(
     assessment_type: str,
-    api_key: str | None = None,
     system_prompt: str | None = None,
     prompts: dict[str, str] | None = None,
-) -> Agent:
+) -> str:
     """
-    Create an agent specifically for evaluation tasks.
+    Resolve the system prompt of an evaluation agent.
 
     Args:
-        provider: LLM provider (e.g., "openai", "github")
-        model_name: Model name (e.g., "gpt-4o-mini")
         assessment_type: Type of assessment (e.g., "technical_accuracy")
-        api_key: API key (optional)
-        system_prompt: Custom system prompt (optional)
+        system_prompt: Custom system prompt (optional), returned unchanged if given
         prompts: Prompt configuration dictionary (optional)
 
     Returns:
-        Agent configured for evaluation tasks
+        System prompt from the custom prompt, the prompts config, or the defaults
     """
-    model = create_simple_model(provider, model_name, api_key)
-
     # Try to get system prompt from prompts config first
     if system_prompt is None and prompts:
         prompt_keys = {
             "technical_accuracy": f"system_prompt_evaluator_{assessment_type}",
             "constructiveness": f"system_prompt_evaluator_{assessment_type}",
             "planning_rationality": f"system_prompt_evaluator_{assessment_type}",
+            "fused": f"system_prompt_evaluator_{assessment_type}",
         }
 
         prompt_key = prompt_keys.get(assessment_type, "system_prompt_evaluator_general")
@@ -153,6 +147,11 @@ def create_evaluation_agent(
                 "You are an expert at evaluating planning quality of agent executions. "
                 "Focus on logical flow and decision quality."
             ),
+            "fused": (
+                "You are an expert at evaluating academic reviews and the agent executions "
+                "that produced them. Assess technical accuracy, constructiveness and "
+                "planning quality together, scoring each criterion independently."
+            ),
             "general": (
                 "You are an expert evaluator providing structured assessments "
                 "of text quality and content."
@@ -160,6 +159,36 @@ def create_evaluation_agent(
         }
         system_prompt = default_prompts.get(assessment_type, default_prompts["general"])
 
+    return system_prompt
+
+
+def create_evaluation_agent(
+    provider: str,
+    model_name: str,
+    assessment_type: str,
+    api_key: str | None = None,
+    system_prompt: str | None = None,
+    prompts: dict[str, str] | None = None,
+    http_client: AsyncClient | None = None,
+) -> Agent:
+    """
+    Create an agent specifically for evaluation tasks.
+
+    Args:
+        provider: LLM provider (e.g., "openai", "github")
+        model_name: Model name (e.g., "gpt-4o-mini")
+        assessment_type: Type of assessment (e.g., "technical_accuracy")
+        api_key: API key (optional)
+        system_prompt: Custom system prompt (optional)
+        prompts: Prompt configuration dictionary (optional)
+        http_client: Shared async HTTP client for the model (optional)
+
+    Returns:
+        Agent configured for evaluation tasks
+    """
+    model = create_simple_model(provider, model_name, api_key, http_client=http_client)
+    system_prompt = resolve_evaluation_system_prompt(assessment_type, system_prompt, prompts)
+
     agent = Agent(
         model=model,
         system_prompt=system_prompt,
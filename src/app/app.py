@@ -54,7 +54,11 @@ from app.config.judge_settings import JudgeSettings
 from app.data_models.app_models import ChatConfig
 from app.data_utils.datasets_peerread import (
     download_peerread_dataset,
+    pack_peerread_dataset,
 )
+from app.data_utils.pdf_markdown import prewarm_markdown_cache
+from app.judge.bertscore_backend import BERTScoreBackend
+from app.judge.embedding_cache import prefill_reference_embeddings
 from app.judge.evaluation_runner import (
     build_graph_from_trace as _build_graph_from_trace,
 )
@@ -62,6 +66,8 @@ from app.judge.evaluation_runner import (
     run_evaluation_if_enabled as _run_evaluation_if_enabled,
 )
 from app.judge.graph_export import persist_graph
+from app.judge.tfidf_model import fit_tfidf_model
+from app.judge.traditional_metrics import start_bertscore_warmup
 from app.utils.error_messages import generic_exception
 from app.utils.load_configs import load_config
 from app.utils.log import logger
@@ -150,9 +156,24 @@ async def _run_agent_execution(
 
 
 def _handle_download_mode(
-    download_full: bool, download_samples: bool, max_samples: int | None
+    download_full: bool,
+    download_samples: bool,
+    max_samples: int | None,
+    sync: bool = False,
 ) -> bool:
     """Handle dataset download modes. Returns True if download was performed."""
+    if sync:
+        logger.info("Incremental sync-only mode activated")
+        try:
+            download_peerread_dataset(
+                peerread_max_papers_per_sample_download=None, incremental=True
+            )
+            logger.info("Sync completed successfully. Exiting.")
+            return True
+        except Exception as e:
+            logger.error(f"Sync failed: {e}")
+            raise
+
     if download_full:
         logger.info("Full download-only mode activated")
         try:
@@ -176,6 +197,74 @@ def _handle_download_mode(
     return False
 
 
+def _handle_pack_mode(pack_only: bool) -> bool:
+    """Handle dataset pack mode. Returns True if packing was performed."""
+    if not pack_only:
+        return False
+
+    logger.info("PeerRead pack-only mode activated")
+    try:
+        total_packed = pack_peerread_dataset()
+        logger.info(f"Packed {total_packed} reviews. Exiting.")
+        return True
+    except Exception as e:
+        logger.error(f"Packing failed: {e}")
+        raise
+
+
+def _handle_prewarm_mode(prewarm_only: bool) -> bool:
+    """Handle PDF Markdown prewarm mode. Returns True if prewarming was performed."""
+    if not prewarm_only:
+        return False
+
+    logger.info("PDF Markdown prewarm-only mode activated")
+    try:
+        converted = prewarm_markdown_cache()
+        logger.info(f"Converted {converted} PDFs. Exiting.")
+        return True
+    except Exception as e:
+        logger.error(f"Prewarm failed: {e}")
+        raise
+
+
+def _handle_prefill_embeddings_mode(prefill_only: bool) -> bool:
+    """Handle reference embedding prefill mode. Returns True if prefilling was performed."""
+    if not prefill_only:
+        return False
+
+    logger.info("Reference embedding prefill-only mode activated")
+    try:
+        cached = prefill_reference_embeddings()
+        logger.info(f"Cached embeddings of {cached} reference reviews. Exiting.")
+        return True
+    except Exception as e:
+        logger.error(f"Prefill failed: {e}")
+        raise
+
+
+def _handle_fit_tfidf_mode(fit_only: bool) -> bool:
+    """Handle TF-IDF model fitting mode. Returns True if fitting was performed."""
+    if not fit_only:
+        return False
+
+    logger.info("TF-IDF fit-only mode activated")
+    try:
+        fitted = fit_tfidf_model()
+        logger.info(f"Fitted TF-IDF model on {fitted} reference reviews. Exiting.")
+        return True
+    except Exception as e:
+        logger.error(f"TF-IDF fit failed: {e}")
+        raise
+
+
+def _start_bertscore_warmup(judge_settings: JudgeSettings | None) -> None:
+    """Start loading the BERTScore model in the background while the agents run."""
+    settings = judge_settings or JudgeSettings()
+    if settings.tier1_bertscore_warmup and 1 in settings.tiers_enabled:
+        logger.info("Warming up BERTScore model in the background")
+        start_bertscore_warmup(BERTScoreBackend.from_settings(settings))
+
+
 def _initialize_instrumentation() -> None:
     """Initialize Logfire instrumentation if enabled in settings."""
     judge_settings = JudgeSettings()
@@ -395,6 +484,11 @@ async def main(
     download_peerread_full_only: bool = False,
     download_peerread_samples_only: bool = False,
     peerread_max_papers_per_sample_download: int | None = 5,
+    sync_peerread_only: bool = False,
+    pack_peerread_only: bool = False,
+    prewarm_pdf_markdown_only: bool = False,
+    prefill_reference_embeddings_only: bool = False,
+    fit_tfidf_model_only: bool = False,
     cc_solo_dir: str | None = None,
     cc_teams_dir: str | None = None,
     cc_teams_tasks_dir: str | None = None,
@@ -417,9 +511,25 @@ async def main(
         download_peerread_full_only,
         download_peerread_samples_only,
         peerread_max_papers_per_sample_download,
+        sync_peerread_only,
     ):
         return None
 
+    if _handle_pack_mode(pack_peerread_only):
+        return None
+
+    if _handle_prewarm_mode(prewarm_pdf_markdown_only):
+        return None
+
+    if _handle_prefill_embeddings_mode(prefill_reference_embeddings_only):
+        return None
+
+    if _handle_fit_tfidf_mode(fit_tfidf_model_only):
+        return None
+
+    if not skip_eval:
+        _start_bertscore_warmup(judge_settings)
+
     try:
         if chat_config_file is None:
             chat_config_file = resolve_config_path(CHAT_CONFIG_FILE)
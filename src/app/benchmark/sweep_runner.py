@@ -18,6 +18,7 @@ from app.config.judge_settings import JudgeSettings
 from app.data_models.evaluation_models import CompositeResult
 from app.engines.cc_engine import CCResult, check_cc_available, run_cc_solo, run_cc_teams
 from app.judge.cc_trace_adapter import CCTraceAdapter
+from app.llms.rate_limiter import get_rate_limiter, rate_limiter_stats
 from app.utils.log import logger
 
 _MAX_RETRIES = 3
@@ -64,7 +65,12 @@ class SweepRunner:
             True if the caller should retry, False if max retries are exhausted.
         """
         if attempt < _MAX_RETRIES:
-            delay = self.config.retry_delay_seconds * (2**attempt)
+            # Reason: Wait at least as long as the provider's Retry-After pause, so
+            # the retry is not rejected by the same exhausted window.
+            delay = max(
+                self.config.retry_delay_seconds * (2**attempt),
+                get_rate_limiter(self.config.chat_provider).cooldown_remaining(),
+            )
             logger.warning(
                 f"Rate limit hit for {label} "
                 f"(attempt {attempt + 1}/{_MAX_RETRIES + 1}). "
@@ -138,8 +144,15 @@ class SweepRunner:
                 if e.status_code != 429 or not await self._handle_rate_limit(e, label, attempt):
                     return None
             except SystemExit as e:
-                # Reason: run_manager raises SystemExit(1) on UsageLimitExceeded;
-                # catch it so one evaluation's token limit doesn't abort the sweep
+                # Reason: run_manager raises SystemExit(1) on 429 and UsageLimitExceeded;
+                # retry the former and catch both so one evaluation doesn't abort the sweep
+                cause = e.__cause__
+                if (
+                    isinstance(cause, ModelHTTPError)
+                    and cause.status_code == 429
+                    and await self._handle_rate_limit(cause, label, attempt)
+                ):
+                    continue
                 logger.error(f"Evaluation aborted for {label}: {e}")
                 return None
             except Exception as e:
@@ -192,6 +205,19 @@ class SweepRunner:
                     if result:
                         self.results.append((composition, result))
                         await self._save_results_json()
+        self._log_rate_limiter_stats()
+
+    def _log_rate_limiter_stats(self) -> None:
+        """Log queue-wait and rate-limit metrics of the shared provider limiters."""
+        for name, stats in rate_limiter_stats().items():
+            if stats.requests == 0:
+                continue
+            logger.info(
+                f"Rate limiter {name}: {stats.requests} requests, "
+                f"{stats.rate_limited} rate-limited, "
+                f"queue wait mean {stats.mean_queue_wait:.2f}s / max {stats.max_queue_wait:.2f}s, "
+                f"concurrency limit {stats.concurrency_limit or 'uncapped'}"
+            )
 
     async def _run_cc_baselines(self) -> None:
         """Run CC comparison evaluations if engine=cc.
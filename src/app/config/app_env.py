@@ -48,4 +48,7 @@ class AppEnv(BaseSettings):
     # Agent Configuration
     AGENT_TOKEN_LIMIT: int | None = None
 
+    # Provider rate limits, JSON: {"openai": {"requests_per_minute": 500, ...}}
+    LLM_RATE_LIMITS: dict[str, dict[str, int]] = {}
+
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
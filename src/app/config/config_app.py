@@ -22,5 +22,16 @@ MAS_RUNS_PATH = f"{RUNS_PATH}/mas"
 CC_RUNS_PATH = f"{RUNS_PATH}/cc"
 DATASETS_PEERREAD_PATH = f"{DATASETS_PATH}/peerread"
 TRACES_DB_FILE = "traces.db"
+REVIEWS_DB_FILE = "reviews.db"
+JUDGE_CACHE_DB_FILE = "judge_cache.db"
+PEERREAD_INDEX_FILE = "paper_index.json"
+PEERREAD_PACK_FILE = "reviews.pack"
+PEERREAD_PACK_INDEX_FILE = "reviews.pack.idx.json"
+PEERREAD_MANIFEST_FILE = "manifest.json"
+PEERREAD_BODY_TEXT_DIR = "body_text"
+PEERREAD_MARKDOWN_CACHE_DIR = "markdown"
+PEERREAD_EMBEDDING_CACHE_DIR = "embeddings"
+PEERREAD_TFIDF_MODEL_DIR = "models"
+PEERREAD_SEARCH_INDEX_FILE = "search_index.json.gz"
 REVIEW_PROMPT_TEMPLATE = "review_template.md"
 DEFAULT_REVIEW_PROMPT_TEMPLATE = "Generate a structured peer review for paper '{paper_id}'."
@@ -7,10 +7,12 @@ This module implements evaluation configuration following 12-Factor #3 (Config)
 - .env file support for local development
 """
 
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from app.config.config_app import RUNS_PATH
+from app.config.config_app import JUDGE_CACHE_DB_FILE, RUNS_PATH
 
 
 class JudgeSettings(BaseSettings):
@@ -27,10 +29,22 @@ class JudgeSettings(BaseSettings):
         tier2_max_seconds: Tier 2 timeout (LLM-as-Judge)
         tier3_max_seconds: Tier 3 timeout (Graph Analysis)
         total_max_seconds: Total pipeline timeout
+        tier_executor: Executor for CPU-bound Tier 1/3 work ('thread' or 'process')
+        tier_executor_workers: Worker processes of the 'process' tier executor
         tier1_similarity_metrics: Similarity metrics for Tier 1
         tier1_confidence_threshold: Confidence threshold for Tier 1
         tier1_bertscore_model: BERTScore model name
+        tier1_bertscore_precision: BERTScore inference precision ('fp32' or 'int8' on CPU)
+        tier1_bertscore_threads: Torch thread count for BERTScore (None = torch default)
+        tier1_bertscore_max_length: Max tokens per text for BERTScore (None = model limit)
+        tier1_bertscore_warmup: Load the BERTScore model in the background at app start
+        tier1_bertscore_server_socket: Unix socket of a shared BERTScore model server
+        tier1_embedding_cache: Reuse cached BERTScore embeddings of reference reviews (opt-in)
+        tier1_jaccard_mode: Word-level Jaccard: 'exact' or 'minhash' (approximate)
+        tier1_jaccard_max_error: Max standard error of MinHash Jaccard estimates
+        tier1_edit_distance_backend: Levenshtein implementation ('auto' picks the fastest)
         tier1_tfidf_max_features: Max features for TF-IDF
+        tier1_tfidf_corpus_model: Use the corpus-fitted TF-IDF model when one has been fitted
         tier2_provider: LLM provider for Tier 2 evaluation
         tier2_model: LLM model for Tier 2 evaluation
         tier2_fallback_provider: Fallback LLM provider
@@ -39,6 +53,17 @@ class JudgeSettings(BaseSettings):
         tier2_timeout_seconds: Request timeout for LLM calls
         tier2_cost_budget_usd: Cost budget for LLM evaluation
         tier2_paper_excerpt_length: Paper excerpt length for LLM context
+        tier2_judge_mode: 'per_criterion' (three calls) or 'fused' (one structured call)
+        tier2_cache_enabled: Cache judge assessments in a persistent SQLite database
+        tier2_cache_path: Path of the judge cache database
+        tier2_cache_ttl_seconds: Age after which cached assessments expire
+        tier2_cache_max_entries: Max cached assessments; least recently used are evicted
+        tier2_cache_bypass: Neither read nor write the judge cache for this run
+        tier2_cache_refresh: Ignore cached assessments but store fresh ones
+        tier2_hedge_enabled: Send slow assessments to the fallback provider as well
+        tier2_hedge_percentile: Latency percentile of the primary after which to hedge
+        tier2_hedge_min_samples: Latency samples needed before the percentile is used
+        tier2_hedge_delay_seconds: Hedge delay used until enough samples are observed
         tier3_min_nodes: Minimum nodes for graph analysis
         tier3_centrality_measures: Centrality measures for graph analysis
         tier3_max_nodes: Maximum nodes for graph analysis
@@ -66,11 +91,27 @@ class JudgeSettings(BaseSettings):
     tier3_max_seconds: float = Field(default=15.0, gt=0, le=300)
     total_max_seconds: float = Field(default=25.0, gt=0, le=300)
 
+    # Tier 1 / Tier 3 execution
+    tier_executor: Literal["thread", "process"] = Field(default="thread")
+    tier_executor_workers: int = Field(default=2, gt=0, le=32)
+
     # Tier 1: Traditional Metrics
     tier1_similarity_metrics: list[str] = Field(default=["cosine", "jaccard", "semantic"])
     tier1_confidence_threshold: float = Field(default=0.8)
     tier1_bertscore_model: str = Field(default="distilbert-base-uncased")
+    tier1_bertscore_precision: Literal["fp32", "int8"] = Field(default="fp32")
+    tier1_bertscore_threads: int | None = Field(default=None, gt=0)
+    tier1_bertscore_max_length: int | None = Field(default=None, gt=0, le=512)
+    tier1_bertscore_warmup: bool = Field(default=False)
+    tier1_bertscore_server_socket: str | None = Field(default=None)
+    tier1_embedding_cache: bool = Field(default=False)
+    tier1_jaccard_mode: Literal["exact", "minhash"] = Field(default="exact")
+    tier1_jaccard_max_error: float = Field(default=0.05, ge=0.01, lt=0.5)
+    tier1_edit_distance_backend: Literal["auto", "rapidfuzz", "levenshtein", "textdistance"] = (
+        Field(default="auto")
+    )
     tier1_tfidf_max_features: int = Field(default=5000)
+    tier1_tfidf_corpus_model: bool = Field(default=True)
 
     # Tier 2: LLM-as-Judge
     tier2_provider: str = Field(
@@ -87,6 +128,17 @@ class JudgeSettings(BaseSettings):
     tier2_timeout_seconds: float = Field(default=30.0, gt=0, le=300)
     tier2_cost_budget_usd: float = Field(default=0.05)
     tier2_paper_excerpt_length: int = Field(default=2000)
+    tier2_judge_mode: Literal["per_criterion", "fused"] = Field(default="per_criterion")
+    tier2_cache_enabled: bool = Field(default=False)
+    tier2_cache_path: str = Field(default=f"{RUNS_PATH}/{JUDGE_CACHE_DB_FILE}")
+    tier2_cache_ttl_seconds: float = Field(default=7 * 24 * 3600, gt=0)
+    tier2_cache_max_entries: int = Field(default=50_000, gt=0)
+    tier2_cache_bypass: bool = Field(default=False)
+    tier2_cache_refresh: bool = Field(default=False)
+    tier2_hedge_enabled: bool = Field(default=False)
+    tier2_hedge_percentile: float = Field(default=0.95, gt=0, lt=1)
+    tier2_hedge_min_samples: int = Field(default=10, gt=0)
+    tier2_hedge_delay_seconds: float = Field(default=10.0, gt=0, le=300)
 
     # Tier 3: Graph Analysis
     tier3_min_nodes: int = Field(default=2, gt=0)
@@ -16,6 +16,10 @@ class PeerReadConfig(BaseModel):
         default="https://api.github.com/repos/allenai/PeerRead/contents/data",
         description="Base URL for GitHub API to list PeerRead dataset contents",
     )
+    github_trees_api_base_url: str = Field(
+        default="https://api.github.com/repos/allenai/PeerRead/git/trees",
+        description="Base URL for GitHub git trees API used for recursive venue listings",
+    )
     raw_github_base_url: str = Field(
         default="https://raw.githubusercontent.com/allenai/PeerRead/master/data",
         description="Base URL for raw GitHub content of PeerRead dataset",
@@ -39,6 +43,12 @@ class PeerReadConfig(BaseModel):
     retry_delay_seconds: int = Field(
         default=5, description="Delay in seconds between retry attempts"
     )
+    max_concurrent_downloads: int = Field(
+        default=16, ge=1, description="Maximum number of file downloads in flight at once"
+    )
+    max_connections_per_host: int = Field(
+        default=8, ge=1, description="Maximum concurrent connections to a single host"
+    )
     similarity_metrics: dict[str, float] = Field(
         default={"cosine_weight": 0.6, "jaccard_weight": 0.4},
         description="Weights for similarity metrics",
@@ -68,6 +68,9 @@ class ProviderMetadata(BaseModel):
     model_prefix: str  # Prefix for model names (empty string if not needed)
     default_base_url: str | None = None  # Default API endpoint for OpenAI-compatible providers
     default_model: str | None = None  # Default model ID for the provider
+    requests_per_minute: int | None = None  # Request budget of the shared rate limiter
+    tokens_per_minute: int | None = None  # Token budget of the shared rate limiter
+    max_concurrency: int | None = None  # Upper bound of adaptive concurrency
 
 
 class ProviderConfig(BaseModel):
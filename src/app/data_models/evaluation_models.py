@@ -5,7 +5,7 @@ This module provides Pydantic models for the comprehensive evaluation framework
 that assesses multi-agent systems on PeerRead scientific paper review generation.
 """
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -41,6 +41,20 @@ class PlanningRationalityAssessment(BaseModel):
     explanation: str = Field(description="Explanation of the assessment")
 
 
+class FusedJudgeAssessment(BaseModel):
+    """All three LLM assessments returned by a single fused judge call."""
+
+    technical_accuracy: TechnicalAccuracyAssessment = Field(
+        description="Technical accuracy of the review"
+    )
+    constructiveness: ConstructivenessAssessment = Field(
+        description="Constructiveness of the review"
+    )
+    planning_rationality: PlanningRationalityAssessment = Field(
+        description="Planning rationality of the agent execution"
+    )
+
+
 class Tier1Result(BaseModel):
     """Traditional metrics evaluation result.
 
@@ -61,6 +75,27 @@ class Tier1Result(BaseModel):
         description="Continuous task success score (0.0 to 1.0, proportional below threshold)"
     )
     overall_score: float = Field(ge=0.0, le=1.0, description="Weighted traditional metrics score")
+    score_backends: dict[str, str] = Field(
+        default_factory=dict, description="Implementation that produced each similarity score"
+    )
+
+
+class Tier1BatchItem(BaseModel):
+    """One agent output to score in a batched Tier 1 evaluation."""
+
+    agent_output: str = Field(description="Generated review text")
+    reference_texts: list[str] = Field(description="Ground truth reviews of the paper")
+    start_time: float = Field(default=0.0, description="Execution start timestamp")
+    end_time: float = Field(default=0.0, description="Execution end timestamp")
+
+
+class Tier1BatchResult(BaseModel):
+    """Results and throughput of a batched Tier 1 evaluation."""
+
+    results: list[Tier1Result] = Field(description="Tier 1 results in input order")
+    reference_groups: int = Field(ge=0, description="Distinct reference sets (papers) scored")
+    elapsed_seconds: float = Field(ge=0.0, description="Wall-clock time of the batch")
+    items_per_second: float = Field(ge=0.0, description="Scored items per second")
 
 
 class Tier2Result(BaseModel):
@@ -79,6 +114,17 @@ class Tier2Result(BaseModel):
         default=None, description="Estimated API cost in USD; None when cost is unavailable"
     )
     fallback_used: bool = Field(default=False, description="Whether fallback was used")
+    cache_hits: list[str] = Field(
+        default_factory=list, description="Assessments served from the judge cache"
+    )
+    judge_mode: Literal["per_criterion", "fused"] = Field(
+        default="per_criterion",
+        description="Whether scores came from one call per criterion or one fused call",
+    )
+    hedge_winners: dict[str, str] = Field(
+        default_factory=dict,
+        description="Provider/model that answered each hedged assessment",
+    )
 
 
 class Tier3Result(BaseModel):
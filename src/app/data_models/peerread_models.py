@@ -165,6 +165,52 @@ class PeerReadPaper(BaseModel):
     )
 
 
+class PaperLocation(BaseModel):
+    """Cached on-disk location of a PeerRead paper.
+
+    Paths in ``files`` are relative to the PeerRead cache directory and keyed
+    by data type ('reviews', 'parsed_pdfs', 'pdfs').
+    """
+
+    venue: str = Field(description="Conference venue the paper belongs to")
+    split: str = Field(description="Data split the paper belongs to")
+    files: dict[str, str] = Field(
+        default_factory=dict, description="Relative file path per available data type"
+    )
+
+
+class ManifestEntry(BaseModel):
+    """Local manifest record for one synced PeerRead file."""
+
+    paper_id: str = Field(description="Paper identifier")
+    split: str = Field(description="Data split the file belongs to")
+    data_type: str = Field(description="Data type ('reviews', 'parsed_pdfs', 'pdfs')")
+    size: int = Field(description="File size in bytes")
+    blob_sha: str = Field(description="Git blob SHA-1 of the file content")
+
+
+class PaperSection(BaseModel):
+    """Boundary of one section in a pre-extracted paper body text.
+
+    Offsets are UTF-8 byte positions in the stored body text file, so a single
+    section can be read with one seek without decoding the whole body.
+    """
+
+    heading: str | None = Field(default=None, description="Section heading, if any")
+    start: int = Field(description="Byte offset of the section text in the body file")
+    end: int = Field(description="Byte offset one past the end of the section text")
+    chars: int = Field(description="Number of characters in the section text")
+
+
+class PaperSearchHit(BaseModel):
+    """Ranked result of a full-text PeerRead paper search."""
+
+    paper_id: str = Field(description="Paper identifier")
+    title: str = Field(description="Paper title")
+    score: float = Field(description="BM25 relevance score")
+    snippet: str = Field(description="Short excerpt around the first matching query term")
+
+
 class DownloadResult(BaseModel):
     """Result of dataset download operation."""
 
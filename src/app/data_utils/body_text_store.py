@@ -0,0 +1,259 @@
+"""
+Pre-extracted body text store for PeerRead parsed PDFs.
+
+Parsed PDF files (``parsed_pdfs/<paper_id>.pdf.json``) hold the full science-parse
+output, but callers only need the concatenated section text. This store keeps,
+per venue/split, a ``body_text/`` directory with one ``<paper_id>.txt`` file
+holding the body text exactly as ``PeerReadLoader`` returns it and one
+``<paper_id>.sections.json`` layout file with section headings, UTF-8 byte
+boundaries and character counts. Loading a body is a single small read and a
+section can be read with one seek.
+
+A stored body is fresh while its text file is at least as new as the parsed PDF
+it was derived from.
+"""
+
+import os
+from json import JSONDecodeError, dump, load
+from pathlib import Path
+from typing import Any
+
+from app.config.config_app import PEERREAD_BODY_TEXT_DIR
+from app.data_models.peerread_models import PaperSection
+from app.utils.log import logger
+
+_LAYOUT_VERSION = 1
+_PARSED_PDF_SUFFIX = ".pdf.json"
+
+
+def extract_body_sections(parsed_data: dict[str, Any]) -> tuple[str, list[PaperSection]]:
+    """Extract body text and section boundaries from parsed PDF data.
+
+    Top-level sections with a 'text' field are joined with newlines and the
+    result is stripped, matching the text historically returned by the loader.
+
+    Args:
+        parsed_data: Parsed PDF JSON data.
+
+    Returns:
+        Tuple of (body text, sections with byte offsets into the UTF-8 body).
+    """
+    pieces: list[str] = []
+    spans: list[tuple[str | None, int, int]] = []
+    position = 0
+    for section in parsed_data.get("metadata", {}).get("sections", []):
+        if "text" not in section:
+            continue
+        if pieces:
+            position += 1
+        text = section["text"]
+        spans.append((section.get("heading"), position, position + len(text)))
+        pieces.append(text)
+        position += len(text)
+
+    joined = "\n".join(pieces)
+    body = joined.strip()
+    lead = len(joined) - len(joined.lstrip())
+
+    sections: list[PaperSection] = []
+    for heading, start, end in spans:
+        # Reason: Clamp to the stripped body; leading/trailing whitespace is not stored.
+        char_start = min(max(start - lead, 0), len(body))
+        char_end = min(max(end - lead, 0), len(body))
+        byte_start = len(body[:char_start].encode("utf-8"))
+        sections.append(
+            PaperSection(
+                heading=heading,
+                start=byte_start,
+                end=byte_start + len(body[char_start:char_end].encode("utf-8")),
+                chars=char_end - char_start,
+            )
+        )
+    return body, sections
+
+
+def _write_atomic(path: Path, data: str) -> None:
+    """Write text to a temporary file and rename it into place."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class BodyTextStore:
+    """Per-paper body text and section layout files of one venue/split."""
+
+    def __init__(self, split_dir: Path):
+        """Initialize the store of a venue/split directory.
+
+        Args:
+            split_dir: Venue/split directory, e.g. ``<cache>/acl_2017/train``.
+        """
+        self.store_dir = split_dir / PEERREAD_BODY_TEXT_DIR
+
+    @classmethod
+    def for_parsed_file(cls, parsed_file: Path) -> tuple["BodyTextStore", str]:
+        """Get the store and paper ID belonging to a parsed PDF file.
+
+        Args:
+            parsed_file: Path like ``<split_dir>/parsed_pdfs/<paper_id>.pdf.json``.
+
+        Returns:
+            Tuple of (store, paper ID).
+        """
+        paper_id = parsed_file.name.removesuffix(_PARSED_PDF_SUFFIX)
+        return cls(parsed_file.parent.parent), paper_id
+
+    def text_path(self, paper_id: str) -> Path:
+        """Path of the stored body text of a paper."""
+        return self.store_dir / f"{paper_id}.txt"
+
+    def layout_path(self, paper_id: str) -> Path:
+        """Path of the stored section layout of a paper."""
+        return self.store_dir / f"{paper_id}.sections.json"
+
+    def is_fresh(self, paper_id: str, source: Path) -> bool:
+        """Check whether the stored body is present and not older than its source.
+
+        Args:
+            paper_id: Paper identifier.
+            source: Parsed PDF file the body is derived from.
+
+        Returns:
+            True if the stored body can be used instead of parsing the source.
+        """
+        try:
+            stored_mtime = self.text_path(paper_id).stat().st_mtime_ns
+        except OSError:
+            return False
+        try:
+            return stored_mtime >= source.stat().st_mtime_ns
+        except OSError:
+            # Reason: The derived body stays usable if the source was removed.
+            return True
+
+    def save(self, paper_id: str, body: str, sections: list[PaperSection]) -> None:
+        """Store the body text and section layout of a paper.
+
+        The layout is written before the text so a fresh text file always has
+        a matching layout.
+
+        Args:
+            paper_id: Paper identifier.
+            body: Extracted body text.
+            sections: Section boundaries from ``extract_body_sections``.
+
+        Raises:
+            OSError: If the store directory is not writable.
+        """
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        layout = {
+            "version": _LAYOUT_VERSION,
+            "chars": len(body),
+            "sections": [s.model_dump() for s in sections],
+        }
+        layout_path = self.layout_path(paper_id)
+        tmp_layout = layout_path.with_name(f"{layout_path.name}.tmp")
+        with open(tmp_layout, "w", encoding="utf-8") as f:
+            dump(layout, f, separators=(",", ":"))
+        os.replace(tmp_layout, layout_path)
+        _write_atomic(self.text_path(paper_id), body)
+
+    def read_text(self, paper_id: str) -> str | None:
+        """Read the stored body text of a paper.
+
+        Args:
+            paper_id: Paper identifier.
+
+        Returns:
+            Body text, or None if not stored.
+        """
+        try:
+            with open(self.text_path(paper_id), encoding="utf-8", newline="") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def read_sections(self, paper_id: str) -> list[PaperSection] | None:
+        """Read the stored section layout of a paper.
+
+        Args:
+            paper_id: Paper identifier.
+
+        Returns:
+            Section boundaries in document order, or None if not stored or unreadable.
+        """
+        layout_path = self.layout_path(paper_id)
+        try:
+            with open(layout_path, encoding="utf-8") as f:
+                layout = load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, JSONDecodeError) as e:
+            logger.warning(f"Failed to read section layout {layout_path}: {e}")
+            return None
+        if layout.get("version") != _LAYOUT_VERSION:
+            return None
+        return [PaperSection.model_validate(s) for s in layout.get("sections", [])]
+
+    def read_section_texts(self, paper_id: str, indices: list[int]) -> list[str] | None:
+        """Read selected sections of a stored body without reading the whole text.
+
+        Args:
+            paper_id: Paper identifier.
+            indices: Section indices into ``read_sections`` order.
+
+        Returns:
+            Section texts in the requested order, or None if not stored.
+
+        Raises:
+            IndexError: If an index is out of range.
+        """
+        sections = self.read_sections(paper_id)
+        if sections is None:
+            return None
+        texts: list[str] = []
+        try:
+            with open(self.text_path(paper_id), "rb") as f:
+                for index in indices:
+                    section = sections[index]
+                    f.seek(section.start)
+                    texts.append(f.read(section.end - section.start).decode("utf-8"))
+        except FileNotFoundError:
+            return None
+        return texts
+
+
+def write_body_text_store(split_dir: Path) -> int:
+    """Pre-extract body text for every parsed PDF of a venue/split.
+
+    Papers whose stored body is already fresh are skipped; unreadable parsed
+    PDFs are logged and skipped.
+
+    Args:
+        split_dir: Venue/split directory, e.g. ``<cache>/acl_2017/train``.
+
+    Returns:
+        Number of bodies (re)written.
+    """
+    parsed_dir = split_dir / "parsed_pdfs"
+    if not parsed_dir.is_dir():
+        return 0
+
+    store = BodyTextStore(split_dir)
+    written = 0
+    for parsed_file in sorted(parsed_dir.glob(f"*{_PARSED_PDF_SUFFIX}")):
+        paper_id = parsed_file.name.removesuffix(_PARSED_PDF_SUFFIX)
+        if store.is_fresh(paper_id, parsed_file):
+            continue
+        try:
+            with open(parsed_file, encoding="utf-8") as f:
+                parsed_data = load(f)
+        except (OSError, JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning(f"Skipping unreadable parsed PDF {parsed_file}: {e}")
+            continue
+        store.save(paper_id, *extract_body_sections(parsed_data))
+        written += 1
+
+    logger.debug(f"Extracted body text for {written} papers in {split_dir}")
+    return written
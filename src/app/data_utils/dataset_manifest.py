@@ -0,0 +1,168 @@
+"""
+Local manifest for incremental PeerRead dataset sync.
+
+One manifest per venue records, for every synced file, the paper ID, split,
+data type, size and git blob SHA. The sync compares it against a single
+recursive git tree listing of the venue, so only missing or changed files are
+fetched. Verification checks manifest entries against file sizes on disk
+instead of parsing every cached file.
+"""
+
+import hashlib
+import os
+import threading
+from json import JSONDecodeError, dump, load
+from pathlib import Path
+
+from app.config.config_app import PEERREAD_MANIFEST_FILE
+from app.data_models.peerread_models import ManifestEntry
+from app.utils.log import logger
+
+_MANIFEST_VERSION = 1
+
+
+def git_blob_sha(data: bytes) -> str:
+    """Compute the git blob SHA-1 of file content, as reported by the GitHub trees API.
+
+    Args:
+        data: Raw file bytes.
+
+    Returns:
+        Hex-encoded SHA-1 of ``blob <size>\\0<data>``.
+    """
+    header = f"blob {len(data)}\0".encode()
+    return hashlib.sha1(header + data, usedforsecurity=False).hexdigest()
+
+
+class DatasetManifest:
+    """Per-venue manifest of synced files, keyed by path relative to the venue dir.
+
+    Relative paths have the form ``<split>/<data_type>/<filename>``.
+    """
+
+    def __init__(self, cache_dir: Path, venue: str):
+        """Load the manifest for a venue, starting empty if none exists.
+
+        Args:
+            cache_dir: PeerRead cache root directory.
+            venue: Conference venue.
+        """
+        self.venue_dir = cache_dir / venue
+        self.path = self.venue_dir / PEERREAD_MANIFEST_FILE
+        self.entries: dict[str, ManifestEntry] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """Read entries from disk if a manifest file exists."""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = load(f)
+            if data.get("version") != _MANIFEST_VERSION:
+                logger.info(f"Ignoring manifest with unknown version: {self.path}")
+                return
+            self.entries = {
+                rel_path: ManifestEntry.model_validate(entry)
+                for rel_path, entry in data.get("files", {}).items()
+            }
+        except (OSError, JSONDecodeError, ValueError) as e:
+            logger.warning(f"Failed to load manifest {self.path}, starting fresh: {e}")
+
+    def exists(self) -> bool:
+        """Check whether a manifest file exists on disk."""
+        return self.path.exists()
+
+    def record(self, rel_path: str, entry: ManifestEntry) -> None:
+        """Record a synced file.
+
+        Args:
+            rel_path: Path relative to the venue directory.
+            entry: Manifest entry for the file.
+        """
+        with self._lock:
+            self.entries[rel_path] = entry
+
+    def is_current(self, rel_path: str, blob_sha: str) -> bool:
+        """Check whether a local file matches a remote blob.
+
+        Trusts the manifest when its entry has the same blob SHA and the file
+        size on disk still matches. Files present on disk but missing from the
+        manifest (e.g. written just before an interrupted sync) are hashed and
+        recorded if they match, so a resumed sync does not re-fetch them.
+
+        Args:
+            rel_path: Path relative to the venue directory.
+            blob_sha: Git blob SHA of the remote file.
+
+        Returns:
+            True if the local file is present and up to date.
+        """
+        local_file = self.venue_dir / rel_path
+        try:
+            size = local_file.stat().st_size
+        except OSError:
+            return False
+
+        entry = self.entries.get(rel_path)
+        if entry is not None and entry.blob_sha == blob_sha:
+            return entry.size == size
+
+        data = local_file.read_bytes()
+        if git_blob_sha(data) != blob_sha:
+            return False
+
+        split, data_type, filename = rel_path.split("/", 2)
+        self.record(
+            rel_path,
+            ManifestEntry(
+                paper_id=filename.split(".", 1)[0],
+                split=split,
+                data_type=data_type,
+                size=size,
+                blob_sha=blob_sha,
+            ),
+        )
+        return True
+
+    def verify_split(self, split: str) -> tuple[int, list[str]]:
+        """Check manifest entries of a split against files on disk.
+
+        Args:
+            split: Data split.
+
+        Returns:
+            Tuple of (number of verified review files, list of problem descriptions).
+        """
+        verified_reviews = 0
+        problems: list[str] = []
+        with self._lock:
+            entries = [(p, e) for p, e in self.entries.items() if e.split == split]
+
+        for rel_path, entry in entries:
+            try:
+                size = (self.venue_dir / rel_path).stat().st_size
+            except OSError:
+                problems.append(f"missing {rel_path}")
+                continue
+            if size != entry.size:
+                problems.append(f"size mismatch {rel_path}")
+                continue
+            if entry.data_type == "reviews":
+                verified_reviews += 1
+
+        return verified_reviews, problems
+
+    def save(self) -> None:
+        """Persist the manifest atomically."""
+        with self._lock:
+            data = {
+                "version": _MANIFEST_VERSION,
+                "files": {rel: e.model_dump() for rel, e in sorted(self.entries.items())},
+            }
+        self.venue_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
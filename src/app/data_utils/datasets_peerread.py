@@ -6,22 +6,40 @@ loading the PeerRead scientific paper review dataset. It contains no evaluation
 logic - only data access and management.
 """
 
-from dataclasses import dataclass
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from json import JSONDecodeError, dump, load
 from pathlib import Path
 from time import sleep
 from typing import Any
+from urllib.parse import urlparse
 
-from httpx import Client, HTTPStatusError, RequestError
+from httpx import AsyncClient, Client, HTTPStatusError, Limits, RequestError
 
 from app.config.app_env import AppEnv
-from app.config.config_app import DATASETS_CONFIG_FILE
+from app.config.config_app import DATASETS_CONFIG_FILE, PEERREAD_PACK_FILE
 from app.config.peerread_config import PeerReadConfig
 from app.data_models.peerread_models import (
     DownloadResult,
+    ManifestEntry,
+    PaperSection,
     PeerReadPaper,
     PeerReadReview,
 )
+from app.data_utils.body_text_store import (
+    BodyTextStore,
+    extract_body_sections,
+    write_body_text_store,
+)
+from app.data_utils.dataset_manifest import DatasetManifest, git_blob_sha
+from app.data_utils.paper_cache import get_paper_cache
+from app.data_utils.paper_index import PaperIndex, get_paper_index
+from app.data_utils.paper_search import get_paper_search_index
+from app.data_utils.review_pack import ReviewPack, reviews_dir_mtime, write_review_pack
+from app.llms.rate_limiter import get_rate_limiter, parse_retry_after
 from app.utils.log import logger
 from app.utils.paths import resolve_config_path, resolve_project_path
 from app.utils.url_validation import validate_url
@@ -47,10 +65,112 @@ DATA_TYPE_SPECS: dict[str, DataTypeSpec] = {
 }
 
 
+def create_paper_index(config: PeerReadConfig, cache_dir: Path) -> PaperIndex:
+    """Create a paper-location index for a PeerRead cache directory.
+
+    Args:
+        config: PeerRead dataset configuration (venue/split lookup order).
+        cache_dir: PeerRead cache root directory.
+
+    Returns:
+        PaperIndex bound to the cache directory.
+    """
+    return PaperIndex(cache_dir, config.venues, config.splits, _index_extensions())
+
+
+def shared_paper_index(config: PeerReadConfig, cache_dir: Path) -> PaperIndex:
+    """Get the process-wide paper-location index for a PeerRead cache directory.
+
+    Args:
+        config: PeerRead dataset configuration (venue/split lookup order).
+        cache_dir: PeerRead cache root directory.
+
+    Returns:
+        Shared PaperIndex bound to the cache directory.
+    """
+    return get_paper_index(cache_dir, config.venues, config.splits, _index_extensions())
+
+
+def _index_extensions() -> dict[str, str]:
+    """Map each data type to its file extension for the paper index."""
+    return {data_type: spec.extension for data_type, spec in DATA_TYPE_SPECS.items()}
+
+
+@dataclass(frozen=True)
+class RemoteFile:
+    """A dataset file listed by the GitHub git trees API.
+
+    Attributes:
+        split: Data split ('train', 'test', 'dev').
+        data_type: Type of data ('reviews', 'parsed_pdfs', 'pdfs').
+        paper_id: Paper identifier.
+        size: File size in bytes.
+        blob_sha: Git blob SHA-1 of the file content.
+    """
+
+    split: str
+    data_type: str
+    paper_id: str
+    size: int
+    blob_sha: str
+
+    @property
+    def rel_path(self) -> str:
+        """Path relative to the venue directory."""
+        extension = DATA_TYPE_SPECS[self.data_type].extension
+        return f"{self.split}/{self.data_type}/{self.paper_id}{extension}"
+
+
+_MANIFEST_FLUSH_INTERVAL = 100
+
+
+@dataclass
+class _DownloadSession:
+    """Shared async client plus global and per-host concurrency limits.
+
+    Attributes:
+        client: Pooled async HTTP client used for every request in the session.
+        max_concurrency: Maximum requests in flight across all hosts.
+        max_per_host: Maximum requests in flight to any single host.
+    """
+
+    client: AsyncClient
+    max_concurrency: int
+    max_per_host: int
+    _global: asyncio.Semaphore = field(init=False)
+    _hosts: dict[str, asyncio.Semaphore] = field(init=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._global = asyncio.Semaphore(self.max_concurrency)
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """Hold a global and a per-host concurrency slot for one request."""
+        host = urlparse(url).netloc
+        host_semaphore = self._hosts.setdefault(host, asyncio.Semaphore(self.max_per_host))
+        async with self._global, host_semaphore:
+            yield
+
+
+def _run_blocking[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    Reason: download_peerread_dataset is sync but is also called from the async
+    app main(), where asyncio.run() is not allowed; use a worker thread there.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
 def _perform_downloads(
     downloader: "PeerReadDownloader",
     config: PeerReadConfig,
     max_papers: int,
+    incremental: bool = False,
 ) -> tuple[int, list[str]]:
     """Perform downloads for all venue/split combinations.
 
@@ -58,6 +178,8 @@ def _perform_downloads(
         downloader: PeerReadDownloader instance.
         config: PeerRead dataset configuration.
         max_papers: Maximum number of papers to download per venue/split.
+        incremental: Sync each venue against its local manifest instead of
+            re-discovering and re-checking every split directory.
 
     Returns:
         Tuple of (total_downloaded, failed_downloads).
@@ -66,9 +188,18 @@ def _perform_downloads(
     failed_downloads: list[str] = []
 
     for venue in config.venues:
+        if incremental:
+            logger.info(f"Syncing {venue}...")
+            split_results = downloader.sync_venue(venue, max_papers=max_papers)
+        else:
+            split_results = {}
+
         for split in config.splits:
-            logger.info(f"Downloading {venue}/{split}...")
-            result = downloader.download_venue_split(venue, split, max_papers=max_papers)
+            if incremental:
+                result = split_results[split]
+            else:
+                logger.info(f"Downloading {venue}/{split}...")
+                result = downloader.download_venue_split(venue, split, max_papers=max_papers)
 
             if result.success:
                 logger.info(f"✓ {venue}/{split}: {result.papers_downloaded} downloaded")
@@ -86,7 +217,11 @@ def _verify_downloads(
     config: PeerReadConfig,
     failed_downloads: list[str],
 ) -> int:
-    """Verify downloads by attempting to load papers.
+    """Verify downloads against the venue manifest, or by loading papers.
+
+    Venues synced incrementally are checked against their manifest (file
+    presence and size); venues without a manifest fall back to loading every
+    split through the loader.
 
     Args:
         loader: PeerReadLoader instance.
@@ -100,7 +235,20 @@ def _verify_downloads(
     verification_count = 0
 
     for venue in config.venues:
+        manifest = DatasetManifest(loader.cache_dir, venue)
         for split in config.splits:
+            if manifest.exists():
+                verified, problems = manifest.verify_split(split)
+                verification_count += verified
+                if problems:
+                    logger.error(
+                        f"✗ Verification failed for {venue}/{split}: {'; '.join(problems[:5])}"
+                    )
+                    failed_downloads.append(f"{venue}/{split} (verification)")
+                else:
+                    logger.info(f"✓ Verified {venue}/{split}: {verified} papers in manifest")
+                continue
+
             try:
                 papers = loader.load_papers(venue, split)
                 verification_count += len(papers)
@@ -138,6 +286,7 @@ def _validate_download_results(
 
 def download_peerread_dataset(
     peerread_max_papers_per_sample_download: int | None = None,
+    incremental: bool = False,
 ) -> None:
     """
     Download PeerRead dataset and verify the download.
@@ -149,6 +298,8 @@ def download_peerread_dataset(
     Args:
         peerread_max_papers_per_sample_download: The maximum number of papers to
             download. If None, downloads all papers it can find.
+        incremental: Resumable manifest-based sync that fetches only missing
+            or changed files.
 
     Raises:
         Exception: If download or verification fails.
@@ -170,7 +321,9 @@ def download_peerread_dataset(
             else config.max_papers_per_query
         )
 
-        total_downloaded, failed_downloads = _perform_downloads(downloader, config, max_papers)
+        total_downloaded, failed_downloads = _perform_downloads(
+            downloader, config, max_papers, incremental=incremental
+        )
 
         loader = PeerReadLoader(config)
         verification_count = _verify_downloads(loader, config, failed_downloads)
@@ -190,6 +343,45 @@ def download_peerread_dataset(
         raise Exception(error_msg) from e
 
 
+def pack_peerread_dataset(config: PeerReadConfig | None = None) -> int:
+    """Convert cached loose review files into packed per-venue/split corpus files.
+
+    Also pre-extracts the body text of every cached parsed PDF and updates the
+    full-text search index. Only venue/split directories that exist in the cache
+    are packed; missing ones are skipped.
+
+    Args:
+        config: PeerRead dataset configuration. Loads from file if None.
+
+    Returns:
+        Total number of review records packed.
+    """
+    config = config or load_peerread_config()
+    cache_dir = resolve_project_path(config.cache_directory)
+    total_packed = 0
+
+    for venue in config.venues:
+        for split in config.splits:
+            split_dir = cache_dir / venue / split
+            extracted = write_body_text_store(split_dir)
+            if extracted:
+                logger.info(f"✓ Extracted {venue}/{split}: {extracted} paper bodies")
+            if not (split_dir / "reviews").is_dir():
+                logger.debug(f"Skipping {venue}/{split}: no cached reviews")
+                continue
+            packed = write_review_pack(split_dir)
+            logger.info(f"✓ Packed {venue}/{split}: {packed} reviews")
+            total_packed += packed
+
+    if cache_dir.exists():
+        loader = PeerReadLoader(config)
+        search_index = get_paper_search_index(loader.cache_dir)
+        search_index.refresh(loader)
+        logger.info(f"✓ Search index covers {len(search_index)} papers")
+
+    return total_packed
+
+
 def load_peerread_config() -> PeerReadConfig:
     """Load PeerRead dataset configuration from config file.
 
@@ -233,6 +425,7 @@ class PeerReadDownloader:
         if app_env.GITHUB_API_KEY:
             logger.info("Using GitHub API key for authenticated requests")
             headers["Authorization"] = f"token {app_env.GITHUB_API_KEY}"
+        self._headers = headers
         self.client = Client(headers=headers)
 
     def _construct_url(
@@ -339,11 +532,97 @@ class PeerReadDownloader:
             )
             return []
 
+    def _discover_venue_tree(self, venue: str) -> list[RemoteFile]:
+        """List all dataset files of a venue with one recursive git tree request.
+
+        Resolves the venue directory's tree SHA from the ``data`` contents
+        listing, then fetches the whole subtree recursively, instead of one
+        contents call per split and data type.
+
+        Args:
+            venue: Conference venue (e.g., 'acl_2017').
+
+        Returns:
+            Remote files of known data types, or an empty list on failure.
+        """
+        try:
+            contents_url = validate_url(self.config.github_api_base_url)
+            logger.info(f"Resolving git tree for {venue} via GitHub API")
+            response = self.client.get(contents_url, timeout=self.config.download_timeout)
+            response.raise_for_status()
+            tree_sha = next(
+                (
+                    entry["sha"]
+                    for entry in response.json()
+                    if entry.get("name") == venue and entry.get("type") == "dir"
+                ),
+                None,
+            )
+            if tree_sha is None:
+                logger.error(f"Venue {venue} not found in PeerRead repository")
+                return []
+
+            tree_url = validate_url(f"{self.config.github_trees_api_base_url}/{tree_sha}")
+            response = self.client.get(
+                tree_url, params={"recursive": "1"}, timeout=self.config.download_timeout
+            )
+            response.raise_for_status()
+            tree_data = response.json()
+        except (RequestError, HTTPStatusError) as e:
+            logger.error(f"Failed to list git tree for {venue}: {e}")
+            return []
+        except (KeyError, ValueError) as e:
+            logger.error(f"Failed to parse git tree response for {venue}: {e}")
+            return []
+
+        if tree_data.get("truncated"):
+            logger.warning(f"Git tree listing for {venue} was truncated by GitHub")
+
+        remote_files: list[RemoteFile] = []
+        for entry in tree_data.get("tree", []):
+            parts = entry.get("path", "").split("/")
+            if entry.get("type") != "blob" or len(parts) != 3:
+                continue
+            split, data_type, filename = parts
+            if data_type not in DATA_TYPE_SPECS:
+                continue
+            paper_id = self._extract_paper_id_from_filename(filename, data_type)
+            if paper_id is None:
+                continue
+            remote_files.append(
+                RemoteFile(
+                    split=split,
+                    data_type=data_type,
+                    paper_id=paper_id,
+                    size=int(entry.get("size", 0)),
+                    blob_sha=entry["sha"],
+                )
+            )
+
+        logger.info(f"Found {len(remote_files)} files in {venue} git tree")
+        return remote_files
+
+    @staticmethod
+    def _record_rate_limit(error: HTTPStatusError, url: str) -> float:
+        """Record a 429 in the host's shared limiter.
+
+        Args:
+            error: The 429 error, whose ``Retry-After`` header pauses the host.
+            url: Requested URL.
+
+        Returns:
+            Seconds until the host's ``Retry-After`` pause ends.
+        """
+        limiter = get_rate_limiter(urlparse(url).netloc)
+        limiter.record_rate_limit(parse_retry_after(error.response.headers.get("retry-after")))
+        return limiter.cooldown_remaining()
+
     def _handle_download_error(
         self,
         error: Exception,
         data_type: str,
         paper_id: str,
+        url: str = "",
     ) -> bool:
         """Handle download errors and determine if retry should continue.
 
@@ -351,16 +630,17 @@ class PeerReadDownloader:
             error: The exception that occurred.
             data_type: Type of data being downloaded.
             paper_id: Paper identifier.
+            url: Requested URL, whose host is paused on ``Retry-After``.
 
         Returns:
             True if retry should continue, False otherwise.
         """
         if isinstance(error, HTTPStatusError) and error.response.status_code == 429:
+            delay = max(self.config.retry_delay_seconds, self._record_rate_limit(error, url))
             logger.warning(
-                f"Rate limit hit for {data_type}/{paper_id}. "
-                f"Retrying in {self.config.retry_delay_seconds} seconds..."
+                f"Rate limit hit for {data_type}/{paper_id}. Retrying in {delay} seconds..."
             )
-            sleep(self.config.retry_delay_seconds)
+            sleep(delay)
             return True
 
         logger.error(f"Failed to download {data_type}/{paper_id}: {error}")
@@ -407,7 +687,7 @@ class PeerReadDownloader:
                 return response.content
 
             except (HTTPStatusError, RequestError, JSONDecodeError) as e:
-                should_retry = self._handle_download_error(e, data_type, paper_id)
+                should_retry = self._handle_download_error(e, data_type, paper_id, url)
                 if not should_retry:
                     return None
 
@@ -416,6 +696,74 @@ class PeerReadDownloader:
         )
         return None
 
+    async def download_file_async(
+        self,
+        session: _DownloadSession,
+        venue: str,
+        split: str,
+        data_type: str,
+        paper_id: str,
+        raw: bool = False,
+    ) -> bytes | dict[str, Any] | None:
+        """Download a single file through a shared async session.
+
+        Rate-limited requests (HTTP 429) back off exponentially with a
+        non-blocking sleep that pauses only this request; the concurrency slot
+        is released while waiting so other downloads keep going. A
+        ``Retry-After`` header pauses every request to the host until it expires.
+
+        Args:
+            session: Async download session with pooled client and limits.
+            venue: Conference venue.
+            split: Data split.
+            data_type: Type of data ('reviews', 'parsed_pdfs', 'pdfs').
+            paper_id: Paper identifier.
+            raw: Return the response bytes unparsed, even for JSON data types.
+
+        Returns:
+            File content (JSON dict for .json files, bytes for PDFs or when
+            raw is set), or None if download fails.
+
+        Raises:
+            ValueError: If venue/split is invalid.
+        """
+        url = self._construct_url(venue, split, data_type, paper_id)
+
+        for attempt in range(self.config.max_retries):
+            try:
+                # Validate URL for SSRF protection (CVE-2026-25580 mitigation)
+                validated_url = validate_url(url)
+                logger.debug(
+                    f"Downloading {data_type}/{paper_id} from {validated_url} "
+                    f"(Attempt {attempt + 1}/{self.config.max_retries})"
+                )
+                await get_rate_limiter(urlparse(validated_url).netloc).wait_ready()
+                async with session.slot(validated_url):
+                    response = await session.client.get(validated_url)
+                response.raise_for_status()
+
+                if DATA_TYPE_SPECS[data_type].is_json and not raw:
+                    return response.json()
+                return response.content
+
+            except (HTTPStatusError, RequestError, JSONDecodeError) as e:
+                if not (isinstance(e, HTTPStatusError) and e.response.status_code == 429):
+                    logger.error(f"Failed to download {data_type}/{paper_id}: {e}")
+                    return None
+                delay = max(
+                    self.config.retry_delay_seconds * 2**attempt,
+                    self._record_rate_limit(e, url),
+                )
+                logger.warning(
+                    f"Rate limit hit for {data_type}/{paper_id}. Retrying in {delay} seconds..."
+                )
+                await asyncio.sleep(delay)
+
+        logger.error(
+            f"Failed to download {data_type}/{paper_id} after {self.config.max_retries} attempts."
+        )
+        return None
+
     def _get_cache_filename(self, data_type: str, paper_id: str) -> str:
         """Get cache filename for given data type and paper ID.
 
@@ -453,8 +801,9 @@ class PeerReadDownloader:
             with open(cache_file, "wb") as f:
                 f.write(file_data)
 
-    def _download_single_data_type(
+    async def _download_single_data_type(
         self,
+        session: _DownloadSession,
         venue: str,
         split: str,
         data_type: str,
@@ -465,6 +814,7 @@ class PeerReadDownloader:
         """Download a single data type for a paper.
 
         Args:
+            session: Async download session with pooled client and limits.
             venue: Conference venue.
             split: Data split.
             data_type: Type of data to download.
@@ -488,26 +838,28 @@ class PeerReadDownloader:
             logger.debug(f"{data_type}/{paper_id} already cached")
             return True
 
-        file_data = self.download_file(venue, split, data_type, paper_id)
+        file_data = await self.download_file_async(session, venue, split, data_type, paper_id)
         if file_data is None:
             errors.append(f"Failed to download {data_type}/{paper_id}")
             return False
 
-        self._save_file_data(file_data, cache_file, data_type)
+        await asyncio.to_thread(self._save_file_data, file_data, cache_file, data_type)
         logger.info(f"Cached {data_type}/{paper_id}")
         return True
 
-    def _download_paper_all_types(
+    async def _download_paper_all_types(
         self,
+        session: _DownloadSession,
         venue: str,
         split: str,
         paper_id: str,
         base_cache_path: Path,
         errors: list[str],
     ) -> bool:
-        """Download all data types for a single paper.
+        """Download all data types for a single paper concurrently.
 
         Args:
+            session: Async download session with pooled client and limits.
             venue: Conference venue.
             split: Data split.
             paper_id: Paper identifier.
@@ -518,16 +870,236 @@ class PeerReadDownloader:
             True if at least one file was downloaded successfully.
         """
         data_types = ["reviews", "parsed_pdfs", "pdfs"]
-        paper_downloaded = False
+        results = await asyncio.gather(
+            *(
+                self._download_single_data_type(
+                    session, venue, split, data_type, paper_id, base_cache_path, errors
+                )
+                for data_type in data_types
+            )
+        )
+        return any(results)
+
+    def _update_paper_index(self, venue: str, split: str) -> None:
+        """Refresh the persisted paper-location index for a downloaded venue/split.
+
+        Args:
+            venue: Conference venue.
+            split: Data split.
+        """
+        index = shared_paper_index(self.config, self.cache_dir)
+        indexed = index.scan_split(venue, split)
+        index.save()
+        logger.debug(f"Indexed {indexed} papers for {venue}/{split}")
+
+    async def _sync_file(
+        self,
+        session: _DownloadSession,
+        manifest: DatasetManifest,
+        venue: str,
+        remote: RemoteFile,
+        errors: list[str],
+    ) -> bool:
+        """Fetch one remote file unless the manifest shows it is current.
+
+        The file is verified against its git blob SHA, written atomically, and
+        recorded in the manifest so an interrupted sync resumes after it.
+
+        Args:
+            session: Async download session with pooled client and limits.
+            manifest: Venue manifest.
+            venue: Conference venue.
+            remote: Remote file to sync.
+            errors: List to append errors to.
+
+        Returns:
+            True if the file is present and current after the call.
+        """
+        # Reason: May hash an unrecorded local file on resume; keep that off the event loop.
+        if await asyncio.to_thread(manifest.is_current, remote.rel_path, remote.blob_sha):
+            return True
+
+        data = await self.download_file_async(
+            session, venue, remote.split, remote.data_type, remote.paper_id, raw=True
+        )
+        if not isinstance(data, bytes):
+            errors.append(f"Failed to download {remote.rel_path}")
+            return False
+        if git_blob_sha(data) != remote.blob_sha:
+            errors.append(f"Checksum mismatch for {remote.rel_path}")
+            return False
+
+        local_file = manifest.venue_dir / remote.rel_path
+        await asyncio.to_thread(self._write_atomic, local_file, data)
+        manifest.record(
+            remote.rel_path,
+            ManifestEntry(
+                paper_id=remote.paper_id,
+                split=remote.split,
+                data_type=remote.data_type,
+                size=len(data),
+                blob_sha=remote.blob_sha,
+            ),
+        )
+        logger.info(f"Synced {venue}/{remote.rel_path}")
+        return True
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """Write bytes via a temporary file so partial files never appear."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.part")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+
+    def sync_venue(
+        self,
+        venue: str,
+        max_papers: int | None = None,
+    ) -> dict[str, DownloadResult]:
+        """Incrementally sync a venue against its local manifest.
+
+        Synchronous wrapper around sync_venue_async.
+
+        Args:
+            venue: Conference venue.
+            max_papers: Maximum number of papers to sync per split.
+
+        Returns:
+            DownloadResult per configured split.
+        """
+        return _run_blocking(self.sync_venue_async(venue, max_papers))
+
+    async def sync_venue_async(
+        self,
+        venue: str,
+        max_papers: int | None = None,
+    ) -> dict[str, DownloadResult]:
+        """Incrementally sync a venue against its local manifest.
+
+        Discovers all files of the venue in one recursive git tree listing and
+        fetches only files that are missing locally or whose blob SHA changed.
+        The manifest is flushed periodically and on exit, so an interrupted
+        sync resumes where it stopped.
+
+        Args:
+            venue: Conference venue.
+            max_papers: Maximum number of papers to sync per split.
+
+        Returns:
+            DownloadResult per configured split.
+        """
+        max_papers = max_papers or self.config.max_papers_per_query
+        remote_files = await asyncio.to_thread(self._discover_venue_tree, venue)
+        manifest = DatasetManifest(self.cache_dir, venue)
+        results: dict[str, DownloadResult] = {}
+
+        limits = Limits(
+            max_connections=self.config.max_concurrent_downloads,
+            max_keepalive_connections=self.config.max_concurrent_downloads,
+        )
+        async with AsyncClient(
+            headers=self._headers, limits=limits, timeout=self.config.download_timeout
+        ) as client:
+            session = _DownloadSession(
+                client=client,
+                max_concurrency=self.config.max_concurrent_downloads,
+                max_per_host=self.config.max_connections_per_host,
+            )
+            completed = 0
+
+            async def sync_and_flush(remote: RemoteFile, errors: list[str]) -> bool:
+                nonlocal completed
+                ok = await self._sync_file(session, manifest, venue, remote, errors)
+                completed += 1
+                if completed % _MANIFEST_FLUSH_INTERVAL == 0:
+                    await asyncio.to_thread(manifest.save)
+                return ok
+
+            try:
+                for split in self.config.splits:
+                    results[split] = await self._sync_split(
+                        venue, split, remote_files, max_papers, sync_and_flush
+                    )
+            finally:
+                await asyncio.to_thread(manifest.save)
+
+        return results
+
+    async def _sync_split(
+        self,
+        venue: str,
+        split: str,
+        remote_files: list[RemoteFile],
+        max_papers: int,
+        sync_file: Callable[[RemoteFile, list[str]], Awaitable[bool]],
+    ) -> DownloadResult:
+        """Sync the selected papers of one split and refresh its index and pack.
+
+        Args:
+            venue: Conference venue.
+            split: Data split.
+            remote_files: All remote files of the venue.
+            max_papers: Maximum number of papers to sync.
+            sync_file: Coroutine function syncing one file.
+
+        Returns:
+            DownloadResult for the split.
+        """
+        base_cache_path = self.cache_dir / venue / split
+        paper_ids = sorted(
+            {f.paper_id for f in remote_files if f.split == split and f.data_type == "reviews"}
+        )[:max_papers]
 
-        for data_type in data_types:
-            success = self._download_single_data_type(
-                venue, split, data_type, paper_id, base_cache_path, errors
+        if not paper_ids:
+            error_msg = f"No review files discovered for {venue}/{split}"
+            logger.error(error_msg)
+            return DownloadResult(
+                success=False,
+                cache_path=str(base_cache_path),
+                papers_downloaded=0,
+                error_message=error_msg,
             )
-            if success and not paper_downloaded:
-                paper_downloaded = True
 
-        return paper_downloaded
+        selected = set(paper_ids)
+        files = [f for f in remote_files if f.split == split and f.paper_id in selected]
+        errors: list[str] = []
+        outcomes = await asyncio.gather(*(sync_file(f, errors) for f in files))
+        present = {f.paper_id for f, ok in zip(files, outcomes, strict=True) if ok}
+
+        await asyncio.to_thread(self._finalize_venue_split, venue, split)
+
+        logger.info(
+            f"{venue}/{split}: {len(present)} of {len(paper_ids)} papers present, "
+            f"{len(errors)} errors"
+        )
+        success = len(present) > 0
+        return DownloadResult(
+            success=success,
+            cache_path=str(base_cache_path),
+            papers_downloaded=len(present),
+            error_message=None if success else "; ".join(errors[:5]),
+        )
+
+    def _finalize_venue_split(self, venue: str, split: str) -> None:
+        """Refresh the paper index, review pack, body text and search index after a download.
+
+        Args:
+            venue: Conference venue.
+            split: Data split.
+        """
+        self._update_paper_index(venue, split)
+        split_dir = self.cache_dir / venue / split
+        if (split_dir / "reviews").is_dir():
+            write_review_pack(split_dir)
+        write_body_text_store(split_dir)
+        search_index = get_paper_search_index(self.cache_dir)
+        # Reason: Only keep an existing search index current; a first build is left
+        # to the first search so downloads without search don't pay for it.
+        if len(search_index) or search_index.path.exists():
+            loader = PeerReadLoader(self.config)
+            loader.cache_dir = self.cache_dir
+            search_index.refresh(loader)
 
     def download_venue_split(
         self,
@@ -537,6 +1109,30 @@ class PeerReadDownloader:
     ) -> DownloadResult:
         """Download all files for a venue/split combination across all data types.
 
+        Synchronous wrapper around download_venue_split_async.
+
+        Args:
+            venue: Conference venue.
+            split: Data split.
+            max_papers: Maximum number of papers to download.
+
+        Returns:
+            DownloadResult with download statistics.
+        """
+        return _run_blocking(self.download_venue_split_async(venue, split, max_papers))
+
+    async def download_venue_split_async(
+        self,
+        venue: str,
+        split: str,
+        max_papers: int | None = None,
+    ) -> DownloadResult:
+        """Download all files for a venue/split concurrently.
+
+        All papers and data types are fetched through one pooled AsyncClient,
+        bounded by config.max_concurrent_downloads overall and
+        config.max_connections_per_host per host.
+
         Args:
             venue: Conference venue.
             split: Data split.
@@ -546,7 +1142,9 @@ class PeerReadDownloader:
             DownloadResult with download statistics.
         """
         base_cache_path = self.cache_dir / venue / split
-        available_paper_ids = self._discover_available_files(venue, split, "reviews")
+        available_paper_ids = await asyncio.to_thread(
+            self._discover_available_files, venue, split, "reviews"
+        )
 
         if not available_paper_ids:
             error_msg = f"No review files discovered for {venue}/{split}"
@@ -565,12 +1163,30 @@ class PeerReadDownloader:
             f"{len(available_paper_ids)} available papers across all data types"
         )
 
-        downloaded = 0
         errors: list[str] = []
+        limits = Limits(
+            max_connections=self.config.max_concurrent_downloads,
+            max_keepalive_connections=self.config.max_concurrent_downloads,
+        )
+        async with AsyncClient(
+            headers=self._headers, limits=limits, timeout=self.config.download_timeout
+        ) as client:
+            session = _DownloadSession(
+                client=client,
+                max_concurrency=self.config.max_concurrent_downloads,
+                max_per_host=self.config.max_connections_per_host,
+            )
+            results = await asyncio.gather(
+                *(
+                    self._download_paper_all_types(
+                        session, venue, split, paper_id, base_cache_path, errors
+                    )
+                    for paper_id in paper_ids_to_download
+                )
+            )
+        downloaded = sum(results)
 
-        for paper_id in paper_ids_to_download:
-            if self._download_paper_all_types(venue, split, paper_id, base_cache_path, errors):
-                downloaded += 1
+        await asyncio.to_thread(self._finalize_venue_split, venue, split)
 
         success = downloaded > 0
         error_message = None if success else "; ".join(errors[:5])
@@ -595,6 +1211,32 @@ class PeerReadLoader:
         self.config = config or load_peerread_config()
         # Resolve cache directory relative to project root
         self.cache_dir = resolve_project_path(self.config.cache_directory)
+        self._index: PaperIndex | None = None
+
+    @property
+    def index(self) -> PaperIndex:
+        """Paper-location index for the current cache directory.
+
+        Shared by all loaders of the same cache directory and configuration.
+        Built from disk and persisted on first use if no index file exists.
+        """
+        if self._index is None or self._index.cache_dir != self.cache_dir:
+            self._index = shared_paper_index(self.config, self.cache_dir)
+            if not self._index.exists() and self.cache_dir.exists():
+                logger.info(f"Building PeerRead paper index in {self.cache_dir}")
+                self._index.rebuild()
+                self._index.save()
+        return self._index
+
+    def _refresh_index_for(self, venue: str, split: str) -> None:
+        """Re-index a venue/split after a lookup found files the index missed.
+
+        Args:
+            venue: Conference venue.
+            split: Data split.
+        """
+        self.index.scan_split(venue, split)
+        self.index.save()
 
     def _extract_text_from_parsed_data(self, parsed_data: dict[str, Any]) -> str:
         """Extract text content from parsed PDF data.
@@ -605,18 +1247,17 @@ class PeerReadLoader:
         Returns:
             Concatenated text from all sections.
         """
-        full_text: list[str] = []
-        sections = parsed_data.get("metadata", {}).get("sections", [])
-        for section in sections:
-            if "text" in section:
-                full_text.append(section["text"])
-        return "\n".join(full_text).strip()
+        return extract_body_sections(parsed_data)[0]
 
-    def _load_parsed_file(self, parsed_file: Path) -> str | None:
-        """Load and parse a single parsed PDF file.
+    def _extract_to_body_store(
+        self, parsed_file: Path, store: BodyTextStore, paper_id: str
+    ) -> str | None:
+        """Parse a parsed PDF file once and persist its body text and sections.
 
         Args:
             parsed_file: Path to parsed PDF file.
+            store: Body text store of the file's venue/split.
+            paper_id: Paper identifier.
 
         Returns:
             Extracted text content, or None if loading fails.
@@ -624,11 +1265,117 @@ class PeerReadLoader:
         try:
             with open(parsed_file, encoding="utf-8") as f:
                 parsed_data = load(f)
-            return self._extract_text_from_parsed_data(parsed_data)
+            body, sections = extract_body_sections(parsed_data)
         except Exception as e:
             logger.warning(f"Failed to load/parse {parsed_file}: {e}")
             return None
 
+        try:
+            store.save(paper_id, body, sections)
+        except OSError as e:
+            # Reason: A read-only cache still serves text, just without the derived store.
+            logger.debug(f"Could not store body text for {paper_id}: {e}")
+        return body
+
+    def _load_parsed_file(self, parsed_file: Path) -> str | None:
+        """Load the body text of a single parsed PDF file.
+
+        Text is served from the process-wide paper cache while the file is
+        unchanged, then from the pre-extracted body text store, and only parsed
+        from the full JSON (populating the store) when neither is available.
+
+        Args:
+            parsed_file: Path to parsed PDF file.
+
+        Returns:
+            Extracted text content, or None if loading fails.
+        """
+        cache = get_paper_cache()
+        cached_text: str | None = cache.get("text", parsed_file)
+        if cached_text is not None:
+            return cached_text
+
+        store, paper_id = BodyTextStore.for_parsed_file(parsed_file)
+        text = store.read_text(paper_id) if store.is_fresh(paper_id, parsed_file) else None
+        if text is None:
+            text = self._extract_to_body_store(parsed_file, store, paper_id)
+        if text is not None:
+            cache.put("text", parsed_file, text)
+        return text
+
+    def _parsed_pdf_candidates(self, paper_id: str) -> list[Path]:
+        """Get parsed PDF files for a paper, in lookup priority order.
+
+        Args:
+            paper_id: Paper identifier.
+
+        Returns:
+            Indexed parsed PDF paths, or the first match per venue/split on disk.
+        """
+        indexed_paths = self.index.get_paths(paper_id, "parsed_pdfs")
+        if indexed_paths is not None:
+            return indexed_paths
+
+        candidates: list[Path] = []
+        for venue in self.config.venues:
+            for split in self.config.splits:
+                parsed_files = sorted(
+                    (self.cache_dir / venue / split / "parsed_pdfs").glob(f"{paper_id}.pdf.json"),
+                    reverse=True,
+                )
+                candidates.extend(parsed_files[:1])
+        return candidates
+
+    def _fresh_body_store(self, paper_id: str) -> BodyTextStore | None:
+        """Get an up-to-date body text store holding a paper, extracting it if needed.
+
+        Args:
+            paper_id: Paper identifier.
+
+        Returns:
+            Store containing the paper's body and sections, or None if not available.
+        """
+        for parsed_file in self._parsed_pdf_candidates(paper_id):
+            store, _ = BodyTextStore.for_parsed_file(parsed_file)
+            if store.is_fresh(paper_id, parsed_file):
+                return store
+            if self._extract_to_body_store(parsed_file, store, paper_id) is not None:
+                if store.is_fresh(paper_id, parsed_file):
+                    return store
+        return None
+
+    def get_paper_sections(self, paper_id: str) -> list[PaperSection] | None:
+        """Get the section outline of a paper's parsed PDF body.
+
+        Args:
+            paper_id: Paper identifier.
+
+        Returns:
+            Sections (heading, byte boundaries, character count) in document
+            order, or None if no parsed PDF is available.
+        """
+        store = self._fresh_body_store(paper_id)
+        return store.read_sections(paper_id) if store is not None else None
+
+    def load_parsed_pdf_sections(self, paper_id: str, indices: list[int]) -> list[str] | None:
+        """Load selected sections of a paper's body text.
+
+        Reads only the requested byte ranges from the body text store instead of
+        the whole body. Use ``get_paper_sections`` to choose indices.
+
+        Args:
+            paper_id: Paper identifier.
+            indices: Section indices in ``get_paper_sections`` order.
+
+        Returns:
+            Section texts in the requested order, or None if no parsed PDF is available.
+
+        Raises:
+            IndexError: If an index is out of range.
+        """
+        store = self._fresh_body_store(paper_id)
+        return store.read_section_texts(paper_id, indices) if store is not None else None
+
     def _find_parsed_pdf_in_split(
         self,
         venue: str,
@@ -667,10 +1414,20 @@ class PeerReadLoader:
         Returns:
             str: The extracted text content, or None if not found/parsed.
         """
+        indexed_paths = self.index.get_paths(paper_id, "parsed_pdfs")
+        if indexed_paths is not None:
+            for parsed_file in indexed_paths:
+                content = self._load_parsed_file(parsed_file)
+                if content:
+                    return content
+            return None
+
+        # Reason: Index miss or stale entry — probe all venues/splits, then heal the index.
         for venue in self.config.venues:
             for split in self.config.splits:
                 content = self._find_parsed_pdf_in_split(venue, split, paper_id)
                 if content:
+                    self._refresh_index_for(venue, split)
                     return content
         return None
 
@@ -683,10 +1440,15 @@ class PeerReadLoader:
         Returns:
             str: The absolute path to the PDF file, or None if not found.
         """
+        indexed_paths = self.index.get_paths(paper_id, "pdfs")
+        if indexed_paths is not None:
+            return str(indexed_paths[0]) if indexed_paths else None
+
         for venue in self.config.venues:
             for split in self.config.splits:
                 pdf_path = self.cache_dir / venue / split / "pdfs" / f"{paper_id}.pdf"
                 if pdf_path.exists():
+                    self._refresh_index_for(venue, split)
                     return str(pdf_path)
         return None
 
@@ -701,6 +1463,55 @@ class PeerReadLoader:
         """
         return PeerReadReview.model_validate(review_data)
 
+    def _validate_paper(
+        self,
+        paper_data: dict[str, Any],
+        skipped_ids: list[str],
+    ) -> PeerReadPaper | None:
+        """Validate and convert a single paper dict to a Pydantic model.
+
+        Args:
+            paper_data: Raw paper dictionary.
+            skipped_ids: List to append the ID of a non-compliant paper to.
+
+        Returns:
+            Validated PeerReadPaper, or None if invalid or non-compliant.
+        """
+        try:
+            # Convert from PeerRead format to our model format
+            paper_id = str(paper_data.get("id", "unknown"))
+            reviews: list[PeerReadReview] = [
+                self._create_review_from_dict(r) for r in paper_data.get("reviews", [])
+            ]
+
+            paper = PeerReadPaper(
+                paper_id=paper_id,
+                title=paper_data["title"],
+                abstract=paper_data["abstract"],
+                reviews=reviews,
+                review_histories=[" ".join(map(str, h)) for h in paper_data.get("histories", [])],
+            )
+
+            # Exclude papers where any review is missing required score fields
+            if reviews and not all(r.is_compliant() for r in reviews):
+                skipped_ids.append(paper_id)
+                return None
+
+            return paper
+
+        except Exception as e:
+            logger.warning(f"Failed to validate paper {paper_data.get('id', 'unknown')}: {e}")
+            return None
+
+    @staticmethod
+    def _log_skipped_papers(skipped_ids: list[str]) -> None:
+        """Log one aggregated summary of non-compliant papers."""
+        if skipped_ids:
+            logger.info(
+                f"Skipping {len(skipped_ids)} non-compliant papers "
+                f"(missing required score fields): {', '.join(skipped_ids)}"
+            )
+
     def _validate_papers(
         self,
         papers_data: list[dict[str, Any]],
@@ -717,40 +1528,11 @@ class PeerReadLoader:
         skipped_ids: list[str] = []
 
         for paper_data in papers_data:
-            try:
-                # Convert from PeerRead format to our model format
-                paper_id = str(paper_data.get("id", "unknown"))
-                reviews: list[PeerReadReview] = [
-                    self._create_review_from_dict(r) for r in paper_data.get("reviews", [])
-                ]
-
-                paper = PeerReadPaper(
-                    paper_id=paper_id,
-                    title=paper_data["title"],
-                    abstract=paper_data["abstract"],
-                    reviews=reviews,
-                    review_histories=[
-                        " ".join(map(str, h)) for h in paper_data.get("histories", [])
-                    ],
-                )
-
-                # Exclude papers where any review is missing required score fields
-                if reviews and not all(r.is_compliant() for r in reviews):
-                    skipped_ids.append(paper_id)
-                    continue
-
+            paper = self._validate_paper(paper_data, skipped_ids)
+            if paper is not None:
                 validated_papers.append(paper)
 
-            except Exception as e:
-                logger.warning(f"Failed to validate paper {paper_data.get('id', 'unknown')}: {e}")
-                continue
-
-        if skipped_ids:
-            logger.info(
-                f"Skipping {len(skipped_ids)} non-compliant papers "
-                f"(missing required score fields): {', '.join(skipped_ids)}"
-            )
-
+        self._log_skipped_papers(skipped_ids)
         return validated_papers
 
     def load_papers(
@@ -760,6 +1542,9 @@ class PeerReadLoader:
     ) -> list[PeerReadPaper]:
         """Load papers from cached data or download if needed.
 
+        Reads the packed corpus file of the venue/split when a fresh one exists,
+        otherwise falls back to the loose ``reviews/*.json`` files.
+
         Args:
             venue: Conference venue.
             split: Data split.
@@ -770,6 +1555,24 @@ class PeerReadLoader:
         Raises:
             FileNotFoundError: If cache directory doesn't exist and download fails.
         """
+        return self._validate_papers(list(self._iter_raw_records(venue, split)))
+
+    def _iter_raw_records(self, venue: str, split: str) -> Iterator[dict[str, Any]]:
+        """Stream raw review records of a venue/split without validation.
+
+        Reads the packed corpus file when a fresh one exists, otherwise the
+        loose ``reviews/*.json`` files, decoding one record at a time.
+
+        Args:
+            venue: Conference venue.
+            split: Data split.
+
+        Yields:
+            Raw paper dictionaries in file order.
+
+        Raises:
+            FileNotFoundError: If the venue/split has not been downloaded.
+        """
         cache_path = self.cache_dir / venue / split
 
         if not cache_path.exists():
@@ -782,6 +1585,12 @@ class PeerReadLoader:
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
 
+        pack = ReviewPack.open_if_fresh(cache_path)
+        if pack is not None:
+            with pack:
+                yield from pack.iter_records()
+            return
+
         # Load all cached papers from reviews directory
         reviews_path = cache_path / "reviews"
 
@@ -795,20 +1604,74 @@ class PeerReadLoader:
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
 
-        papers_data: list[dict[str, Any]] = []
-        for json_file in reviews_path.glob("*.json"):
+        for json_file in sorted(reviews_path.glob("*.json")):
             try:
                 with open(json_file, encoding="utf-8") as f:
-                    papers_data.append(load(f))
+                    record = load(f)
             except Exception as e:
                 logger.warning(f"Failed to load {json_file}: {e}")
                 continue
+            yield record
+
+    def iter_papers(
+        self,
+        venue: str | None = None,
+        split: str | None = None,
+        min_reviews: int = 0,
+        limit: int | None = None,
+        raw_filter: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> Iterator[PeerReadPaper]:
+        """Stream validated papers, filtering raw records before validation.
+
+        Records are decoded one at a time; cheap predicates (review count and
+        ``raw_filter``) run on the raw dict so rejected papers never pay for
+        Pydantic validation, and iteration stops as soon as ``limit`` papers
+        have been yielded. Venue/splits that are not downloaded are skipped.
 
-        return self._validate_papers(papers_data)
+        Args:
+            venue: Filter by venue (None for all configured venues).
+            split: Filter by split (None for all configured splits).
+            min_reviews: Minimum number of reviews required.
+            limit: Maximum number of papers to yield (None or 0 for no limit).
+            raw_filter: Optional predicate on the raw paper dict.
+
+        Yields:
+            Validated PeerReadPaper models in venue/split/file order.
+        """
+        venues_to_search = [venue] if venue else self.config.venues
+        splits_to_search = [split] if split else self.config.splits
+        skipped_ids: list[str] = []
+        yielded = 0
+
+        try:
+            for search_venue in venues_to_search:
+                for search_split in splits_to_search:
+                    records = self._iter_raw_records(search_venue, search_split)
+                    try:
+                        for record in records:
+                            if len(record.get("reviews", [])) < min_reviews:
+                                continue
+                            if raw_filter is not None and not raw_filter(record):
+                                continue
+                            paper = self._validate_paper(record, skipped_ids)
+                            if paper is None:
+                                continue
+                            yield paper
+                            yielded += 1
+                            if limit and yielded >= limit:
+                                return
+                    except FileNotFoundError as e:
+                        logger.warning(f"Failed to load {search_venue}/{search_split}: {e}")
+                        continue
+        finally:
+            self._log_skipped_papers(skipped_ids)
 
     def _load_paper_from_path(self, cache_path: Path, paper_id: str) -> PeerReadPaper | None:
         """Load and validate a paper from a specific cache path.
 
+        Validated papers are served from the process-wide paper cache while the
+        file is unchanged.
+
         Args:
             cache_path: Path to the cached paper JSON file.
             paper_id: Paper identifier for logging.
@@ -816,15 +1679,59 @@ class PeerReadLoader:
         Returns:
             Validated PeerReadPaper, or None if loading fails.
         """
+        cache = get_paper_cache()
+        cached_paper: PeerReadPaper | None = cache.get("paper", cache_path)
+        if cached_paper is not None:
+            return cached_paper
+
         try:
             with open(cache_path, encoding="utf-8") as f:
                 data: dict[str, Any] = load(f)
             papers = self._validate_papers([data])
-            return papers[0] if papers else None
+            if not papers:
+                return None
+            cache.put("paper", cache_path, papers[0])
+            return papers[0]
         except Exception as e:
             logger.warning(f"Failed to load paper {paper_id}: {e}")
             return None
 
+    def _get_paper_from_packs(self, paper_id: str) -> PeerReadPaper | None:
+        """Look up a paper in packed venue/split corpus files.
+
+        Args:
+            paper_id: Paper identifier.
+
+        Returns:
+            Validated PeerReadPaper from the first pack containing it, or None.
+        """
+        cache = get_paper_cache()
+        for venue in self.config.venues:
+            for split in self.config.splits:
+                split_dir = self.cache_dir / venue / split
+                pack_file = split_dir / PEERREAD_PACK_FILE
+                if not pack_file.exists():
+                    continue
+                # Reason: The pack file is unchanged when only loose reviews change, so
+                # key its entries on the loose reviews dir too; a stale pack then misses.
+                member = f"{paper_id}@{reviews_dir_mtime(split_dir)}"
+                cached_paper: PeerReadPaper | None = cache.get("paper", pack_file, member)
+                if cached_paper is not None:
+                    return cached_paper
+
+                pack = ReviewPack.open_if_fresh(split_dir)
+                if pack is None:
+                    continue
+                with pack:
+                    record = pack.get_record(paper_id)
+                if record is None:
+                    continue
+                papers = self._validate_papers([record])
+                if papers:
+                    cache.put("paper", pack_file, papers[0], member=member)
+                    return papers[0]
+        return None
+
     def get_paper_by_id(self, paper_id: str) -> PeerReadPaper | None:
         """Get a specific paper by ID.
 
@@ -834,12 +1741,25 @@ class PeerReadLoader:
         Returns:
             PeerReadPaper if found, None otherwise.
         """
+        indexed_paths = self.index.get_paths(paper_id, "reviews")
+        if indexed_paths is not None:
+            for cache_path in indexed_paths:
+                paper = self._load_paper_from_path(cache_path, paper_id)
+                if paper:
+                    return paper
+            return None
+
+        packed_paper = self._get_paper_from_packs(paper_id)
+        if packed_paper is not None:
+            return packed_paper
+
         for venue in self.config.venues:
             for split in self.config.splits:
                 cache_path = self.cache_dir / venue / split / "reviews" / f"{paper_id}.json"
                 if not cache_path.exists():
                     continue
 
+                self._refresh_index_for(venue, split)
                 paper = self._load_paper_from_path(cache_path, paper_id)
                 if paper:
                     return paper
@@ -862,23 +1782,4 @@ class PeerReadLoader:
         Returns:
             List of filtered PeerReadPaper models.
         """
-        all_papers: list[PeerReadPaper] = []
-        venues_to_search = [venue] if venue else self.config.venues
-
-        for search_venue in venues_to_search:
-            for split in self.config.splits:
-                try:
-                    papers = self.load_papers(search_venue, split)
-                    all_papers.extend(papers)
-                except Exception as e:
-                    logger.warning(f"Failed to load {search_venue}/{split}: {e}")
-                    continue
-
-        # Apply filters
-        filtered_papers = [paper for paper in all_papers if len(paper.reviews) >= min_reviews]
-
-        # Apply limit
-        if limit:
-            filtered_papers = filtered_papers[:limit]
-
-        return filtered_papers
+        return list(self.iter_papers(venue=venue, min_reviews=min_reviews, limit=limit))
@@ -0,0 +1,128 @@
+"""Process-wide LRU cache for parsed PeerRead data.
+
+Caches validated ``PeerReadPaper`` models and extracted body text across all
+``PeerReadLoader`` instances. Entries are keyed by source file path (plus an
+optional member key for records inside a packed file) and tagged with the
+file's mtime and size, so editing or replacing a file invalidates its entries.
+
+Example:
+    >>> from app.data_utils.paper_cache import get_paper_cache
+    >>> cache = get_paper_cache()
+    >>> paper = cache.get("paper", Path("reviews/104.json"))
+    >>> print(cache.stats())
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+_DEFAULT_MAX_ENTRIES = 512
+
+_FileIdentity = tuple[int, int]
+
+
+class PaperCache:
+    """Thread-safe bounded LRU cache keyed by file identity.
+
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = _DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of entries before least-recently-used eviction.
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str, str], tuple[_FileIdentity, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _identity(path: Path) -> _FileIdentity | None:
+        """Get (mtime_ns, size) of a file, or None if it cannot be stat'ed."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self, kind: str, path: Path, member: str = "") -> Any | None:
+        """Get a cached value if the source file is unchanged.
+
+        Args:
+            kind: Value kind, e.g. 'paper' or 'text'.
+            path: Source file the value was derived from.
+            member: Optional key of a record inside the file.
+
+        Returns:
+            Cached value, or None on miss or if the file changed.
+        """
+        key = (kind, str(path), member)
+        identity = self._identity(path)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and identity is not None and cached[0] == identity:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+            if cached is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, kind: str, path: Path, value: Any, member: str = "") -> None:
+        """Store a value derived from a source file.
+
+        Args:
+            kind: Value kind, e.g. 'paper' or 'text'.
+            path: Source file the value was derived from.
+            value: Value to cache.
+            member: Optional key of a record inside the file.
+        """
+        identity = self._identity(path)
+        if identity is None:
+            return
+        key = (kind, str(path), member)
+        with self._lock:
+            self._entries[key] = (identity, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Global singleton instance
+_global_cache: PaperCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_paper_cache() -> PaperCache:
+    """Get or create the global PaperCache singleton.
+
+    Returns:
+        The process-wide PaperCache instance.
+    """
+    global _global_cache
+    with _cache_lock:
+        if _global_cache is None:
+            _global_cache = PaperCache()
+        return _global_cache
@@ -0,0 +1,274 @@
+"""
+Persistent paper-location index for the PeerRead cache.
+
+Maps each paper ID to the venue/split directories and per-data-type files it
+was found in, so lookups by ID touch one known path instead of probing every
+configured venue × split combination on disk. The index is stored as a single
+JSON file in the cache root, refreshed by the downloader after each venue/split
+and rebuilt lazily by the loader when missing or stale. One instance per cache
+directory is shared process-wide and re-reads the file only when it changes.
+"""
+
+import os
+import threading
+from json import JSONDecodeError, dump, load
+from pathlib import Path
+
+from app.config.config_app import PEERREAD_INDEX_FILE
+from app.data_models.peerread_models import PaperLocation
+from app.utils.log import logger
+
+_INDEX_VERSION = 1
+
+
+class PaperIndex:
+    """Paper ID → on-disk location index backed by a JSON file.
+
+    A paper ID can exist in several venue/split directories (PeerRead IDs are
+    only unique per venue), so each ID maps to a list of locations kept in
+    config order. This preserves the first-match semantics of the original
+    venue × split probe loop.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        venues: list[str],
+        splits: list[str],
+        extensions: dict[str, str],
+    ):
+        """Initialize index for a cache directory.
+
+        Args:
+            cache_dir: PeerRead cache root directory.
+            venues: Configured venues, in lookup priority order.
+            splits: Configured splits, in lookup priority order.
+            extensions: Mapping of data type to file extension, e.g.
+                {'reviews': '.json', 'parsed_pdfs': '.pdf.json'}.
+        """
+        self.cache_dir = cache_dir
+        self.index_file = cache_dir / PEERREAD_INDEX_FILE
+        self.venues = list(venues)
+        self.splits = list(splits)
+        # Reason: Match longest extension first so '104.pdf.json' is not read as '104.pdf'.
+        self.extensions = dict(sorted(extensions.items(), key=lambda kv: -len(kv[1])))
+        self._locations: dict[str, list[PaperLocation]] = {}
+        self._loaded_mtime: float | None = None
+        self._lock = threading.Lock()
+
+    def _order_key(self, location: PaperLocation) -> tuple[int, int]:
+        """Sort key placing locations in configured venue × split order."""
+        venue_rank = (
+            self.venues.index(location.venue) if location.venue in self.venues else len(self.venues)
+        )
+        split_rank = (
+            self.splits.index(location.split) if location.split in self.splits else len(self.splits)
+        )
+        return venue_rank, split_rank
+
+    def _load_if_changed(self) -> None:
+        """Load the index file if it exists and changed since the last load."""
+        try:
+            mtime = self.index_file.stat().st_mtime
+        except OSError:
+            return
+        if mtime == self._loaded_mtime:
+            return
+
+        try:
+            with open(self.index_file, encoding="utf-8") as f:
+                data = load(f)
+            if data.get("version") != _INDEX_VERSION:
+                logger.info(f"Ignoring paper index with unknown version: {self.index_file}")
+                return
+            self._locations = {
+                paper_id: [PaperLocation.model_validate(loc) for loc in locs]
+                for paper_id, locs in data.get("papers", {}).items()
+            }
+            self._loaded_mtime = mtime
+        except (OSError, JSONDecodeError, ValueError) as e:
+            logger.warning(f"Failed to load paper index {self.index_file}: {e}")
+
+    def exists(self) -> bool:
+        """Check whether a persisted index file exists."""
+        return self.index_file.exists()
+
+    def __len__(self) -> int:
+        """Number of indexed paper IDs."""
+        with self._lock:
+            self._load_if_changed()
+            return len(self._locations)
+
+    def paper_ids(self) -> list[str]:
+        """Get all indexed paper IDs."""
+        with self._lock:
+            self._load_if_changed()
+            return list(self._locations)
+
+    def lookup(self, paper_id: str) -> list[PaperLocation]:
+        """Get all indexed locations of a paper in priority order.
+
+        Args:
+            paper_id: Paper identifier.
+
+        Returns:
+            List of locations, empty if the paper is not indexed.
+        """
+        with self._lock:
+            self._load_if_changed()
+            return list(self._locations.get(paper_id, []))
+
+    def get_paths(self, paper_id: str, data_type: str) -> list[Path] | None:
+        """Get existing file paths of a data type for a paper.
+
+        Args:
+            paper_id: Paper identifier.
+            data_type: Type of data ('reviews', 'parsed_pdfs', 'pdfs').
+
+        Returns:
+            Absolute paths in priority order (possibly empty if the paper is
+            indexed without that data type), or None if the paper is not
+            indexed or any indexed path no longer exists (stale entry).
+        """
+        locations = self.lookup(paper_id)
+        if not locations:
+            return None
+
+        paths: list[Path] = []
+        for location in locations:
+            rel_path = location.files.get(data_type)
+            if rel_path is None:
+                continue
+            path = self.cache_dir / rel_path
+            if not path.exists():
+                logger.debug(f"Stale paper index entry for {paper_id}: {rel_path}")
+                return None
+            paths.append(path)
+        return paths
+
+    def scan_split(self, venue: str, split: str) -> int:
+        """Re-index one venue/split directory from disk.
+
+        Uses one directory listing per data type instead of per-paper probes.
+
+        Args:
+            venue: Conference venue.
+            split: Data split.
+
+        Returns:
+            Number of papers indexed for the venue/split.
+        """
+        split_path = self.cache_dir / venue / split
+        found: dict[str, dict[str, str]] = {}
+
+        for data_type, extension in self.extensions.items():
+            type_path = split_path / data_type
+            if not type_path.is_dir():
+                continue
+            for entry in os.scandir(type_path):
+                if not entry.is_file() or not entry.name.endswith(extension):
+                    continue
+                paper_id = entry.name[: -len(extension)]
+                found.setdefault(paper_id, {})[data_type] = (
+                    f"{venue}/{split}/{data_type}/{entry.name}"
+                )
+
+        with self._lock:
+            self._load_if_changed()
+            # Drop previous entries for this venue/split, then merge fresh ones.
+            for paper_id in list(self._locations):
+                kept = [
+                    loc
+                    for loc in self._locations[paper_id]
+                    if (loc.venue, loc.split) != (venue, split)
+                ]
+                if kept:
+                    self._locations[paper_id] = kept
+                else:
+                    del self._locations[paper_id]
+
+            for paper_id, files in found.items():
+                locations = self._locations.setdefault(paper_id, [])
+                locations.append(PaperLocation(venue=venue, split=split, files=files))
+                locations.sort(key=self._order_key)
+
+        return len(found)
+
+    def rebuild(self) -> int:
+        """Rebuild the index from scratch for all configured venues and splits.
+
+        Returns:
+            Total number of indexed paper IDs.
+        """
+        with self._lock:
+            self._locations = {}
+            # Reason: Mark the on-disk file as loaded so scan_split does not merge it back in.
+            try:
+                self._loaded_mtime = self.index_file.stat().st_mtime
+            except OSError:
+                self._loaded_mtime = None
+        for venue in self.venues:
+            for split in self.splits:
+                self.scan_split(venue, split)
+        return len(self._locations)
+
+    def save(self) -> None:
+        """Persist the index atomically to the cache root.
+
+        Does nothing if the cache directory does not exist.
+        """
+        if not self.cache_dir.exists():
+            return
+
+        with self._lock:
+            data = {
+                "version": _INDEX_VERSION,
+                "papers": {
+                    paper_id: [loc.model_dump() for loc in locs]
+                    for paper_id, locs in self._locations.items()
+                },
+            }
+            tmp_file = self.index_file.with_suffix(".tmp")
+            try:
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    dump(data, f, separators=(",", ":"))
+                os.replace(tmp_file, self.index_file)
+                self._loaded_mtime = self.index_file.stat().st_mtime
+            except OSError as e:
+                logger.warning(f"Failed to save paper index {self.index_file}: {e}")
+
+
+# Global per-cache-directory instances
+_global_indexes: dict[
+    tuple[Path, tuple[str, ...], tuple[str, ...], tuple[tuple[str, str], ...]], PaperIndex
+] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_paper_index(
+    cache_dir: Path,
+    venues: list[str],
+    splits: list[str],
+    extensions: dict[str, str],
+) -> PaperIndex:
+    """Get or create the process-wide paper index for a cache directory.
+
+    The shared instance keeps the parsed locations in memory and reloads the
+    index file only when its mtime changes, so repeated loaders do not re-read
+    and re-validate the whole index on every lookup.
+
+    Args:
+        cache_dir: PeerRead cache root directory.
+        venues: Configured venues, in lookup priority order.
+        splits: Configured splits, in lookup priority order.
+        extensions: Mapping of data type to file extension.
+
+    Returns:
+        Shared PaperIndex instance.
+    """
+    # Reason: Venue/split order decides lookup priority, so it is part of the key.
+    key = (cache_dir, tuple(venues), tuple(splits), tuple(sorted(extensions.items())))
+    with _indexes_lock:
+        if key not in _global_indexes:
+            _global_indexes[key] = PaperIndex(cache_dir, venues, splits, extensions)
+        return _global_indexes[key]
@@ -0,0 +1,344 @@
+"""
+BM25 full-text search over cached PeerRead papers.
+
+Indexes titles, abstracts and parsed PDF bodies of all papers known to the
+loader's paper index. Each document records a fingerprint of its source files
+(mtime and size), so ``update`` only re-tokenizes papers that were added or
+changed. The index is stored as one gzip-compressed JSON file in the cache root
+with a shared term vocabulary and per-paper ``[term_id, tf, ...]`` arrays; the
+inverted postings are rebuilt in memory on first search.
+
+Example:
+    >>> from app.data_utils.paper_search import get_paper_search_index
+    >>> search_index = get_paper_search_index(loader.cache_dir)
+    >>> search_index.refresh(loader)  # update and persist
+    >>> hits = search_index.search("attention machine translation", limit=5)
+"""
+
+import gzip
+import math
+import os
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from json import JSONDecodeError, dump, load
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from app.config.config_app import PEERREAD_SEARCH_INDEX_FILE
+from app.data_models.peerread_models import PaperSearchHit
+from app.utils.log import logger
+
+if TYPE_CHECKING:
+    from app.data_utils.datasets_peerread import PeerReadLoader
+
+_SEARCH_INDEX_VERSION = 1
+_TITLE_WEIGHT = 2
+_SNIPPET_RADIUS = 120
+_FINGERPRINT_TYPES = ("reviews", "parsed_pdfs")
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this "
+    "to was we were which with our can not these their than also".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase search terms, dropping stopwords and single characters.
+
+    Args:
+        text: Text to tokenize.
+
+    Returns:
+        List of terms in text order.
+    """
+    return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in _STOPWORDS]
+
+
+@dataclass
+class _IndexedPaper:
+    """Stored search document of one paper."""
+
+    fingerprint: list[int]
+    title: str
+    abstract: str
+    length: int
+    terms: dict[str, int]
+
+
+def _make_snippet(text: str, query_terms: set[str]) -> str:
+    """Cut a short excerpt of text around the first query term occurrence."""
+    position = 0
+    for match in _TOKEN_RE.finditer(text.lower()):
+        if match.group() in query_terms:
+            position = match.start()
+            break
+    start = max(position - _SNIPPET_RADIUS, 0)
+    end = min(position + _SNIPPET_RADIUS, len(text))
+    snippet = " ".join(text[start:end].split())
+    prefix = "..." if start > 0 else ""
+    suffix = "..." if end < len(text) else ""
+    return f"{prefix}{snippet}{suffix}"
+
+
+class PaperSearchIndex:
+    """Okapi BM25 index over PeerRead titles, abstracts and bodies."""
+
+    def __init__(self, cache_dir: Path, k1: float = 1.5, b: float = 0.75):
+        """Initialize the index of a cache directory, loading it from disk if present.
+
+        Args:
+            cache_dir: PeerRead cache root directory.
+            k1: BM25 term-frequency saturation parameter.
+            b: BM25 document-length normalization parameter.
+        """
+        self.cache_dir = cache_dir
+        self.path = cache_dir / PEERREAD_SEARCH_INDEX_FILE
+        self.k1 = k1
+        self.b = b
+        self._papers: dict[str, _IndexedPaper] = {}
+        self._postings: dict[str, list[tuple[str, int]]] | None = None
+        self._lock = threading.Lock()
+        # Reason: Serializes updates so concurrent first searches tokenize each paper once.
+        self._update_lock = threading.Lock()
+        self._load()
+
+    def __len__(self) -> int:
+        """Number of indexed papers."""
+        return len(self._papers)
+
+    def _load(self) -> None:
+        """Read the persisted index if it exists."""
+        if not self.path.exists():
+            return
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                data = load(f)
+            if data.get("version") != _SEARCH_INDEX_VERSION:
+                logger.info(f"Ignoring search index with unknown version: {self.path}")
+                return
+            vocab: list[str] = data["vocab"]
+            for paper_id, doc in data["papers"].items():
+                flat: list[int] = doc["terms"]
+                self._papers[paper_id] = _IndexedPaper(
+                    fingerprint=doc["fp"],
+                    title=doc["title"],
+                    abstract=doc["abstract"],
+                    length=doc["len"],
+                    terms={vocab[flat[i]]: flat[i + 1] for i in range(0, len(flat), 2)},
+                )
+        except (OSError, EOFError, JSONDecodeError, KeyError, IndexError) as e:
+            logger.warning(f"Failed to load search index {self.path}, starting fresh: {e}")
+            self._papers = {}
+
+    def save(self) -> None:
+        """Persist the index atomically as gzip-compressed JSON."""
+        with self._lock:
+            vocab: dict[str, int] = {}
+            papers: dict[str, dict[str, object]] = {}
+            for paper_id, paper in self._papers.items():
+                flat: list[int] = []
+                for term, tf in paper.terms.items():
+                    flat.extend((vocab.setdefault(term, len(vocab)), tf))
+                papers[paper_id] = {
+                    "fp": paper.fingerprint,
+                    "title": paper.title,
+                    "abstract": paper.abstract,
+                    "len": paper.length,
+                    "terms": flat,
+                }
+        data = {"version": _SEARCH_INDEX_VERSION, "vocab": list(vocab), "papers": papers}
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+
+    def _fingerprint(self, loader: "PeerReadLoader", paper_id: str) -> list[int]:
+        """Get (mtime_ns, size) of a paper's review and parsed PDF files, flattened."""
+        fingerprint: list[int] = []
+        for location in loader.index.lookup(paper_id):
+            for data_type in _FINGERPRINT_TYPES:
+                rel_path = location.files.get(data_type)
+                if rel_path is None:
+                    continue
+                try:
+                    stat = (self.cache_dir / rel_path).stat()
+                except OSError:
+                    continue
+                fingerprint.extend((stat.st_mtime_ns, stat.st_size))
+        return fingerprint
+
+    def update(self, loader: "PeerReadLoader") -> int:
+        """Bring the index up to date with the loader's paper index.
+
+        Papers with unchanged source files are kept as-is; new or changed papers
+        are loaded and tokenized; papers no longer on disk are dropped.
+
+        Args:
+            loader: Loader for the same cache directory.
+
+        Returns:
+            Number of papers (re)indexed.
+        """
+        with self._update_lock:
+            return self._update(loader)
+
+    def _update(self, loader: "PeerReadLoader") -> int:
+        current_ids = loader.index.paper_ids()
+        changed: dict[str, _IndexedPaper] = {}
+        for paper_id in current_ids:
+            fingerprint = self._fingerprint(loader, paper_id)
+            existing = self._papers.get(paper_id)
+            if existing is not None and existing.fingerprint == fingerprint:
+                continue
+            paper = loader.get_paper_by_id(paper_id)
+            if paper is None:
+                continue
+            body = loader.load_parsed_pdf_content(paper_id) or ""
+            tokens = tokenize(paper.title) * _TITLE_WEIGHT
+            tokens += tokenize(paper.abstract) + tokenize(body)
+            changed[paper_id] = _IndexedPaper(
+                fingerprint=fingerprint,
+                title=paper.title,
+                abstract=paper.abstract,
+                length=len(tokens),
+                terms=dict(Counter(tokens)),
+            )
+
+        keep = set(current_ids)
+        with self._lock:
+            # Reason: Copy-on-write so searches can score a snapshot without holding the lock.
+            papers = {pid: paper for pid, paper in self._papers.items() if pid in keep}
+            removed = len(self._papers) - len(papers)
+            papers.update(changed)
+            if changed or removed:
+                self._papers = papers
+                self._postings = None
+
+        logger.info(f"Search index: {len(changed)} papers indexed, {removed} removed")
+        return len(changed)
+
+    def is_stale(self, loader: "PeerReadLoader") -> bool:
+        """Whether any paper was added, removed or changed on disk since it was indexed.
+
+        Compares the stored (mtime, size) fingerprints of each paper's review and
+        parsed PDF files, so edited papers are picked up as well as new ones.
+
+        Args:
+            loader: Loader for the same cache directory.
+
+        Returns:
+            True if the index needs an update.
+        """
+        with self._lock:
+            papers = self._papers
+        current_ids = loader.index.paper_ids()
+        if len(current_ids) != len(papers):
+            return True
+        for paper_id in current_ids:
+            indexed = papers.get(paper_id)
+            if indexed is None or indexed.fingerprint != self._fingerprint(loader, paper_id):
+                return True
+        return False
+
+    def refresh(self, loader: "PeerReadLoader") -> int:
+        """Update the index from the loader and persist it if anything changed.
+
+        Args:
+            loader: Loader for the same cache directory.
+
+        Returns:
+            Number of papers (re)indexed.
+        """
+        size_before = len(self)
+        indexed = self.update(loader)
+        if indexed or len(self) != size_before or not self.path.exists():
+            try:
+                self.save()
+            except OSError as e:
+                logger.warning(f"Could not persist search index: {e}")
+        return indexed
+
+    def _snapshot(
+        self,
+    ) -> tuple[dict[str, _IndexedPaper], dict[str, list[tuple[str, int]]]]:
+        """Get the current papers and their (lazily built) inverted postings.
+
+        Updates replace both instead of mutating them, so the returned pair stays
+        consistent while a concurrent refresh runs.
+        """
+        with self._lock:
+            if self._postings is None:
+                postings: dict[str, list[tuple[str, int]]] = {}
+                for paper_id, paper in self._papers.items():
+                    for term, tf in paper.terms.items():
+                        postings.setdefault(term, []).append((paper_id, tf))
+                self._postings = postings
+            return self._papers, self._postings
+
+    def search(self, query: str, limit: int = 10) -> list[PaperSearchHit]:
+        """Rank papers against a free-text query with BM25.
+
+        Args:
+            query: Free-text query.
+            limit: Maximum number of hits.
+
+        Returns:
+            Hits sorted by descending score; empty if no query term is indexed.
+        """
+        query_terms = set(tokenize(query))
+        if not query_terms:
+            return []
+
+        papers, postings = self._snapshot()
+        total = len(papers)
+        if not total:
+            return []
+        avg_length = sum(p.length for p in papers.values()) / total or 1.0
+
+        scores: dict[str, float] = {}
+        for term in query_terms:
+            matches = postings.get(term)
+            if not matches:
+                continue
+            idf = math.log(1 + (total - len(matches) + 0.5) / (len(matches) + 0.5))
+            for paper_id, tf in matches:
+                norm = self.k1 * (1 - self.b + self.b * papers[paper_id].length / avg_length)
+                scores[paper_id] = scores.get(paper_id, 0.0) + idf * tf * (self.k1 + 1) / (
+                    tf + norm
+                )
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [
+            PaperSearchHit(
+                paper_id=paper_id,
+                title=papers[paper_id].title,
+                score=round(score, 4),
+                snippet=_make_snippet(papers[paper_id].abstract, query_terms),
+            )
+            for paper_id, score in ranked
+        ]
+
+
+# Global per-cache-directory instances
+_global_indexes: dict[Path, PaperSearchIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_paper_search_index(cache_dir: Path) -> PaperSearchIndex:
+    """Get or create the process-wide search index for a cache directory.
+
+    Args:
+        cache_dir: PeerRead cache root directory.
+
+    Returns:
+        Shared PaperSearchIndex instance.
+    """
+    with _indexes_lock:
+        if cache_dir not in _global_indexes:
+            _global_indexes[cache_dir] = PaperSearchIndex(cache_dir)
+        return _global_indexes[cache_dir]
@@ -0,0 +1,184 @@
+"""
+Cached MarkItDown conversion of raw PeerRead PDFs.
+
+Converting a PDF to Markdown costs seconds of CPU, so converted text is stored
+on disk keyed by the SHA-256 of the PDF bytes and the installed MarkItDown
+version. Identical PDFs are converted once regardless of path, and a library
+upgrade naturally starts a fresh cache. A single converter instance is reused
+per process, and ``prewarm_markdown_cache`` converts all uncached raw PDFs of
+the configured venues/splits across a process pool.
+"""
+
+import hashlib
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from markitdown import MarkItDown
+
+from app.config.config_app import PEERREAD_MARKDOWN_CACHE_DIR
+from app.config.peerread_config import PeerReadConfig
+from app.data_utils.datasets_peerread import load_peerread_config
+from app.utils.log import logger
+from app.utils.paths import resolve_project_path
+
+# Global singleton converter, one per process
+_global_converter: MarkItDown | None = None
+_converter_lock = threading.Lock()
+
+
+def get_markdown_converter() -> MarkItDown:
+    """Get or create the process-wide MarkItDown converter.
+
+    Returns:
+        Shared MarkItDown instance.
+    """
+    global _global_converter
+    with _converter_lock:
+        if _global_converter is None:
+            _global_converter = MarkItDown()
+        return _global_converter
+
+
+def _markitdown_version() -> str:
+    """Get the installed MarkItDown version, used to namespace cached output."""
+    try:
+        return version("markitdown")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def default_markdown_cache_dir(config: PeerReadConfig | None = None) -> Path:
+    """Get the Markdown cache directory inside the PeerRead cache.
+
+    Args:
+        config: PeerRead dataset configuration. Loads from file if None.
+
+    Returns:
+        Directory holding cached conversions for the installed MarkItDown version.
+    """
+    config = config or load_peerread_config()
+    cache_root = resolve_project_path(config.cache_directory) / PEERREAD_MARKDOWN_CACHE_DIR
+    return cache_root / f"markitdown-{_markitdown_version()}"
+
+
+def _cache_file(cache_dir: Path, digest: str) -> Path:
+    """Path of the cached Markdown for a content digest."""
+    return cache_dir / digest[:2] / f"{digest}.md"
+
+
+def _pdf_digest(pdf_file: Path) -> str:
+    """SHA-256 hex digest of a PDF file's content."""
+    hasher = hashlib.sha256()
+    with open(pdf_file, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def is_markdown_cached(pdf_file: Path, cache_dir: Path) -> bool:
+    """Check whether a PDF's conversion is already cached.
+
+    Args:
+        pdf_file: Path to the PDF file.
+        cache_dir: Markdown cache directory.
+
+    Returns:
+        True if cached Markdown exists for the PDF content.
+    """
+    return _cache_file(cache_dir, _pdf_digest(pdf_file)).exists()
+
+
+def convert_pdf_to_markdown(pdf_file: Path, cache_dir: Path | None = None) -> str:
+    """Convert a PDF to Markdown text, using the content-addressed cache.
+
+    Args:
+        pdf_file: Path to the PDF file.
+        cache_dir: Markdown cache directory. Defaults to the PeerRead cache.
+
+    Returns:
+        Stripped Markdown text of the entire PDF.
+
+    Raises:
+        OSError: If the PDF cannot be read.
+        Exception: Any conversion error raised by MarkItDown.
+    """
+    cache_dir = cache_dir or default_markdown_cache_dir()
+    cache_file = _cache_file(cache_dir, _pdf_digest(pdf_file))
+    try:
+        text = cache_file.read_text(encoding="utf-8")
+        logger.debug(f"Markdown cache hit for {pdf_file}")
+        return text
+    except FileNotFoundError:
+        pass
+
+    text = get_markdown_converter().convert(pdf_file).text_content.strip()
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_text(text, encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.debug(f"Could not cache Markdown for {pdf_file}: {e}")
+    return text
+
+
+def _prewarm_worker(pdf_path: str, cache_dir: str) -> str:
+    """Convert one PDF in a pool worker; returns the path for progress reporting."""
+    convert_pdf_to_markdown(Path(pdf_path), Path(cache_dir))
+    return pdf_path
+
+
+def prewarm_markdown_cache(
+    config: PeerReadConfig | None = None,
+    venues: list[str] | None = None,
+    splits: list[str] | None = None,
+    max_workers: int | None = None,
+) -> int:
+    """Convert all uncached raw PDFs of the given venues/splits across a process pool.
+
+    Args:
+        config: PeerRead dataset configuration. Loads from file if None.
+        venues: Venues to prewarm. Defaults to all configured venues.
+        splits: Splits to prewarm. Defaults to all configured splits.
+        max_workers: Worker process count. Defaults to the CPU count.
+
+    Returns:
+        Number of PDFs converted. PDFs that fail to convert are logged and skipped.
+    """
+    config = config or load_peerread_config()
+    dataset_dir = resolve_project_path(config.cache_directory)
+    cache_dir = default_markdown_cache_dir(config)
+
+    pending: list[Path] = []
+    for venue in venues or config.venues:
+        for split in splits or config.splits:
+            pdf_dir = dataset_dir / venue / split / "pdfs"
+            if not pdf_dir.is_dir():
+                continue
+            pending.extend(
+                pdf
+                for pdf in sorted(pdf_dir.glob("*.pdf"))
+                if not is_markdown_cached(pdf, cache_dir)
+            )
+
+    if not pending:
+        logger.info("Markdown cache already warm, nothing to convert")
+        return 0
+
+    logger.info(f"Converting {len(pending)} PDFs to Markdown")
+    converted = 0
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(_prewarm_worker, str(pdf), str(cache_dir)) for pdf in pending]
+        for future in as_completed(futures):
+            try:
+                future.result()
+                converted += 1
+            except Exception as e:
+                logger.warning(f"PDF conversion failed during prewarm: {e}")
+
+    logger.info(f"✓ Converted {converted}/{len(pending)} PDFs")
+    return converted
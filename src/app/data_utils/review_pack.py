@@ -0,0 +1,204 @@
+"""
+Packed single-file corpus format for PeerRead reviews.
+
+Each venue/split directory can hold a ``reviews.pack`` data file containing the
+raw bytes of every ``reviews/<paper_id>.json`` file back to back, plus a small
+JSON offset index mapping paper IDs to ``(offset, length)`` byte ranges. Readers
+memory-map the data file and decode only the records they need, avoiding one
+open/parse round-trip per paper on cold corpus loads.
+
+A pack records the modification time of the ``reviews/`` directory it was built
+from; if loose files are added or removed afterwards the pack is reported stale
+and callers fall back to the loose-file layout.
+"""
+
+import mmap
+import os
+from collections.abc import Iterator
+from json import JSONDecodeError, dump, load, loads
+from pathlib import Path
+from typing import Any
+
+from app.config.config_app import PEERREAD_PACK_FILE, PEERREAD_PACK_INDEX_FILE
+from app.utils.log import logger
+
+_PACK_VERSION = 1
+
+
+def reviews_dir_mtime(split_dir: Path) -> int | None:
+    """Get the mtime (ns) of a split's loose reviews directory, or None if absent."""
+    try:
+        return (split_dir / "reviews").stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def write_review_pack(split_dir: Path) -> int:
+    """Pack all loose review files of a venue/split into a single data file.
+
+    Files are written to temporary names and atomically renamed; the offset
+    index is replaced last and records the data file size so readers can detect
+    a torn update.
+
+    Args:
+        split_dir: Venue/split directory, e.g. ``<cache>/acl_2017/train``.
+
+    Returns:
+        Number of records packed.
+
+    Raises:
+        FileNotFoundError: If the split has no ``reviews/`` directory.
+    """
+    reviews_dir = split_dir / "reviews"
+    if not reviews_dir.is_dir():
+        raise FileNotFoundError(f"No reviews directory to pack: {reviews_dir}")
+
+    source_mtime = reviews_dir_mtime(split_dir)
+    pack_file = split_dir / PEERREAD_PACK_FILE
+    index_file = split_dir / PEERREAD_PACK_INDEX_FILE
+    tmp_pack = pack_file.with_suffix(".pack.tmp")
+    tmp_index = index_file.with_suffix(".tmp")
+
+    offsets: dict[str, list[int]] = {}
+    position = 0
+    with open(tmp_pack, "wb") as out:
+        for json_file in sorted(reviews_dir.glob("*.json")):
+            try:
+                data = json_file.read_bytes()
+                # Reason: Validate once at pack time so readers never hit corrupt records.
+                loads(data)
+            except (OSError, JSONDecodeError, UnicodeDecodeError) as e:
+                logger.warning(f"Skipping unreadable review file {json_file}: {e}")
+                continue
+            out.write(data)
+            offsets[json_file.stem] = [position, len(data)]
+            position += len(data)
+
+    with open(tmp_index, "w", encoding="utf-8") as f:
+        dump(
+            {
+                "version": _PACK_VERSION,
+                "size": position,
+                "source_mtime_ns": source_mtime,
+                "offsets": offsets,
+            },
+            f,
+            separators=(",", ":"),
+        )
+
+    os.replace(tmp_pack, pack_file)
+    os.replace(tmp_index, index_file)
+    logger.debug(f"Packed {len(offsets)} reviews into {pack_file}")
+    return len(offsets)
+
+
+class ReviewPack:
+    """Read-only, memory-mapped view of a venue/split review pack.
+
+    Use as a context manager or call ``close()`` to release the mapping.
+    """
+
+    def __init__(self, split_dir: Path):
+        """Open the pack of a venue/split directory.
+
+        Args:
+            split_dir: Venue/split directory, e.g. ``<cache>/acl_2017/train``.
+
+        Raises:
+            FileNotFoundError: If the pack or its offset index is missing.
+            ValueError: If the offset index is unreadable or does not match the pack.
+        """
+        self.split_dir = split_dir
+        self.pack_file = split_dir / PEERREAD_PACK_FILE
+        index_file = split_dir / PEERREAD_PACK_INDEX_FILE
+
+        try:
+            with open(index_file, encoding="utf-8") as f:
+                index: dict[str, Any] = load(f)
+        except JSONDecodeError as e:
+            raise ValueError(f"Corrupt review pack index {index_file}: {e}") from e
+
+        if index.get("version") != _PACK_VERSION:
+            raise ValueError(f"Unsupported review pack version in {index_file}")
+        size = self.pack_file.stat().st_size
+        if size != index.get("size"):
+            raise ValueError(f"Review pack {self.pack_file} does not match its index")
+
+        self.source_mtime_ns: int | None = index.get("source_mtime_ns")
+        self._offsets: dict[str, tuple[int, int]] = {
+            paper_id: (offset, length) for paper_id, (offset, length) in index["offsets"].items()
+        }
+        self._file = open(self.pack_file, "rb")
+        # Reason: mmap rejects zero-length files; an empty pack has nothing to map.
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+    @classmethod
+    def open_if_fresh(cls, split_dir: Path) -> "ReviewPack | None":
+        """Open a venue/split pack if it exists and matches the loose files.
+
+        Args:
+            split_dir: Venue/split directory.
+
+        Returns:
+            Open ReviewPack, or None if no usable pack exists.
+        """
+        if not (split_dir / PEERREAD_PACK_FILE).exists():
+            return None
+        try:
+            pack = cls(split_dir)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unusable review pack in {split_dir}: {e}")
+            return None
+
+        loose_mtime = reviews_dir_mtime(split_dir)
+        # Reason: A pack-only cache has no reviews/ dir and is always authoritative.
+        if loose_mtime is not None and loose_mtime != pack.source_mtime_ns:
+            logger.debug(f"Review pack in {split_dir} is stale, using loose files")
+            pack.close()
+            return None
+        return pack
+
+    def __enter__(self) -> "ReviewPack":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __contains__(self, paper_id: object) -> bool:
+        return paper_id in self._offsets
+
+    def close(self) -> None:
+        """Release the memory mapping and file handle."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def paper_ids(self) -> list[str]:
+        """Get all paper IDs in pack order."""
+        return list(self._offsets)
+
+    def get_record(self, paper_id: str) -> dict[str, Any] | None:
+        """Decode a single review record.
+
+        Args:
+            paper_id: Paper identifier (review file stem).
+
+        Returns:
+            Raw review JSON dict, or None if the paper is not packed.
+        """
+        span = self._offsets.get(paper_id)
+        if span is None or self._mm is None:
+            return None
+        offset, length = span
+        return loads(self._mm[offset : offset + length])
+
+    def iter_records(self) -> Iterator[dict[str, Any]]:
+        """Decode records one at a time in pack order."""
+        for paper_id in self._offsets:
+            record = self.get_record(paper_id)
+            if record is not None:
+                yield record
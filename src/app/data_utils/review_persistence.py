@@ -1,28 +1,90 @@
 """Review persistence interface for MAS and evaluation system integration."""
 
 import json
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from pathlib import Path
 
-from app.config.config_app import MAS_RUNS_PATH
+from app.config.config_app import MAS_RUNS_PATH, REVIEWS_DB_FILE
 from app.data_models.peerread_models import PeerReadReview
+from app.data_utils.review_store import ReviewRecord, ReviewStore, StoredReview
 from app.utils.paths import resolve_project_path
 
 _DEFAULT_REVIEWS_DIR = MAS_RUNS_PATH
 
 
-class ReviewPersistence:
-    """Handles saving and loading of MAS-generated reviews."""
+def _utc_timestamp() -> str:
+    """Current UTC time in the review filename timestamp format."""
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H-%M-%SZ")
+
 
-    def __init__(self, reviews_dir: str = _DEFAULT_REVIEWS_DIR):
+class ReviewPersistence:
+    """Handles saving and loading of MAS-generated reviews.
+
+    Reviews in the reviews directory are indexed in a SQLite store
+    (``reviews.db``), so lookups read sorted rows instead of parsing files.
+    Per-file JSON copies are still written by default for compatibility, and
+    the directory stays authoritative for them: listing re-scans its file
+    names, indexing files written by other processes and dropping deleted
+    ones. Pass ``write_files=False`` to keep reviews in the store only and use
+    ``export_reviews`` when the file layout is needed.
+    """
+
+    def __init__(self, reviews_dir: str = _DEFAULT_REVIEWS_DIR, write_files: bool = True):
         """Initialize with reviews directory path.
 
         Args:
             reviews_dir: Directory to store review files
+            write_files: Also write one pretty-printed JSON file per saved review.
         """
         # Resolve reviews directory relative to project root
         self.reviews_dir = resolve_project_path(reviews_dir)
         self.reviews_dir.mkdir(parents=True, exist_ok=True)
+        self.write_files = write_files
+        self._store: ReviewStore | None = None
+
+    @property
+    def store(self) -> ReviewStore:
+        """Review store of the reviews directory, created on first use."""
+        if self._store is None:
+            self._store = ReviewStore(self.reviews_dir / REVIEWS_DB_FILE)
+        return self._store
+
+    def _synced_store(self) -> ReviewStore:
+        """Review store after syncing it with the review files in the directory."""
+        # Reason: Re-scan file names on every lookup; the directory mtime cannot
+        # signal changes, as the store's own WAL files come and go in it.
+        store = self.store
+        store.sync_directory(self.reviews_dir)
+        return store
+
+    def _store_reference(self, review_id: int) -> str:
+        """Location string for a review kept only in the store."""
+        return f"{self.store.db_path}#{review_id}"
+
+    def _location(self, review_id: int, file_path: str | None) -> str:
+        """Location string returned to callers: the JSON file if any, else a store reference."""
+        return file_path if file_path is not None else self._store_reference(review_id)
+
+    @staticmethod
+    def _build_review_data(
+        paper_id: str,
+        review: PeerReadReview,
+        timestamp: str,
+        structured_review: dict[str, object] | None,
+        model_info: str | None,
+    ) -> dict[str, object]:
+        """Build the serialized review record."""
+        review_data: dict[str, object] = {
+            "paper_id": paper_id,
+            "timestamp": timestamp,
+            "review": review.model_dump(),
+        }
+        if structured_review is not None:
+            review_data["structured_review"] = structured_review
+        if model_info is not None:
+            review_data["model_info"] = model_info
+        return review_data
 
     def save_review(
         self,
@@ -44,46 +106,76 @@ class ReviewPersistence:
             model_info: Optional model identifier string.
 
         Returns:
-            str: Path to the saved review file
+            str: Path to the saved review file, or a ``<db>#<id>`` store
+                reference when per-file output is disabled
         """
+        from app.utils.artifact_registry import get_artifact_registry
+
+        timestamp = timestamp or _utc_timestamp()
+        review_data = self._build_review_data(
+            paper_id, review, timestamp, structured_review, model_info
+        )
+
         if run_dir is not None:
             filepath = run_dir / "review.json"
-        else:
-            if timestamp is None:
-                timestamp = datetime.now(UTC).strftime("%Y-%m-%dT%H-%M-%SZ")
-            filename = f"{paper_id}_{timestamp}.json"
-            filepath = self.reviews_dir / filename
+            with open(filepath, "w", encoding="utf-8") as f:
+                json.dump(review_data, f, indent=2, ensure_ascii=False)
+            get_artifact_registry().register("Review", filepath)
+            return str(filepath)
 
-        review_data: dict[str, object] = {
-            "paper_id": paper_id,
-            "timestamp": timestamp or datetime.now(UTC).strftime("%Y-%m-%dT%H-%M-%SZ"),
-            "review": review.model_dump(),
-        }
-        if structured_review is not None:
-            review_data["structured_review"] = structured_review
-        if model_info is not None:
-            review_data["model_info"] = model_info
+        return self.save_reviews([(paper_id, review_data)])[0]
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(review_data, f, indent=2, ensure_ascii=False)
+    def save_reviews(self, reviews: Iterable[tuple[str, dict[str, object]]]) -> list[str]:
+        """Save serialized reviews to the reviews directory in one store transaction.
 
-        from app.utils.artifact_registry import get_artifact_registry
+        Args:
+            reviews: (paper_id, review_data) pairs; review_data must contain a
+                'timestamp' key, as produced by ``save_review``.
 
-        get_artifact_registry().register("Review", filepath)
+        Returns:
+            list: Locations of the saved reviews, in input order
+        """
+        from app.utils.artifact_registry import get_artifact_registry
 
-        return str(filepath)
+        store = self.store
+        records: list[ReviewRecord] = []
+        for paper_id, review_data in reviews:
+            timestamp = str(review_data["timestamp"])
+            file_path: str | None = None
+            if self.write_files:
+                filepath = self.reviews_dir / f"{paper_id}_{timestamp}.json"
+                with open(filepath, "w", encoding="utf-8") as f:
+                    json.dump(review_data, f, indent=2, ensure_ascii=False)
+                get_artifact_registry().register("Review", filepath)
+                file_path = str(filepath)
+            records.append(ReviewRecord(paper_id, timestamp, dict(review_data), file_path))
+
+        review_ids = store.add_many(records)
+        if not self.write_files and records:
+            get_artifact_registry().register("Review store", store.db_path)
+        return [
+            self._location(review_id, record.file_path)
+            for review_id, record in zip(review_ids, records, strict=True)
+        ]
 
     def load_review(self, filepath: str) -> tuple[str, PeerReadReview]:
         """Load a review from file.
 
         Args:
-            filepath: Path to the review file
+            filepath: Path to the review file, or a store reference
 
         Returns:
             tuple: (paper_id, PeerReadReview object)
         """
-        with open(filepath, encoding="utf-8") as f:
-            review_data = json.load(f)
+        store_prefix = f"{self.reviews_dir / REVIEWS_DB_FILE}#"
+        if filepath.startswith(store_prefix):
+            stored: StoredReview | None = self.store.get(int(filepath[len(store_prefix) :]))
+            if stored is None:
+                raise FileNotFoundError(f"Review not found in store: {filepath}")
+            review_data = stored.data
+        else:
+            with open(filepath, encoding="utf-8") as f:
+                review_data = json.load(f)
 
         paper_id = review_data["paper_id"]
         review = PeerReadReview.model_validate(review_data["review"])
@@ -91,30 +183,41 @@ class ReviewPersistence:
         return paper_id, review
 
     def list_reviews(self, paper_id: str | None = None) -> list[str]:
-        """List available review files.
+        """List available reviews, oldest first.
 
         Args:
             paper_id: Optional filter by paper ID
 
         Returns:
-            list: Paths to matching review files
+            list: Locations of matching reviews
         """
-        pattern = f"{paper_id}_*.json" if paper_id else "*.json"
-        return [str(p) for p in self.reviews_dir.glob(pattern)]
+        return [
+            self._location(review_id, file_path)
+            for review_id, file_path in self._synced_store().list_locations(paper_id)
+            # Reason: A file deleted since the sync is skipped rather than returned.
+            if file_path is None or Path(file_path).exists()
+        ]
 
     def get_latest_review(self, paper_id: str) -> str | None:
-        """Get the most recent review file for a paper.
+        """Get the most recent review for a paper.
 
         Args:
             paper_id: Paper identifier
 
         Returns:
-            str: Path to latest review file, or None if not found
+            str: Location of the latest review, or None if not found
         """
         reviews = self.list_reviews(paper_id)
-        if not reviews:
-            return None
+        return reviews[-1] if reviews else None
 
-        # Sort by timestamp in filename (newest first)
-        reviews.sort(reverse=True)
-        return reviews[0]
+    def export_reviews(self, target_dir: Path | None = None, paper_id: str | None = None) -> int:
+        """Export stored reviews to the per-file ``<paper_id>_<timestamp>.json`` layout.
+
+        Args:
+            target_dir: Output directory, defaults to the reviews directory
+            paper_id: Optional filter by paper ID
+
+        Returns:
+            int: Number of files written
+        """
+        return self.store.export_files(target_dir or self.reviews_dir, paper_id)
@@ -0,0 +1,281 @@
+"""
+Indexed SQLite store for MAS-generated reviews.
+
+Replaces directory globbing and filename sorting with a single ``reviews``
+table indexed on ``(paper_id, timestamp)``, so listing a paper's reviews and
+finding its latest review are index range scans instead of full directory
+scans. Inserts can be batched in one transaction, and stored reviews can be
+exported to the legacy ``<paper_id>_<timestamp>.json`` per-file layout.
+"""
+
+import json
+import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from app.utils.log import logger
+
+
+class StoredReview(NamedTuple):
+    """One row of the review store."""
+
+    review_id: int
+    paper_id: str
+    timestamp: str
+    data: dict[str, Any]
+    file_path: str | None
+
+
+class ReviewRecord(NamedTuple):
+    """Review to insert into the store."""
+
+    paper_id: str
+    timestamp: str
+    data: dict[str, Any]
+    file_path: str | None = None
+
+
+class ReviewStore:
+    """SQLite-backed review store with a (paper_id, timestamp) index."""
+
+    def __init__(self, db_path: Path):
+        """Open (and create if needed) the review database.
+
+        Args:
+            db_path: Path to the SQLite database file.
+        """
+        self.db_path = db_path
+        self._init_database()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, committing on success and always closing it."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_database(self) -> None:
+        """Initialize the schema."""
+        with self._connect() as conn:
+            # Reason: WAL lets concurrent sweep workers read while one writes.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS reviews (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    paper_id TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    file_path TEXT
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_reviews_paper_ts ON reviews (paper_id, timestamp)"
+            )
+            # Reason: A review file maps to one row, even if a directory sync in another
+            # process indexes it between the file write and the insert.
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_reviews_file ON reviews (file_path) "
+                "WHERE file_path IS NOT NULL"
+            )
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS store_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
+
+    @staticmethod
+    def _row_to_review(row: tuple[Any, ...]) -> StoredReview:
+        review_id, paper_id, timestamp, data, file_path = row
+        return StoredReview(review_id, paper_id, timestamp, json.loads(data), file_path)
+
+    def add(self, record: ReviewRecord) -> int:
+        """Insert one review.
+
+        Args:
+            record: Review to insert.
+
+        Returns:
+            Row ID of the inserted review.
+        """
+        return self.add_many([record])[0]
+
+    def add_many(self, records: Iterable[ReviewRecord]) -> list[int]:
+        """Insert reviews in a single transaction.
+
+        Args:
+            records: Reviews to insert.
+
+        Returns:
+            Row IDs of the inserted reviews, in input order.
+        """
+        review_ids: list[int] = []
+        with self._connect() as conn:
+            for record in records:
+                row = conn.execute(
+                    "INSERT INTO reviews (paper_id, timestamp, data, file_path) "
+                    "VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (file_path) WHERE file_path IS NOT NULL DO UPDATE SET "
+                    "paper_id = excluded.paper_id, timestamp = excluded.timestamp, "
+                    "data = excluded.data "
+                    "RETURNING id",
+                    (
+                        record.paper_id,
+                        record.timestamp,
+                        json.dumps(record.data, ensure_ascii=False, separators=(",", ":")),
+                        record.file_path,
+                    ),
+                ).fetchone()
+                review_ids.append(row[0])
+        return review_ids
+
+    def get(self, review_id: int) -> StoredReview | None:
+        """Get a review by row ID."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT id, paper_id, timestamp, data, file_path FROM reviews WHERE id = ?",
+                (review_id,),
+            ).fetchone()
+        return self._row_to_review(row) if row else None
+
+    def latest(self, paper_id: str) -> StoredReview | None:
+        """Get the most recent review of a paper using the (paper_id, timestamp) index.
+
+        Args:
+            paper_id: Paper identifier.
+
+        Returns:
+            Latest review, or None if the paper has none.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT id, paper_id, timestamp, data, file_path FROM reviews "
+                "WHERE paper_id = ? ORDER BY timestamp DESC, id DESC LIMIT 1",
+                (paper_id,),
+            ).fetchone()
+        return self._row_to_review(row) if row else None
+
+    def list_locations(self, paper_id: str | None = None) -> list[tuple[int, str | None]]:
+        """List (row ID, file path) of stored reviews, oldest first.
+
+        Args:
+            paper_id: Optional filter by paper ID.
+
+        Returns:
+            List of (review_id, file_path) tuples without decoding review data.
+        """
+        with self._connect() as conn:
+            if paper_id is None:
+                rows = conn.execute(
+                    "SELECT id, file_path FROM reviews ORDER BY timestamp, id"
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT id, file_path FROM reviews WHERE paper_id = ? ORDER BY timestamp, id",
+                    (paper_id,),
+                ).fetchall()
+        return [(row[0], row[1]) for row in rows]
+
+    def sync_directory(self, reviews_dir: Path) -> tuple[int, int]:
+        """Bring the store in line with the review files of a directory.
+
+        Files not yet in the store are indexed in one batch, unless the store
+        already holds that paper's review with the same timestamp (e.g. one
+        exported from the store). Rows whose file in the directory was deleted
+        are dropped, as the directory listing no longer shows them.
+
+        Args:
+            reviews_dir: Directory of ``<paper_id>_<timestamp>.json`` files.
+
+        Returns:
+            Tuple of (imported, removed) review counts.
+        """
+        file_names = {p.name for p in reviews_dir.glob("*.json")}
+        with self._connect() as conn:
+            rows = conn.execute("SELECT id, paper_id, timestamp, file_path FROM reviews").fetchall()
+
+        known_paths = {row[3] for row in rows if row[3] is not None}
+        known_keys = {(row[1], row[2]) for row in rows}
+        removed_ids = [
+            (row[0],)
+            for row in rows
+            if row[3] is not None
+            and Path(row[3]).parent == reviews_dir
+            and Path(row[3]).name not in file_names
+        ]
+
+        records: list[ReviewRecord] = []
+        for name in sorted(file_names):
+            json_file = reviews_dir / name
+            if str(json_file) in known_paths:
+                continue
+            try:
+                with open(json_file, encoding="utf-8") as f:
+                    data = json.load(f)
+                record = ReviewRecord(
+                    paper_id=data["paper_id"],
+                    timestamp=data.get("timestamp", ""),
+                    data=data,
+                    file_path=str(json_file),
+                )
+            except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+                logger.warning(f"Skipping unreadable review file {json_file}: {e}")
+                continue
+            if (record.paper_id, record.timestamp) not in known_keys:
+                records.append(record)
+
+        self.add_many(records)
+        if removed_ids:
+            with self._connect() as conn:
+                conn.executemany("DELETE FROM reviews WHERE id = ?", removed_ids)
+        if records or removed_ids:
+            logger.info(
+                f"Synced {reviews_dir} into {self.db_path}: "
+                f"{len(records)} imported, {len(removed_ids)} removed"
+            )
+        return len(records), len(removed_ids)
+
+    def get_meta(self, key: str) -> str | None:
+        """Read a store metadata value."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM store_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        """Write a store metadata value."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO store_meta (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    def export_files(self, target_dir: Path, paper_id: str | None = None) -> int:
+        """Export stored reviews to the legacy per-file JSON layout.
+
+        Args:
+            target_dir: Directory to write ``<paper_id>_<timestamp>.json`` files to.
+            paper_id: Optional filter by paper ID.
+
+        Returns:
+            Number of files written.
+        """
+        target_dir.mkdir(parents=True, exist_ok=True)
+        query = "SELECT id, paper_id, timestamp, data, file_path FROM reviews"
+        params: tuple[str, ...] = ()
+        if paper_id is not None:
+            query += " WHERE paper_id = ?"
+            params = (paper_id,)
+
+        written = 0
+        with self._connect() as conn:
+            for row in conn.execute(query + " ORDER BY timestamp, id", params):
+                review = self._row_to_review(row)
+                filepath = target_dir / f"{review.paper_id}_{review.timestamp}.json"
+                with open(filepath, "w", encoding="utf-8") as f:
+                    json.dump(review.data, f, indent=2, ensure_ascii=False)
+                written += 1
+        return written
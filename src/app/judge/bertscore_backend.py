@@ -0,0 +1,111 @@
+"""
+CPU inference options for the Tier 1 BERTScore model.
+
+The default backend loads the model in full precision, exactly as before. The
+opt-in ``int8`` precision applies PyTorch dynamic quantization to the model's
+``Linear`` layers, which is usually 2-3x faster on CPU at a small F1
+deviation. ``num_threads`` pins the intra-op thread count, and ``max_length``
+truncates tokenized inputs so long reviews cannot exceed the time budget.
+
+Example:
+    >>> backend = BERTScoreBackend.from_settings(JudgeSettings(tier1_bertscore_precision="int8"))
+    >>> engine = TraditionalMetricsEngine(bertscore_backend=backend)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from app.utils.log import logger
+
+if TYPE_CHECKING:
+    from app.config.judge_settings import JudgeSettings
+
+BERTScorePrecision = Literal["fp32", "int8"]
+
+
+@dataclass(frozen=True)
+class BERTScoreBackend:
+    """How the BERTScore model is loaded and run.
+
+    Attributes:
+        model_type: Hugging Face model name passed to ``BERTScorer``
+        precision: ``fp32`` (default) or ``int8`` dynamic quantization
+        num_threads: Torch intra-op threads; None keeps the torch default
+        max_length: Maximum tokens per text; None keeps the tokenizer limit
+        server_socket: Unix socket of a shared model server; None loads in-process
+    """
+
+    model_type: str = "distilbert-base-uncased"
+    precision: BERTScorePrecision = "fp32"
+    num_threads: int | None = None
+    max_length: int | None = None
+    server_socket: str | None = None
+
+    @classmethod
+    def from_settings(cls, settings: JudgeSettings) -> BERTScoreBackend:
+        """Build the backend from ``tier1_bertscore_*`` settings."""
+        return cls(
+            model_type=settings.tier1_bertscore_model,
+            precision=settings.tier1_bertscore_precision,
+            num_threads=settings.tier1_bertscore_threads,
+            max_length=settings.tier1_bertscore_max_length,
+            server_socket=settings.tier1_bertscore_server_socket,
+        )
+
+    @property
+    def cache_tag(self) -> str:
+        """Suffix for cached embeddings; empty for the plain fp32 model.
+
+        Thread count and server socket do not change scores, so they are not part of the tag.
+        """
+        tag = "" if self.precision == "fp32" else f"_{self.precision}"
+        if self.max_length is not None:
+            tag += f"_max{self.max_length}"
+        return tag
+
+    @property
+    def server_tag(self) -> str:
+        """Model name plus cache tag; a shared server only serves clients with its own tag."""
+        return f"{self.model_type}{self.cache_tag}"
+
+
+def apply_bertscore_backend(scorer: Any, backend: BERTScoreBackend) -> Any:
+    """Apply precision, thread and sequence-length options to a loaded BERTScorer.
+
+    Args:
+        scorer: BERTScorer instance in full precision.
+        backend: Options to apply.
+
+    Returns:
+        The same scorer, modified in place.
+    """
+    if backend.precision == "fp32" and backend.num_threads is None and backend.max_length is None:
+        return scorer
+
+    import torch
+
+    if backend.num_threads is not None:
+        # Reason: Process-wide setting; Tier 1 is the only torch user in this process.
+        torch.set_num_threads(backend.num_threads)
+
+    if backend.precision == "int8":
+        try:
+            scorer._model = torch.quantization.quantize_dynamic(
+                scorer._model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            scorer._model.eval()
+        except Exception as e:
+            logger.warning(f"int8 quantization failed, keeping fp32 BERTScore model: {e}")
+
+    if backend.max_length is not None:
+        # Reason: bert_score truncates at tokenizer.model_max_length when encoding.
+        scorer._tokenizer.model_max_length = backend.max_length
+
+    logger.info(
+        f"BERTScore backend: precision={backend.precision}, "
+        f"threads={backend.num_threads or torch.get_num_threads()}, "
+        f"max_length={backend.max_length or 'model default'}"
+    )
+    return scorer
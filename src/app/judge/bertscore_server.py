@@ -0,0 +1,462 @@
+"""
+Shared BERTScore model server for parallel evaluation processes.
+
+Each evaluation process normally loads its own copy of the BERTScore model. With
+``JUDGE_TIER1_BERTSCORE_SERVER_SOCKET`` set, Tier 1 instead sends ``score``
+requests to one model-serving process over a local Unix socket. The first
+process that needs the model spawns the server while holding a lock file next to
+the socket; the others wait for the lock and connect to it. Clients only use a
+server that loaded the same model, precision and max length as their own
+backend settings. The server authenticates clients with a random key stored next
+to the socket (owner-only permissions) and exits after a period without
+requests; the next request then starts a new one.
+
+Example:
+    $ python -m app.judge.bertscore_server /tmp/agents-eval-bertscore.sock
+"""
+
+import os
+import secrets
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import replace
+from multiprocessing.connection import AuthenticationError, Client, Connection, Listener
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from app.judge.bertscore_backend import BERTScoreBackend
+from app.utils.log import logger
+
+_SERVER_READY_TIMEOUT = 180.0
+_IDLE_TIMEOUT = 900.0
+_POLL_INTERVAL = 0.5
+
+
+def default_bertscore_socket() -> str:
+    """Per-user default socket path in the system temp directory."""
+    user = os.getuid() if hasattr(os, "getuid") else "user"
+    return str(Path(tempfile.gettempdir()) / f"agents-eval-bertscore-{user}.sock")
+
+
+def _authkey_path(socket_path: str) -> Path:
+    return Path(f"{socket_path}.key")
+
+
+def _write_authkey(socket_path: str, authkey: bytes) -> None:
+    """Write the authentication key readable by the owner only."""
+    key_path = _authkey_path(socket_path)
+    tmp_path = key_path.with_name(f"{key_path.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(authkey)
+    os.replace(tmp_path, key_path)
+
+
+def _try_flock(path: Path) -> int | None:
+    """Take an exclusive lock on path without blocking.
+
+    Returns:
+        The open descriptor holding the lock (closing it releases the lock), or
+        None if another process or thread holds it.
+    """
+    # Reason: Deferred import; fcntl is POSIX-only and Tier 1 imports this module
+    # unconditionally, also on platforms without the shared server.
+    import fcntl
+
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _connect(socket_path: str) -> Connection:
+    """Open an authenticated connection to a running server."""
+    authkey = _authkey_path(socket_path).read_bytes()
+    return Client(socket_path, family="AF_UNIX", authkey=authkey)
+
+
+class RemoteBERTScorer:
+    """Client with the ``BERTScorer.score`` interface, backed by the shared server."""
+
+    def __init__(self, socket_path: str, backend: BERTScoreBackend | None = None):
+        """Initialize the client; the connection is opened on first use.
+
+        Args:
+            socket_path: Unix socket of the server.
+            backend: Model options the server must run; defaults to the plain model.
+        """
+        self.socket_path = socket_path
+        self.backend = backend or BERTScoreBackend()
+        self._conn: Connection | None = None
+        self._lock = threading.Lock()
+
+    def _send(self, message: tuple[Any, ...]) -> Any:
+        """Send one message on the current connection and return the payload of the reply."""
+        with self._lock:
+            try:
+                if self._conn is None:
+                    self._conn = _connect(self.socket_path)
+                self._conn.send(message)
+                status, payload = self._conn.recv()
+            except (OSError, EOFError):
+                # Reason: Drop a broken connection so the next request reconnects.
+                self._conn = None
+                raise
+        if status != "ok":
+            raise RuntimeError(f"BERTScore server error: {payload}")
+        return payload
+
+    def _request(self, *message: Any) -> Any:
+        """Send one request, restarting the server once if it has gone away.
+
+        Raises:
+            ConnectionError: If the server is gone and no replacement answers.
+            RuntimeError: If the server reports an error for the request.
+        """
+        try:
+            return self._send(message)
+        except (OSError, EOFError) as e:
+            # Reason: The server exits after its idle timeout and may crash.
+            logger.info(f"Lost BERTScore server at {self.socket_path}, reconnecting: {e!r}")
+        try:
+            self.ensure_server(timeout=_SERVER_READY_TIMEOUT)
+            return self._send(message)
+        except (OSError, EOFError, RuntimeError) as e:
+            raise ConnectionError(f"BERTScore server at {self.socket_path} unavailable: {e}") from e
+
+    def ping(self) -> str:
+        """Check the server is alive; returns the ``server_tag`` of its backend."""
+        return self._send(("ping",))
+
+    def score(
+        self, cands: list[str], refs: list[str], verbose: bool = False, batch_size: int = 64
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Score candidate/reference pairs on the server.
+
+        Args:
+            cands: Candidate texts.
+            refs: Reference texts, aligned with ``cands``.
+            verbose: Ignored; kept for ``BERTScorer.score`` compatibility.
+            batch_size: Server-side batch size.
+
+        Returns:
+            (precision, recall, f1) arrays, one value per pair.
+
+        Raises:
+            ConnectionError: If the server is gone and could not be restarted.
+        """
+        precision, recall, f1 = self._request("score", list(cands), list(refs), batch_size)
+        return np.asarray(precision), np.asarray(recall), np.asarray(f1)
+
+    def serving_tag(self) -> str | None:
+        """Backend tag of the live server on the socket, or None if none answers."""
+        try:
+            return self.ping()
+        except (OSError, EOFError, RuntimeError):
+            return None
+
+    def answers(self) -> bool:
+        """Whether a live server for this client's backend answers on the socket.
+
+        Raises:
+            RuntimeError: If the server on the socket runs a different backend.
+        """
+        tag = self.serving_tag()
+        if tag is None:
+            return False
+        if tag != self.backend.server_tag:
+            raise RuntimeError(
+                f"BERTScore server at {self.socket_path} serves {tag!r}, "
+                f"expected {self.backend.server_tag!r}"
+            )
+        return True
+
+    def ensure_server(self, spawn: bool = True, timeout: float = _SERVER_READY_TIMEOUT) -> None:
+        """Wait until a server for this client's backend answers, spawning it if needed.
+
+        Args:
+            spawn: Start a server process if none answers.
+            timeout: Seconds to wait for a spawned server to load its model.
+
+        Raises:
+            RuntimeError: If no server answers within the timeout, or the server on
+                the socket runs a different backend.
+        """
+        if self.answers():
+            return
+        if not spawn:
+            raise RuntimeError(f"No BERTScore server at {self.socket_path}")
+
+        # Reason: Only the holder of the spawn lock starts a server; concurrent callers
+        # (threads or processes) wait for the lock or for the server to answer.
+        deadline = time.monotonic() + timeout
+        not_ready = f"BERTScore server at {self.socket_path} not ready after {timeout:.0f}s"
+        lock_path = Path(f"{self.socket_path}.lock")
+        lock_fd = _try_flock(lock_path)
+        while lock_fd is None:
+            if time.monotonic() >= deadline:
+                raise RuntimeError(not_ready)
+            time.sleep(_POLL_INTERVAL)
+            if self.answers():
+                return
+            lock_fd = _try_flock(lock_path)
+
+        try:
+            if self.answers():
+                return
+            logger.info(f"Starting shared BERTScore server at {self.socket_path}")
+            _spawn_server(self.socket_path, self.backend)
+            while time.monotonic() < deadline:
+                time.sleep(_POLL_INTERVAL)
+                if self.answers():
+                    return
+        finally:
+            os.close(lock_fd)
+        raise RuntimeError(not_ready)
+
+
+def _spawn_server(socket_path: str, backend: BERTScoreBackend) -> None:
+    """Start a detached server process running the given backend."""
+    src_root = str(Path(__file__).resolve().parents[2])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (src_root, env.get("PYTHONPATH")) if p)
+    # Reason: The server reads its backend from JudgeSettings; pass this client's
+    # options explicitly in case they were not set through the environment.
+    options = {
+        "JUDGE_TIER1_BERTSCORE_MODEL": backend.model_type,
+        "JUDGE_TIER1_BERTSCORE_PRECISION": backend.precision,
+        "JUDGE_TIER1_BERTSCORE_THREADS": backend.num_threads,
+        "JUDGE_TIER1_BERTSCORE_MAX_LENGTH": backend.max_length,
+    }
+    for name, value in options.items():
+        if value is None:
+            env.pop(name, None)
+        else:
+            env[name] = str(value)
+    subprocess.Popen(
+        [sys.executable, "-m", "app.judge.bertscore_server", socket_path],
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def connect_bertscore_server(
+    socket_path: str,
+    backend: BERTScoreBackend | None = None,
+    spawn: bool = True,
+    timeout: float = _SERVER_READY_TIMEOUT,
+) -> RemoteBERTScorer:
+    """Connect to the shared server, spawning it if none is running.
+
+    Args:
+        socket_path: Unix socket of the server.
+        backend: Model options the server must run; defaults to the plain model.
+        spawn: Start a server process if none answers.
+        timeout: Seconds to wait for a spawned server to load its model.
+
+    Returns:
+        Connected RemoteBERTScorer.
+
+    Raises:
+        RuntimeError: If no server answers within the timeout, or the server on
+            the socket runs a different backend.
+    """
+    client = RemoteBERTScorer(socket_path, backend)
+    client.ensure_server(spawn=spawn, timeout=timeout)
+    return client
+
+
+# Global per-socket/backend clients; failed sockets are not retried within a process
+_global_clients: dict[tuple[str, str], RemoteBERTScorer | None] = {}
+_clients_lock = threading.Lock()
+
+
+def get_remote_bertscorer(backend: BERTScoreBackend) -> RemoteBERTScorer | None:
+    """Get the process-wide client of a shared server, connecting on first use.
+
+    Args:
+        backend: Model options, with ``server_socket`` set to the server's socket.
+
+    Returns:
+        Connected client, or None if the server could not be reached or started,
+        or runs a different backend.
+    """
+    if backend.server_socket is None:
+        return None
+    key = (backend.server_socket, backend.server_tag)
+    with _clients_lock:
+        if key not in _global_clients:
+            try:
+                _global_clients[key] = connect_bertscore_server(backend.server_socket, backend)
+            except Exception as e:
+                logger.warning(f"Shared BERTScore server unavailable, loading locally: {e}")
+                _global_clients[key] = None
+        return _global_clients[key]
+
+
+def discard_remote_bertscorer(client: RemoteBERTScorer) -> None:
+    """Stop using a shared server that is gone and could not be restarted.
+
+    Later ``get_remote_bertscorer`` calls for the same socket and backend return
+    None, so callers load the model in-process.
+
+    Args:
+        client: Client whose server is unavailable.
+    """
+    key = (client.socket_path, client.backend.server_tag)
+    with _clients_lock:
+        if _global_clients.get(key) is client:
+            _global_clients[key] = None
+
+
+def stop_bertscore_server(socket_path: str) -> bool:
+    """Ask a running server to shut down.
+
+    Args:
+        socket_path: Unix socket of the server.
+
+    Returns:
+        True if a server acknowledged the shutdown.
+    """
+    try:
+        conn = _connect(socket_path)
+    except (OSError, EOFError):
+        return False
+    with conn:
+        conn.send(("shutdown",))
+        try:
+            conn.recv()
+        except EOFError:
+            pass
+    return True
+
+
+def serve_bertscore(
+    socket_path: str, backend: BERTScoreBackend, idle_timeout: float = _IDLE_TIMEOUT
+) -> None:
+    """Load the model once and serve ``score`` requests until shutdown or idle timeout.
+
+    Returns immediately, without touching the socket, if another server is
+    running or starting on it.
+
+    Args:
+        socket_path: Unix socket to listen on.
+        backend: Model and inference options to load.
+        idle_timeout: Seconds without requests after which the server exits.
+
+    Raises:
+        RuntimeError: If the BERTScore model cannot be loaded.
+    """
+    # Reason: The server lock is held for the server's lifetime, so a second server
+    # (e.g. started by hand) refuses to start instead of unlinking a live socket.
+    server_lock = _try_flock(Path(f"{socket_path}.server.lock"))
+    if server_lock is None or RemoteBERTScorer(socket_path).serving_tag() is not None:
+        if server_lock is not None:
+            os.close(server_lock)
+        logger.info(f"BERTScore server already running at {socket_path}")
+        return
+    try:
+        # Reason: No other server holds the lock, so an existing socket file is stale.
+        Path(socket_path).unlink(missing_ok=True)
+        _serve_locked(socket_path, backend, idle_timeout)
+    finally:
+        os.close(server_lock)
+
+
+def _serve_locked(socket_path: str, backend: BERTScoreBackend, idle_timeout: float) -> None:
+    """Serve requests; the caller holds the server lock of socket_path."""
+    from app.judge.traditional_metrics import TraditionalMetricsEngine
+
+    local_backend = replace(backend, server_socket=None)
+    scorer = TraditionalMetricsEngine(bertscore_backend=local_backend)._get_bertscore_model()
+    if scorer is None:
+        raise RuntimeError("BERTScore model could not be loaded")
+
+    authkey = secrets.token_bytes(32)
+    _write_authkey(socket_path, authkey)
+    listener = Listener(socket_path, family="AF_UNIX", authkey=authkey)
+    stop = threading.Event()
+    score_lock = threading.Lock()
+    last_request = [time.monotonic()]
+
+    def _wake_listener() -> None:
+        # Reason: Listener.accept() blocks; a dummy connection lets the loop see `stop`.
+        try:
+            Client(socket_path, family="AF_UNIX", authkey=authkey).close()
+        except OSError:
+            pass
+
+    def _handle(conn: Connection) -> None:
+        with conn:
+            while not stop.is_set():
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    return
+                if stop.is_set():
+                    # Reason: A stopping server drops open connections so clients reconnect.
+                    return
+                last_request[0] = time.monotonic()
+                command = message[0]
+                try:
+                    if command == "ping":
+                        reply: tuple[str, Any] = ("ok", local_backend.server_tag)
+                    elif command == "score":
+                        with score_lock:
+                            p, r, f1 = scorer.score(message[1], message[2], batch_size=message[3])
+                        reply = ("ok", (p.tolist(), r.tolist(), f1.tolist()))
+                    elif command == "shutdown":
+                        stop.set()
+                        reply = ("ok", None)
+                    else:
+                        reply = ("error", f"Unknown command: {command}")
+                except Exception as e:
+                    reply = ("error", str(e))
+                conn.send(reply)
+                if stop.is_set():
+                    _wake_listener()
+
+    def _watch_idle() -> None:
+        while not stop.wait(_POLL_INTERVAL * 10):
+            if time.monotonic() - last_request[0] > idle_timeout:
+                logger.info("BERTScore server idle, shutting down")
+                stop.set()
+                _wake_listener()
+
+    threading.Thread(target=_watch_idle, daemon=True).start()
+    logger.info(f"BERTScore server ready at {socket_path} ({local_backend.model_type})")
+    try:
+        while not stop.is_set():
+            try:
+                conn = listener.accept()
+            except (OSError, EOFError, AuthenticationError) as e:
+                # Reason: Failed handshakes (wrong key) must not stop the server.
+                logger.debug(f"Rejected BERTScore client: {e}")
+                continue
+            threading.Thread(target=_handle, args=(conn,), daemon=True).start()
+    finally:
+        listener.close()
+        _authkey_path(socket_path).unlink(missing_ok=True)
+
+
+def main() -> None:
+    """Run the server with Tier 1 settings from the environment."""
+    from app.config.judge_settings import JudgeSettings
+
+    socket_path = sys.argv[1] if len(sys.argv) > 1 else default_bertscore_socket()
+    serve_bertscore(socket_path, BERTScoreBackend.from_settings(JudgeSettings()))
+
+
+if __name__ == "__main__":
+    main()
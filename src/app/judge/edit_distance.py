@@ -0,0 +1,193 @@
+"""
+Edit-distance backends for Tier 1 Levenshtein similarity.
+
+Without a native extension, ``textdistance`` computes Levenshtein distance with
+a pure-Python O(n*m) dynamic program, which takes seconds on 5k-character
+reviews. This module picks the fastest installed implementation: rapidfuzz,
+then python-Levenshtein, then textdistance. All backends return the same
+normalized similarity, ``1 - distance / max(len(a), len(b))``.
+
+Passing ``min_similarity`` turns a call into a near-duplicate check. Pairs below
+the cutoff return 0.0 as soon as the distance is known to exceed it, via the
+native ``score_cutoff`` or a banded dynamic program that only fills cells within
+the allowed distance of the diagonal.
+
+Example:
+    >>> backend = get_edit_distance_backend()  # "auto"
+    >>> backend.normalized_similarity(review, reference)
+    >>> backend.normalized_similarity(review, reference, min_similarity=0.9)
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cache
+from typing import Literal
+
+import textdistance
+
+from app.utils.log import logger
+
+EditDistanceBackendName = Literal["auto", "rapidfuzz", "levenshtein", "textdistance"]
+
+# Distance function: (a, b, max_distance) -> distance, or None once it exceeds max_distance
+DistanceFn = Callable[[str, str, int | None], int | None]
+
+
+def banded_levenshtein(a: str, b: str, max_distance: int) -> int | None:
+    """Levenshtein distance bounded by ``max_distance``, in O(len * max_distance) time.
+
+    Args:
+        a: First text.
+        b: Second text.
+        max_distance: Largest distance of interest.
+
+    Returns:
+        The distance, or None as soon as it is known to exceed ``max_distance``.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    # Reason: Common prefixes and suffixes never change the distance.
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+    if len(a) > len(b):
+        a, b = b, a
+    if not a:
+        return len(b) if len(b) <= max_distance else None
+
+    over = max_distance + 1
+    previous = [j if j <= max_distance else over for j in range(len(b) + 1)]
+    for i, char in enumerate(a, start=1):
+        current = [over] * (len(b) + 1)
+        current[0] = i if i <= max_distance else over
+        row_min = current[0]
+        for j in range(max(1, i - max_distance), min(len(b), i + max_distance) + 1):
+            value = min(
+                previous[j - 1] + (char != b[j - 1]),
+                previous[j] + 1,
+                current[j - 1] + 1,
+            )
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return None
+        previous = current
+    return previous[-1] if previous[-1] <= max_distance else None
+
+
+def _textdistance_distance(a: str, b: str, max_distance: int | None) -> int | None:
+    if max_distance is not None:
+        return banded_levenshtein(a, b, max_distance)
+    return int(textdistance.levenshtein.distance(a, b))
+
+
+def _load_rapidfuzz() -> DistanceFn | None:
+    try:
+        from rapidfuzz.distance import Levenshtein
+    except ImportError:
+        return None
+
+    def distance(a: str, b: str, max_distance: int | None) -> int | None:
+        # Reason: With score_cutoff, rapidfuzz returns max_distance + 1 when exceeded.
+        value = Levenshtein.distance(a, b, score_cutoff=max_distance)
+        return None if max_distance is not None and value > max_distance else value
+
+    return distance
+
+
+def _load_python_levenshtein() -> DistanceFn | None:
+    try:
+        import Levenshtein
+    except ImportError:
+        return None
+
+    def distance(a: str, b: str, max_distance: int | None) -> int | None:
+        value = Levenshtein.distance(a, b)
+        return None if max_distance is not None and value > max_distance else value
+
+    return distance
+
+
+_LOADERS: dict[str, Callable[[], DistanceFn | None]] = {
+    "rapidfuzz": _load_rapidfuzz,
+    "levenshtein": _load_python_levenshtein,
+    "textdistance": lambda: _textdistance_distance,
+}
+
+
+@dataclass(frozen=True)
+class EditDistanceBackend:
+    """A Levenshtein implementation with normalized similarity.
+
+    Attributes:
+        name: Backend name, recorded with the scores it produces
+        distance: Distance function; returns None once ``max_distance`` is exceeded
+    """
+
+    name: str
+    distance: DistanceFn
+
+    def normalized_similarity(self, a: str, b: str, min_similarity: float | None = None) -> float:
+        """Normalized Levenshtein similarity, ``1 - distance / max(len(a), len(b))``.
+
+        Args:
+            a: First text.
+            b: Second text.
+            min_similarity: Optional cutoff; pairs below it return 0.0 early.
+
+        Returns:
+            Similarity between 0.0 and 1.0; 1.0 for two empty texts.
+        """
+        longest = max(len(a), len(b))
+        if longest == 0:
+            return 1.0
+        max_distance = (
+            None if min_similarity is None else math.floor((1 - min_similarity) * longest)
+        )
+        value = self.distance(a, b, max_distance)
+        if value is None:
+            return 0.0
+        return 1 - value / longest
+
+
+def available_edit_distance_backends() -> list[str]:
+    """Names of installed backends, fastest first."""
+    return [name for name, loader in _LOADERS.items() if loader() is not None]
+
+
+@cache
+def get_edit_distance_backend(name: EditDistanceBackendName = "auto") -> EditDistanceBackend:
+    """Get an edit-distance backend by name.
+
+    Args:
+        name: Backend name, or "auto" for the fastest installed one. A named
+            backend that is not installed falls back to "auto" with a warning.
+
+    Returns:
+        The selected backend.
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    if name != "auto" and name not in _LOADERS:
+        raise ValueError(f"Unknown edit-distance backend: {name}")
+    if name != "auto":
+        distance = _LOADERS[name]()
+        if distance is not None:
+            return EditDistanceBackend(name, distance)
+        logger.warning(f"Edit-distance backend '{name}' not installed, selecting automatically")
+
+    for candidate, loader in _LOADERS.items():
+        distance = loader()
+        if distance is not None:
+            logger.debug(f"Using edit-distance backend: {candidate}")
+            return EditDistanceBackend(candidate, distance)
+    raise RuntimeError("No edit-distance backend available")  # pragma: no cover
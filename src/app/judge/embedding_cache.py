@@ -0,0 +1,300 @@
+"""
+Persistent BERTScore embedding cache for ground-truth reference reviews.
+
+PeerRead reference reviews never change, so their contextual token embeddings
+and token weights only need one forward pass ever. Entries are stored as
+``.npz`` files keyed by the BERTScore configuration hash (model, layer, IDF
+mode, library versions) and the SHA-256 of the text. With a warm cache, Tier 1
+only encodes the agent output and computes the greedy-matching F1 against the
+cached references, which is the same F1 that ``BERTScorer.score`` returns.
+
+Example:
+    >>> from app.judge.embedding_cache import prefill_reference_embeddings
+    >>> prefill_reference_embeddings(venues=["acl_2017"])
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+
+from app.config.config_app import PEERREAD_EMBEDDING_CACHE_DIR
+from app.config.peerread_config import PeerReadConfig
+from app.data_utils.datasets_peerread import PeerReadLoader, load_peerread_config
+from app.utils.log import logger
+from app.utils.paths import resolve_project_path
+
+if TYPE_CHECKING:
+    from bert_score import BERTScorer
+
+    from app.judge.bertscore_backend import BERTScoreBackend
+
+_ENCODE_BATCH_SIZE = 64
+_UNSAFE_CHARS_RE = re.compile(r"[^A-Za-z0-9._=-]+")
+
+
+class TokenEmbeddings(NamedTuple):
+    """Contextual token embeddings of one text, ready for greedy matching.
+
+    Attributes:
+        embedding: L2-normalized token vectors, shape (tokens, dim).
+        idf: Token weights normalized to sum to 1, shape (tokens,).
+    """
+
+    embedding: np.ndarray
+    idf: np.ndarray
+
+
+def scorer_namespace(scorer: BERTScorer, backend: BERTScoreBackend | None = None) -> str:
+    """Cache namespace of a scorer: its BERTScore configuration hash plus backend options."""
+    tag = backend.cache_tag if backend is not None else ""
+    return _UNSAFE_CHARS_RE.sub("_", f"{scorer.hash}{tag}")
+
+
+def encode_texts(scorer: BERTScorer, texts: list[str]) -> list[TokenEmbeddings]:
+    """Encode texts with the scorer's model, as ``BERTScorer.score`` does internally.
+
+    Args:
+        scorer: Initialized BERTScorer (IDF disabled, as used by Tier 1).
+        texts: Texts to encode.
+
+    Returns:
+        Token embeddings per text, in input order.
+    """
+    from bert_score.utils import get_bert_embedding
+
+    tokenizer = scorer._tokenizer
+    # Reason: Same weights BERTScorer.score uses without IDF: 1.0, except [CLS]/[SEP].
+    idf_dict: defaultdict[int, float] = defaultdict(lambda: 1.0)
+    idf_dict[tokenizer.sep_token_id] = 0
+    idf_dict[tokenizer.cls_token_id] = 0
+
+    results: list[TokenEmbeddings | None] = [None] * len(texts)
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    for start in range(0, len(order), _ENCODE_BATCH_SIZE):
+        chunk = order[start : start + _ENCODE_BATCH_SIZE]
+        embedding, mask, idf = get_bert_embedding(
+            [texts[i] for i in chunk],
+            scorer._model,
+            tokenizer,
+            idf_dict,
+            device=scorer.device,
+            all_layers=scorer.all_layers,
+        )
+        for row, text_idx in enumerate(chunk):
+            length = int(mask[row].sum().item())
+            vectors = embedding[row, :length].float()
+            vectors = vectors / vectors.norm(dim=-1, keepdim=True)
+            weights = idf[row, :length].float()
+            weights = weights / weights.sum()
+            results[text_idx] = TokenEmbeddings(
+                vectors.cpu().numpy().astype(np.float32),
+                weights.cpu().numpy().astype(np.float32),
+            )
+    return [r for r in results if r is not None]
+
+
+def greedy_match_f1(candidate: TokenEmbeddings, reference: TokenEmbeddings) -> float:
+    """BERTScore F1 from precomputed token embeddings.
+
+    Args:
+        candidate: Embeddings of the agent output.
+        reference: Embeddings of the reference review.
+
+    Returns:
+        Greedy-matching F1, identical to ``BERTScorer.score`` without baseline rescaling.
+    """
+    sim = candidate.embedding @ reference.embedding.T
+    precision = float((sim.max(axis=1) * candidate.idf).sum())
+    recall = float((sim.max(axis=0) * reference.idf).sum())
+    if precision + recall == 0:
+        return 0.0
+    return 2 * precision * recall / (precision + recall)
+
+
+class ReferenceEmbeddingCache:
+    """On-disk cache of reference token embeddings keyed by (scorer, text hash)."""
+
+    def __init__(self, cache_dir: Path):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Root directory of cached embeddings.
+        """
+        self.cache_dir = cache_dir
+        self._memory: dict[tuple[str, str], TokenEmbeddings] = {}
+        self._lock = threading.Lock()
+
+    def _cache_file(self, namespace: str, digest: str) -> Path:
+        """Path of the cached embeddings for a namespace and text digest."""
+        return self.cache_dir / namespace / digest[:2] / f"{digest}.npz"
+
+    @staticmethod
+    def _digest(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get(self, namespace: str, text: str) -> TokenEmbeddings | None:
+        """Look up cached embeddings of a text, from memory or disk.
+
+        Args:
+            namespace: Scorer namespace from ``scorer_namespace``.
+            text: Reference text.
+
+        Returns:
+            Cached embeddings, or None on a miss.
+        """
+        key = (namespace, self._digest(text))
+        with self._lock:
+            cached = self._memory.get(key)
+        if cached is not None:
+            return cached
+
+        cache_file = self._cache_file(*key)
+        try:
+            with np.load(cache_file) as data:
+                cached = TokenEmbeddings(data["embedding"], data["idf"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug(f"Ignoring unreadable embedding cache entry {cache_file}: {e}")
+            return None
+
+        with self._lock:
+            self._memory[key] = cached
+        return cached
+
+    def put(self, namespace: str, text: str, embeddings: TokenEmbeddings) -> None:
+        """Store embeddings of a text atomically.
+
+        Args:
+            namespace: Scorer namespace from ``scorer_namespace``.
+            text: Reference text.
+            embeddings: Embeddings to store.
+        """
+        key = (namespace, self._digest(text))
+        with self._lock:
+            self._memory[key] = embeddings
+
+        cache_file = self._cache_file(*key)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(f"{cache_file.stem}.{os.getpid()}.tmp.npz")
+            np.savez(tmp_file, embedding=embeddings.embedding, idf=embeddings.idf)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not cache embeddings in {cache_file}: {e}")
+
+    def get_or_encode(
+        self,
+        scorer: BERTScorer,
+        texts: list[str],
+        backend: BERTScoreBackend | None = None,
+    ) -> list[TokenEmbeddings]:
+        """Get embeddings of reference texts, encoding and storing only the misses.
+
+        Args:
+            scorer: Initialized BERTScorer.
+            texts: Reference texts.
+            backend: Backend options the scorer was loaded with, part of the cache key.
+
+        Returns:
+            Embeddings per text, in input order.
+        """
+        namespace = scorer_namespace(scorer, backend)
+        found: dict[str, TokenEmbeddings] = {}
+        missing: list[str] = []
+        for text in dict.fromkeys(texts):
+            cached = self.get(namespace, text)
+            if cached is None:
+                missing.append(text)
+            else:
+                found[text] = cached
+
+        if missing:
+            for text, embeddings in zip(missing, encode_texts(scorer, missing), strict=True):
+                self.put(namespace, text, embeddings)
+                found[text] = embeddings
+        return [found[text] for text in texts]
+
+
+def default_embedding_cache_dir(config: PeerReadConfig | None = None) -> Path:
+    """Get the embedding cache directory inside the PeerRead cache.
+
+    Args:
+        config: PeerRead dataset configuration. Loads from file if None.
+
+    Returns:
+        Root directory of cached reference embeddings.
+    """
+    config = config or load_peerread_config()
+    return resolve_project_path(config.cache_directory) / PEERREAD_EMBEDDING_CACHE_DIR
+
+
+# Global singleton cache
+_global_cache: ReferenceEmbeddingCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_reference_embedding_cache() -> ReferenceEmbeddingCache:
+    """Get or create the process-wide reference embedding cache.
+
+    Returns:
+        Shared ReferenceEmbeddingCache rooted in the PeerRead cache directory.
+    """
+    global _global_cache
+    with _cache_lock:
+        if _global_cache is None:
+            _global_cache = ReferenceEmbeddingCache(default_embedding_cache_dir())
+        return _global_cache
+
+
+def prefill_reference_embeddings(
+    config: PeerReadConfig | None = None,
+    venues: list[str] | None = None,
+    splits: list[str] | None = None,
+    cache: ReferenceEmbeddingCache | None = None,
+) -> int:
+    """Encode all ground-truth review texts of the given venues/splits ahead of time.
+
+    Args:
+        config: PeerRead dataset configuration. Loads from file if None.
+        venues: Venues to prefill. Defaults to all configured venues.
+        splits: Splits to prefill. Defaults to all configured splits.
+        cache: Target cache. Defaults to the process-wide cache.
+
+    Returns:
+        Number of distinct review texts now cached.
+
+    Raises:
+        RuntimeError: If BERTScore is not installed or failed to initialize.
+    """
+    from app.config.judge_settings import JudgeSettings
+    from app.judge.bertscore_backend import BERTScoreBackend
+    from app.judge.traditional_metrics import TraditionalMetricsEngine
+
+    backend = BERTScoreBackend.from_settings(JudgeSettings())
+    scorer: Any = TraditionalMetricsEngine(bertscore_backend=backend)._get_bertscore_model()
+    if scorer is None:
+        raise RuntimeError("BERTScore is unavailable; cannot prefill reference embeddings")
+
+    config = config or load_peerread_config()
+    cache = cache or get_reference_embedding_cache()
+    loader = PeerReadLoader(config)
+
+    texts: dict[str, None] = {}
+    for venue in venues or config.venues:
+        for split in splits or config.splits:
+            for paper in loader.iter_papers(venue=venue, split=split):
+                texts.update((r.comments, None) for r in paper.reviews if r.comments.strip())
+
+    logger.info(f"Prefilling reference embeddings for {len(texts)} review texts")
+    cache.get_or_encode(scorer, list(texts), backend)
+    logger.info(f"✓ Reference embeddings cached in {cache.cache_dir}")
+    return len(texts)
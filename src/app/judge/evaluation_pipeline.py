@@ -24,6 +24,7 @@ from app.judge.composite_scorer import CompositeScorer
 from app.judge.graph_analysis import GraphAnalysisEngine
 from app.judge.llm_evaluation_managers import LLMJudgeEngine
 from app.judge.performance_monitor import PerformanceMonitor
+from app.judge.tier_executor import get_tier_executor
 from app.judge.traditional_metrics import TraditionalMetricsEngine
 from app.utils.log import logger
 
@@ -65,12 +66,13 @@ class EvaluationPipeline:
         self.performance_monitor = PerformanceMonitor(settings.get_performance_targets())
 
         # Initialize engines with settings
-        self.traditional_engine = TraditionalMetricsEngine()
+        self.traditional_engine = TraditionalMetricsEngine.from_settings(settings)
         self.llm_engine = LLMJudgeEngine(
             settings, chat_provider=chat_provider, chat_model=chat_model
         )
         self.graph_engine = GraphAnalysisEngine(settings)
         self.composite_scorer = CompositeScorer(settings=settings)
+        self.tier_executor = get_tier_executor(settings)
 
         enabled_tiers = sorted(settings.get_enabled_tiers())
         fallback_strategy = settings.fallback_strategy
@@ -186,18 +188,16 @@ class EvaluationPipeline:
 
             ref_reviews = usable_refs
 
-            result = await asyncio.wait_for(
-                asyncio.create_task(
-                    asyncio.to_thread(
-                        self.traditional_engine.evaluate_traditional_metrics,
-                        review,  # agent_output
-                        ref_reviews,  # reference_texts
-                        start_evaluation,  # start_time
-                        time.time(),  # end_time (will be updated in method)
-                        self.settings,  # settings
-                    )
-                ),
+            result = await self.tier_executor.run(
+                "tier1",
+                self.traditional_engine.evaluate_traditional_metrics,
+                review,  # agent_output
+                ref_reviews,  # reference_texts
+                start_evaluation,  # start_time
+                time.time(),  # end_time (will be updated in method)
+                self.settings,  # settings
                 timeout=timeout,
+                settings=self.settings,
             )
 
             execution_time = time.time() - start_time
@@ -489,11 +489,12 @@ class EvaluationPipeline:
 
             logger.info("Executing Tier 3: Graph Analysis")
 
-            result = await asyncio.wait_for(
-                asyncio.create_task(
-                    asyncio.to_thread(self.graph_engine.evaluate_graph_metrics, trace_data)
-                ),
+            result = await self.tier_executor.run(
+                "tier3",
+                self.graph_engine.evaluate_graph_metrics,
+                trace_data,
                 timeout=timeout,
+                settings=self.settings,
             )
 
             execution_time = time.time() - start_time
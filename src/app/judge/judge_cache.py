@@ -0,0 +1,216 @@
+"""
+Persistent SQLite cache of LLM-judge assessments.
+
+Sweep repetitions, replays and baseline comparisons re-evaluate identical
+(paper excerpt, review) pairs. Each Tier 2 assessment is a deterministic
+function of the judge provider, model, assessment type, system prompt and user
+prompt, so its structured output is cached under a hash of those inputs and
+served without an LLM call on the next identical request.
+
+User prompts are normalized before hashing (whitespace runs collapsed, ends
+stripped), so formatting-only differences share one entry. Entries expire
+after a TTL, and the least recently used entries are evicted once the cache
+exceeds its size limit.
+
+Example:
+    >>> cache = get_judge_cache(settings)  # None unless tier2_cache_enabled
+    >>> key = judge_cache_key("openai", "gpt-4o-mini", "constructiveness", system, prompt)
+    >>> output = cache.get(key)
+    >>> if output is None:
+    ...     cache.put(key, "openai", "gpt-4o-mini", "constructiveness", fresh_output)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from app.utils.log import logger
+
+if TYPE_CHECKING:
+    from app.config.judge_settings import JudgeSettings
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_judge_input(text: str) -> str:
+    """Collapse whitespace runs to single spaces and strip the ends."""
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def judge_cache_key(
+    provider: str,
+    model: str,
+    assessment_type: str,
+    system_prompt: str,
+    prompt: str,
+) -> str:
+    """Cache key of one judge call.
+
+    Args:
+        provider: Judge provider name.
+        model: Judge model name.
+        assessment_type: Assessment type, e.g. "technical_accuracy".
+        system_prompt: System prompt of the judge agent.
+        prompt: User prompt; normalized before hashing.
+
+    Returns:
+        Hex SHA-256 digest of the inputs.
+    """
+    digest = hashlib.sha256()
+    for part in (provider, model, assessment_type, system_prompt, normalize_judge_input(prompt)):
+        digest.update(part.encode("utf-8"))
+        # Reason: A separator keeps ("ab", "c") and ("a", "bc") distinct.
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class JudgeCache:
+    """SQLite-backed judge response cache with TTL and LRU size eviction."""
+
+    def __init__(self, db_path: Path, ttl_seconds: float, max_entries: int):
+        """Open (and create if needed) the cache database.
+
+        Args:
+            db_path: Path to the SQLite database file.
+            ttl_seconds: Age after which entries are treated as missing and purged.
+            max_entries: Entry count above which least recently used entries are evicted.
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_database()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, committing on success and always closing it."""
+        conn = sqlite3.connect(self.db_path, timeout=10.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_database(self) -> None:
+        """Initialize the schema."""
+        with self._connect() as conn:
+            # Reason: WAL lets concurrent sweep workers read while one writes.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS judge_cache (
+                    key TEXT PRIMARY KEY,
+                    provider TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    assessment_type TEXT NOT NULL,
+                    output TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_judge_cache_accessed ON judge_cache (accessed_at)"
+            )
+
+    def get(self, key: str) -> str | None:
+        """Get a cached output and mark it as recently used.
+
+        Args:
+            key: Key from ``judge_cache_key``.
+
+        Returns:
+            Serialized assessment output, or None if missing, expired or unreadable.
+        """
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT output FROM judge_cache WHERE key = ? AND created_at >= ?",
+                    (key, now - self.ttl_seconds),
+                ).fetchone()
+                if row is not None:
+                    conn.execute("UPDATE judge_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        except sqlite3.Error as e:
+            logger.warning(f"Judge cache read failed: {e}")
+            return None
+        return row[0] if row else None
+
+    def put(self, key: str, provider: str, model: str, assessment_type: str, output: str) -> None:
+        """Store an output, then purge expired and excess entries.
+
+        Write failures are logged and otherwise ignored.
+
+        Args:
+            key: Key from ``judge_cache_key``.
+            provider: Judge provider name, stored for inspection.
+            model: Judge model name, stored for inspection.
+            assessment_type: Assessment type, stored for inspection.
+            output: Serialized assessment output.
+        """
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO judge_cache "
+                    "(key, provider, model, assessment_type, output, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, provider, model, assessment_type, output, now, now),
+                )
+                conn.execute(
+                    "DELETE FROM judge_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+                )
+                conn.execute(
+                    "DELETE FROM judge_cache WHERE key IN ("
+                    "SELECT key FROM judge_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Judge cache write failed: {e}")
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM judge_cache").fetchone()[0]
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM judge_cache")
+
+
+_global_caches: dict[tuple[str, float, int], JudgeCache] = {}
+_cache_lock = threading.Lock()
+
+
+def get_judge_cache(settings: JudgeSettings) -> JudgeCache | None:
+    """Get the process-wide judge cache for the given settings.
+
+    Args:
+        settings: Judge settings with ``tier2_cache_*`` configuration.
+
+    Returns:
+        Shared cache, or None when caching is disabled or bypassed.
+    """
+    if not settings.tier2_cache_enabled or settings.tier2_cache_bypass:
+        return None
+    key = (
+        settings.tier2_cache_path,
+        settings.tier2_cache_ttl_seconds,
+        settings.tier2_cache_max_entries,
+    )
+    with _cache_lock:
+        cache = _global_caches.get(key)
+        if cache is None:
+            try:
+                cache = JudgeCache(Path(key[0]), key[1], key[2])
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Judge cache unavailable at {key[0]}: {e}")
+                return None
+            _global_caches[key] = cache
+    return cache
@@ -9,26 +9,166 @@ for evaluation tasks.
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Any
-
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+from httpx import AsyncClient
+from pydantic import BaseModel, ValidationError
 from pydantic_ai import Agent
+from pydantic_ai.exceptions import UnexpectedModelBehavior
 
-from app.agents.agent_factories import create_evaluation_agent
+from app.agents.agent_factories import create_evaluation_agent, resolve_evaluation_system_prompt
 from app.config.app_env import AppEnv
 from app.data_models.evaluation_models import (
     ConstructivenessAssessment,
+    FusedJudgeAssessment,
     PlanningRationalityAssessment,
     TechnicalAccuracyAssessment,
     Tier2Result,
 )
+from app.judge.judge_cache import get_judge_cache, judge_cache_key
 from app.judge.traditional_metrics import TraditionalMetricsEngine
 from app.llms.providers import get_api_key
+from app.llms.rate_limiter import get_rate_limited_client
 from app.utils.log import logger
 from app.utils.prompt_sanitization import sanitize_for_prompt, sanitize_review_text
 
 if TYPE_CHECKING:
     from app.config.judge_settings import JudgeSettings
 
+AssessmentT = TypeVar("AssessmentT", bound=BaseModel)
+
+_LATENCY_WINDOW = 100
+
+_TECHNICAL_ACCURACY_CRITERIA = """1. Factual Correctness: Are claims supported by the paper?
+2. Methodology Understanding: Does reviewer grasp the approach?
+3. Domain Knowledge: Appropriate technical terminology?"""
+_CONSTRUCTIVENESS_CRITERIA = """1. Actionable Feedback: Specific, implementable suggestions?
+2. Balanced Critique: Both strengths and weaknesses noted?
+3. Improvement Guidance: Clear direction for authors?"""
+_PLANNING_RATIONALITY_CRITERIA = """1. Logical Flow: Coherent step progression?
+2. Decision Quality: Appropriate choices made?
+3. Resource Efficiency: Optimal tool/agent usage?"""
+
+
+class JudgeAgentPool:
+    """Reusable judge agents sharing one pooled, rate-limited HTTP client per provider.
+
+    Building a judge agent creates a provider SDK client, and a fresh HTTP client
+    pays connection setup and TLS handshakes on its first request. The pool builds
+    each agent once and hands it to every later assessment and engine.
+
+    Agents use the provider's process-wide client from ``get_rate_limited_client``,
+    which keeps a connection pool per event loop, so pooled agents can be used
+    from successive event loops. Access is guarded by a lock, so pipelines
+    running in separate threads can share the pool.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty pool."""
+        self._lock = threading.Lock()
+        self._agents: dict[tuple[str, ...], Agent] = {}
+
+    def http_client(self, provider: str) -> AsyncClient:
+        """Get the shared HTTP client of a provider.
+
+        Args:
+            provider: Provider name.
+
+        Returns:
+            Process-wide rate-limited async HTTP client of the provider.
+        """
+        return get_rate_limited_client(provider)
+
+    def get_agent(self, key: tuple[str, ...], factory: Callable[[], Agent]) -> Agent:
+        """Get the pooled agent for a key.
+
+        Args:
+            key: Agent identity, e.g. (provider, model, assessment type, system prompt).
+            factory: Builds the agent on first use.
+
+        Returns:
+            Pooled agent.
+        """
+        with self._lock:
+            agent = self._agents.get(key)
+            if agent is None:
+                agent = factory()
+                self._agents[key] = agent
+            return agent
+
+
+_global_agent_pool: JudgeAgentPool | None = None
+_agent_pool_lock = threading.Lock()
+
+
+def get_judge_agent_pool() -> JudgeAgentPool:
+    """Get the process-wide judge agent pool."""
+    global _global_agent_pool
+    with _agent_pool_lock:
+        if _global_agent_pool is None:
+            _global_agent_pool = JudgeAgentPool()
+        return _global_agent_pool
+
+
+class JudgeLatencyTracker:
+    """Rolling window of successful judge call latencies per provider and model.
+
+    Shared across engines so the hedge delay reflects the provider's recent
+    behaviour, not only the current evaluation.
+    """
+
+    def __init__(self, window: int = _LATENCY_WINDOW) -> None:
+        """Initialize empty latency windows.
+
+        Args:
+            window: Number of most recent latencies kept per provider and model.
+        """
+        self._lock = threading.Lock()
+        self._window = window
+        self._latencies: dict[str, deque[float]] = {}
+
+    def record(self, provider: str, model: str, seconds: float) -> None:
+        """Record the latency of a successful call."""
+        with self._lock:
+            key = f"{provider}/{model}"
+            self._latencies.setdefault(key, deque(maxlen=self._window)).append(seconds)
+
+    def percentile(self, provider: str, model: str, q: float, min_samples: int) -> float | None:
+        """Nearest-rank latency percentile of a provider and model.
+
+        Args:
+            provider: Provider name.
+            model: Model name.
+            q: Percentile as a fraction, e.g. 0.95.
+            min_samples: Samples required for a meaningful estimate.
+
+        Returns:
+            Latency in seconds, or None with fewer than ``min_samples`` samples.
+        """
+        with self._lock:
+            samples = sorted(self._latencies.get(f"{provider}/{model}", ()))
+        if len(samples) < min_samples:
+            return None
+        return samples[max(0, math.ceil(q * len(samples)) - 1)]
+
+
+_global_latency_tracker: JudgeLatencyTracker | None = None
+_latency_tracker_lock = threading.Lock()
+
+
+def get_judge_latency_tracker() -> JudgeLatencyTracker:
+    """Get the process-wide judge latency tracker."""
+    global _global_latency_tracker
+    with _latency_tracker_lock:
+        if _global_latency_tracker is None:
+            _global_latency_tracker = JudgeLatencyTracker()
+        return _global_latency_tracker
+
 
 class LLMJudgeEngine:
     """Manager for LLM-based evaluation with provider flexibility and fallbacks."""
@@ -99,6 +239,42 @@ class LLMJudgeEngine:
         # Track auth failures for fallback_used flag
         self._auth_failure_count = 0
 
+        # Judge agents and HTTP clients shared across assessments and engines
+        self.agent_pool = get_judge_agent_pool()
+
+        # Persistent judge cache (None when disabled or bypassed)
+        self.judge_cache = get_judge_cache(settings)
+        self._cache_hits: list[str] = []
+
+        # Hedged requests to the fallback provider when the primary is slow
+        self.latency_tracker = get_judge_latency_tracker()
+        self._fallback_api_key: str | None = None
+        self.hedging_enabled = self._init_hedging(env_config)
+        self._hedge_winners: dict[str, str] = {}
+
+    def _init_hedging(self, env_config: AppEnv) -> bool:
+        """Resolve the fallback API key if hedging is enabled and possible.
+
+        Hedging needs a usable primary and a distinct fallback with a valid key.
+
+        Args:
+            env_config: Application environment configuration
+
+        Returns:
+            True if assessments may be hedged to the fallback provider.
+        """
+        if not self.settings.tier2_hedge_enabled or not self.tier2_available:
+            return False
+        if (self.provider, self.model) == (self.fallback_provider, self.fallback_model):
+            logger.info("Judge hedging disabled: primary and fallback are the same")
+            return False
+        is_valid, api_key = self._resolve_provider_key(self.fallback_provider, env_config)
+        if not is_valid:
+            logger.info(f"Judge hedging disabled: no API key for {self.fallback_provider}")
+            return False
+        self._fallback_api_key = api_key
+        return True
+
     def _resolve_model(
         self, chat_model: str | None, resolved_provider: str, configured_provider: str
     ) -> str:
@@ -177,7 +353,10 @@ class LLMJudgeEngine:
 
     async def create_judge_agent(self, assessment_type: str, use_fallback: bool = False) -> Agent:
         """
-        Create an LLM judge agent for specific assessment type.
+        Get an LLM judge agent for specific assessment type from the agent pool.
+
+        Agents are built once per (provider, model, assessment type, system prompt)
+        and API key, and reuse the provider's pooled HTTP client.
 
         Args:
             assessment_type: Type of assessment ("technical_accuracy", etc.)
@@ -189,170 +368,385 @@ class LLMJudgeEngine:
         if use_fallback:
             provider = self.fallback_provider
             model = self.fallback_model
+            api_key = self._fallback_api_key or self._api_key
             logger.info(f"Using fallback provider: {provider}/{model}")
         else:
             provider = self.provider
             model = self.model
+            api_key = self._api_key
+
+        system_prompt = resolve_evaluation_system_prompt(assessment_type)
+        key = (provider, model, assessment_type, system_prompt, api_key or "")
+        return self.agent_pool.get_agent(
+            key,
+            lambda: create_evaluation_agent(
+                provider=provider,
+                model_name=model,
+                assessment_type=assessment_type,
+                api_key=api_key,
+                http_client=self.agent_pool.http_client(provider),
+            ),
+        )
 
-        return create_evaluation_agent(
-            provider=provider,
-            model_name=model,
-            assessment_type=assessment_type,
-            api_key=self._api_key,
+    async def _run_judge(
+        self, assessment_type: str, prompt: str, output_type: type[AssessmentT]
+    ) -> AssessmentT:
+        """Run a judge agent, serving identical requests from the judge cache.
+
+        Args:
+            assessment_type: Type of assessment ("technical_accuracy", etc.)
+            prompt: User prompt for the judge
+            output_type: Structured assessment model
+
+        Returns:
+            Assessment from the cache or from a fresh LLM call
+        """
+        system_prompt = resolve_evaluation_system_prompt(assessment_type)
+        if self.judge_cache is not None and not self.settings.tier2_cache_refresh:
+            candidates = [(self.provider, self.model)]
+            if self.hedging_enabled:
+                candidates.append((self.fallback_provider, self.fallback_model))
+            for provider, model in candidates:
+                cached = self.judge_cache.get(
+                    judge_cache_key(provider, model, assessment_type, system_prompt, prompt)
+                )
+                if cached is None:
+                    continue
+                try:
+                    output = output_type.model_validate_json(cached)
+                except ValidationError as e:
+                    logger.debug(f"Ignoring stale judge cache entry for {assessment_type}: {e}")
+                else:
+                    self._cache_hits.append(assessment_type)
+                    return output
+
+        use_fallback = False
+        if self.hedging_enabled:
+            output, use_fallback = await self._run_hedged(assessment_type, prompt, output_type)
+        else:
+            output = await self._call_judge(assessment_type, prompt, output_type)
+        if self.judge_cache is not None:
+            # Reason: Stored under the answering provider, so hedge winners are
+            # never served as if the primary had produced them.
+            provider, model = (
+                (self.fallback_provider, self.fallback_model)
+                if use_fallback
+                else (self.provider, self.model)
+            )
+            self.judge_cache.put(
+                judge_cache_key(provider, model, assessment_type, system_prompt, prompt),
+                provider,
+                model,
+                assessment_type,
+                output.model_dump_json(),
+            )
+        return output
+
+    async def _call_judge(
+        self,
+        assessment_type: str,
+        prompt: str,
+        output_type: type[AssessmentT],
+        use_fallback: bool = False,
+    ) -> AssessmentT:
+        """Run one judge call with the timeout, recording its latency on success."""
+        provider, model = (
+            (self.fallback_provider, self.fallback_model)
+            if use_fallback
+            else (self.provider, self.model)
+        )
+        agent = await self.create_judge_agent(assessment_type, use_fallback=use_fallback)
+        start = time.monotonic()
+        result = await asyncio.wait_for(
+            agent.run(prompt, output_type=output_type),
+            timeout=self.timeout,
         )
+        self.latency_tracker.record(provider, model, time.monotonic() - start)
+        return result.output
+
+    def _hedge_delay(self) -> float:
+        """Seconds to wait for the primary before also asking the fallback."""
+        observed = self.latency_tracker.percentile(
+            self.provider,
+            self.model,
+            self.settings.tier2_hedge_percentile,
+            self.settings.tier2_hedge_min_samples,
+        )
+        return self.settings.tier2_hedge_delay_seconds if observed is None else observed
 
-    async def assess_technical_accuracy(self, paper: str, review: str) -> float:
-        """Assess technical accuracy of review against paper."""
+    async def _run_hedged(
+        self, assessment_type: str, prompt: str, output_type: type[AssessmentT]
+    ) -> tuple[AssessmentT, bool]:
+        """Race the primary against a delayed request to the fallback provider.
+
+        The fallback is asked once the primary exceeds its latency percentile, or
+        right away if the primary fails first. The first valid answer wins and
+        the other request is cancelled.
+
+        Returns:
+            Tuple of (assessment, whether the fallback answered).
+
+        Raises:
+            Exception: The primary's error if neither provider returns an answer.
+        """
+        primary = asyncio.create_task(self._call_judge(assessment_type, prompt, output_type))
+        tasks = [primary]
         try:
-            # Truncate paper content for cost efficiency
-            paper_excerpt = (
-                paper[: self.paper_excerpt_length]
-                if len(paper) > self.paper_excerpt_length
-                else paper
+            done, _ = await asyncio.wait({primary}, timeout=self._hedge_delay())
+            if done and primary.exception() is None:
+                self._hedge_winners[assessment_type] = f"{self.provider}/{self.model}"
+                return primary.result(), False
+            if done:
+                logger.warning(
+                    f"{assessment_type} failed on {self.provider}, "
+                    f"failing over to {self.fallback_provider}: {primary.exception()}"
+                )
+            else:
+                logger.info(
+                    f"Hedging {assessment_type}: no answer from {self.provider} yet, "
+                    f"also asking {self.fallback_provider}"
+                )
+            hedge = asyncio.create_task(
+                self._call_judge(assessment_type, prompt, output_type, use_fallback=True)
             )
+            tasks.append(hedge)
+            pending = {task for task in tasks if not task.done()}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Reason: Prefer the primary if both answered in the same step.
+                for task in (t for t in tasks if t in done and t.exception() is None):
+                    use_fallback = task is hedge
+                    winner = (
+                        f"{self.fallback_provider}/{self.fallback_model}"
+                        if use_fallback
+                        else f"{self.provider}/{self.model}"
+                    )
+                    self._hedge_winners[assessment_type] = winner
+                    return task.result(), use_fallback
+            raise primary.exception()  # type: ignore[misc]
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _sanitized_paper_excerpt(self, paper: str) -> str:
+        """Truncate the paper for cost efficiency and wrap it in XML delimiters."""
+        paper_excerpt = (
+            paper[: self.paper_excerpt_length] if len(paper) > self.paper_excerpt_length else paper
+        )
+        return sanitize_for_prompt(
+            paper_excerpt, max_length=self.paper_excerpt_length, delimiter="paper_excerpt"
+        )
 
-            # Sanitize user-controlled content with XML delimiters
-            sanitized_paper = sanitize_for_prompt(
-                paper_excerpt, max_length=self.paper_excerpt_length, delimiter="paper_excerpt"
-            )
-            sanitized_review = sanitize_review_text(review)
+    def _technical_accuracy_prompt(self, paper: str, review: str) -> str:
+        """Build the technical accuracy prompt from a paper excerpt and the review."""
+        # Sanitize user-controlled content with XML delimiters
+        sanitized_paper = self._sanitized_paper_excerpt(paper)
+        sanitized_review = sanitize_review_text(review)
 
-            prompt = f"""Evaluate technical accuracy of this review (1-5 scale):
+        return f"""Evaluate technical accuracy of this review (1-5 scale):
 
 Paper Excerpt: {sanitized_paper}
 
 Review: {sanitized_review}
 
 Rate each aspect (1=poor, 5=excellent):
-1. Factual Correctness: Are claims supported by the paper?
-2. Methodology Understanding: Does reviewer grasp the approach?
-3. Domain Knowledge: Appropriate technical terminology?
+{_TECHNICAL_ACCURACY_CRITERIA}
 
 Provide scores and brief explanation."""
 
-            agent = await self.create_judge_agent("technical_accuracy")
-            result = await asyncio.wait_for(
-                agent.run(prompt, output_type=TechnicalAccuracyAssessment),
-                timeout=self.timeout,
-            )
+    @staticmethod
+    def _technical_accuracy_score(output: TechnicalAccuracyAssessment) -> float:
+        """Weighted technical accuracy score normalized to 0-1."""
+        weighted_score = (
+            output.factual_correctness * 0.5
+            + output.methodology_understanding * 0.3
+            + output.domain_knowledge * 0.2
+        ) / 5.0
+        return min(1.0, max(0.0, weighted_score))
 
-            # Calculate weighted score and normalize to 0-1
-            weighted_score = (
-                result.output.factual_correctness * 0.5
-                + result.output.methodology_understanding * 0.3
-                + result.output.domain_knowledge * 0.2
-            ) / 5.0
+    @staticmethod
+    def _constructiveness_prompt(review: str) -> str:
+        """Build the constructiveness prompt from the review."""
+        # Sanitize user-controlled content with XML delimiters
+        sanitized_review = sanitize_review_text(review)
 
-            return min(1.0, max(0.0, weighted_score))
+        return f"""Evaluate constructiveness of this review (1-5 scale):
 
-        except Exception as e:
-            logger.warning(f"Technical accuracy assessment failed: {e}")
-            # Distinguish auth failures (401) from timeouts per STORY-001
-            error_msg = str(e).lower()
-            is_auth_failure = "401" in error_msg or "unauthorized" in error_msg
+Review: {sanitized_review}
 
-            if is_auth_failure:
-                # Auth failures get neutral score (0.5) - provider unavailable
-                logger.warning("Auth failure detected - using neutral fallback score")
-                self._auth_failure_count += 1
-                return 0.5
-            else:
-                # Timeouts and other errors use semantic similarity fallback
-                return self.fallback_engine.compute_semantic_similarity(paper, review)
+Rate each aspect (1=poor, 5=excellent):
+{_CONSTRUCTIVENESS_CRITERIA}
 
-    async def assess_constructiveness(self, review: str) -> float:
-        """Assess constructiveness and helpfulness of review."""
-        try:
-            # Sanitize user-controlled content with XML delimiters
-            sanitized_review = sanitize_review_text(review)
+Provide scores and brief explanation."""
 
-            prompt = f"""Evaluate constructiveness of this review (1-5 scale):
+    @staticmethod
+    def _constructiveness_score(output: ConstructivenessAssessment) -> float:
+        """Equally weighted constructiveness score normalized to 0-1."""
+        average_score = (
+            output.actionable_feedback + output.balanced_critique + output.improvement_guidance
+        ) / 15.0
+        return min(1.0, max(0.0, average_score))
 
-Review: {sanitized_review}
+    def _planning_rationality_prompt(self, execution_trace: dict[str, Any]) -> str:
+        """Build the planning rationality prompt from the execution trace."""
+        planning_summary = self._extract_planning_decisions(execution_trace)
+
+        return f"""Evaluate planning rationality of this execution (1-5 scale):
+
+Execution Summary: {planning_summary}
 
 Rate each aspect (1=poor, 5=excellent):
-1. Actionable Feedback: Specific, implementable suggestions?
-2. Balanced Critique: Both strengths and weaknesses noted?
-3. Improvement Guidance: Clear direction for authors?
+{_PLANNING_RATIONALITY_CRITERIA}
 
 Provide scores and brief explanation."""
 
-            agent = await self.create_judge_agent("constructiveness")
-            result = await asyncio.wait_for(
-                agent.run(prompt, output_type=ConstructivenessAssessment),
-                timeout=self.timeout,
+    @staticmethod
+    def _planning_rationality_score(output: PlanningRationalityAssessment) -> float:
+        """Planning score weighting decision quality most heavily, normalized to 0-1."""
+        weighted_score = (
+            output.logical_flow * 0.3
+            + output.decision_quality * 0.5
+            + output.resource_efficiency * 0.2
+        ) / 5.0
+        return min(1.0, max(0.0, weighted_score))
+
+    def _fused_prompt(self, paper: str, review: str, execution_trace: dict[str, Any]) -> str:
+        """Build one prompt covering all three criteria, sending each input once."""
+        sanitized_paper = self._sanitized_paper_excerpt(paper)
+        sanitized_review = sanitize_review_text(review)
+        planning_summary = self._extract_planning_decisions(execution_trace)
+
+        return f"""Evaluate this review and the agent execution that produced it (1-5 scale):
+
+Paper Excerpt: {sanitized_paper}
+
+Review: {sanitized_review}
+
+Execution Summary: {planning_summary}
+
+Rate each aspect (1=poor, 5=excellent).
+
+Technical accuracy of the review:
+{_TECHNICAL_ACCURACY_CRITERIA}
+
+Constructiveness of the review:
+{_CONSTRUCTIVENESS_CRITERIA}
+
+Planning rationality of the execution:
+{_PLANNING_RATIONALITY_CRITERIA}
+
+Provide scores and brief explanation for each of the three assessments."""
+
+    def _record_auth_failure(self, e: Exception) -> bool:
+        """Count auth failures (401), which get a neutral score instead of a fallback."""
+        error_msg = str(e).lower()
+        if "401" in error_msg or "unauthorized" in error_msg:
+            logger.warning("Auth failure detected - using neutral fallback score")
+            self._auth_failure_count += 1
+            return True
+        return False
+
+    async def assess_technical_accuracy(self, paper: str, review: str) -> float:
+        """Assess technical accuracy of review against paper."""
+        try:
+            prompt = self._technical_accuracy_prompt(paper, review)
+            output = await self._run_judge(
+                "technical_accuracy", prompt, TechnicalAccuracyAssessment
             )
+            return self._technical_accuracy_score(output)
 
-            # Equal weighting for constructiveness aspects
-            average_score = (
-                result.output.actionable_feedback
-                + result.output.balanced_critique
-                + result.output.improvement_guidance
-            ) / 15.0  # Normalize to 0-1
+        except Exception as e:
+            logger.warning(f"Technical accuracy assessment failed: {e}")
+            # Distinguish auth failures (401) from timeouts per STORY-001
+            if self._record_auth_failure(e):
+                # Auth failures get neutral score (0.5) - provider unavailable
+                return 0.5
+            # Timeouts and other errors use semantic similarity fallback
+            return self.fallback_engine.compute_semantic_similarity(paper, review)
 
-            return min(1.0, max(0.0, average_score))
+    async def assess_constructiveness(self, review: str) -> float:
+        """Assess constructiveness and helpfulness of review."""
+        try:
+            prompt = self._constructiveness_prompt(review)
+            output = await self._run_judge("constructiveness", prompt, ConstructivenessAssessment)
+            return self._constructiveness_score(output)
 
         except Exception as e:
             logger.warning(f"Constructiveness assessment failed: {e}")
             # Distinguish auth failures (401) from other errors
-            error_msg = str(e).lower()
-            is_auth_failure = "401" in error_msg or "unauthorized" in error_msg
-
-            if is_auth_failure:
+            if self._record_auth_failure(e):
                 # Auth failures get neutral score (0.5) - provider unavailable
-                logger.warning("Auth failure detected - using neutral fallback score")
-                self._auth_failure_count += 1
                 return 0.5
-            else:
-                # Other errors use heuristic fallback
-                return self._fallback_constructiveness_check(review)
+            # Other errors use heuristic fallback
+            return self._fallback_constructiveness_check(review)
 
     async def assess_planning_rationality(self, execution_trace: dict[str, Any]) -> float:
         """Assess quality of agent planning and decision-making."""
         try:
-            # Extract planning summary from trace
-            planning_summary = self._extract_planning_decisions(execution_trace)
+            prompt = self._planning_rationality_prompt(execution_trace)
+            output = await self._run_judge(
+                "planning_rationality", prompt, PlanningRationalityAssessment
+            )
+            return self._planning_rationality_score(output)
 
-            prompt = f"""Evaluate planning rationality of this execution (1-5 scale):
+        except Exception as e:
+            logger.warning(f"Planning rationality assessment failed: {e}")
+            # Distinguish auth failures (401) from other errors
+            if self._record_auth_failure(e):
+                # Auth failures get neutral score (0.5) - provider unavailable
+                return 0.5
+            # Other errors use heuristic fallback
+            return self._fallback_planning_check(execution_trace)
 
-Execution Summary: {planning_summary}
+    async def assess_fused(
+        self, paper: str, review: str, execution_trace: dict[str, Any]
+    ) -> tuple[float, float, float]:
+        """Assess all three criteria with one structured-output LLM call.
 
-Rate each aspect (1=poor, 5=excellent):
-1. Logical Flow: Coherent step progression?
-2. Decision Quality: Appropriate choices made?
-3. Resource Efficiency: Optimal tool/agent usage?
+        The paper excerpt, review and execution summary are sent once, and the
+        judge returns a ``FusedJudgeAssessment``. Scores use the same weighting
+        as the per-criterion assessments.
 
-Provide scores and brief explanation."""
+        Args:
+            paper: Paper text; truncated to the configured excerpt length.
+            review: Review text.
+            execution_trace: Execution trace dict for the planning summary.
 
-            agent = await self.create_judge_agent("planning_rationality")
-            result = await asyncio.wait_for(
-                agent.run(prompt, output_type=PlanningRationalityAssessment),
-                timeout=self.timeout,
-            )
+        Returns:
+            Tuple of (technical_accuracy, constructiveness, planning_rationality) scores.
 
-            # Weight decision quality most heavily
-            weighted_score = (
-                result.output.logical_flow * 0.3
-                + result.output.decision_quality * 0.5
-                + result.output.resource_efficiency * 0.2
-            ) / 5.0
+        Raises:
+            UnexpectedModelBehavior: If the judge output fails validation.
+            Exception: Timeouts and provider errors propagate to the caller.
+        """
+        prompt = self._fused_prompt(paper, review, execution_trace)
+        output = await self._run_judge("fused", prompt, FusedJudgeAssessment)
+        return (
+            self._technical_accuracy_score(output.technical_accuracy),
+            self._constructiveness_score(output.constructiveness),
+            self._planning_rationality_score(output.planning_rationality),
+        )
 
-            return min(1.0, max(0.0, weighted_score))
+    async def _run_fused(
+        self, paper: str, review: str, execution_trace: dict[str, Any]
+    ) -> tuple[float | BaseException, ...] | None:
+        """Run the fused assessment and map its failures to per-criterion outcomes.
 
+        Returns:
+            Three scores or exceptions for ``_handle_assessment_failures``, or None
+            when the judge output fails validation and per-criterion calls should run.
+        """
+        try:
+            return await self.assess_fused(paper, review, execution_trace)
+        except (UnexpectedModelBehavior, ValidationError) as e:
+            logger.warning(f"Fused judge output invalid, falling back to per-criterion calls: {e}")
+            return None
         except Exception as e:
-            logger.warning(f"Planning rationality assessment failed: {e}")
-            # Distinguish auth failures (401) from other errors
-            error_msg = str(e).lower()
-            is_auth_failure = "401" in error_msg or "unauthorized" in error_msg
-
-            if is_auth_failure:
-                # Auth failures get neutral score (0.5) - provider unavailable
-                logger.warning("Auth failure detected - using neutral fallback score")
-                self._auth_failure_count += 1
-                return 0.5
-            else:
-                # Other errors use heuristic fallback
-                return self._fallback_planning_check(execution_trace)
+            logger.warning(f"Fused assessment failed: {e}")
+            if self._record_auth_failure(e):
+                # Auth failures get neutral scores (0.5) - provider unavailable
+                return (0.5, 0.5, 0.5)
+            return (e, e, e)
 
     def _handle_assessment_failures(
         self,
@@ -420,24 +814,27 @@ Provide scores and brief explanation."""
     ) -> Tier2Result:
         """Run comprehensive LLM-based evaluation."""
         try:
-            # Reset auth failure counter for this evaluation
+            # Reset per-evaluation auth failure, cache hit and hedge winner tracking
             self._auth_failure_count = 0
-
-            # Run assessments concurrently for efficiency
-            technical_task = self.assess_technical_accuracy(paper, review)
-            constructiveness_task = self.assess_constructiveness(review)
-            planning_task = self.assess_planning_rationality(execution_trace)
-
-            (
-                technical_score,
-                constructiveness_score,
-                planning_score,
-            ) = await asyncio.gather(
-                technical_task,
-                constructiveness_task,
-                planning_task,
-                return_exceptions=True,
-            )
+            self._cache_hits = []
+            self._hedge_winners = {}
+
+            scores: tuple[float | BaseException, ...] | None = None
+            judge_mode: Literal["per_criterion", "fused"] = "per_criterion"
+            if self.settings.tier2_judge_mode == "fused":
+                scores = await self._run_fused(paper, review, execution_trace)
+                if scores is not None:
+                    judge_mode = "fused"
+
+            if scores is None:
+                # Run assessments concurrently for efficiency
+                scores = await asyncio.gather(
+                    self.assess_technical_accuracy(paper, review),
+                    self.assess_constructiveness(review),
+                    self.assess_planning_rationality(execution_trace),
+                    return_exceptions=True,
+                )
+            technical_score, constructiveness_score, planning_score = scores
 
             # Handle individual assessment failures
             (
@@ -458,9 +855,11 @@ Provide scores and brief explanation."""
             if self._auth_failure_count > 0:
                 fallback_used = True
 
-            # Estimate API cost (approximate)
+            # Estimate API cost (approximate); cached assessments cost nothing
             total_tokens = len(paper) / 4 + len(review) / 4 + 500
-            api_cost = (total_tokens / 1000) * 0.0001
+            cached = set(self._cache_hits)
+            uncached_share = 0.0 if "fused" in cached else 1.0 - len(cached) / len(self.weights)
+            api_cost = (total_tokens / 1000) * 0.0001 * uncached_share
 
             # Calculate overall score
             overall_score = self._calculate_overall_score(
@@ -475,6 +874,9 @@ Provide scores and brief explanation."""
                 model_used=f"{self.provider}/{self.model}",
                 api_cost=api_cost,
                 fallback_used=fallback_used,
+                cache_hits=sorted(set(self._cache_hits)),
+                judge_mode=judge_mode,
+                hedge_winners=dict(self._hedge_winners),
             )
 
         except Exception as e:
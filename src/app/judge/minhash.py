@@ -0,0 +1,220 @@
+"""
+MinHash signatures and an LSH index for approximate word-level Jaccard similarity.
+
+Exact Jaccard builds and intersects Python sets for every comparison. A MinHash
+signature of ``k`` hash minima estimates the Jaccard index with a standard error
+of at most ``1 / (2 * sqrt(k))``. Signatures of reference reviews are computed
+once and cached, so each comparison becomes a vectorized equality count.
+``MinHashLSH`` buckets signatures into bands and retrieves top-k candidates from
+large reference pools without scoring every reference.
+
+Tokens are the whitespace-separated words of the lowercased text, the same sets
+that exact word-level Jaccard in ``traditional_metrics`` compares.
+
+Example:
+    >>> hasher = MinHasher(num_perm_for_error(0.05))
+    >>> index = MinHashLSH(hasher, threshold=0.3)
+    >>> for key, text in reviews.items():
+    ...     index.add(key, text)
+    >>> index.top_k(agent_review, k=5)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from collections import defaultdict
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from app.config.judge_settings import JudgeSettings
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_SIGNATURE_CACHE_SIZE = 4096
+
+
+def num_perm_for_error(max_error: float) -> int:
+    """Signature length whose Jaccard estimate has at most ``max_error`` standard error.
+
+    The estimate of a Jaccard index J has standard error sqrt(J(1-J)/k), which
+    is largest at J = 0.5, giving k = ceil(1 / (4 * max_error^2)).
+
+    Args:
+        max_error: Maximum standard error of the estimate, in (0, 0.5).
+
+    Returns:
+        Number of hash permutations.
+
+    Raises:
+        ValueError: If ``max_error`` is outside (0, 0.5).
+    """
+    if not 0 < max_error < 0.5:
+        raise ValueError(f"max_error must be in (0, 0.5), got {max_error}")
+    return math.ceil(1 / (4 * max_error**2))
+
+
+def _token_hash(token: str) -> int:
+    """Stable 32-bit hash of a token (unlike ``hash``, not salted per process)."""
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+class MinHasher:
+    """Computes and caches MinHash signatures of word sets."""
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        """Initialize the hash family.
+
+        Args:
+            num_perm: Signature length; see ``num_perm_for_error``.
+            seed: Seed of the hash family. Signatures are only comparable
+                between hashers with the same ``num_perm`` and ``seed``.
+        """
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._signatures: dict[str, np.ndarray] = {}
+
+    def signature(self, tokens: Iterable[str]) -> np.ndarray:
+        """MinHash signature of a token set.
+
+        Args:
+            tokens: Distinct tokens.
+
+        Returns:
+            uint64 array of shape (num_perm,). The empty set maps to all-max values,
+            so two empty sets estimate as identical.
+        """
+        hashes = np.fromiter((_token_hash(t) for t in tokens), dtype=np.uint64)
+        if hashes.size == 0:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        # Reason: Universal hashing (a*x + b) mod p; uint64 wrap-around is accepted
+        # as in common MinHash implementations and keeps this fully vectorized.
+        permuted = ((hashes[:, None] * self._a + self._b) % _MERSENNE_PRIME) & _MAX_HASH
+        return permuted.min(axis=0)
+
+    def text_signature(self, text: str) -> np.ndarray:
+        """Cached signature of the lowercased word set of a text."""
+        cached = self._signatures.get(text)
+        if cached is None:
+            if len(self._signatures) >= _SIGNATURE_CACHE_SIZE:
+                self._signatures.clear()
+            cached = self.signature(frozenset(text.lower().split()))
+            self._signatures[text] = cached
+        return cached
+
+    def estimate_matrix(self, outputs: list[str], references: list[str]) -> np.ndarray:
+        """Estimated Jaccard of every output against every reference.
+
+        Args:
+            outputs: Texts to score.
+            references: Texts to score against; their signatures are cached.
+
+        Returns:
+            Array of shape (len(outputs), len(references)).
+        """
+        if not outputs or not references:
+            return np.zeros((len(outputs), len(references)))
+        output_sigs = np.stack([self.text_signature(t) for t in outputs])
+        reference_sigs = np.stack([self.text_signature(t) for t in references])
+        return (output_sigs[:, None, :] == reference_sigs[None, :, :]).mean(axis=2)
+
+
+def _lsh_params(num_perm: int, threshold: float) -> tuple[int, int]:
+    """Bands and rows per band whose S-curve midpoint (1/b)^(1/r) is closest to ``threshold``."""
+    best = (num_perm, 1)
+    best_gap = math.inf
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        gap = abs((1 / bands) ** (1 / rows) - threshold)
+        if gap < best_gap:
+            best, best_gap = (bands, rows), gap
+    return best
+
+
+class MinHashLSH:
+    """Banded LSH index over MinHash signatures for top-k candidate retrieval."""
+
+    def __init__(self, hasher: MinHasher, threshold: float = 0.3):
+        """Initialize an empty index.
+
+        Args:
+            hasher: Hasher used for indexed and query texts.
+            threshold: Jaccard level around which pairs become likely candidates.
+                Lower values retrieve more candidates (fewer misses, more scoring).
+        """
+        self.hasher = hasher
+        self.bands, self.rows = _lsh_params(hasher.num_perm, threshold)
+        self._buckets: list[defaultdict[bytes, list[int]]] = [
+            defaultdict(list) for _ in range(self.bands)
+        ]
+        self._keys: list[str] = []
+        self._signatures: list[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _band_keys(self, signature: np.ndarray) -> list[bytes]:
+        return [
+            signature[band * self.rows : (band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def add(self, key: str, text: str) -> None:
+        """Index a text under a key, e.g. a review ID.
+
+        Args:
+            key: Identifier returned by ``top_k``.
+            text: Text to index.
+        """
+        signature = self.hasher.text_signature(text)
+        position = len(self._keys)
+        self._keys.append(key)
+        self._signatures.append(signature)
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature), strict=True):
+            bucket[band_key].append(position)
+
+    def top_k(self, text: str, k: int) -> list[tuple[str, float]]:
+        """Indexed texts most similar to ``text`` among the LSH candidates.
+
+        Args:
+            text: Query text.
+            k: Maximum number of results.
+
+        Returns:
+            (key, estimated Jaccard) pairs, most similar first. Texts sharing no
+            band with the query are not returned.
+        """
+        signature = self.hasher.text_signature(text)
+        candidates = sorted(
+            {
+                position
+                for bucket, band_key in zip(self._buckets, self._band_keys(signature), strict=True)
+                for position in bucket.get(band_key, ())
+            }
+        )
+        if not candidates:
+            return []
+        estimates = (np.stack([self._signatures[p] for p in candidates]) == signature).mean(axis=1)
+        order = np.argsort(-estimates, kind="stable")[:k]
+        return [(self._keys[candidates[i]], float(estimates[i])) for i in order]
+
+
+@lru_cache(maxsize=4)
+def _shared_minhasher(num_perm: int) -> MinHasher:
+    return MinHasher(num_perm)
+
+
+def minhasher_from_settings(settings: JudgeSettings) -> MinHasher | None:
+    """Process-wide hasher for ``tier1_jaccard_mode="minhash"``, or None for exact Jaccard.
+
+    The hasher is shared so reference signatures are computed once per process.
+    """
+    if settings.tier1_jaccard_mode != "minhash":
+        return None
+    return _shared_minhasher(num_perm_for_error(settings.tier1_jaccard_max_error))
@@ -7,7 +7,6 @@ following the adapter pattern with opt-in Tier 1 context enrichment.
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any
 
 from pydantic import BaseModel
@@ -16,6 +15,7 @@ from app.config.judge_settings import JudgeSettings
 from app.data_models.evaluation_models import Tier2Result
 from app.judge.llm_evaluation_managers import LLMJudgeEngine
 from app.judge.plugins.base import EvaluatorPlugin
+from app.llms.rate_limiter import run_closing_clients
 from app.utils.log import logger
 
 
@@ -87,7 +87,7 @@ class LLMJudgePlugin(EvaluatorPlugin):
             )
 
         # Delegate to existing engine (run async method in new event loop)
-        result = asyncio.run(
+        result = run_closing_clients(
             self._engine.evaluate_comprehensive(
                 paper=paper, review=review, execution_trace=execution_trace
             )
@@ -37,7 +37,7 @@ class TraditionalMetricsPlugin(EvaluatorPlugin):
         """
         self._settings = JudgeSettings()
         self.timeout_seconds = timeout_seconds or self._settings.tier1_max_seconds
-        self._engine = TraditionalMetricsEngine()
+        self._engine = TraditionalMetricsEngine.from_settings(self._settings)
 
     @property
     def name(self) -> str:
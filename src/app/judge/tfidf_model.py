@@ -0,0 +1,143 @@
+"""
+Corpus-fitted TF-IDF model for Tier 1 cosine similarity.
+
+A vectorizer fitted on just the two texts being compared has almost no IDF
+information. This module fits one ``TfidfVectorizer`` on all PeerRead review
+texts, persists it in the PeerRead cache (namespaced by the installed
+scikit-learn version), and loads it once per process, so evaluation only calls
+``transform``.
+
+Example:
+    >>> from app.judge.tfidf_model import fit_tfidf_model
+    >>> fit_tfidf_model(venues=["acl_2017"])
+"""
+
+import os
+import threading
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+import joblib
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from app.config.config_app import PEERREAD_TFIDF_MODEL_DIR
+from app.config.judge_settings import JudgeSettings
+from app.config.peerread_config import PeerReadConfig
+from app.data_utils.datasets_peerread import PeerReadLoader, load_peerread_config
+from app.utils.log import logger
+from app.utils.paths import resolve_project_path
+
+
+def _sklearn_version() -> str:
+    """Get the installed scikit-learn version, used to namespace persisted models."""
+    try:
+        return version("scikit-learn")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def default_tfidf_model_path(config: PeerReadConfig | None = None) -> Path:
+    """Get the path of the persisted TF-IDF model inside the PeerRead cache.
+
+    Args:
+        config: PeerRead dataset configuration. Loads from file if None.
+
+    Returns:
+        Model file path for the installed scikit-learn version.
+    """
+    config = config or load_peerread_config()
+    model_dir = resolve_project_path(config.cache_directory) / PEERREAD_TFIDF_MODEL_DIR
+    return model_dir / f"tfidf-sklearn-{_sklearn_version()}.joblib"
+
+
+def load_tfidf_vectorizer(path: Path) -> TfidfVectorizer | None:
+    """Load a persisted vectorizer.
+
+    Args:
+        path: Model file path.
+
+    Returns:
+        Fitted vectorizer, or None if the file is missing or unreadable.
+    """
+    if not path.exists():
+        return None
+    try:
+        vectorizer = joblib.load(path)
+    except Exception as e:
+        logger.warning(f"Failed to load TF-IDF model {path}: {e}")
+        return None
+    if not isinstance(vectorizer, TfidfVectorizer):
+        logger.warning(f"Ignoring unexpected object in TF-IDF model file {path}")
+        return None
+    return vectorizer
+
+
+def fit_tfidf_model(
+    config: PeerReadConfig | None = None,
+    venues: list[str] | None = None,
+    splits: list[str] | None = None,
+    path: Path | None = None,
+) -> int:
+    """Fit the TF-IDF vectorizer on all review texts of the given venues/splits and save it.
+
+    Args:
+        config: PeerRead dataset configuration. Loads from file if None.
+        venues: Venues to fit on. Defaults to all configured venues.
+        splits: Splits to fit on. Defaults to all configured splits.
+        path: Output model file. Defaults to ``default_tfidf_model_path``.
+
+    Returns:
+        Number of distinct review texts the model was fitted on.
+
+    Raises:
+        ValueError: If no review texts are available.
+    """
+    config = config or load_peerread_config()
+    path = path or default_tfidf_model_path(config)
+    loader = PeerReadLoader(config)
+
+    texts: dict[str, None] = {}
+    for venue in venues or config.venues:
+        for split in splits or config.splits:
+            for paper in loader.iter_papers(venue=venue, split=split):
+                texts.update((r.comments, None) for r in paper.reviews if r.comments.strip())
+    if not texts:
+        raise ValueError("No PeerRead review texts found to fit the TF-IDF model")
+
+    vectorizer = TfidfVectorizer(
+        stop_words="english",
+        ngram_range=(1, 2),
+        max_features=JudgeSettings().tier1_tfidf_max_features,
+    )
+    vectorizer.fit(list(texts))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    joblib.dump(vectorizer, tmp_path)
+    os.replace(tmp_path, path)
+
+    # Reason: Drop a stale process-wide model so the next engine picks up the new fit.
+    global _global_vectorizer
+    with _vectorizer_lock:
+        _global_vectorizer = None
+
+    logger.info(f"✓ Fitted TF-IDF model on {len(texts)} reviews, saved to {path}")
+    return len(texts)
+
+
+# Global singleton vectorizer
+_global_vectorizer: TfidfVectorizer | None = None
+_vectorizer_lock = threading.Lock()
+
+
+def get_tfidf_vectorizer() -> TfidfVectorizer | None:
+    """Get the process-wide corpus-fitted vectorizer, loading it on first use.
+
+    Returns:
+        Fitted vectorizer, or None if no model has been fitted yet.
+    """
+    global _global_vectorizer
+    with _vectorizer_lock:
+        if _global_vectorizer is None:
+            _global_vectorizer = load_tfidf_vectorizer(default_tfidf_model_path())
+        return _global_vectorizer
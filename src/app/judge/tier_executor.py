@@ -0,0 +1,360 @@
+"""
+Pluggable executors for the CPU-bound evaluation tiers (Tier 1 and Tier 3).
+
+The ``thread`` executor (default) runs tier work with ``asyncio.to_thread`` on
+the event loop's default executor. A timeout abandons the work but cannot stop
+it. The ``process`` executor runs tier work on long-lived worker processes that
+load the Tier 1 models once at start and keep them warm between evaluations. A
+timed-out worker is killed and replaced, so abandoned BERTScore or graph work
+stops consuming CPU and never competes with the event loop for the GIL. The
+same happens when the awaiting coroutine is cancelled, and shutting the
+executor down kills busy workers along with idle ones. Waiting
+for a worker to finish warming up counts against the call's timeout; a worker
+that is still warming up is returned to the pool, not killed.
+
+Example:
+    >>> executor = get_tier_executor(JudgeSettings(tier_executor="process"))
+    >>> result = await executor.run("tier3", engine.evaluate_graph_metrics, trace, timeout=15)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from typing import Any, Literal, TypeVar
+
+from app.config.judge_settings import JudgeSettings
+from app.data_models.evaluation_models import GraphTraceData, Tier1Result, Tier3Result
+from app.judge.graph_analysis import GraphAnalysisEngine
+from app.judge.traditional_metrics import TraditionalMetricsEngine, engine_settings_key
+from app.utils.log import logger
+
+TierTask = Literal["tier1", "tier3"]
+T = TypeVar("T")
+
+
+class TierExecutor(ABC):
+    """Runs one CPU-bound tier call with a timeout."""
+
+    @abstractmethod
+    async def run(
+        self,
+        task: TierTask,
+        fn: Callable[..., T],
+        *args: Any,
+        timeout: float,
+        settings: JudgeSettings | None = None,
+    ) -> T:
+        """Run a tier call.
+
+        Args:
+            task: Tier task name; process workers run their own warm engine for it.
+            fn: In-process callable for the task, used by the thread executor.
+            *args: Arguments of ``fn`` (must be picklable for the process executor).
+            timeout: Seconds before the call is abandoned.
+            settings: Settings the process workers select their engine with.
+                Defaults to the settings the workers were started with.
+
+        Returns:
+            Return value of the tier call.
+
+        Raises:
+            TimeoutError: If the call exceeds ``timeout``.
+        """
+
+    @abstractmethod
+    def shutdown(self) -> None:
+        """Release worker threads or processes."""
+
+
+class ThreadTierExecutor(TierExecutor):
+    """Runs tier calls via ``asyncio.to_thread``; timed-out work keeps running."""
+
+    async def run(
+        self,
+        task: TierTask,
+        fn: Callable[..., T],
+        *args: Any,
+        timeout: float,
+        settings: JudgeSettings | None = None,
+    ) -> T:
+        """Run ``fn`` on the loop's default executor (see ``TierExecutor.run``)."""
+        return await asyncio.wait_for(asyncio.to_thread(fn, *args), timeout)
+
+    def shutdown(self) -> None:
+        """Nothing to release; the default executor belongs to the event loop."""
+
+
+class _WorkerTasks:
+    """Tier engines living in a worker process, reused across calls."""
+
+    def __init__(self, settings: JudgeSettings):
+        self.settings = settings
+        self._traditional: dict[tuple[object, ...], TraditionalMetricsEngine] = {}
+
+    def _traditional_engine(self, settings: JudgeSettings) -> TraditionalMetricsEngine:
+        key = engine_settings_key(settings)
+        if key not in self._traditional:
+            self._traditional[key] = TraditionalMetricsEngine.from_settings(settings)
+        return self._traditional[key]
+
+    def warm_up(self) -> None:
+        """Load the Tier 1 models before the worker reports ready."""
+        if self.settings.is_tier_enabled(1):
+            engine = self._traditional_engine(self.settings)
+            if "semantic" in self.settings.tier1_similarity_metrics:
+                engine._get_bertscore_model()
+
+    def tier1(self, settings: JudgeSettings, *args: Any) -> Tier1Result:
+        """Run ``evaluate_traditional_metrics(*args)`` on the engine for settings."""
+        return self._traditional_engine(settings).evaluate_traditional_metrics(*args)
+
+    def tier3(self, settings: JudgeSettings, trace_data: GraphTraceData) -> Tier3Result:
+        return GraphAnalysisEngine(settings).evaluate_graph_metrics(trace_data)
+
+
+def _worker_main(conn: Connection, settings: JudgeSettings) -> None:
+    """Worker process loop: warm up, then serve ``(task, args)`` messages until EOF."""
+    tasks = _WorkerTasks(settings)
+    try:
+        tasks.warm_up()
+    except Exception as e:
+        logger.warning(f"Tier worker warm-up failed, models load on first use: {e}")
+    conn.send(("ready", None))
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        task, args, call_settings = message
+        try:
+            reply: tuple[str, Any] = ("ok", getattr(tasks, task)(call_settings or settings, *args))
+        except Exception as e:
+            reply = ("error", e)
+        try:
+            conn.send(reply)
+        except Exception as e:
+            # Reason: Some exceptions and results do not pickle; report them as text.
+            conn.send(("error", RuntimeError(f"{task} reply could not be sent: {e}")))
+
+
+class _Worker:
+    """Handle of one worker process and its pipe."""
+
+    def __init__(self, ctx: Any, settings: JudgeSettings):
+        parent_conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main, args=(child_conn, settings), name="tier-worker", daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn: Connection = parent_conn
+        self._ready = False
+
+    def wait_ready(self, timeout: float) -> bool:
+        """Wait up to timeout for the worker to finish warming up.
+
+        Returns:
+            True once the worker is ready.
+
+        Raises:
+            EOFError: If the worker died.
+        """
+        if not self._ready and self.conn.poll(timeout):
+            self.conn.recv()
+            self._ready = True
+        return self._ready
+
+    def kill(self) -> None:
+        """Terminate the worker, stopping any work in progress."""
+        self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+
+class _PendingCall:
+    """Worker assignment of one call, so a cancelled caller can stop its work."""
+
+    def __init__(self) -> None:
+        self.worker: _Worker | None = None
+        self.cancelled = False
+
+
+class ProcessTierExecutor(TierExecutor):
+    """Pool of warm worker processes; a timeout kills and replaces the worker."""
+
+    def __init__(self, max_workers: int, settings: JudgeSettings):
+        """Start the workers; they warm up in the background.
+
+        Args:
+            max_workers: Number of worker processes.
+            settings: Settings the workers warm up with, and the default for
+                calls that pass no settings.
+        """
+        # Reason: spawn, not fork — the parent has threads and possibly torch state.
+        self._ctx = multiprocessing.get_context("spawn")
+        self._settings = settings
+        self._lock = threading.Lock()
+        self._busy: set[_Worker] = set()
+        self._closed = False
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        for _ in range(max_workers):
+            self._idle.put(_Worker(self._ctx, settings))
+
+    def _checkout(self, task: TierTask, pending: _PendingCall, timeout: float) -> _Worker:
+        """Take an idle worker for a call and mark it busy."""
+        try:
+            worker = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No tier worker free within {timeout}s") from None
+        with self._lock:
+            closed = self._closed
+            if not (closed or pending.cancelled):
+                self._busy.add(worker)
+                pending.worker = worker
+                return worker
+        if closed:
+            worker.kill()
+            raise RuntimeError(f"{task}: tier executor was shut down")
+        self._idle.put(worker)
+        raise RuntimeError(f"{task} cancelled before it started")
+
+    def _release(self, worker: _Worker) -> None:
+        """Return a worker to the pool, replacing it if it was killed meanwhile."""
+        if not worker.process.is_alive():
+            self._replace(worker)
+            return
+        with self._lock:
+            self._busy.discard(worker)
+            if not self._closed:
+                self._idle.put(worker)
+                return
+        worker.kill()
+
+    def _replace(self, worker: _Worker) -> None:
+        worker.kill()
+        with self._lock:
+            self._busy.discard(worker)
+            if self._closed:
+                return
+        self._idle.put(_Worker(self._ctx, self._settings))
+
+    def _cancel(self, pending: _PendingCall) -> None:
+        """Stop the work of a call whose caller was cancelled."""
+        with self._lock:
+            pending.cancelled = True
+            worker = pending.worker
+        if worker is not None:
+            # Reason: Kill without joining so the event loop does not block; the
+            # thread still waiting on the worker sees EOF and replaces it.
+            worker.process.kill()
+
+    def _call(
+        self,
+        task: TierTask,
+        args: tuple[Any, ...],
+        timeout: float,
+        settings: JudgeSettings | None,
+        pending: _PendingCall,
+    ) -> Any:
+        """Blocking round trip to one worker, all within timeout."""
+        deadline = time.monotonic() + timeout
+        worker = self._checkout(task, pending, timeout)
+
+        try:
+            ready = worker.wait_ready(max(0.0, deadline - time.monotonic()))
+        except BaseException:
+            self._replace(worker)
+            raise
+        if not ready:
+            # Reason: A worker still loading its models is healthy; requeue it behind the
+            # other workers so later calls try a warm one first.
+            self._release(worker)
+            raise TimeoutError(f"{task}: tier worker still warming up after {timeout}s")
+
+        try:
+            worker.conn.send((task, args, settings))
+            if not worker.conn.poll(max(0.0, deadline - time.monotonic())):
+                raise TimeoutError(f"{task} exceeded {timeout}s")
+            status, payload = worker.conn.recv()
+        except BaseException:
+            # Reason: Killing the process is the only way to stop CPU-bound work mid-call.
+            self._replace(worker)
+            raise
+
+        self._release(worker)
+        if status == "error":
+            raise payload
+        return payload
+
+    async def run(
+        self,
+        task: TierTask,
+        fn: Callable[..., T],
+        *args: Any,
+        timeout: float,
+        settings: JudgeSettings | None = None,
+    ) -> T:
+        """Run ``task`` on a warm worker (see ``TierExecutor.run``)."""
+        start = time.monotonic()
+        pending = _PendingCall()
+        try:
+            result = await asyncio.to_thread(self._call, task, args, timeout, settings, pending)
+        except asyncio.CancelledError:
+            self._cancel(pending)
+            raise
+        logger.debug(f"{task} ran on worker process in {time.monotonic() - start:.2f}s")
+        return result
+
+    def shutdown(self) -> None:
+        """Kill all workers, stopping calls in progress; no replacements are started."""
+        with self._lock:
+            self._closed = True
+            busy = list(self._busy)
+        for worker in busy:
+            # Reason: The threads waiting on busy workers see EOF and finish the kill.
+            worker.process.kill()
+        while True:
+            try:
+                self._idle.get_nowait().kill()
+            except queue.Empty:
+                return
+
+
+# Global shared executor, recreated when the executor settings change
+_global_executor: TierExecutor | None = None
+_global_executor_key: tuple[str, int] | None = None
+_executor_lock = threading.Lock()
+
+
+def get_tier_executor(settings: JudgeSettings) -> TierExecutor:
+    """Get the process-wide Tier 1/Tier 3 executor for the given settings.
+
+    Args:
+        settings: Judge settings; ``tier_executor`` selects the kind and
+            ``tier_executor_workers`` the number of worker processes.
+
+    Returns:
+        Shared TierExecutor, so worker processes and their models are reused
+        across pipelines. Callers pass their settings with each ``run``.
+    """
+    global _global_executor, _global_executor_key
+    key = (settings.tier_executor, settings.tier_executor_workers)
+    with _executor_lock:
+        if _global_executor is None or _global_executor_key != key:
+            if _global_executor is not None:
+                _global_executor.shutdown()
+            if settings.tier_executor == "process":
+                logger.info(f"Starting {settings.tier_executor_workers} tier worker processes")
+                _global_executor = ProcessTierExecutor(settings.tier_executor_workers, settings)
+            else:
+                _global_executor = ThreadTierExecutor()
+            _global_executor_key = key
+        return _global_executor
@@ -9,19 +9,39 @@ from __future__ import annotations
 
 import math
 import re
+import threading
 import time
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+import numpy as np
 import textdistance
+from scipy.sparse import csr_matrix, vstack
 from sklearn.feature_extraction.text import TfidfVectorizer
 
 if TYPE_CHECKING:
     from app.config.judge_settings import JudgeSettings
+    from app.judge.embedding_cache import ReferenceEmbeddingCache
 from sklearn.metrics.pairwise import cosine_similarity
 
-from app.data_models.evaluation_models import PeerReadEvalResult, Tier1Result
+from app.data_models.evaluation_models import (
+    PeerReadEvalResult,
+    Tier1BatchItem,
+    Tier1BatchResult,
+    Tier1Result,
+)
 from app.data_models.peerread_models import PeerReadReview
+from app.judge.bertscore_backend import BERTScoreBackend, apply_bertscore_backend
+from app.judge.bertscore_server import (
+    RemoteBERTScorer,
+    discard_remote_bertscorer,
+    get_remote_bertscorer,
+)
+from app.judge.edit_distance import EditDistanceBackend, get_edit_distance_backend
+from app.judge.minhash import MinHasher, minhasher_from_settings
 
 try:
     from bert_score import BERTScorer
@@ -30,6 +50,56 @@ except ImportError:
 
 from app.utils.log import logger
 
+_BERTSCORE_BATCH_SIZE = 64
+_TFIDF_ROW_CACHE_SIZE = 4096
+_WORD_RE = re.compile(r"\w+")
+SIMILARITY_METRICS = ("cosine", "jaccard", "semantic", "levenshtein")
+
+
+def _empty_text_score(text1: str, text2: str) -> float | None:
+    """Score for pairs with an empty side: 1.0 if both empty, 0.0 if one is, else None."""
+    if not text1.strip() and not text2.strip():
+        return 1.0
+    if not text1.strip() or not text2.strip():
+        return 0.0
+    return None
+
+
+@dataclass(frozen=True)
+class _TextFeatures:
+    """Normalized forms of a text shared by all lexical metrics."""
+
+    lowered: str
+    words: frozenset[str]
+    regex_words: frozenset[str]
+
+
+@lru_cache(maxsize=1024)
+def _text_features(text: str) -> _TextFeatures:
+    """Lowercase and tokenize a text once; repeated references hit the cache."""
+    lowered = text.lower()
+    return _TextFeatures(
+        lowered=lowered,
+        words=frozenset(lowered.split()),
+        regex_words=frozenset(_WORD_RE.findall(lowered)),
+    )
+
+
+def _apply_empty_text_scores(matrix: np.ndarray, outputs: list[str], refs: list[str]) -> None:
+    """Set (output, reference) cells with an empty side in place, as ``_empty_text_score``."""
+    output_empty = np.array([not t.strip() for t in outputs], dtype=bool)[:, None]
+    ref_empty = np.array([not t.strip() for t in refs], dtype=bool)[None, :]
+    matrix[output_empty | ref_empty] = 0.0
+    matrix[output_empty & ref_empty] = 1.0
+
+
+def _set_jaccard(set1: frozenset[str], set2: frozenset[str]) -> float:
+    """Jaccard index of two sets, 1.0 if both are empty."""
+    if not set1 and not set2:
+        return 1.0
+    union = len(set1 | set2)
+    return len(set1 & set2) / union if union > 0 else 0.0
+
 
 @dataclass
 class SimilarityScores:
@@ -41,6 +111,21 @@ class SimilarityScores:
     levenshtein: float = 0.0  # Optional for backward compatibility
 
 
+@dataclass
+class SimilarityMatrix:
+    """Similarity of one output against every reference.
+
+    Attributes:
+        per_reference: Scores per reference, in input order
+        best: Per-metric maximum over all references (the best-match vector)
+        backends: Implementation that produced each metric's scores
+    """
+
+    per_reference: list[SimilarityScores]
+    best: SimilarityScores
+    backends: dict[str, str] = field(default_factory=dict)
+
+
 class TraditionalMetricsEngine:
     """Lightweight traditional metrics engine for fast evaluation.
 
@@ -51,39 +136,163 @@ class TraditionalMetricsEngine:
     # Reason: Class-level cache so BERTScorer init failure (e.g. read-only FS)
     # is not retried on every new engine instance.
     _bertscore_instance = None
+    _bertscore_instance_backend: BERTScoreBackend | None = None
     _bertscore_init_failed = False
+    # Reason: Serializes model loading so a background warm-up and the first
+    # evaluation never load two copies.
+    _bertscore_lock = threading.Lock()
 
-    def __init__(self):
+    def __init__(
+        self,
+        embedding_cache: ReferenceEmbeddingCache | None = None,
+        tfidf_vectorizer: TfidfVectorizer | None = None,
+        bertscore_backend: BERTScoreBackend | None = None,
+        minhasher: MinHasher | None = None,
+        edit_distance_backend: EditDistanceBackend | None = None,
+    ):
         """Initialize metrics engine with cached components.
 
         Uses lazy loading for computationally expensive components
         to minimize startup time and memory usage.
+
+        Args:
+            embedding_cache: Optional cache of reference BERTScore embeddings. When set,
+                only agent outputs are encoded at evaluation time.
+            tfidf_vectorizer: Optional TF-IDF vectorizer fitted on the review corpus.
+                When set, cosine similarity only transforms texts; otherwise a
+                vectorizer is fitted on the compared texts themselves.
+            bertscore_backend: BERTScore inference options. Defaults to the fp32
+                distilbert-base-uncased model.
+            minhasher: Optional MinHash hasher. When set, word-level Jaccard is
+                estimated from cached signatures instead of computed exactly.
+            edit_distance_backend: Levenshtein implementation. Defaults to the
+                fastest installed one.
+        """
+        self._bertscore_backend = bertscore_backend or BERTScoreBackend()
+        self._embedding_cache = embedding_cache
+        self._vectorizer = tfidf_vectorizer
+        self._tfidf_rows: dict[str, object] = {}
+        self._minhasher = minhasher
+        self._edit_distance = edit_distance_backend or get_edit_distance_backend()
+        # Reason: Thread-local so concurrent evaluations on a shared engine
+        # record only their own backends.
+        self._backend_log = threading.local()
+
+    @classmethod
+    def from_settings(cls, settings: JudgeSettings) -> TraditionalMetricsEngine:
+        """Build an engine with the Tier 1 components selected by ``tier1_*`` settings.
+
+        Args:
+            settings: JudgeSettings selecting embedding cache, TF-IDF corpus model,
+                BERTScore backend, Jaccard mode and edit-distance backend.
+
+        Returns:
+            Engine sharing the process-wide cache, vectorizer and hasher.
         """
-        self._vectorizer = TfidfVectorizer(
-            stop_words="english",
-            ngram_range=(1, 2),
-            max_features=5000,  # Limit for performance
+        # Reason: Deferred imports; both modules pull in the PeerRead data loader.
+        from app.judge.embedding_cache import get_reference_embedding_cache
+        from app.judge.tfidf_model import get_tfidf_vectorizer
+
+        return cls(
+            embedding_cache=(
+                get_reference_embedding_cache() if settings.tier1_embedding_cache else None
+            ),
+            tfidf_vectorizer=get_tfidf_vectorizer() if settings.tier1_tfidf_corpus_model else None,
+            bertscore_backend=BERTScoreBackend.from_settings(settings),
+            minhasher=minhasher_from_settings(settings),
+            edit_distance_backend=get_edit_distance_backend(settings.tier1_edit_distance_backend),
         )
 
     def _get_bertscore_model(self):
         """Lazy-load BERTScorer instance for semantic similarity.
 
+        With ``server_socket`` set on the backend, returns a client of the shared
+        model server instead, falling back to an in-process model if the server
+        cannot be reached or runs a different backend.
+
         Returns:
             BERTScorer instance if available, None if bert-score not installed or init failed.
         """
-        if TraditionalMetricsEngine._bertscore_instance is not None:
-            return TraditionalMetricsEngine._bertscore_instance
-        if TraditionalMetricsEngine._bertscore_init_failed or BERTScorer is None:
-            return None
+        backend = self._bertscore_backend
+        if backend.server_socket is not None:
+            remote = get_remote_bertscorer(backend)
+            if remote is not None:
+                return remote
+        with TraditionalMetricsEngine._bertscore_lock:
+            if (
+                TraditionalMetricsEngine._bertscore_instance is not None
+                and TraditionalMetricsEngine._bertscore_instance_backend in (None, backend)
+            ):
+                return TraditionalMetricsEngine._bertscore_instance
+            if TraditionalMetricsEngine._bertscore_init_failed or BERTScorer is None:
+                return None
+            try:
+                scorer = BERTScorer(model_type=backend.model_type, lang="en")
+                TraditionalMetricsEngine._bertscore_instance = apply_bertscore_backend(
+                    scorer, backend
+                )
+                TraditionalMetricsEngine._bertscore_instance_backend = backend
+                return TraditionalMetricsEngine._bertscore_instance
+            except Exception as e:
+                logger.warning(f"BERTScore initialization failed: {e}")
+                TraditionalMetricsEngine._bertscore_init_failed = True
+                return None
+
+    def _bertscore_f1(self, scorer, cands: list[str], refs: list[str], **kwargs):
+        """Score pairs with ``scorer`` and return F1 plus the scorer that produced it.
+
+        If the shared server is gone and could not be restarted, the process stops
+        using it and scores with the in-process model instead; callers should use
+        the returned scorer for further batches.
+
+        Raises:
+            RuntimeError: If the server is gone and no local model can be loaded.
+        """
+        if isinstance(scorer, RemoteBERTScorer):
+            try:
+                return scorer.score(cands, refs, **kwargs)[2], scorer
+            except ConnectionError as e:
+                logger.warning(f"Shared BERTScore server unavailable, loading locally: {e}")
+                discard_remote_bertscorer(scorer)
+                scorer = self._get_bertscore_model()
+                if scorer is None:
+                    raise RuntimeError("BERTScore model unavailable") from e
+        return scorer.score(cands, refs, **kwargs)[2], scorer
+
+    def _record_bertscore(self, scorer) -> None:
+        """Record which BERTScore implementation scored the semantic metric."""
+        remote = isinstance(scorer, RemoteBERTScorer)
+        self._record_backend("semantic", "bertscore-server" if remote else "bertscore")
+
+    @contextmanager
+    def _recording_backends(self) -> Iterator[dict[str, str]]:
+        """Collect the backends that compute calls in this thread use, per metric.
+
+        Nested recordings also report their backends to the enclosing one.
+        """
+        previous = getattr(self._backend_log, "used", None)
+        used: dict[str, str] = {}
+        self._backend_log.used = used
         try:
-            TraditionalMetricsEngine._bertscore_instance = BERTScorer(
-                model_type="distilbert-base-uncased", lang="en"
-            )
-            return TraditionalMetricsEngine._bertscore_instance
-        except Exception as e:
-            logger.warning(f"BERTScore initialization failed: {e}")
-            TraditionalMetricsEngine._bertscore_init_failed = True
-            return None
+            yield used
+        finally:
+            self._backend_log.used = previous
+            for metric, backends in used.items():
+                for backend in backends.split("+"):
+                    self._record_backend(metric, backend)
+
+    def _record_backend(self, metric: str, backend: str) -> None:
+        """Record the implementation that just produced scores of metric.
+
+        Mixed implementations within one recording (e.g. a fallback for some
+        references only) are joined, e.g. ``"textdistance+exact"``.
+        """
+        used: dict[str, str] | None = getattr(self._backend_log, "used", None)
+        if used is None:
+            return
+        names = used[metric].split("+") if metric in used else []
+        if backend not in names:
+            used[metric] = "+".join([*names, backend])
 
     def _compute_word_overlap_fallback(self, text1: str, text2: str) -> float:
         """Fallback to simple word overlap when TF-IDF fails."""
@@ -116,22 +325,166 @@ class TraditionalMetricsEngine:
             return 0.0
 
         try:
-            vectorizer = TfidfVectorizer(stop_words="english", lowercase=True, max_features=1000)
-            texts = [text1, text2]
-            tfidf_matrix = vectorizer.fit_transform(texts)
-            dense_matrix = tfidf_matrix.toarray()  # type: ignore[union-attr]
-            similarity_matrix = cosine_similarity(dense_matrix[0:1], dense_matrix[1:2])
+            tfidf_matrix = self._tfidf_matrix([text1, text2])
+            similarity_matrix = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])
             score: float = similarity_matrix[0][0]  # type: ignore[assignment]
+            self._record_backend("cosine", self._tfidf_backend)
             return score
 
         except Exception as e:
             logger.warning(f"TF-IDF cosine similarity failed: {e}")
             try:
+                self._record_backend("cosine", "word-overlap")
                 return self._compute_word_overlap_fallback(text1, text2)
             except Exception:
                 logger.warning("Cosine similarity calculation failed completely")
                 return 0.0
 
+    @property
+    def _tfidf_backend(self) -> str:
+        return "tfidf-corpus" if self._vectorizer is not None else "tfidf"
+
+    def _tfidf_matrix(self, texts: list[str]):
+        """Sparse, L2-normalized TF-IDF rows of texts.
+
+        Uses the corpus-fitted vectorizer (transform only) when available,
+        otherwise fits a small vectorizer on the given texts.
+        """
+        if self._vectorizer is not None:
+            return self._transform_cached(self._vectorizer, texts)
+        vectorizer = TfidfVectorizer(stop_words="english", lowercase=True, max_features=1000)
+        return vectorizer.fit_transform(texts)
+
+    def _transform_cached(self, vectorizer: TfidfVectorizer, texts: list[str]):
+        """Transform texts with the corpus vectorizer, reusing rows of texts seen before."""
+        missing = list(dict.fromkeys(t for t in texts if t not in self._tfidf_rows))
+        if missing:
+            if len(self._tfidf_rows) + len(missing) > _TFIDF_ROW_CACHE_SIZE:
+                self._tfidf_rows.clear()
+            rows = vectorizer.transform(missing)
+            for idx, text in enumerate(missing):
+                self._tfidf_rows[text] = rows[idx]
+        return vstack([self._tfidf_rows[text] for text in texts], format="csr")
+
+    def compute_cosine_similarity_batch(
+        self, agent_output: str, reference_texts: list[str]
+    ) -> list[float]:
+        """Compute TF-IDF cosine similarity of one output against all references.
+
+        The output and all references are vectorized in a single call and scored
+        with one sparse matrix-vector product.
+
+        Args:
+            agent_output: Agent-generated review text
+            reference_texts: Reference review texts
+
+        Returns:
+            Similarity score per reference, in input order
+        """
+        scores = [_empty_text_score(agent_output, ref) for ref in reference_texts]
+        pending = [idx for idx, score in enumerate(scores) if score is None]
+        if pending:
+            try:
+                tfidf_matrix = self._tfidf_matrix(
+                    [agent_output, *(reference_texts[idx] for idx in pending)]
+                )
+                # Reason: Rows are L2-normalized, so the sparse dot product is the cosine.
+                similarities = (tfidf_matrix[1:] @ tfidf_matrix[0].T).toarray().ravel()
+                for idx, similarity in zip(pending, similarities, strict=True):
+                    scores[idx] = float(similarity)
+                self._record_backend("cosine", self._tfidf_backend)
+            except Exception as e:
+                logger.warning(f"Batched TF-IDF cosine similarity failed: {e}")
+                self._record_backend("cosine", "word-overlap")
+                output_words = _text_features(agent_output).regex_words
+                for idx in pending:
+                    reference_words = _text_features(reference_texts[idx]).regex_words
+                    scores[idx] = (
+                        _set_jaccard(output_words, reference_words)
+                        if output_words and reference_words
+                        else 0.0
+                    )
+        return [score or 0.0 for score in scores]
+
+    def compute_jaccard_similarity_batch(
+        self, agent_output: str, reference_texts: list[str], enhanced: bool = False
+    ) -> list[float]:
+        """Compute Jaccard similarity of one output against all references.
+
+        Uses cached token sets, so each distinct text is tokenized once. With a
+        MinHash hasher, the word-level score is estimated from cached signatures.
+
+        Args:
+            agent_output: Agent-generated review text
+            reference_texts: Reference review texts
+            enhanced: Use textdistance library for robust calculation
+
+        Returns:
+            Similarity score per reference, in input order
+        """
+        if self._minhasher is not None and not enhanced:
+            matrix = self._minhasher.estimate_matrix([agent_output], reference_texts)
+            _apply_empty_text_scores(matrix, [agent_output], reference_texts)
+            self._record_backend("jaccard", "minhash")
+            return matrix[0].tolist() if reference_texts else []
+
+        output = _text_features(agent_output)
+        scores: list[float] = []
+        for ref in reference_texts:
+            edge_score = _empty_text_score(agent_output, ref)
+            if edge_score is not None:
+                scores.append(edge_score)
+                continue
+            reference = _text_features(ref)
+            if enhanced:
+                try:
+                    scores.append(
+                        float(
+                            textdistance.jaccard.normalized_similarity(
+                                output.lowered, reference.lowered
+                            )
+                        )
+                    )
+                    self._record_backend("jaccard", "textdistance")
+                    continue
+                except Exception as e:
+                    logger.warning(f"Enhanced Jaccard similarity failed: {e}")
+            scores.append(_set_jaccard(output.words, reference.words))
+            self._record_backend("jaccard", "exact")
+        return scores
+
+    def compute_levenshtein_similarity_batch(
+        self, agent_output: str, reference_texts: list[str]
+    ) -> list[float]:
+        """Compute Levenshtein similarity of one output against all references.
+
+        Args:
+            agent_output: Agent-generated review text
+            reference_texts: Reference review texts
+
+        Returns:
+            Similarity score per reference, in input order
+        """
+        output = _text_features(agent_output)
+        scores: list[float] = []
+        for ref in reference_texts:
+            edge_score = _empty_text_score(agent_output, ref)
+            if edge_score is not None:
+                scores.append(edge_score)
+                continue
+            try:
+                scores.append(
+                    self._edit_distance.normalized_similarity(
+                        output.lowered, _text_features(ref).lowered
+                    )
+                )
+                self._record_backend("levenshtein", self._edit_distance.name)
+            except Exception as e:
+                logger.warning(f"Levenshtein similarity calculation failed: {e}")
+                scores.append(self._compute_char_overlap_fallback(agent_output, ref))
+                self._record_backend("levenshtein", "char-overlap")
+        return scores
+
     def _compute_jaccard_basic(self, text1: str, text2: str) -> float:
         """Basic word-based Jaccard implementation."""
         words1 = set(text1.lower().split())
@@ -206,17 +559,21 @@ class TraditionalMetricsEngine:
 
         return intersection / union if union > 0 else 0.0
 
-    def compute_levenshtein_similarity(self, text1: str, text2: str) -> float:
-        """Compute Levenshtein (edit distance) similarity using textdistance.
+    def compute_levenshtein_similarity(
+        self, text1: str, text2: str, min_similarity: float | None = None
+    ) -> float:
+        """Compute Levenshtein (edit distance) similarity with the configured backend.
 
         Args:
             text1: Agent-generated review text
             text2: Reference review text
+            min_similarity: Optional near-duplicate cutoff; pairs below it return
+                0.0 without computing the full distance
 
         Returns:
             Normalized Levenshtein similarity score between 0.0 and 1.0
 
-        Performance: ~20ms for typical review lengths
+        Performance: ~20ms for typical review lengths with a native backend
         """
         if not text1.strip() and not text2.strip():
             return 1.0
@@ -224,12 +581,15 @@ class TraditionalMetricsEngine:
             return 0.0
 
         try:
-            return float(
-                textdistance.levenshtein.normalized_similarity(text1.lower(), text2.lower())
+            score = self._edit_distance.normalized_similarity(
+                text1.lower(), text2.lower(), min_similarity
             )
+            self._record_backend("levenshtein", self._edit_distance.name)
+            return score
         except Exception as e:
             logger.warning(f"Levenshtein similarity calculation failed: {e}")
             try:
+                self._record_backend("levenshtein", "char-overlap")
                 return self._compute_char_overlap_fallback(text1, text2)
             except Exception:
                 return 0.0
@@ -254,13 +614,126 @@ class TraditionalMetricsEngine:
         scorer = self._get_bertscore_model()
         if scorer is not None:
             try:
-                _, _, f1 = scorer.score([text1], [text2])
+                f1, scorer = self._bertscore_f1(scorer, [text1], [text2])
+                self._record_bertscore(scorer)
                 return float(f1.mean().item())  # type: ignore[union-attr]
             except Exception as e:
                 logger.warning(f"BERTScore computation failed, falling back to Levenshtein: {e}")
 
+        self._record_backend("semantic", f"levenshtein-{self._edit_distance.name}")
         return self.compute_levenshtein_similarity(text1, text2)
 
+    def compute_semantic_similarity_batch(
+        self, agent_output: str, reference_texts: list[str]
+    ) -> list[float]:
+        """Score one agent output against all references in a single BERTScore call.
+
+        Args:
+            agent_output: Agent-generated review text
+            reference_texts: Reference review texts
+
+        Returns:
+            Similarity score per reference, in input order
+        """
+        return self.compute_semantic_similarity_corpus([(agent_output, reference_texts)])[0]
+
+    def compute_semantic_similarity_corpus(
+        self,
+        groups: list[tuple[str, list[str]]],
+        batch_size: int = _BERTSCORE_BATCH_SIZE,
+    ) -> list[list[float]]:
+        """Score many (agent output, references) groups in length-bucketed batches.
+
+        All (output, reference) pairs of all groups are sorted by length and
+        scored in chunks of ``batch_size``, so each forward pass pads to similar
+        lengths. Pairs with an empty side are scored without the model. If
+        BERTScore is unavailable or fails, every pair falls back to Levenshtein,
+        matching ``compute_semantic_similarity``.
+
+        Args:
+            groups: (agent_output, reference_texts) tuples, e.g. one per paper
+            batch_size: Maximum pairs per BERTScore forward pass
+
+        Returns:
+            Per-group lists of similarity scores, aligned with the inputs
+
+        Example:
+            >>> engine.compute_semantic_similarity_corpus(
+            ...     [("Strong paper.", ["Good work.", "Weak paper."]), ("Unclear.", ["Vague."])]
+            ... )
+        """
+        results = [[0.0] * len(refs) for _, refs in groups]
+        pairs: list[tuple[int, int, str, str]] = []
+        for group_idx, (output, refs) in enumerate(groups):
+            for ref_idx, ref in enumerate(refs):
+                edge_score = _empty_text_score(output, ref)
+                if edge_score is None:
+                    pairs.append((group_idx, ref_idx, output, ref))
+                else:
+                    results[group_idx][ref_idx] = edge_score
+
+        scorer = self._get_bertscore_model() if pairs else None
+        # Reason: The shared server only exposes score(); token embeddings stay remote.
+        if (
+            scorer is not None
+            and self._embedding_cache is not None
+            and not isinstance(scorer, RemoteBERTScorer)
+        ):
+            try:
+                self._score_pairs_with_cached_references(
+                    scorer, self._embedding_cache, pairs, results
+                )
+                self._record_backend("semantic", "bertscore")
+                return results
+            except Exception as e:
+                logger.warning(f"Cached-embedding BERTScore failed, scoring directly: {e}")
+
+        if scorer is not None:
+            # Reason: Bucket by length so padding inside each forward pass stays small.
+            ordered = sorted(pairs, key=lambda p: len(p[2]) + len(p[3]))
+            try:
+                used = []
+                for start in range(0, len(ordered), batch_size):
+                    chunk = ordered[start : start + batch_size]
+                    f1, scorer = self._bertscore_f1(
+                        scorer, [p[2] for p in chunk], [p[3] for p in chunk], batch_size=batch_size
+                    )
+                    used.append(scorer)
+                    for (group_idx, ref_idx, _, _), value in zip(chunk, f1.tolist(), strict=True):
+                        results[group_idx][ref_idx] = float(value)
+                # Reason: A server lost mid-corpus scored the earlier batches only.
+                for batch_scorer in dict.fromkeys(used):
+                    self._record_bertscore(batch_scorer)
+                return results
+            except Exception as e:
+                logger.warning(f"Batched BERTScore failed, falling back to Levenshtein: {e}")
+
+        for group_idx, ref_idx, output, ref in pairs:
+            results[group_idx][ref_idx] = self.compute_levenshtein_similarity(output, ref)
+        if pairs:
+            self._record_backend("semantic", f"levenshtein-{self._edit_distance.name}")
+        return results
+
+    def _score_pairs_with_cached_references(
+        self,
+        scorer,
+        cache: ReferenceEmbeddingCache,
+        pairs: list[tuple[int, int, str, str]],
+        results: list[list[float]],
+    ) -> None:
+        """Score pairs from cached reference embeddings, encoding only the agent outputs."""
+        from app.judge.embedding_cache import encode_texts, greedy_match_f1
+
+        outputs = list(dict.fromkeys(p[2] for p in pairs))
+        output_embeddings = dict(zip(outputs, encode_texts(scorer, outputs), strict=True))
+        reference_embeddings = cache.get_or_encode(
+            scorer, [p[3] for p in pairs], self._bertscore_backend
+        )
+        for (group_idx, ref_idx, output, _), reference in zip(
+            pairs, reference_embeddings, strict=True
+        ):
+            results[group_idx][ref_idx] = greedy_match_f1(output_embeddings[output], reference)
+
     def measure_execution_time(self, start_time: float, end_time: float) -> float:
         """Calculate execution time with normalization for scoring.
 
@@ -325,23 +798,8 @@ class TraditionalMetricsEngine:
         Returns:
             SimilarityScores container with all computed metrics
         """
-        cosine_score = self.compute_cosine_similarity(agent_output, reference_text)
-        jaccard_score = self.compute_jaccard_similarity(
-            agent_output, reference_text, enhanced=enhanced
-        )
-        semantic_score = self.compute_semantic_similarity(agent_output, reference_text)
-
-        # Add Levenshtein similarity when enhanced mode is enabled
-        levenshtein_score = 0.0
-        if enhanced:
-            levenshtein_score = self.compute_levenshtein_similarity(agent_output, reference_text)
-
-        return SimilarityScores(
-            cosine=cosine_score,
-            jaccard=jaccard_score,
-            semantic=semantic_score,
-            levenshtein=levenshtein_score,
-        )
+        matrix = self.compute_similarity_matrix(agent_output, [reference_text], enhanced=enhanced)
+        return matrix.per_reference[0]
 
     def find_best_match(
         self, agent_output: str, reference_texts: list[str], enhanced: bool = False
@@ -356,26 +814,79 @@ class TraditionalMetricsEngine:
         Returns:
             Best similarity scores across all reference texts
         """
-        if not reference_texts:
-            return SimilarityScores(cosine=0.0, jaccard=0.0, semantic=0.0, levenshtein=0.0)
+        return self.compute_similarity_matrix(agent_output, reference_texts, enhanced=enhanced).best
 
-        all_scores = [
-            self.compute_all_similarities(agent_output, ref, enhanced=enhanced)
-            for ref in reference_texts
-        ]
+    def compute_similarity_matrix(
+        self,
+        agent_output: str,
+        reference_texts: list[str],
+        metrics: Iterable[str] | None = None,
+        enhanced: bool = False,
+    ) -> SimilarityMatrix:
+        """Compute every requested metric against all references in one pass.
 
-        # Take maximum score for each metric (best match approach)
-        best_cosine = max(scores.cosine for scores in all_scores)
-        best_jaccard = max(scores.jaccard for scores in all_scores)
-        best_semantic = max(scores.semantic for scores in all_scores)
-        best_levenshtein = max(scores.levenshtein for scores in all_scores) if enhanced else 0.0
-
-        return SimilarityScores(
-            cosine=best_cosine,
-            jaccard=best_jaccard,
-            semantic=best_semantic,
-            levenshtein=best_levenshtein,
-        )
+        Each distinct text is normalized and tokenized once, TF-IDF and
+        BERTScore run once over all references, and metrics that are not
+        requested are reported as 0.0.
+
+        Args:
+            agent_output: Generated review text
+            reference_texts: List of ground truth reviews
+            metrics: Metrics to compute, from ``SIMILARITY_METRICS``. Defaults to
+                cosine, Jaccard and semantic.
+            enhanced: Use textdistance Jaccard and add Levenshtein similarity
+
+        Returns:
+            SimilarityMatrix with per-reference scores and the best-match vector
+
+        Raises:
+            ValueError: If an unknown metric is requested
+        """
+        requested = set(metrics) if metrics is not None else {"cosine", "jaccard", "semantic"}
+        unknown = requested - set(SIMILARITY_METRICS)
+        if unknown:
+            raise ValueError(f"Unknown similarity metrics: {sorted(unknown)}")
+        if enhanced:
+            requested.add("levenshtein")
+
+        zeros = [0.0] * len(reference_texts)
+        with self._recording_backends() as backends:
+            cosine = (
+                self.compute_cosine_similarity_batch(agent_output, reference_texts)
+                if "cosine" in requested
+                else zeros
+            )
+            jaccard = (
+                self.compute_jaccard_similarity_batch(agent_output, reference_texts, enhanced)
+                if "jaccard" in requested
+                else zeros
+            )
+            semantic = (
+                self.compute_semantic_similarity_batch(agent_output, reference_texts)
+                if "semantic" in requested
+                else zeros
+            )
+            levenshtein = (
+                self.compute_levenshtein_similarity_batch(agent_output, reference_texts)
+                if "levenshtein" in requested
+                else zeros
+            )
+
+        per_reference = [
+            SimilarityScores(cosine=c, jaccard=j, semantic=s, levenshtein=lev)
+            for c, j, s, lev in zip(cosine, jaccard, semantic, levenshtein, strict=True)
+        ]
+        if not per_reference:
+            best = SimilarityScores(cosine=0.0, jaccard=0.0, semantic=0.0, levenshtein=0.0)
+        else:
+            # Take maximum score for each metric (best match approach)
+            best = SimilarityScores(
+                cosine=max(scores.cosine for scores in per_reference),
+                jaccard=max(scores.jaccard for scores in per_reference),
+                semantic=max(scores.semantic for scores in per_reference),
+                levenshtein=max(scores.levenshtein for scores in per_reference),
+            )
+        return SimilarityMatrix(per_reference=per_reference, best=best, backends=backends)
 
     def evaluate_traditional_metrics(
         self,
@@ -398,8 +909,19 @@ class TraditionalMetricsEngine:
             Tier1Result with all traditional metrics
         """
         # Find best similarity scores across all references
-        best_scores = self.find_best_match(agent_output, reference_texts)
+        with self._recording_backends() as backends:
+            best_scores = self.find_best_match(agent_output, reference_texts)
+        return self._build_tier1_result(best_scores, start_time, end_time, settings, backends)
 
+    def _build_tier1_result(
+        self,
+        best_scores: SimilarityScores,
+        start_time: float,
+        end_time: float,
+        settings: JudgeSettings | None,
+        score_backends: dict[str, str],
+    ) -> Tier1Result:
+        """Turn best-match scores, timing and the backends used into a Tier1Result."""
         # Reason: Clamp cosine/semantic scores to [0, 1] — TF-IDF + sklearn cosine_similarity
         # can return 1.0000000000000002 due to floating-point precision (tests-review C1).
         cosine_score = min(1.0, max(0.0, best_scores.cosine))
@@ -432,6 +954,186 @@ class TraditionalMetricsEngine:
             time_score=time_score,
             task_success=task_success,
             overall_score=overall_score,
+            score_backends=score_backends,
+        )
+
+    def weight_enhanced_scores(
+        self,
+        best_scores: SimilarityScores,
+        config_weights: dict[str, float] | None = None,
+    ) -> float:
+        """Combine enhanced best-match scores into one weighted similarity.
+
+        Args:
+            best_scores: Best-match scores computed with ``enhanced=True``
+            config_weights: Optional weight configuration for metrics
+
+        Returns:
+            Weighted overall similarity score (0-1)
+        """
+        # Default balanced weights
+        default_weights = {
+            "cosine_weight": 0.4,
+            "jaccard_weight": 0.4,
+            "semantic_weight": 0.2,
+        }
+
+        weights = config_weights or default_weights
+
+        # Weighted combination using config weights
+        cosine_weight = weights.get("cosine_weight", 0.4)
+        jaccard_weight = weights.get("jaccard_weight", 0.4)
+        semantic_weight = weights.get("semantic_weight", 0.2)
+
+        # Calculate weighted average
+        weighted_score = (
+            best_scores.cosine * cosine_weight
+            + best_scores.jaccard * jaccard_weight
+            + best_scores.levenshtein * semantic_weight
+        )
+
+        return min(1.0, max(0.0, weighted_score))
+
+    def _cosine_matrix(
+        self, outputs: list[str], refs: list[str]
+    ) -> tuple[np.ndarray, list[dict[str, str]]]:
+        """TF-IDF cosine of every output against every reference, shape (outputs, refs).
+
+        With a corpus-fitted vectorizer, all texts are transformed together and
+        scored with one sparse product. Without one, each output gets its own
+        vectorizer fitted on ``[output, *refs]``, as in the single-item path, so
+        IDF weights (and scores) never depend on the other outputs in the batch.
+
+        Returns:
+            The cosine matrix and, per output, the backend that scored it
+        """
+        if self._vectorizer is not None:
+            try:
+                tfidf_matrix = self._tfidf_matrix([*refs, *outputs])
+                # Reason: Rows are L2-normalized, so one sparse product gives all cosines.
+                matrix = np.asarray(
+                    (tfidf_matrix[len(refs) :] @ tfidf_matrix[: len(refs)].T).toarray()
+                )
+                _apply_empty_text_scores(matrix, outputs, refs)
+                self._record_backend("cosine", self._tfidf_backend)
+                return matrix, [{"cosine": self._tfidf_backend} for _ in outputs]
+            except Exception as e:
+                logger.warning(f"Vectorized TF-IDF cosine failed, scoring per output: {e}")
+
+        rows: list[list[float]] = []
+        row_backends: list[dict[str, str]] = []
+        for output in outputs:
+            with self._recording_backends() as used:
+                rows.append(self.compute_cosine_similarity_batch(output, refs))
+            row_backends.append(used)
+        matrix = np.array(rows, dtype=float).reshape(len(outputs), len(refs))
+        _apply_empty_text_scores(matrix, outputs, refs)
+        return matrix, row_backends
+
+    def _jaccard_matrix(self, outputs: list[str], refs: list[str]) -> np.ndarray:
+        """Word-level Jaccard of every output against every reference, shape (outputs, refs).
+
+        Texts become binary bag-of-words rows over a shared vocabulary, so all
+        intersections come from one sparse product. With a MinHash hasher, all
+        cells are estimated from signatures instead.
+        """
+        if self._minhasher is not None:
+            matrix = self._minhasher.estimate_matrix(outputs, refs)
+            _apply_empty_text_scores(matrix, outputs, refs)
+            self._record_backend("jaccard", "minhash")
+            return matrix
+
+        vocabulary: dict[str, int] = {}
+        indices: list[int] = []
+        indptr = [0]
+        for text in [*refs, *outputs]:
+            words = _text_features(text).words
+            indices.extend(vocabulary.setdefault(w, len(vocabulary)) for w in words)
+            indptr.append(len(indices))
+        bags = csr_matrix(
+            (np.ones(len(indices)), indices, indptr),
+            shape=(len(refs) + len(outputs), max(len(vocabulary), 1)),
+        )
+        sizes = np.diff(bags.indptr).astype(float)
+        ref_bags, output_bags = bags[: len(refs)], bags[len(refs) :]
+
+        intersection = np.asarray((output_bags @ ref_bags.T).toarray())
+        union = sizes[len(refs) :, None] + sizes[None, : len(refs)] - intersection
+        matrix = np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+        _apply_empty_text_scores(matrix, outputs, refs)
+        self._record_backend("jaccard", "exact")
+        return matrix
+
+    def evaluate_traditional_metrics_batch(
+        self,
+        items: Sequence[Tier1BatchItem],
+        settings: JudgeSettings | None = None,
+    ) -> Tier1BatchResult:
+        """Evaluate many agent outputs at once, e.g. for sweeps and offline re-scoring.
+
+        Items are grouped by their reference set (i.e. by paper), so reference
+        features are computed once per paper, and the cosine and Jaccard scores
+        of all outputs of a paper come from sparse matrix products. BERTScore
+        runs once over all items in length-bucketed batches.
+
+        Args:
+            items: Outputs to score with their references and timing
+            settings: JudgeSettings instance. If None, uses defaults.
+
+        Returns:
+            Tier1BatchResult with Tier1Results in input order and throughput
+        """
+        started = time.perf_counter()
+        groups: dict[tuple[str, ...], list[int]] = {}
+        for idx, item in enumerate(items):
+            groups.setdefault(tuple(item.reference_texts), []).append(idx)
+
+        cosine: list[list[float]] = [[] for _ in items]
+        jaccard: list[list[float]] = [[] for _ in items]
+        backends: list[dict[str, str]] = [{} for _ in items]
+        for refs, indices in groups.items():
+            if not refs:
+                continue
+            outputs = [items[idx].agent_output for idx in indices]
+            cosine_matrix, cosine_backends = self._cosine_matrix(outputs, list(refs))
+            with self._recording_backends() as jaccard_backends:
+                jaccard_matrix = self._jaccard_matrix(outputs, list(refs))
+            for row, idx in enumerate(indices):
+                cosine[idx] = cosine_matrix[row].tolist()
+                jaccard[idx] = jaccard_matrix[row].tolist()
+                backends[idx] = {**cosine_backends[row], **jaccard_backends}
+
+        with self._recording_backends() as semantic_backends:
+            semantic = self.compute_semantic_similarity_corpus(
+                [(item.agent_output, item.reference_texts) for item in items]
+            )
+
+        results = [
+            self._build_tier1_result(
+                SimilarityScores(
+                    cosine=max(cosine[idx], default=0.0),
+                    jaccard=max(jaccard[idx], default=0.0),
+                    semantic=max(semantic[idx], default=0.0),
+                ),
+                item.start_time,
+                item.end_time,
+                settings,
+                {**backends[idx], **semantic_backends},
+            )
+            for idx, item in enumerate(items)
+        ]
+
+        elapsed = time.perf_counter() - started
+        items_per_second = len(items) / elapsed if elapsed > 0 else 0.0
+        logger.info(
+            f"Tier 1 batch: {len(items)} items over {len(groups)} papers "
+            f"in {elapsed:.2f}s ({items_per_second:.1f} items/s)"
+        )
+        return Tier1BatchResult(
+            results=results,
+            reference_groups=len(groups),
+            elapsed_seconds=elapsed,
+            items_per_second=items_per_second,
         )
 
     def evaluate_enhanced_similarity(
@@ -457,36 +1159,9 @@ class TraditionalMetricsEngine:
             Weighted overall similarity score (0-1)
         """
         try:
-            # Default balanced weights
-            default_weights = {
-                "cosine_weight": 0.4,
-                "jaccard_weight": 0.4,
-                "semantic_weight": 0.2,
-            }
-
-            weights = config_weights or default_weights
-
             # Find best matching scores with enhanced features enabled
             best_scores = self.find_best_match(agent_output, reference_texts, enhanced=True)
-
-            # Calculate multiple similarity metrics
-            cosine_sim = best_scores.cosine
-            jaccard_sim = best_scores.jaccard
-            levenshtein_sim = best_scores.levenshtein
-
-            # Weighted combination using config weights
-            cosine_weight = weights.get("cosine_weight", 0.4)
-            jaccard_weight = weights.get("jaccard_weight", 0.4)
-            semantic_weight = weights.get("semantic_weight", 0.2)
-
-            # Calculate weighted average
-            weighted_score = (
-                cosine_sim * cosine_weight
-                + jaccard_sim * jaccard_weight
-                + levenshtein_sim * semantic_weight
-            )
-
-            return min(1.0, max(0.0, weighted_score))
+            return self.weight_enhanced_scores(best_scores, config_weights)
 
         except Exception as e:
             logger.warning(f"Enhanced similarity evaluation failed: {e}")
@@ -498,6 +1173,86 @@ class TraditionalMetricsEngine:
                 return 0.0
 
 
+# Global shared engines for the convenience functions, one per engine configuration
+_shared_engines: dict[tuple[object, ...], TraditionalMetricsEngine] = {}
+_shared_engine_lock = threading.Lock()
+
+
+def engine_settings_key(settings: JudgeSettings) -> tuple[object, ...]:
+    """Settings that shape a TraditionalMetricsEngine built by ``from_settings``.
+
+    Engines built from settings with equal keys are interchangeable, so callers
+    can cache one engine per key instead of per full settings object.
+    """
+    return (
+        settings.tier1_embedding_cache,
+        settings.tier1_tfidf_corpus_model,
+        BERTScoreBackend.from_settings(settings),
+        settings.tier1_jaccard_mode,
+        settings.tier1_jaccard_max_error,
+        settings.tier1_edit_distance_backend,
+    )
+
+
+def _get_shared_engine(settings: JudgeSettings | None = None) -> TraditionalMetricsEngine:
+    """Get or create the shared engine configured from settings.
+
+    Args:
+        settings: JudgeSettings instance. If None, uses defaults.
+    """
+    if settings is None:
+        from app.config.judge_settings import JudgeSettings
+
+        settings = JudgeSettings()
+    key = engine_settings_key(settings)
+    with _shared_engine_lock:
+        if key not in _shared_engines:
+            _shared_engines[key] = TraditionalMetricsEngine.from_settings(settings)
+        return _shared_engines[key]
+
+
+def start_bertscore_warmup(backend: BERTScoreBackend | None = None) -> threading.Thread:
+    """Start loading the BERTScore model in a background daemon thread.
+
+    Evaluations that need the model before the warm-up finishes wait for it
+    instead of loading a second copy.
+
+    Args:
+        backend: BERTScore inference options. Defaults to the fp32 model.
+
+    Returns:
+        The started warm-up thread.
+    """
+    engine = TraditionalMetricsEngine(bertscore_backend=backend)
+    thread = threading.Thread(
+        target=engine._get_bertscore_model, name="bertscore-warmup", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def evaluate_traditional_metrics_batch(
+    items: Sequence[Tier1BatchItem],
+    settings: JudgeSettings | None = None,
+) -> Tier1BatchResult:
+    """Convenience function for batched traditional evaluation.
+
+    Args:
+        items: Outputs to score with their references and timing
+        settings: Optional JudgeSettings override. If None, uses defaults.
+
+    Returns:
+        Tier1BatchResult with Tier1Results in input order and throughput
+
+    Example:
+        >>> batch = evaluate_traditional_metrics_batch(
+        ...     [Tier1BatchItem(agent_output="Solid work.", reference_texts=refs) for _ in range(8)]
+        ... )
+        >>> print(f"{batch.items_per_second:.0f} items/s")
+    """
+    return _get_shared_engine(settings).evaluate_traditional_metrics_batch(items, settings)
+
+
 def evaluate_single_traditional(
     agent_output: str,
     reference_texts: list[str],
@@ -524,7 +1279,7 @@ def evaluate_single_traditional(
         from app.config.judge_settings import JudgeSettings
 
         settings = JudgeSettings()
-    engine = TraditionalMetricsEngine()
+    engine = _get_shared_engine(settings)
 
     start_time = time.perf_counter()
     end_time = time.perf_counter()
@@ -572,7 +1327,7 @@ def evaluate_single_enhanced(
         ... )
         >>> print(f"Enhanced similarity: {result:.3f}")
     """
-    engine = TraditionalMetricsEngine()
+    engine = _get_shared_engine()
     return engine.evaluate_enhanced_similarity(
         agent_output=agent_output,
         reference_texts=reference_texts,
@@ -601,16 +1356,11 @@ def create_evaluation_result(
     # Extract reference texts for similarity calculation
     reference_texts = [review.comments for review in ground_truth_reviews]
 
-    # Use enhanced similarity evaluation (equivalent to evaluate_review_similarity)
-    overall_similarity = evaluate_single_enhanced(
-        agent_output=agent_review,
-        reference_texts=reference_texts,
-        config_weights=None,  # Use default weights
-    )
-
-    # Calculate individual similarity metrics for detailed breakdown
-    engine = TraditionalMetricsEngine()
+    # Reason: Compute the enhanced best match once and derive both the weighted overall
+    # similarity (as evaluate_single_enhanced does) and the detailed breakdown from it.
+    engine = _get_shared_engine()
     best_scores = engine.find_best_match(agent_review, reference_texts, enhanced=True)
+    overall_similarity = engine.weight_enhanced_scores(best_scores)
 
     similarity_scores = {
         "cosine": best_scores.cosine,
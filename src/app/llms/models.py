@@ -5,12 +5,14 @@ This module provides pure model creation functionality without business logic.
 Handles model instantiation for different providers in a unified way.
 """
 
+from httpx import AsyncClient
 from pydantic_ai.models import Model
 from pydantic_ai.models.openai import OpenAIChatModel
 from pydantic_ai.profiles.openai import OpenAIModelProfile
 from pydantic_ai.providers.openai import OpenAIProvider
 
 from app.data_models.app_models import PROVIDER_REGISTRY, EndpointConfig, ModelDict
+from app.llms.rate_limiter import get_rate_limited_client
 from app.utils.log import logger
 
 
@@ -48,7 +50,11 @@ def get_llm_model_name(provider: str, model_name: str) -> str:
 
 
 def _create_model_for_provider(
-    provider: str, model_name: str, api_key: str | None, base_url: str | None
+    provider: str,
+    model_name: str,
+    api_key: str | None,
+    base_url: str | None,
+    http_client: AsyncClient | None = None,
 ) -> Model:
     """Create a PydanticAI model for a given provider.
 
@@ -60,22 +66,29 @@ def _create_model_for_provider(
         model_name: Model identifier for the provider.
         api_key: API key, or None (SDK falls back to env var).
         base_url: API base URL, or None for providers with native SDK support.
+        http_client: Shared HTTP client for OpenAI-compatible and Anthropic backends,
+            or None for the provider's shared rate-limited client.
 
     Returns:
         PydanticAI Model instance routed to the correct backend.
     """
+    if http_client is None and provider != "gemini":
+        # Reason: All models of a provider share one limiter, so concurrent agents,
+        # judges and sweep runs stay within the provider's quota together.
+        http_client = get_rate_limited_client(provider)
     if provider == "ollama":
         return OpenAIChatModel(
             model_name=model_name,
             provider=OpenAIProvider(
                 base_url=base_url or "http://localhost:11434/v1",
                 api_key="not-required",
+                http_client=http_client,
             ),
         )
     elif provider == "openai":
         return OpenAIChatModel(
             model_name=model_name,
-            provider=OpenAIProvider(api_key=api_key),
+            provider=OpenAIProvider(api_key=api_key, http_client=http_client),
         )
     elif provider == "anthropic":
         # Reason: Anthropic has native PydanticAI support; using the OpenAI-compatible
@@ -86,13 +99,15 @@ def _create_model_for_provider(
 
             return AnthropicModel(
                 model_name=model_name,
-                provider=AnthropicProvider(api_key=api_key),
+                provider=AnthropicProvider(api_key=api_key, http_client=http_client),
             )
         except ImportError:
             logger.warning("AnthropicModel not available, falling back to OpenAI format")
             return OpenAIChatModel(
                 model_name=model_name,
-                provider=OpenAIProvider(base_url=base_url, api_key=api_key),
+                provider=OpenAIProvider(
+                    base_url=base_url, api_key=api_key, http_client=http_client
+                ),
             )
     elif provider in ["cerebras", "groq", "fireworks", "together", "sambanova"]:
         # Reason: These providers reject requests with mixed strict values on tools.
@@ -100,7 +115,7 @@ def _create_model_for_provider(
         # the 'strict' field to some tools but not others.
         return OpenAIChatModel(
             model_name=model_name,
-            provider=OpenAIProvider(base_url=base_url, api_key=api_key),
+            provider=OpenAIProvider(base_url=base_url, api_key=api_key, http_client=http_client),
             profile=OpenAIModelProfile(openai_supports_strict_tool_definition=False),
         )
     elif provider == "gemini":
@@ -117,12 +132,14 @@ def _create_model_for_provider(
             logger.warning("GoogleModel not available, falling back to OpenAI format")
             return OpenAIChatModel(
                 model_name=model_name,
-                provider=OpenAIProvider(base_url=base_url, api_key=api_key),
+                provider=OpenAIProvider(
+                    base_url=base_url, api_key=api_key, http_client=http_client
+                ),
             )
     else:
         return OpenAIChatModel(
             model_name=model_name,
-            provider=OpenAIProvider(base_url=base_url, api_key=api_key),
+            provider=OpenAIProvider(base_url=base_url, api_key=api_key, http_client=http_client),
         )
 
 
@@ -176,7 +193,12 @@ def create_agent_models(
     )
 
 
-def create_simple_model(provider: str, model_name: str, api_key: str | None = None) -> Model:
+def create_simple_model(
+    provider: str,
+    model_name: str,
+    api_key: str | None = None,
+    http_client: AsyncClient | None = None,
+) -> Model:
     """Create a simple model for basic usage like evaluation.
 
     Routes to the correct provider backend using the same logic as create_llm_model.
@@ -186,6 +208,8 @@ def create_simple_model(provider: str, model_name: str, api_key: str | None = No
         provider: Provider name (e.g., "openai", "anthropic", "cerebras").
         model_name: Model name (e.g., "gpt-4o-mini", "claude-sonnet-4-20250514").
         api_key: API key (optional, will use environment if not provided).
+        http_client: Shared async HTTP client (optional); reusing one client across
+            models keeps its connection pool and TLS sessions warm.
 
     Returns:
         PydanticAI Model instance routed to the correct backend.
@@ -193,4 +217,4 @@ def create_simple_model(provider: str, model_name: str, api_key: str | None = No
     provider_lower = provider.lower()
     registry_entry = PROVIDER_REGISTRY.get(provider_lower)
     base_url = registry_entry.default_base_url if registry_entry else None
-    return _create_model_for_provider(provider_lower, model_name, api_key, base_url)
+    return _create_model_for_provider(provider_lower, model_name, api_key, base_url, http_client)
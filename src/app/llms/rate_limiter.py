@@ -0,0 +1,468 @@
+"""
+Process-wide rate limiting and adaptive concurrency per LLM provider.
+
+Every provider gets one ``ProviderRateLimiter`` per process, shared by the agent
+system, the Tier 2 judge and the suggestion engine. A request is admitted when
+
+- the provider is not cooling down after a ``Retry-After`` response,
+- fewer requests are in flight than the current concurrency limit, and
+- the requests/min and tokens/min token buckets hold enough capacity.
+
+Concurrency is not capped unless a provider sets ``max_concurrency``; the first
+429 then starts the limit at half the requests in flight. From there it follows
+AIMD (additive increase, multiplicative decrease): each successful response
+raises it by ``1 / limit`` (about +1 per window of responses, up to
+``max_concurrency`` if set), and a 429 halves it, at most once per second so a
+burst of 429s from requests already in flight counts as one signal. Time spent
+waiting for admission is recorded as queue-wait metrics.
+
+Limits come from ``PROVIDER_REGISTRY`` and can be overridden per provider with the
+``LLM_RATE_LIMITS`` environment variable (JSON), e.g.
+``{"openai": {"requests_per_minute": 500, "tokens_per_minute": 200000}}``.
+
+``get_rate_limited_client`` returns the process-wide ``httpx.AsyncClient`` of a
+provider, whose transport routes every request through the provider's limiter,
+so SDK-level retries are throttled as well. It keeps one connection pool per
+event loop. Owners of an event
+loop release its pools with ``aclose_loop_clients`` (``run_closing_clients``
+wraps ``asyncio.run()`` to do so).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Coroutine
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from httpx import (
+    AsyncBaseTransport,
+    AsyncClient,
+    AsyncHTTPTransport,
+    Limits,
+    Request,
+    RequestNotRead,
+    Response,
+    Timeout,
+)
+
+from app.config.app_env import AppEnv
+from app.data_models.app_models import PROVIDER_REGISTRY
+from app.utils.log import logger
+
+# Reason: Matches PydanticAI's default client timeouts; callers enforce their own
+# per-call timeouts on top.
+_HTTP_TIMEOUT = Timeout(timeout=600, connect=5)
+_HTTP_LIMITS = Limits(max_connections=100, max_keepalive_connections=20)
+_POLL_SECONDS = 0.05
+_DECREASE_INTERVAL_SECONDS = 1.0
+
+
+def parse_retry_after(value: Any) -> float | None:
+    """Parse a ``Retry-After`` header value into seconds.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date.
+
+    Returns:
+        Non-negative seconds to wait, or None if absent or unparsable.
+    """
+    if not isinstance(value, str | int | float) or isinstance(value, bool):
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+@dataclass(frozen=True)
+class RateLimiterStats:
+    """Snapshot of a limiter's state and queue-wait metrics.
+
+    Attributes:
+        name: Provider (or host) the limiter controls
+        requests: Requests admitted so far
+        rate_limited: 429 responses observed
+        concurrency_limit: Current AIMD concurrency limit; None while uncapped
+        in_flight: Requests currently admitted and not yet released
+        queued: Requests currently waiting for admission
+        total_queue_wait: Seconds spent waiting for admission, summed over requests
+        max_queue_wait: Longest single wait for admission in seconds
+    """
+
+    name: str
+    requests: int
+    rate_limited: int
+    concurrency_limit: int | None
+    in_flight: int
+    queued: int
+    total_queue_wait: float
+    max_queue_wait: float
+
+    @property
+    def mean_queue_wait(self) -> float:
+        """Average seconds a request waited for admission."""
+        return self.total_queue_wait / self.requests if self.requests else 0.0
+
+
+class _TokenBucket:
+    """Token bucket refilled continuously at ``per_minute / 60`` per second."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, amount: float) -> float:
+        """Seconds until ``amount`` is available; amounts above capacity need a full bucket."""
+        deficit = min(amount, self.capacity) - self.level
+        return max(0.0, deficit / self.rate)
+
+    def take(self, amount: float) -> None:
+        self.level -= min(amount, self.capacity)
+
+
+class ProviderRateLimiter:
+    """Token-bucket rate limiter with AIMD concurrency control for one provider.
+
+    State is guarded by a thread lock and waits use ``asyncio.sleep``, so one
+    limiter can be shared by pipelines on different threads and event loops.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        max_concurrency: int | None = None,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            name: Provider (or host) name, used in logs and stats.
+            requests_per_minute: Request budget, or None for no request limit.
+            tokens_per_minute: Token budget, or None for no token limit.
+            max_concurrency: Upper bound of the adaptive concurrency limit, or None
+                to leave concurrency uncapped until the provider answers with a 429.
+        """
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency) if max_concurrency is not None else None
+        self._requests = _TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._tokens = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._lock = threading.Lock()
+        self._limit = float(self.max_concurrency or math.inf)
+        self._in_flight = 0
+        self._queued = 0
+        self._blocked_until = 0.0
+        self._last_decrease = -math.inf
+        self._admitted = 0
+        self._rate_limited = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _admission_delay(self, now: float, tokens: int) -> float:
+        """Seconds to wait before admitting a request; 0 when it can go now."""
+        delay = self._blocked_until - now
+        if self._limit != math.inf and self._in_flight >= int(self._limit):
+            delay = max(delay, _POLL_SECONDS)
+        for bucket, amount in ((self._requests, 1), (self._tokens, tokens)):
+            if bucket is not None:
+                bucket.refill(now)
+                delay = max(delay, bucket.delay(amount))
+        return max(0.0, delay)
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """Wait until a request may be sent and reserve capacity for it.
+
+        Args:
+            tokens: Estimated tokens of the request, charged to the token bucket.
+
+        Returns:
+            Seconds spent waiting for admission.
+        """
+        start = time.monotonic()
+        with self._lock:
+            self._queued += 1
+        try:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    delay = self._admission_delay(now, tokens)
+                    if delay == 0.0:
+                        if self._requests is not None:
+                            self._requests.take(1)
+                        if self._tokens is not None:
+                            self._tokens.take(tokens)
+                        self._in_flight += 1
+                        waited = now - start
+                        self._admitted += 1
+                        self._total_wait += waited
+                        self._max_wait = max(self._max_wait, waited)
+                        return waited
+                await asyncio.sleep(delay)
+        finally:
+            with self._lock:
+                self._queued -= 1
+
+    def release(self) -> None:
+        """Release the concurrency slot of an admitted request."""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+
+    @asynccontextmanager
+    async def slot(self, tokens: int = 0) -> AsyncIterator[None]:
+        """Hold an admitted request slot for the duration of the block."""
+        await self.acquire(tokens)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def record_success(self) -> None:
+        """Additive increase of the concurrency limit after a successful response."""
+        with self._lock:
+            ceiling = float(self.max_concurrency or math.inf)
+            self._limit = min(ceiling, self._limit + 1.0 / self._limit)
+
+    def record_rate_limit(self, retry_after: float | None = None) -> None:
+        """Multiplicative decrease after a 429, pausing all requests for ``retry_after``.
+
+        Args:
+            retry_after: Seconds from the ``Retry-After`` header, if any.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._rate_limited += 1
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+            if self._requests is not None:
+                # Reason: The provider's window is exhausted; refill from empty.
+                self._requests.refill(now)
+                self._requests.level = min(self._requests.level, 0.0)
+            if now - self._last_decrease >= _DECREASE_INTERVAL_SECONDS:
+                # Reason: An uncapped limiter starts AIMD from what was in flight.
+                current = self._limit if self._limit != math.inf else float(self._in_flight)
+                self._limit = max(1.0, current / 2)
+                self._last_decrease = now
+                logger.warning(
+                    f"Rate limited by {self.name}: concurrency limit now {int(self._limit)}"
+                    + (f", pausing {retry_after:.1f}s" if retry_after else "")
+                )
+
+    def cooldown_remaining(self) -> float:
+        """Seconds until the current ``Retry-After`` pause ends."""
+        with self._lock:
+            return max(0.0, self._blocked_until - time.monotonic())
+
+    async def wait_ready(self) -> None:
+        """Wait out the current ``Retry-After`` pause, if any."""
+        delay = self.cooldown_remaining()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def stats(self) -> RateLimiterStats:
+        """Snapshot of the limiter's state and queue-wait metrics."""
+        with self._lock:
+            return RateLimiterStats(
+                name=self.name,
+                requests=self._admitted,
+                rate_limited=self._rate_limited,
+                concurrency_limit=None if self._limit == math.inf else int(self._limit),
+                in_flight=self._in_flight,
+                queued=self._queued,
+                total_queue_wait=self._total_wait,
+                max_queue_wait=self._max_wait,
+            )
+
+
+_global_limiters: dict[str, ProviderRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def _configured_limits(name: str) -> dict[str, int]:
+    """Limits of a provider from the registry, overridden by ``LLM_RATE_LIMITS``."""
+    limits: dict[str, int] = {}
+    metadata = PROVIDER_REGISTRY.get(name)
+    if metadata is not None:
+        for key in ("requests_per_minute", "tokens_per_minute", "max_concurrency"):
+            value = getattr(metadata, key)
+            if value is not None:
+                limits[key] = value
+    limits.update(AppEnv().LLM_RATE_LIMITS.get(name, {}))
+    return limits
+
+
+def get_rate_limiter(name: str) -> ProviderRateLimiter:
+    """Get the process-wide limiter of a provider (or host), creating it on first use.
+
+    Args:
+        name: Provider name as in ``PROVIDER_REGISTRY``, or any other key such as
+            a download host. Unknown names get concurrency control only.
+
+    Returns:
+        Shared limiter.
+    """
+    with _limiters_lock:
+        limiter = _global_limiters.get(name)
+        if limiter is None:
+            limiter = ProviderRateLimiter(name, **_configured_limits(name))
+            _global_limiters[name] = limiter
+        return limiter
+
+
+def rate_limiter_stats() -> dict[str, RateLimiterStats]:
+    """Stats of every limiter created in this process, keyed by name."""
+    with _limiters_lock:
+        limiters = list(_global_limiters.values())
+    return {limiter.name: limiter.stats() for limiter in limiters}
+
+
+def _estimate_tokens(request: Request) -> int:
+    """Rough prompt token estimate of a request (4 bytes per token)."""
+    try:
+        return len(request.content) // 4
+    except RequestNotRead:
+        return 0
+
+
+class RateLimitedTransport(AsyncBaseTransport):
+    """HTTP transport that admits every request through a provider limiter."""
+
+    def __init__(self, limiter: ProviderRateLimiter, transport: AsyncBaseTransport):
+        """Wrap a transport.
+
+        Args:
+            limiter: Limiter admitting the requests and observing their responses.
+            transport: Transport that sends admitted requests.
+        """
+        self.limiter = limiter
+        self._transport = transport
+
+    async def handle_async_request(self, request: Request) -> Response:
+        async with self.limiter.slot(_estimate_tokens(request)):
+            response = await self._transport.handle_async_request(request)
+        if response.status_code == 429:
+            self.limiter.record_rate_limit(parse_retry_after(response.headers.get("retry-after")))
+        elif response.status_code < 500:
+            self.limiter.record_success()
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class LoopLocalTransport(AsyncBaseTransport):
+    """Transport keeping one inner transport (connection pool) per event loop.
+
+    Pooled connections are bound to the loop that opened them, so a client used
+    from several loops (e.g. successive ``asyncio.run()`` calls) gets a separate
+    pool on each. ``aclose()`` closes the pool of the running loop only; pools of
+    loops closed without it are dropped the next time another loop uses the transport.
+    """
+
+    def __init__(self, factory: Callable[[], AsyncBaseTransport]):
+        """Initialize without any pool; pools are created on first use per loop.
+
+        Args:
+            factory: Creates the inner transport of a loop.
+        """
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._transports: dict[asyncio.AbstractEventLoop, AsyncBaseTransport] = {}
+
+    def _loop_transport(self) -> AsyncBaseTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._transports.get(loop)
+            if transport is None:
+                # Reason: Loops closed without aclose() would stay referenced by
+                # their transports forever.
+                for closed in [other for other in self._transports if other.is_closed()]:
+                    self._transports.pop(closed)
+                transport = self._factory()
+                self._transports[loop] = transport
+            return transport
+
+    async def handle_async_request(self, request: Request) -> Response:
+        return await self._loop_transport().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        with self._lock:
+            transport = self._transports.pop(asyncio.get_running_loop(), None)
+        if transport is not None:
+            await transport.aclose()
+
+
+_global_clients: dict[str, AsyncClient] = {}
+_global_pools: dict[str, LoopLocalTransport] = {}
+_clients_lock = threading.Lock()
+
+
+def get_rate_limited_client(provider: str) -> AsyncClient:
+    """Get the process-wide rate-limited HTTP client of a provider.
+
+    Models of a provider share this client and thus its connection pools,
+    which are kept per event loop and released by ``aclose_loop_clients``.
+
+    Args:
+        provider: Provider name.
+
+    Returns:
+        Shared async HTTP client, recreated if it was closed.
+    """
+    with _clients_lock:
+        client = _global_clients.get(provider)
+        if client is None or client.is_closed:
+            pools = LoopLocalTransport(lambda: AsyncHTTPTransport(limits=_HTTP_LIMITS))
+            transport = RateLimitedTransport(get_rate_limiter(provider), pools)
+            client = AsyncClient(transport=transport, timeout=_HTTP_TIMEOUT)
+            _global_clients[provider] = client
+            _global_pools[provider] = pools
+        return client
+
+
+async def aclose_loop_clients() -> None:
+    """Close the running loop's connection pools of all shared provider clients.
+
+    Call it once all requests on the loop are done, e.g. at the end of the
+    coroutine passed to ``asyncio.run()``. The clients stay usable; a later
+    loop opens new pools.
+    """
+    with _clients_lock:
+        pools = list(_global_pools.values())
+    for pool in pools:
+        await pool.aclose()
+
+
+def run_closing_clients[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine with ``asyncio.run()`` and close its loop's provider connections.
+
+    Args:
+        coro: Main coroutine of the event loop.
+
+    Returns:
+        The coroutine's result.
+    """
+
+    async def _main() -> T:
+        try:
+            return await coro
+        finally:
+            await aclose_loop_clients()
+
+    return asyncio.run(_main())
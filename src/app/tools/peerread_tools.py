@@ -5,22 +5,25 @@ This module provides agent tools that enable the manager agent to interact
 with the PeerRead dataset for paper retrieval, querying, and review evaluation.
 """
 
+import asyncio
 import time
 from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import TypeVar
 
-from markitdown import MarkItDown
 from pydantic import BaseModel
 from pydantic_ai import Agent, ModelRetry, RunContext
 
 from app.data_models.peerread_models import (
     GeneratedReview,
+    PaperSearchHit,
     PeerReadPaper,
     PeerReadReview,
     ReviewGenerationResult,
 )
 from app.data_utils.datasets_peerread import PeerReadLoader, load_peerread_config
+from app.data_utils.paper_search import get_paper_search_index
+from app.data_utils.pdf_markdown import convert_pdf_to_markdown
 from app.data_utils.review_persistence import ReviewPersistence
 from app.judge.trace_processors import get_trace_collector
 from app.utils.log import logger
@@ -40,6 +43,7 @@ def read_paper_pdf(
 
     Note: MarkItDown extracts the entire PDF content as a single text block.
     Page-level extraction is not supported by the underlying library.
+    Conversions are cached on disk by PDF content hash and share one converter.
 
     Args:
         ctx: RunContext (unused but required for tool compatibility).
@@ -69,10 +73,9 @@ def read_paper_pdf(
         raise ValueError(f"Not a PDF file: {pdf_file}")
 
     try:
-        md_converter = MarkItDown()
-        result = md_converter.convert(pdf_file)
+        text = convert_pdf_to_markdown(pdf_file)
         logger.info(f"Extracted text from {pdf_file}")
-        return result.text_content.strip()
+        return text
 
     except Exception as e:
         logger.error(f"Error reading PDF with MarkItDown: {e}")
@@ -210,6 +213,44 @@ def add_peerread_tools_to_agent(agent: Agent[None, BaseModel], agent_id: str = "
             error_msg="Failed to query papers",
         )
 
+    @agent.tool
+    async def search_peerread_papers(  # type: ignore[reportUnusedFunction]
+        ctx: RunContext[None], query: str, limit: int = 10
+    ) -> list[PaperSearchHit]:
+        """Search papers in the local PeerRead dataset by topic (full-text BM25).
+
+        Returns ranked paper IDs, titles and short abstract snippets without
+        loading full papers. Use this to find candidate papers on a topic, then
+        fetch details with get_peerread_paper or get_paper_content.
+
+        Args:
+            query: Free-text topic query (e.g. "attention for machine translation").
+            limit: Maximum number of results to return.
+
+        Returns:
+            List of PaperSearchHit ordered by relevance.
+        """
+
+        async def _fn() -> list[PaperSearchHit]:
+            config = load_peerread_config()
+            loader = PeerReadLoader(config)
+            search_index = get_paper_search_index(loader.cache_dir)
+            if search_index.is_stale(loader):
+                # Reason: Tokenizes new papers (every paper on first use); keep it
+                # off the event loop.
+                await asyncio.to_thread(search_index.refresh, loader)
+            hits = search_index.search(query, limit=max(1, min(limit, config.max_papers_per_query)))
+            logger.info(f"Search '{query}' returned {len(hits)} papers")
+            return hits
+
+        return await _traced_tool_call(
+            agent_id=agent_id,
+            tool_name="search_peerread_papers",
+            context=f"query={query},limit={limit}",
+            fn=_fn,
+            error_msg="Failed to search papers",
+        )
+
     @agent.tool
     async def get_paper_content(  # type: ignore[reportUnusedFunction]
         ctx: RunContext[None],
@@ -236,7 +277,10 @@ def add_peerread_tools_to_agent(agent: Agent[None, BaseModel], agent_id: str = "
             paper = loader.get_paper_by_id(paper_id)
             if not paper:
                 raise ValueError(f"Paper {paper_id} not found in PeerRead dataset")
-            content = _load_paper_content_with_fallback(ctx, loader, paper_id, paper.abstract)
+            # Reason: Raw PDF conversion is CPU-bound; keep it off the event loop.
+            content = await asyncio.to_thread(
+                _load_paper_content_with_fallback, ctx, loader, paper_id, paper.abstract
+            )
             logger.info(f"Retrieved content for paper {paper_id}")
             return content
 
@@ -49,39 +49,12 @@ from gui.config.text import (
 from gui.utils.log_capture import LogCapture
 
 
-def _collect_unique_papers(
-    loader: PeerReadLoader,
-    venue: str,
-    split: str,
-    seen_ids: set[str],
-    papers: list[PeerReadPaper],
-) -> None:
-    """Collect unique papers from a single venue/split combination.
-
-    Appends papers not already in seen_ids. Silently skips when the
-    venue/split data has not been downloaded (FileNotFoundError).
-
-    Args:
-        loader: PeerReadLoader instance to load papers from.
-        venue: Venue name (e.g. "acl_2017").
-        split: Data split name (e.g. "train").
-        seen_ids: Mutable set tracking already-collected paper IDs.
-        papers: Mutable list to append new papers to.
-    """
-    try:
-        for paper in loader.load_papers(venue, split):
-            if paper.paper_id not in seen_ids:
-                seen_ids.add(paper.paper_id)
-                papers.append(paper)
-    except FileNotFoundError:
-        pass
-
-
 def _load_available_papers() -> list[PeerReadPaper]:
     """Load all locally downloaded PeerRead papers across configured venues and splits.
 
-    Iterates all configured venues and splits, collecting unique papers by paper_id.
-    Returns an empty list when the dataset has not been downloaded yet.
+    Streams papers from all configured venues and splits, collecting unique papers
+    by paper_id. Venue/splits that have not been downloaded are skipped, so this
+    returns an empty list when the dataset has not been downloaded yet.
 
     Returns:
         Deduplicated list of PeerReadPaper objects available locally.
@@ -90,9 +63,10 @@ def _load_available_papers() -> list[PeerReadPaper]:
     seen_ids: set[str] = set()
     papers: list[PeerReadPaper] = []
 
-    for venue in loader.config.venues:
-        for split in loader.config.splits:
-            _collect_unique_papers(loader, venue, split, seen_ids, papers)
+    for paper in loader.iter_papers():
+        if paper.paper_id not in seen_ids:
+            seen_ids.add(paper.paper_id)
+            papers.append(paper)
 
     return papers
 
@@ -24,6 +24,11 @@ for _flag, _help in [
     ("--pydantic-ai-stream", "Enable streaming output"),
     ("--download-peerread-full-only", "Download all PeerRead data and exit (setup mode)"),
     ("--download-peerread-samples-only", "Download PeerRead sample and exit (setup mode)"),
+    ("--sync-peerread-only", "Incrementally sync PeerRead data via local manifest and exit"),
+    ("--pack-peerread-only", "Pack cached PeerRead reviews and paper bodies, then exit"),
+    ("--prewarm-pdf-markdown-only", "Convert cached PeerRead PDFs to Markdown and exit"),
+    ("--prefill-reference-embeddings-only", "Cache BERTScore embeddings of reviews and exit"),
+    ("--fit-tfidf-model-only", "Fit the Tier 1 TF-IDF model on cached reviews and exit"),
     ("--cc-teams", "Use Claude Code Agent Teams mode (requires --engine=cc)"),
     ("--no-llm-suggestions", "Disable LLM-assisted suggestions in generated report"),
 ]:
@@ -203,9 +208,8 @@ def cli_main() -> None:
         )
         exit(1)
 
-    from asyncio import run
-
     from app.app import main
+    from app.llms.rate_limiter import run_closing_clients
     from app.utils.artifact_registry import get_artifact_registry
     from app.utils.log import logger
 
@@ -214,7 +218,9 @@ def cli_main() -> None:
     cc_result_obj = _run_cc_engine(args, cc_teams) if engine == "cc" else None
 
     try:
-        result_dict = run(main(**args, engine=engine, cc_result=cc_result_obj, cc_teams=cc_teams))
+        result_dict = run_closing_clients(
+            main(**args, engine=engine, cc_result=cc_result_obj, cc_teams=cc_teams)
+        )
         if generate_report_flag and result_dict:
             _maybe_generate_report(result_dict, no_llm_suggestions)
     finally:
@@ -15,7 +15,6 @@ Functions:
 - main(): Main function to set up and run the Streamlit application.
 """
 
-from asyncio import run
 from pathlib import Path
 
 import streamlit as st
@@ -27,6 +26,7 @@ from app.config.config_app import (
 )
 from app.config.judge_settings import JudgeSettings
 from app.data_models.app_models import ChatConfig
+from app.llms.rate_limiter import run_closing_clients
 from app.utils.load_configs import load_config
 from app.utils.log import logger
 from gui.components.sidebar import render_sidebar
@@ -100,4 +100,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    run(main())
+    run_closing_clients(main())
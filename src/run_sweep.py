@@ -5,7 +5,6 @@ statistical analysis of results.
 """
 
 import argparse
-import asyncio
 import json
 import sys
 from datetime import datetime
@@ -14,6 +13,7 @@ from pathlib import Path
 from app.benchmark import AgentComposition, SweepConfig, generate_all_compositions, run_sweep
 from app.config.config_app import CHAT_DEFAULT_PROVIDER, OUTPUT_PATH
 from app.data_models.app_models import PROVIDER_REGISTRY
+from app.llms.rate_limiter import run_closing_clients
 from app.utils.log import logger
 
 
@@ -212,7 +212,7 @@ def main() -> int:
     Returns:
         int: Exit code (0 for success, 1 for error).
     """
-    return asyncio.run(main_async())
+    return run_closing_clients(main_async())
 
 
 if __name__ == "__main__":
@@ -233,7 +233,9 @@ class TestCreateEvaluationAgent:
                     api_key="test-key",
                 )
 
-                mock_create_model.assert_called_once_with("openai", "gpt-4", "test-key")
+                mock_create_model.assert_called_once_with(
+                    "openai", "gpt-4", "test-key", http_client=None
+                )
                 mock_agent_class.assert_called_once()
                 call_args = mock_agent_class.call_args
                 assert "technical accuracy" in call_args[1]["system_prompt"].lower()
@@ -130,6 +130,7 @@ class TestPeerReadAgentTools:
             assert "timestamp" in saved_data
 
 
+@pytest.mark.usefixtures("isolated_markdown_cache")
 class TestPaperPDFReading:
     """Test PDF reading functionality."""
 
@@ -374,6 +375,7 @@ class TestToolRegistration:
                 asyncio.run(get_paper_tool(None, "invalid_id"))
 
 
+@pytest.mark.usefixtures("isolated_markdown_cache")
 class TestPDFExtractionErrorHandling:
     """Test PDF extraction error handling."""
 
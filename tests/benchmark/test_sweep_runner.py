@@ -380,6 +380,35 @@ class TestStory013bRetryAndPersistence:
         assert result is not None, "Should succeed after retries"
         assert call_count == 3, f"Expected 3 calls (2 retries + 1 success), got {call_count}"
 
+    @pytest.mark.asyncio
+    async def test_run_single_evaluation_retries_systemexit_caused_by_rate_limit(
+        self, tmp_path: Path, mock_composite_result: CompositeResult
+    ):
+        """SystemExit raised by run_manager for a 429 is retried like the 429 itself."""
+        config = SweepConfig(
+            compositions=[AgentComposition(include_researcher=True)],
+            repetitions=1,
+            paper_ids=["1"],
+            output_dir=tmp_path / "sweep_results",
+            retry_delay_seconds=0.0,
+        )
+        runner = SweepRunner(config)
+        call_count = 0
+
+        async def mock_main(**kwargs):
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                error = ModelHTTPError(status_code=429, model_name="test-model", body={})
+                raise SystemExit(1) from error
+            return {"composite_result": mock_composite_result}
+
+        with patch("app.benchmark.sweep_runner.main", side_effect=mock_main):
+            result = await runner._run_single_evaluation(config.compositions[0], "1", 0)
+
+        assert result is mock_composite_result
+        assert call_count == 2
+
     @pytest.mark.asyncio
     async def test_run_single_evaluation_returns_none_after_max_retries(self, tmp_path: Path):
         """Test that _run_single_evaluation returns None after exhausting retries."""
@@ -89,6 +89,27 @@ def no_bertscore_download():
         yield
 
 
+@pytest.fixture
+def isolated_markdown_cache(tmp_path: Path):
+    """Redirect the PDF Markdown conversion cache to a per-test directory.
+
+    Use in tests that reach read_paper_pdf() so converted text is not written
+    to (or served from) the shared PeerRead cache, and a fresh converter is
+    created inside the test.
+
+    Usage:
+        @pytest.mark.usefixtures("isolated_markdown_cache")
+        class TestPdfReading: ...
+    """
+    cache_dir = tmp_path / "markdown_cache"
+    # Reason: Reset the converter singleton so patched MarkItDown classes take effect.
+    with (
+        patch("app.data_utils.pdf_markdown.default_markdown_cache_dir", return_value=cache_dir),
+        patch("app.data_utils.pdf_markdown._global_converter", None),
+    ):
+        yield cache_dir
+
+
 def capture_registered_tools(register_fn: Callable, agent_id: str = "test") -> dict:
     """Register agent tools via a capture decorator and return them by name.
 
@@ -0,0 +1,134 @@
+"""Tests for the pre-extracted PeerRead body text store."""
+
+import json
+import os
+from pathlib import Path
+
+from app.config.peerread_config import PeerReadConfig
+from app.data_utils.body_text_store import (
+    BodyTextStore,
+    extract_body_sections,
+    write_body_text_store,
+)
+from app.data_utils.datasets_peerread import PeerReadLoader
+
+_PARSED = {
+    "metadata": {
+        "sections": [
+            {"heading": "1 Introduction", "text": "  Intro with ünïcode."},
+            {"heading": "2 Methods"},
+            {"heading": "3 Results", "text": "Results text.\n"},
+        ]
+    }
+}
+
+
+def _write_parsed(split_dir: Path, paper_id: str, parsed: dict = _PARSED) -> Path:
+    parsed_dir = split_dir / "parsed_pdfs"
+    parsed_dir.mkdir(parents=True, exist_ok=True)
+    parsed_file = parsed_dir / f"{paper_id}.pdf.json"
+    parsed_file.write_text(json.dumps(parsed))
+    return parsed_file
+
+
+class TestExtractBodySections:
+    """Test body and section boundary extraction."""
+
+    def test_body_matches_joined_section_text(self):
+        """The body equals the stripped newline-join of sections with text."""
+        # Act
+        body, sections = extract_body_sections(_PARSED)
+
+        # Assert
+        assert body == "Intro with ünïcode.\nResults text."
+        assert [s.heading for s in sections] == ["1 Introduction", "3 Results"]
+        assert [s.chars for s in sections] == [19, 13]
+
+    def test_byte_offsets_slice_sections(self):
+        """Byte offsets cut each section out of the UTF-8 body."""
+        # Arrange
+        body, sections = extract_body_sections(_PARSED)
+        encoded = body.encode("utf-8")
+
+        # Act
+        texts = [encoded[s.start : s.end].decode("utf-8") for s in sections]
+
+        # Assert
+        assert texts == ["Intro with ünïcode.", "Results text."]
+
+    def test_no_sections(self):
+        """Missing sections yield an empty body."""
+        assert extract_body_sections({"metadata": {}}) == ("", [])
+
+
+class TestBodyTextStore:
+    """Test writing, freshness and section-level reads."""
+
+    def test_write_and_read_sections(self, tmp_path: Path):
+        """Stored bodies can be read whole or by section."""
+        # Arrange
+        _write_parsed(tmp_path, "42")
+
+        # Act
+        written = write_body_text_store(tmp_path)
+        store = BodyTextStore(tmp_path)
+
+        # Assert
+        assert written == 1
+        assert store.read_text("42") == "Intro with ünïcode.\nResults text."
+        assert store.read_section_texts("42", [1, 0]) == ["Results text.", "Intro with ünïcode."]
+        assert write_body_text_store(tmp_path) == 0
+
+    def test_updated_source_makes_store_stale(self, tmp_path: Path):
+        """A parsed PDF newer than the stored body is re-extracted."""
+        # Arrange
+        parsed_file = _write_parsed(tmp_path, "42")
+        write_body_text_store(tmp_path)
+        store = BodyTextStore(tmp_path)
+        stored_mtime = store.text_path("42").stat().st_mtime_ns
+
+        # Act
+        os.utime(parsed_file, ns=(stored_mtime, stored_mtime + 1_000_000_000))
+
+        # Assert
+        assert store.is_fresh("42", parsed_file) is False
+        assert write_body_text_store(tmp_path) == 1
+
+
+class TestLoaderBodyTextIntegration:
+    """Test that PeerReadLoader uses the body text store."""
+
+    def _make_loader(self, cache_dir: Path) -> PeerReadLoader:
+        loader = PeerReadLoader(PeerReadConfig(venues=["acl_2017"], splits=["train"]))
+        loader.cache_dir = cache_dir
+        return loader
+
+    def test_load_populates_store(self, tmp_path: Path):
+        """The first load writes the store so later loads skip JSON parsing."""
+        # Arrange
+        split_dir = tmp_path / "acl_2017" / "train"
+        _write_parsed(split_dir, "9")
+        loader = self._make_loader(tmp_path)
+
+        # Act
+        content = loader.load_parsed_pdf_content("9")
+
+        # Assert
+        assert content == "Intro with ünïcode.\nResults text."
+        assert BodyTextStore(split_dir).read_text("9") == content
+
+    def test_section_access(self, tmp_path: Path):
+        """Callers can list sections and fetch only the ones they need."""
+        # Arrange
+        _write_parsed(tmp_path / "acl_2017" / "train", "9")
+        loader = self._make_loader(tmp_path)
+
+        # Act
+        sections = loader.get_paper_sections("9")
+        texts = loader.load_parsed_pdf_sections("9", [1])
+
+        # Assert
+        assert sections is not None
+        assert [s.heading for s in sections] == ["1 Introduction", "3 Results"]
+        assert texts == ["Results text."]
+        assert loader.get_paper_sections("missing") is None
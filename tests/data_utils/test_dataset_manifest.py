@@ -0,0 +1,182 @@
+"""Tests for manifest-based incremental PeerRead sync."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from app.config.peerread_config import PeerReadConfig
+from app.data_models.peerread_models import ManifestEntry
+from app.data_utils.dataset_manifest import DatasetManifest, git_blob_sha
+from app.data_utils.datasets_peerread import (
+    PeerReadDownloader,
+    PeerReadLoader,
+    RemoteFile,
+    _verify_downloads,
+)
+
+
+def _remote(split: str, data_type: str, paper_id: str, data: bytes) -> RemoteFile:
+    return RemoteFile(
+        split=split,
+        data_type=data_type,
+        paper_id=paper_id,
+        size=len(data),
+        blob_sha=git_blob_sha(data),
+    )
+
+
+class TestDatasetManifest:
+    """Test manifest bookkeeping and verification."""
+
+    def test_git_blob_sha_matches_git(self):
+        """Blob SHA equals `git hash-object` output."""
+        assert git_blob_sha(b"hello\n") == "ce013625030ba8dba906f756967f9e9ca394464a"
+
+    def test_is_current_adopts_unrecorded_matching_file(self, tmp_path: Path):
+        """A file written before an interrupted sync is recognised on resume."""
+        # Arrange
+        data = b'{"id": "104"}'
+        local = tmp_path / "acl_2017" / "train" / "reviews" / "104.json"
+        local.parent.mkdir(parents=True)
+        local.write_bytes(data)
+        manifest = DatasetManifest(tmp_path, "acl_2017")
+
+        # Act
+        current = manifest.is_current("train/reviews/104.json", git_blob_sha(data))
+
+        # Assert
+        assert current is True
+        assert manifest.entries["train/reviews/104.json"].paper_id == "104"
+
+    def test_is_current_detects_changed_remote(self, tmp_path: Path):
+        """A different remote blob SHA marks the local file as outdated."""
+        # Arrange
+        data = b'{"id": "104"}'
+        local = tmp_path / "acl_2017" / "train" / "reviews" / "104.json"
+        local.parent.mkdir(parents=True)
+        local.write_bytes(data)
+        manifest = DatasetManifest(tmp_path, "acl_2017")
+
+        # Act / Assert
+        assert manifest.is_current("train/reviews/104.json", git_blob_sha(b"changed")) is False
+
+    def test_verify_split_reports_missing_and_resized_files(self, tmp_path: Path):
+        """verify_split checks presence and size without parsing files."""
+        # Arrange
+        venue_dir = tmp_path / "acl_2017"
+        (venue_dir / "train" / "reviews").mkdir(parents=True)
+        (venue_dir / "train" / "reviews" / "1.json").write_bytes(b"{}")
+        (venue_dir / "train" / "reviews" / "2.json").write_bytes(b"{}")
+        manifest = DatasetManifest(tmp_path, "acl_2017")
+        for paper_id, size in [("1", 2), ("2", 99), ("3", 2)]:
+            manifest.record(
+                f"train/reviews/{paper_id}.json",
+                ManifestEntry(
+                    paper_id=paper_id, split="train", data_type="reviews", size=size, blob_sha="x"
+                ),
+            )
+        manifest.save()
+
+        # Act
+        verified, problems = DatasetManifest(tmp_path, "acl_2017").verify_split("train")
+
+        # Assert
+        assert verified == 1
+        assert sorted(problems) == [
+            "missing train/reviews/3.json",
+            "size mismatch train/reviews/2.json",
+        ]
+
+
+class TestSyncVenue:
+    """Test incremental venue sync in PeerReadDownloader."""
+
+    def _downloader(self, tmp_path: Path) -> PeerReadDownloader:
+        downloader = PeerReadDownloader(PeerReadConfig(venues=["acl_2017"], splits=["train"]))
+        downloader.cache_dir = tmp_path
+        return downloader
+
+    def test_second_sync_fetches_only_changed_files(self, tmp_path: Path):
+        """Unchanged files are skipped; a changed blob SHA is re-fetched."""
+        # Arrange
+        review = json.dumps({"id": "1", "title": "T", "abstract": "A", "reviews": []}).encode()
+        pdf = b"%PDF-1.4"
+        remote_files = [
+            _remote("train", "reviews", "1", review),
+            _remote("train", "pdfs", "1", pdf),
+        ]
+        contents = {("reviews", "1"): review, ("pdfs", "1"): pdf}
+
+        async def fake_download(session, venue, split, data_type, paper_id, raw=False):
+            return contents[(data_type, paper_id)]
+
+        downloader = self._downloader(tmp_path)
+
+        # Act
+        with (
+            patch.object(downloader, "_discover_venue_tree", return_value=remote_files),
+            patch.object(downloader, "download_file_async", side_effect=fake_download) as dl,
+        ):
+            first = downloader.sync_venue("acl_2017")
+            first_calls = dl.call_count
+            second = downloader.sync_venue("acl_2017")
+            second_calls = dl.call_count - first_calls
+
+            contents[("pdfs", "1")] = b"%PDF-1.5"
+            remote_files[1] = _remote("train", "pdfs", "1", b"%PDF-1.5")
+            downloader.sync_venue("acl_2017")
+            third_calls = dl.call_count - first_calls
+
+        # Assert
+        assert first["train"].success and first["train"].papers_downloaded == 1
+        assert first_calls == 2
+        assert second["train"].papers_downloaded == 1
+        assert second_calls == 0
+        assert third_calls == 1
+        assert (tmp_path / "acl_2017" / "train" / "pdfs" / "1.pdf").read_bytes() == b"%PDF-1.5"
+        assert (tmp_path / "acl_2017" / "manifest.json").exists()
+
+    def test_checksum_mismatch_is_reported(self, tmp_path: Path):
+        """Content that does not match the listed blob SHA is rejected."""
+        # Arrange
+        remote_files = [_remote("train", "reviews", "1", b"{}")]
+
+        async def corrupt_download(session, venue, split, data_type, paper_id, raw=False):
+            return b"{broken"
+
+        downloader = self._downloader(tmp_path)
+
+        # Act
+        with (
+            patch.object(downloader, "_discover_venue_tree", return_value=remote_files),
+            patch.object(downloader, "download_file_async", side_effect=corrupt_download),
+        ):
+            results = downloader.sync_venue("acl_2017")
+
+        # Assert
+        assert results["train"].success is False
+        assert "Checksum mismatch" in (results["train"].error_message or "")
+        assert not (tmp_path / "acl_2017" / "train" / "reviews" / "1.json").exists()
+
+    def test_verify_downloads_uses_manifest(self, tmp_path: Path):
+        """_verify_downloads checks the manifest and skips loading papers."""
+        # Arrange
+        config = PeerReadConfig(venues=["acl_2017"], splits=["train"])
+        review = b"{}"
+        (tmp_path / "acl_2017" / "train" / "reviews").mkdir(parents=True)
+        (tmp_path / "acl_2017" / "train" / "reviews" / "1.json").write_bytes(review)
+        manifest = DatasetManifest(tmp_path, "acl_2017")
+        manifest.is_current("train/reviews/1.json", git_blob_sha(review))
+        manifest.save()
+        loader = PeerReadLoader(config)
+        loader.cache_dir = tmp_path
+        failed: list[str] = []
+
+        # Act
+        with patch.object(loader, "load_papers") as load_papers:
+            verified = _verify_downloads(loader, config, failed)
+
+        # Assert
+        assert verified == 1
+        assert failed == []
+        load_papers.assert_not_called()
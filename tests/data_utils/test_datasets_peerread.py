@@ -618,7 +618,7 @@ class TestDownloadVenueSplit:
             patch.object(
                 downloader, "_discover_available_files", return_value=["101", "102", "103"]
             ),
-            patch.object(downloader, "download_file") as mock_download,
+            patch.object(downloader, "download_file_async") as mock_download,
         ):
             # Each paper requires 3 downloads (reviews, parsed_pdfs, pdfs)
             # Reason: download_venue_split downloads all data types per paper
@@ -656,7 +656,7 @@ class TestDownloadVenueSplit:
                 "_discover_available_files",
                 return_value=["101", "102", "103", "104", "105"],
             ),
-            patch.object(downloader, "download_file") as mock_download,
+            patch.object(downloader, "download_file_async") as mock_download,
         ):
             mock_download.return_value = {
                 "id": "test",
@@ -689,7 +689,7 @@ class TestDownloadVenueSplit:
             patch.object(
                 downloader, "_discover_available_files", return_value=["201", "202", "203"]
             ),
-            patch.object(downloader, "download_file") as mock_download,
+            patch.object(downloader, "download_file_async") as mock_download,
         ):
             # Each paper needs 3 calls (reviews, parsed_pdfs, pdfs)
             # Paper 201: all succeed, Paper 202: all fail, Paper 203: all succeed
@@ -772,6 +772,178 @@ class TestDownloadVenueSplit:
             assert "No review files discovered" in result.error_message
 
 
+class TestAsyncDownloadEngine:
+    """Test the concurrent async download engine."""
+
+    async def test_download_file_async_backs_off_without_blocking(self):
+        """429 responses trigger an exponential asyncio.sleep, not time.sleep."""
+        from unittest.mock import AsyncMock, Mock
+
+        from app.data_utils.datasets_peerread import PeerReadDownloader, _DownloadSession
+
+        # Arrange
+        config = PeerReadConfig(max_retries=3, retry_delay_seconds=2)
+        downloader = PeerReadDownloader(config)
+        response_429 = Mock(status_code=429)
+        response_429.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "429 Too Many Requests", request=Mock(), response=response_429
+        )
+        response_ok = Mock()
+        response_ok.raise_for_status.return_value = None
+        response_ok.json.return_value = {"id": "104"}
+        client = Mock()
+        client.get = AsyncMock(side_effect=[response_429, response_429, response_ok])
+        session = _DownloadSession(client=client, max_concurrency=4, max_per_host=2)
+
+        # Act
+        with (
+            patch("app.data_utils.datasets_peerread.asyncio.sleep", new=AsyncMock()) as a_sleep,
+            patch("app.data_utils.datasets_peerread.sleep") as blocking_sleep,
+        ):
+            result = await downloader.download_file_async(
+                session, "acl_2017", "train", "reviews", "104"
+            )
+
+        # Assert
+        assert result == {"id": "104"}
+        assert [c.args[0] for c in a_sleep.await_args_list] == [2, 4]
+        blocking_sleep.assert_not_called()
+
+    async def test_session_enforces_per_host_limit(self):
+        """No more than max_per_host requests to one host run at the same time."""
+        import asyncio
+        from unittest.mock import Mock
+
+        from app.data_utils.datasets_peerread import _DownloadSession
+
+        # Arrange
+        session = _DownloadSession(client=Mock(), max_concurrency=10, max_per_host=2)
+        in_flight = 0
+        peak = 0
+
+        async def fake_request(url: str) -> None:
+            nonlocal in_flight, peak
+            async with session.slot(url):
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        # Act
+        await asyncio.gather(*(fake_request("https://example.org/f") for _ in range(6)))
+
+        # Assert
+        assert peak == 2
+
+    def test_download_venue_split_runs_inside_event_loop(self, tmp_path):
+        """The sync wrapper works when called from a running event loop."""
+        import asyncio
+
+        from app.data_utils.datasets_peerread import PeerReadDownloader
+
+        # Arrange
+        downloader = PeerReadDownloader(PeerReadConfig())
+        downloader.cache_dir = tmp_path / "cache"
+
+        async def call_from_loop():
+            return downloader.download_venue_split("acl_2017", "train", max_papers=1)
+
+        # Act
+        with (
+            patch.object(downloader, "_discover_available_files", return_value=["101"]),
+            patch.object(downloader, "download_file_async", return_value={"id": "101"}),
+        ):
+            result = asyncio.run(call_from_loop())
+
+        # Assert
+        assert result.success is True
+        assert result.papers_downloaded == 1
+
+
+class TestIterPapers:
+    """Test streaming paper iteration with raw pre-filtering and early stop."""
+
+    @staticmethod
+    def _write_split(cache_dir, venue, split, review_counts):
+        import json
+
+        reviews_dir = cache_dir / venue / split / "reviews"
+        reviews_dir.mkdir(parents=True)
+        compliant_review = {field: "3" for field in OPTIONAL_REVIEW_FIELDS}
+        for i, count in enumerate(review_counts):
+            paper_id = f"{venue}_{split}_{i}"
+            (reviews_dir / f"{paper_id}.json").write_text(
+                json.dumps(
+                    {
+                        "id": paper_id,
+                        "title": f"Title {paper_id}",
+                        "abstract": "Abstract",
+                        "reviews": [compliant_review] * count,
+                    }
+                )
+            )
+
+    def _loader(self, tmp_path):
+        from app.data_utils.datasets_peerread import PeerReadLoader
+
+        loader = PeerReadLoader(PeerReadConfig(venues=["acl_2017", "conll_2016"], splits=["train"]))
+        loader.cache_dir = tmp_path
+        return loader
+
+    def test_stops_validating_once_limit_reached(self, tmp_path):
+        """Only as many records as needed are validated."""
+        # Arrange
+        self._write_split(tmp_path, "acl_2017", "train", [1, 1, 1, 1])
+        self._write_split(tmp_path, "conll_2016", "train", [1, 1])
+        loader = self._loader(tmp_path)
+
+        # Act
+        with patch.object(loader, "_validate_paper", wraps=loader._validate_paper) as validate:
+            papers = list(loader.iter_papers(limit=2))
+
+        # Assert
+        assert [p.paper_id for p in papers] == ["acl_2017_train_0", "acl_2017_train_1"]
+        assert validate.call_count == 2
+
+    def test_min_reviews_filters_before_validation(self, tmp_path):
+        """Papers below min_reviews never reach model validation."""
+        # Arrange
+        self._write_split(tmp_path, "acl_2017", "train", [0, 2, 1, 3])
+        loader = self._loader(tmp_path)
+
+        # Act
+        with patch.object(loader, "_validate_paper", wraps=loader._validate_paper) as validate:
+            papers = list(loader.iter_papers(venue="acl_2017", min_reviews=2))
+
+        # Assert
+        assert [len(p.reviews) for p in papers] == [2, 3]
+        assert validate.call_count == 2
+
+    def test_raw_filter_and_missing_splits(self, tmp_path):
+        """raw_filter applies to raw dicts; undownloaded venues are skipped."""
+        # Arrange
+        self._write_split(tmp_path, "acl_2017", "train", [1, 1, 1])
+        loader = self._loader(tmp_path)
+
+        # Act
+        papers = list(loader.iter_papers(raw_filter=lambda raw: raw["id"].endswith("_1")))
+
+        # Assert
+        assert [p.paper_id for p in papers] == ["acl_2017_train_1"]
+
+    def test_query_papers_uses_streaming_limit(self, tmp_path):
+        """query_papers returns the first `limit` papers meeting min_reviews."""
+        # Arrange
+        self._write_split(tmp_path, "acl_2017", "train", [0, 1, 1, 1])
+        loader = self._loader(tmp_path)
+
+        # Act
+        papers = loader.query_papers(min_reviews=1, limit=2)
+
+        # Assert
+        assert [p.paper_id for p in papers] == ["acl_2017_train_1", "acl_2017_train_2"]
+
+
 class TestPeerReadDataInvariants:
     """Property-based tests for PeerRead data validation invariants."""
 
@@ -919,6 +1091,7 @@ class TestPeerReadDataSnapshots:
             {
                 "base_url": "https://github.com/allenai/PeerRead/tree/master/data",
                 "github_api_base_url": "https://api.github.com/repos/allenai/PeerRead/contents/data",
+                "github_trees_api_base_url": "https://api.github.com/repos/allenai/PeerRead/git/trees",
                 "raw_github_base_url": "https://raw.githubusercontent.com/allenai/PeerRead/master/data",
                 "cache_directory": DATASETS_PEERREAD_PATH,
                 "venues": ["acl_2017", "conll_2016", "iclr_2017"],
@@ -927,6 +1100,8 @@ class TestPeerReadDataSnapshots:
                 "download_timeout": 30,
                 "max_retries": 5,
                 "retry_delay_seconds": 5,
+                "max_concurrent_downloads": 16,
+                "max_connections_per_host": 8,
                 "similarity_metrics": {"cosine_weight": 0.6, "jaccard_weight": 0.4},
             }
         )
@@ -1764,7 +1939,7 @@ class TestPerformDownloads:
 class TestVerifyDownloads:
     """Test _verify_downloads function."""
 
-    def test_verify_downloads_success(self):
+    def test_verify_downloads_success(self, tmp_path):
         """Test successful download verification."""
         from app.data_models.peerread_models import PeerReadPaper
         from app.data_utils.datasets_peerread import PeerReadLoader, _verify_downloads
@@ -1773,6 +1948,7 @@ class TestVerifyDownloads:
         config.venues = ["acl_2017"]
         config.splits = ["train"]
         loader = PeerReadLoader(config)
+        loader.cache_dir = tmp_path
         failed_downloads: list[str] = []
 
         test_papers = [
@@ -1790,7 +1966,7 @@ class TestVerifyDownloads:
             assert verification_count == 1
             assert len(failed_downloads) == 0
 
-    def test_verify_downloads_with_failure(self):
+    def test_verify_downloads_with_failure(self, tmp_path):
         """Test verification with loader failure."""
         from app.data_utils.datasets_peerread import PeerReadLoader, _verify_downloads
 
@@ -1798,6 +1974,7 @@ class TestVerifyDownloads:
         config.venues = ["acl_2017"]
         config.splits = ["train"]
         loader = PeerReadLoader(config)
+        loader.cache_dir = tmp_path
         failed_downloads: list[str] = []
 
         with patch.object(loader, "load_papers", side_effect=Exception("Load failed")):
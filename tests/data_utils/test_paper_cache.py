@@ -0,0 +1,131 @@
+"""Tests for the process-wide PeerRead paper cache."""
+
+import json
+import os
+from pathlib import Path
+
+from app.config.peerread_config import PeerReadConfig
+from app.data_utils.datasets_peerread import PeerReadLoader
+from app.data_utils.paper_cache import PaperCache, get_paper_cache
+
+
+class TestPaperCache:
+    """Test LRU behaviour and file-identity invalidation."""
+
+    def test_hit_and_miss_counters(self, tmp_path: Path):
+        """A put value is returned on the next get and counted as a hit."""
+        # Arrange
+        source = tmp_path / "a.json"
+        source.write_text("{}")
+        cache = PaperCache()
+
+        # Act
+        first = cache.get("paper", source)
+        cache.put("paper", source, "value")
+        second = cache.get("paper", source)
+
+        # Assert
+        assert first is None
+        assert second == "value"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_changed_file_invalidates_entry(self, tmp_path: Path):
+        """Modifying the source file turns the next lookup into a miss."""
+        # Arrange
+        source = tmp_path / "a.json"
+        source.write_text("{}")
+        cache = PaperCache()
+        cache.put("text", source, "old")
+
+        # Act
+        source.write_text('{"changed": true}')
+        result = cache.get("text", source)
+
+        # Assert
+        assert result is None
+        assert cache.stats()["entries"] == 0
+
+    def test_same_size_rewrite_invalidates_entry(self, tmp_path: Path):
+        """A rewrite with identical size is detected via mtime."""
+        # Arrange
+        source = tmp_path / "a.json"
+        source.write_text("{1}")
+        cache = PaperCache()
+        cache.put("text", source, "old")
+        stat = source.stat()
+
+        # Act
+        source.write_text("{2}")
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        # Assert
+        assert cache.get("text", source) is None
+
+    def test_least_recently_used_entry_is_evicted(self, tmp_path: Path):
+        """Exceeding max_entries evicts the least recently used entry."""
+        # Arrange
+        files = [tmp_path / f"{i}.json" for i in range(3)]
+        for f in files:
+            f.write_text("{}")
+        cache = PaperCache(max_entries=2)
+        cache.put("paper", files[0], 0)
+        cache.put("paper", files[1], 1)
+        cache.get("paper", files[0])
+
+        # Act
+        cache.put("paper", files[2], 2)
+
+        # Assert
+        assert cache.get("paper", files[1]) is None
+        assert cache.get("paper", files[0]) == 0
+        assert cache.get("paper", files[2]) == 2
+
+    def test_members_are_cached_independently(self, tmp_path: Path):
+        """Records inside one file are keyed by member."""
+        # Arrange
+        source = tmp_path / "reviews.pack"
+        source.write_bytes(b"xx")
+        cache = PaperCache()
+
+        # Act
+        cache.put("paper", source, "a", member="1")
+        cache.put("paper", source, "b", member="2")
+
+        # Assert
+        assert cache.get("paper", source, "1") == "a"
+        assert cache.get("paper", source, "2") == "b"
+
+
+class TestLoaderSharesCache:
+    """Test that separate loader instances share cached papers and text."""
+
+    def test_second_loader_hits_cache(self, tmp_path: Path):
+        """A fresh loader reuses the paper and body text parsed by another loader."""
+        # Arrange
+        split_dir = tmp_path / "acl_2017" / "train"
+        (split_dir / "reviews").mkdir(parents=True)
+        (split_dir / "parsed_pdfs").mkdir()
+        (split_dir / "reviews" / "7.json").write_text(
+            json.dumps({"id": "7", "title": "Cached", "abstract": "A", "reviews": []})
+        )
+        (split_dir / "parsed_pdfs" / "7.pdf.json").write_text(
+            json.dumps({"metadata": {"sections": [{"text": "Body"}]}})
+        )
+        config = PeerReadConfig(venues=["acl_2017"], splits=["train"])
+        loaders = [PeerReadLoader(config), PeerReadLoader(config)]
+        for loader in loaders:
+            loader.cache_dir = tmp_path
+        cache = get_paper_cache()
+        hits_before = cache.stats()["hits"]
+
+        # Act
+        first = loaders[0].get_paper_by_id("7")
+        first_text = loaders[0].load_parsed_pdf_content("7")
+        second = loaders[1].get_paper_by_id("7")
+        second_text = loaders[1].load_parsed_pdf_content("7")
+
+        # Assert
+        assert first is not None and second is first
+        assert first_text == second_text == "Body"
+        assert cache.stats()["hits"] - hits_before == 2
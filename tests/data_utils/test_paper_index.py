@@ -0,0 +1,163 @@
+"""Tests for the persistent PeerRead paper-location index."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from app.config.peerread_config import PeerReadConfig
+from app.data_utils.datasets_peerread import PeerReadLoader, create_paper_index
+
+
+def _write_paper(cache_dir: Path, venue: str, split: str, paper_id: str, title: str) -> None:
+    """Write a minimal compliant review file plus parsed PDF and raw PDF."""
+    reviews_dir = cache_dir / venue / split / "reviews"
+    parsed_dir = cache_dir / venue / split / "parsed_pdfs"
+    pdfs_dir = cache_dir / venue / split / "pdfs"
+    for d in (reviews_dir, parsed_dir, pdfs_dir):
+        d.mkdir(parents=True, exist_ok=True)
+
+    (reviews_dir / f"{paper_id}.json").write_text(
+        json.dumps({"id": paper_id, "title": title, "abstract": "Abstract", "reviews": []})
+    )
+    (parsed_dir / f"{paper_id}.pdf.json").write_text(
+        json.dumps({"metadata": {"sections": [{"text": f"Body of {title}"}]}})
+    )
+    (pdfs_dir / f"{paper_id}.pdf").write_bytes(b"%PDF-1.4")
+
+
+def _make_loader(cache_dir: Path) -> PeerReadLoader:
+    config = PeerReadConfig(venues=["acl_2017", "conll_2016"], splits=["train", "dev"])
+    loader = PeerReadLoader(config)
+    loader.cache_dir = cache_dir
+    return loader
+
+
+class TestPaperIndex:
+    """Test PaperIndex scanning, persistence, and lookup order."""
+
+    def test_scan_split_indexes_all_data_types(self, tmp_path: Path):
+        """scan_split records reviews, parsed_pdfs and pdfs without confusing extensions."""
+        # Arrange
+        _write_paper(tmp_path, "acl_2017", "train", "104", "Paper 104")
+        index = create_paper_index(PeerReadConfig(), tmp_path)
+
+        # Act
+        count = index.scan_split("acl_2017", "train")
+
+        # Assert
+        assert count == 1
+        [location] = index.lookup("104")
+        assert (location.venue, location.split) == ("acl_2017", "train")
+        assert location.files == {
+            "reviews": "acl_2017/train/reviews/104.json",
+            "parsed_pdfs": "acl_2017/train/parsed_pdfs/104.pdf.json",
+            "pdfs": "acl_2017/train/pdfs/104.pdf",
+        }
+
+    def test_save_and_reload_roundtrip(self, tmp_path: Path):
+        """A saved index is readable by a fresh instance."""
+        # Arrange
+        _write_paper(tmp_path, "acl_2017", "train", "104", "Paper 104")
+        index = create_paper_index(PeerReadConfig(), tmp_path)
+        index.rebuild()
+
+        # Act
+        index.save()
+        reloaded = create_paper_index(PeerReadConfig(), tmp_path)
+
+        # Assert
+        assert reloaded.exists()
+        assert reloaded.lookup("104") == index.lookup("104")
+
+    def test_duplicate_ids_kept_in_config_order(self, tmp_path: Path):
+        """Papers sharing an ID across venues are ordered by configured venue priority."""
+        # Arrange
+        config = PeerReadConfig(venues=["acl_2017", "conll_2016"], splits=["train"])
+        _write_paper(tmp_path, "conll_2016", "train", "7", "CoNLL 7")
+        _write_paper(tmp_path, "acl_2017", "train", "7", "ACL 7")
+        index = create_paper_index(config, tmp_path)
+
+        # Act
+        index.scan_split("conll_2016", "train")
+        index.scan_split("acl_2017", "train")
+
+        # Assert
+        assert [loc.venue for loc in index.lookup("7")] == ["acl_2017", "conll_2016"]
+
+    def test_get_paths_returns_none_for_stale_entry(self, tmp_path: Path):
+        """Deleted files invalidate the indexed entry."""
+        # Arrange
+        _write_paper(tmp_path, "acl_2017", "train", "104", "Paper 104")
+        index = create_paper_index(PeerReadConfig(), tmp_path)
+        index.scan_split("acl_2017", "train")
+        (tmp_path / "acl_2017" / "train" / "pdfs" / "104.pdf").unlink()
+
+        # Act / Assert
+        assert index.get_paths("104", "pdfs") is None
+        assert index.get_paths("104", "reviews") == [
+            tmp_path / "acl_2017" / "train" / "reviews" / "104.json"
+        ]
+
+
+class TestSharedPaperIndex:
+    """Test that loaders share one in-memory index per cache directory."""
+
+    def test_new_loaders_reuse_loaded_index(self, tmp_path: Path):
+        """Fresh loaders do not re-read the index file until it changes on disk."""
+        # Arrange
+        _write_paper(tmp_path, "acl_2017", "train", "1", "Paper 1")
+        assert _make_loader(tmp_path).get_paper_by_id("1") is not None
+
+        # Act
+        with patch("app.data_utils.paper_index.load", side_effect=json.load) as load:
+            for _ in range(3):
+                assert _make_loader(tmp_path).index.lookup("1")
+
+        # Assert
+        assert load.call_count == 0
+        assert _make_loader(tmp_path).index is _make_loader(tmp_path).index
+
+
+class TestLoaderIndexIntegration:
+    """Test that PeerReadLoader resolves papers through the index."""
+
+    def test_loader_builds_index_on_first_lookup(self, tmp_path: Path):
+        """First lookup builds and persists the index, then resolves all data types."""
+        # Arrange
+        _write_paper(tmp_path, "conll_2016", "dev", "42", "Paper 42")
+        loader = _make_loader(tmp_path)
+
+        # Act
+        paper = loader.get_paper_by_id("42")
+
+        # Assert
+        assert paper is not None and paper.title == "Paper 42"
+        assert loader.index.exists()
+        assert loader.load_parsed_pdf_content("42") == "Body of Paper 42"
+        assert loader.get_raw_pdf_path("42") == str(tmp_path / "conll_2016/dev/pdfs/42.pdf")
+
+    def test_loader_heals_index_for_files_added_later(self, tmp_path: Path):
+        """Papers added after the index was built are found and indexed."""
+        # Arrange
+        _write_paper(tmp_path, "acl_2017", "train", "1", "Paper 1")
+        loader = _make_loader(tmp_path)
+        assert loader.get_paper_by_id("1") is not None
+        _write_paper(tmp_path, "acl_2017", "dev", "2", "Paper 2")
+
+        # Act
+        paper = loader.get_paper_by_id("2")
+
+        # Assert
+        assert paper is not None and paper.title == "Paper 2"
+        assert [loc.split for loc in loader.index.lookup("2")] == ["dev"]
+
+    def test_loader_returns_none_for_unknown_paper(self, tmp_path: Path):
+        """Unknown IDs return None from all lookups."""
+        # Arrange
+        _write_paper(tmp_path, "acl_2017", "train", "1", "Paper 1")
+        loader = _make_loader(tmp_path)
+
+        # Act / Assert
+        assert loader.get_paper_by_id("missing") is None
+        assert loader.load_parsed_pdf_content("missing") is None
+        assert loader.get_raw_pdf_path("missing") is None
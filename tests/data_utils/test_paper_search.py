@@ -0,0 +1,186 @@
+"""Tests for the BM25 PeerRead full-text search index."""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from app.config.peerread_config import PeerReadConfig
+from app.data_utils.datasets_peerread import PeerReadDownloader, PeerReadLoader
+from app.data_utils.paper_search import PaperSearchIndex, get_paper_search_index, tokenize
+
+_PAPERS = {
+    "1": ("Neural Machine Translation", "Attention over source words for translation.", "BLEU"),
+    "2": ("Dependency Parsing", "A transition-based parser for syntax trees.", "Parsing body"),
+    "3": ("Sentiment Analysis", "Classifying reviews by polarity.", "We use attention pooling."),
+}
+
+
+def _write_corpus(cache_dir: Path) -> Path:
+    """Write review and parsed PDF files for the test papers."""
+    split_dir = cache_dir / "acl_2017" / "train"
+    (split_dir / "reviews").mkdir(parents=True)
+    (split_dir / "parsed_pdfs").mkdir()
+    for paper_id, (title, abstract, body) in _PAPERS.items():
+        (split_dir / "reviews" / f"{paper_id}.json").write_text(
+            json.dumps({"id": paper_id, "title": title, "abstract": abstract, "reviews": []})
+        )
+        (split_dir / "parsed_pdfs" / f"{paper_id}.pdf.json").write_text(
+            json.dumps({"metadata": {"sections": [{"text": body}]}})
+        )
+    return split_dir
+
+
+def _make_loader(cache_dir: Path) -> PeerReadLoader:
+    loader = PeerReadLoader(PeerReadConfig(venues=["acl_2017"], splits=["train"]))
+    loader.cache_dir = cache_dir
+    return loader
+
+
+class TestTokenize:
+    """Test query and document tokenization."""
+
+    def test_lowercases_and_drops_stopwords(self):
+        """Stopwords, punctuation and single characters are removed."""
+        assert tokenize("The BERT-base model, a baseline.") == ["bert", "base", "model", "baseline"]
+
+
+class TestPaperSearchIndex:
+    """Test ranking, incremental updates and persistence."""
+
+    def test_search_ranks_title_match_first(self, tmp_path: Path):
+        """Papers matching in title and abstract outrank body-only matches."""
+        # Arrange
+        _write_corpus(tmp_path)
+        search_index = PaperSearchIndex(tmp_path)
+        search_index.update(_make_loader(tmp_path))
+
+        # Act
+        hits = search_index.search("attention translation")
+
+        # Assert
+        assert [h.paper_id for h in hits] == ["1", "3"]
+        assert hits[0].title == "Neural Machine Translation"
+        assert "Attention" in hits[0].snippet
+        assert search_index.search("the of and") == []
+
+    def test_update_reindexes_only_changed_papers(self, tmp_path: Path):
+        """A second update skips unchanged papers and picks up edited ones."""
+        # Arrange
+        split_dir = _write_corpus(tmp_path)
+        loader = _make_loader(tmp_path)
+        search_index = PaperSearchIndex(tmp_path)
+        first = search_index.update(loader)
+        review_file = split_dir / "reviews" / "2.json"
+        stat = review_file.stat()
+        review_file.write_text(
+            json.dumps({"id": "2", "title": "Graph Parsing", "abstract": "New.", "reviews": []})
+        )
+        os.utime(review_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        # Act
+        second = search_index.update(loader)
+
+        # Assert
+        assert first == 3
+        assert second == 1
+        assert [h.paper_id for h in search_index.search("graph")] == ["2"]
+
+    def test_saved_index_roundtrips(self, tmp_path: Path):
+        """A persisted index answers queries identically after reload."""
+        # Arrange
+        _write_corpus(tmp_path)
+        search_index = PaperSearchIndex(tmp_path)
+        search_index.update(_make_loader(tmp_path))
+        expected = search_index.search("parser syntax")
+
+        # Act
+        search_index.save()
+        reloaded = PaperSearchIndex(tmp_path)
+
+        # Assert
+        assert len(reloaded) == 3
+        assert reloaded.search("parser syntax") == expected
+
+    def test_concurrent_updates_tokenize_each_paper_once(self, tmp_path: Path):
+        """Parallel first updates are serialized; the second finds nothing to do."""
+        # Arrange
+        _write_corpus(tmp_path)
+        loader = _make_loader(tmp_path)
+        loader.index.paper_ids()
+        search_index = PaperSearchIndex(tmp_path)
+
+        # Act
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            counts = list(pool.map(lambda _: search_index.update(loader), range(4)))
+
+        # Assert
+        assert sorted(counts) == [0, 0, 0, 3]
+
+    def test_is_stale_detects_edited_paper(self, tmp_path: Path):
+        """Changing a paper's review file on disk marks the index stale."""
+        # Arrange
+        split_dir = _write_corpus(tmp_path)
+        loader = _make_loader(tmp_path)
+        search_index = PaperSearchIndex(tmp_path)
+        search_index.update(loader)
+        assert not search_index.is_stale(loader)
+        review_file = split_dir / "reviews" / "3.json"
+        stat = review_file.stat()
+
+        # Act
+        os.utime(review_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        # Assert
+        assert search_index.is_stale(loader)
+
+    def test_search_during_update_uses_consistent_snapshot(self, tmp_path: Path):
+        """Searches racing with updates that add and drop papers never fail."""
+        # Arrange
+        split_dir = _write_corpus(tmp_path)
+        loader = _make_loader(tmp_path)
+        search_index = PaperSearchIndex(tmp_path)
+        search_index.update(loader)
+        extra = split_dir / "reviews" / "4.json"
+
+        def churn() -> None:
+            for i in range(20):
+                if i % 2:
+                    extra.unlink()
+                else:
+                    extra.write_text(
+                        json.dumps({"id": "4", "title": "Attention", "abstract": "", "reviews": []})
+                    )
+                loader.index.scan_split("acl_2017", "train")
+                search_index.update(loader)
+
+        # Act
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            updates = pool.submit(churn)
+            while not updates.done():
+                hits = search_index.search("attention")
+                assert {"1", "3"} <= {h.paper_id for h in hits}
+            updates.result()
+
+        # Assert
+        assert {h.paper_id for h in search_index.search("attention")} == {"1", "3"}
+
+    def test_download_refreshes_existing_index(self, tmp_path: Path):
+        """Papers downloaded after the first build become searchable."""
+        # Arrange
+        split_dir = _write_corpus(tmp_path)
+        search_index = get_paper_search_index(tmp_path)
+        search_index.refresh(_make_loader(tmp_path))
+        (split_dir / "reviews" / "4.json").write_text(
+            json.dumps({"id": "4", "title": "Summarization", "abstract": "Short.", "reviews": []})
+        )
+        config = PeerReadConfig(venues=["acl_2017"], splits=["train"])
+        downloader = PeerReadDownloader(config)
+        downloader.cache_dir = tmp_path
+
+        # Act
+        downloader._finalize_venue_split("acl_2017", "train")
+
+        # Assert
+        assert [h.paper_id for h in search_index.search("summarization")] == ["4"]
+        assert not search_index.is_stale(_make_loader(tmp_path))
@@ -0,0 +1,102 @@
+"""Tests for cached MarkItDown PDF conversion."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.config.peerread_config import PeerReadConfig
+from app.data_utils.pdf_markdown import (
+    convert_pdf_to_markdown,
+    get_markdown_converter,
+    is_markdown_cached,
+    prewarm_markdown_cache,
+)
+
+
+@pytest.fixture
+def mock_converter():
+    """Patch MarkItDown with a converter returning fixed text."""
+    converter = Mock()
+    converter.convert.return_value = Mock(text_content="  # Converted  \n")
+    with (
+        patch("app.data_utils.pdf_markdown.MarkItDown", return_value=converter) as md_class,
+        patch("app.data_utils.pdf_markdown._global_converter", None),
+    ):
+        yield converter, md_class
+
+
+class TestConvertPdfToMarkdown:
+    """Test content-addressed caching of conversions."""
+
+    def test_second_conversion_is_served_from_cache(self, tmp_path: Path, mock_converter):
+        """Identical PDF bytes are converted once, even under a different path."""
+        # Arrange
+        converter, _ = mock_converter
+        first = tmp_path / "a.pdf"
+        second = tmp_path / "b.pdf"
+        first.write_bytes(b"%PDF-1.4 same")
+        second.write_bytes(b"%PDF-1.4 same")
+        cache_dir = tmp_path / "cache"
+
+        # Act
+        results = [convert_pdf_to_markdown(p, cache_dir) for p in (first, second)]
+
+        # Assert
+        assert results == ["# Converted", "# Converted"]
+        assert converter.convert.call_count == 1
+        assert is_markdown_cached(second, cache_dir)
+
+    def test_failed_conversion_is_not_cached(self, tmp_path: Path, mock_converter):
+        """Conversion errors propagate and leave no cache entry."""
+        # Arrange
+        converter, _ = mock_converter
+        converter.convert.side_effect = Exception("broken")
+        pdf = tmp_path / "bad.pdf"
+        pdf.write_bytes(b"%PDF-1.4 bad")
+
+        # Act / Assert
+        with pytest.raises(Exception, match="broken"):
+            convert_pdf_to_markdown(pdf, tmp_path / "cache")
+        assert not is_markdown_cached(pdf, tmp_path / "cache")
+
+    def test_converter_is_created_once(self, mock_converter):
+        """The MarkItDown converter is a per-process singleton."""
+        # Arrange
+        _, md_class = mock_converter
+
+        # Act
+        first = get_markdown_converter()
+        second = get_markdown_converter()
+
+        # Assert
+        assert first is second
+        md_class.assert_called_once()
+
+
+class TestPrewarmMarkdownCache:
+    """Test batch prewarming of raw PDFs."""
+
+    def test_prewarm_converts_only_uncached_pdfs(self, tmp_path: Path, mock_converter):
+        """Already cached PDFs are skipped on a second prewarm run."""
+        # Arrange
+        converter, _ = mock_converter
+        pdf_dir = tmp_path / "data" / "acl_2017" / "train" / "pdfs"
+        pdf_dir.mkdir(parents=True)
+        for paper_id in ["1", "2"]:
+            (pdf_dir / f"{paper_id}.pdf").write_bytes(f"%PDF-1.4 {paper_id}".encode())
+        config = PeerReadConfig(
+            venues=["acl_2017"], splits=["train"], cache_directory=str(tmp_path / "data")
+        )
+
+        # Act
+        # Reason: Mocks do not cross process boundaries; run workers as threads.
+        with patch("app.data_utils.pdf_markdown.ProcessPoolExecutor", ThreadPoolExecutor):
+            first = prewarm_markdown_cache(config)
+            second = prewarm_markdown_cache(config)
+
+        # Assert
+        assert first == 2
+        assert second == 0
+        assert converter.convert.call_count == 2
@@ -0,0 +1,164 @@
+"""Tests for the packed PeerRead review corpus format."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from app.config.peerread_config import PeerReadConfig
+from app.data_utils.datasets_peerread import PeerReadLoader
+from app.data_utils.review_pack import ReviewPack, write_review_pack
+
+
+def _write_reviews(split_dir: Path, paper_ids: list[str]) -> None:
+    """Write minimal loose review files for a venue/split."""
+    reviews_dir = split_dir / "reviews"
+    reviews_dir.mkdir(parents=True, exist_ok=True)
+    for paper_id in paper_ids:
+        (reviews_dir / f"{paper_id}.json").write_text(
+            json.dumps(
+                {"id": paper_id, "title": f"Title {paper_id}", "abstract": "A", "reviews": []},
+                indent=2,
+            )
+        )
+
+
+class TestReviewPack:
+    """Test writing and reading review packs."""
+
+    def test_roundtrip_decodes_individual_records(self, tmp_path: Path):
+        """Packed records decode to the original JSON, individually and in bulk."""
+        # Arrange
+        _write_reviews(tmp_path, ["101", "102", "103"])
+
+        # Act
+        packed = write_review_pack(tmp_path)
+
+        # Assert
+        assert packed == 3
+        with ReviewPack(tmp_path) as pack:
+            assert len(pack) == 3
+            assert pack.get_record("102") == {
+                "id": "102",
+                "title": "Title 102",
+                "abstract": "A",
+                "reviews": [],
+            }
+            assert pack.get_record("999") is None
+            assert [r["id"] for r in pack.iter_records()] == ["101", "102", "103"]
+
+    def test_unreadable_files_are_skipped(self, tmp_path: Path):
+        """Corrupt loose files are not packed."""
+        # Arrange
+        _write_reviews(tmp_path, ["101"])
+        (tmp_path / "reviews" / "bad.json").write_text("{not json")
+
+        # Act / Assert
+        assert write_review_pack(tmp_path) == 1
+
+    def test_empty_reviews_dir_produces_empty_pack(self, tmp_path: Path):
+        """An empty split still produces a valid (unmapped) pack."""
+        # Arrange
+        (tmp_path / "reviews").mkdir()
+
+        # Act
+        write_review_pack(tmp_path)
+
+        # Assert
+        with ReviewPack(tmp_path) as pack:
+            assert len(pack) == 0
+            assert list(pack.iter_records()) == []
+
+    def test_missing_reviews_dir_raises(self, tmp_path: Path):
+        """Packing a split without loose reviews raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            write_review_pack(tmp_path)
+
+    def test_open_if_fresh_detects_stale_pack(self, tmp_path: Path):
+        """Adding loose files after packing invalidates the pack."""
+        # Arrange
+        _write_reviews(tmp_path, ["101"])
+        write_review_pack(tmp_path)
+        reviews_dir = tmp_path / "reviews"
+        stat = reviews_dir.stat()
+        (reviews_dir / "102.json").write_text("{}")
+        # Reason: Force a distinct directory mtime on filesystems with coarse timestamps.
+        os.utime(reviews_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        # Act / Assert
+        assert ReviewPack.open_if_fresh(tmp_path) is None
+
+    def test_open_if_fresh_accepts_pack_only_split(self, tmp_path: Path):
+        """A pack without loose files is authoritative."""
+        # Arrange
+        _write_reviews(tmp_path, ["101"])
+        write_review_pack(tmp_path)
+        (tmp_path / "reviews" / "101.json").unlink()
+        (tmp_path / "reviews").rmdir()
+
+        # Act
+        pack = ReviewPack.open_if_fresh(tmp_path)
+
+        # Assert
+        assert pack is not None
+        with pack:
+            assert "101" in pack
+
+
+class TestLoaderPackIntegration:
+    """Test that PeerReadLoader reads packs and falls back to loose files."""
+
+    def _make_loader(self, cache_dir: Path) -> PeerReadLoader:
+        loader = PeerReadLoader(PeerReadConfig(venues=["acl_2017"], splits=["train"]))
+        loader.cache_dir = cache_dir
+        return loader
+
+    def test_load_papers_from_pack_only_cache(self, tmp_path: Path):
+        """load_papers and get_paper_by_id work when only the pack exists."""
+        # Arrange
+        split_dir = tmp_path / "acl_2017" / "train"
+        _write_reviews(split_dir, ["101", "102"])
+        write_review_pack(split_dir)
+        for f in (split_dir / "reviews").iterdir():
+            f.unlink()
+        (split_dir / "reviews").rmdir()
+        loader = self._make_loader(tmp_path)
+
+        # Act
+        papers = loader.load_papers("acl_2017", "train")
+        paper = loader.get_paper_by_id("102")
+
+        # Assert
+        assert sorted(p.paper_id for p in papers) == ["101", "102"]
+        assert paper is not None and paper.title == "Title 102"
+
+    def test_load_papers_without_pack_uses_loose_files(self, tmp_path: Path):
+        """Without a pack the loose-file layout is used."""
+        # Arrange
+        _write_reviews(tmp_path / "acl_2017" / "train", ["101"])
+        loader = self._make_loader(tmp_path)
+
+        # Act
+        papers = loader.load_papers("acl_2017", "train")
+
+        # Assert
+        assert [p.paper_id for p in papers] == ["101"]
+
+    def test_cached_pack_paper_not_served_after_loose_reviews_change(self, tmp_path: Path):
+        """Changing the loose reviews makes the pack stale, even for cached papers."""
+        # Arrange
+        split_dir = tmp_path / "acl_2017" / "train"
+        _write_reviews(split_dir, ["101"])
+        write_review_pack(split_dir)
+        loader = self._make_loader(tmp_path)
+        assert loader._get_paper_from_packs("101") is not None
+
+        # Act
+        _write_reviews(split_dir, ["102"])
+        reviews_dir = split_dir / "reviews"
+        stat = reviews_dir.stat()
+        os.utime(reviews_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        # Assert
+        assert loader._get_paper_from_packs("101") is None
@@ -0,0 +1,131 @@
+"""Tests for the indexed SQLite review store and its ReviewPersistence integration."""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.data_models.peerread_models import PeerReadReview
+from app.data_utils.review_persistence import ReviewPersistence
+from app.data_utils.review_store import ReviewRecord, ReviewStore
+
+
+@pytest.fixture(autouse=True)
+def mock_artifact_registry():
+    """Keep saved reviews out of the global artifact registry."""
+    with patch("app.utils.artifact_registry.get_artifact_registry") as mock_reg:
+        mock_reg.return_value = MagicMock()
+        yield
+
+
+def _review(comments: str = "Good paper") -> PeerReadReview:
+    return PeerReadReview(comments=comments)
+
+
+class TestReviewStore:
+    """Test batched inserts, latest lookup and export."""
+
+    def test_latest_returns_newest_timestamp(self, tmp_path: Path):
+        """latest() picks the highest timestamp regardless of insert order."""
+        # Arrange
+        store = ReviewStore(tmp_path / "reviews.db")
+        store.add_many(
+            [
+                ReviewRecord("104", "2026-01-02T00-00-00Z", {"n": 2}),
+                ReviewRecord("104", "2026-01-03T00-00-00Z", {"n": 3}),
+                ReviewRecord("104", "2026-01-01T00-00-00Z", {"n": 1}),
+                ReviewRecord("105", "2026-02-01T00-00-00Z", {"n": 9}),
+            ]
+        )
+
+        # Act
+        latest = store.latest("104")
+
+        # Assert
+        assert latest is not None and latest.data == {"n": 3}
+        assert store.latest("missing") is None
+        assert len(store.list_locations("104")) == 3
+
+    def test_export_writes_legacy_layout(self, tmp_path: Path):
+        """Exported files use the <paper_id>_<timestamp>.json layout."""
+        # Arrange
+        store = ReviewStore(tmp_path / "reviews.db")
+        store.add(ReviewRecord("104", "2026-01-01T00-00-00Z", {"paper_id": "104"}))
+
+        # Act
+        written = store.export_files(tmp_path / "export")
+
+        # Assert
+        assert written == 1
+        exported = tmp_path / "export" / "104_2026-01-01T00-00-00Z.json"
+        assert json.loads(exported.read_text()) == {"paper_id": "104"}
+
+
+class TestReviewPersistenceStore:
+    """Test ReviewPersistence lookups backed by the store."""
+
+    def test_latest_review_without_files(self, tmp_path: Path):
+        """With write_files=False reviews live only in the store and still load."""
+        # Arrange
+        rp = ReviewPersistence(reviews_dir=str(tmp_path), write_files=False)
+        rp.save_review("104", _review("old"), timestamp="2026-01-01T00-00-00Z")
+        rp.save_review("104", _review("new"), timestamp="2026-01-02T00-00-00Z")
+
+        # Act
+        latest = rp.get_latest_review("104")
+
+        # Assert
+        assert latest is not None
+        assert rp.load_review(latest) == ("104", _review("new"))
+        assert list(tmp_path.glob("104_*.json")) == []
+        assert rp.export_reviews() == 2
+        assert len(list(tmp_path.glob("104_*.json"))) == 2
+
+    def test_existing_files_are_imported_once(self, tmp_path: Path):
+        """Reviews written before the store existed are indexed on first use."""
+        # Arrange
+        legacy = {"paper_id": "7", "timestamp": "2025-12-01T00-00-00Z", "review": {}}
+        (tmp_path / "7_2025-12-01T00-00-00Z.json").write_text(json.dumps(legacy))
+        rp = ReviewPersistence(reviews_dir=str(tmp_path))
+
+        # Act
+        rp.save_review("7", _review(), timestamp="2026-01-01T00-00-00Z")
+        reviews = ReviewPersistence(reviews_dir=str(tmp_path)).list_reviews("7")
+
+        # Assert
+        assert [Path(r).name for r in reviews] == [
+            "7_2025-12-01T00-00-00Z.json",
+            "7_2026-01-01T00-00-00Z.json",
+        ]
+        assert rp.get_latest_review("7") == str(tmp_path / "7_2026-01-01T00-00-00Z.json")
+
+    def test_listing_follows_directory_changes(self, tmp_path: Path):
+        """Files added or deleted by other writers show up in listings."""
+        # Arrange
+        rp = ReviewPersistence(reviews_dir=str(tmp_path))
+        saved = rp.save_review("7", _review(), timestamp="2026-01-01T00-00-00Z")
+        external = {"paper_id": "7", "timestamp": "2026-01-02T00-00-00Z", "review": {}}
+        (tmp_path / "7_2026-01-02T00-00-00Z.json").write_text(json.dumps(external))
+
+        # Act
+        latest = rp.get_latest_review("7")
+        Path(latest or "").unlink()
+        remaining = rp.list_reviews("7")
+
+        # Assert
+        assert latest == str(tmp_path / "7_2026-01-02T00-00-00Z.json")
+        assert remaining == [saved]
+        assert rp.get_latest_review("7") == saved
+
+    def test_exported_files_are_not_indexed_twice(self, tmp_path: Path):
+        """Exporting store-only reviews into the directory does not duplicate them."""
+        # Arrange
+        rp = ReviewPersistence(reviews_dir=str(tmp_path), write_files=False)
+        rp.save_review("104", _review(), timestamp="2026-01-01T00-00-00Z")
+
+        # Act
+        rp.export_reviews()
+
+        # Assert
+        assert len(rp.list_reviews("104")) == 1
@@ -173,10 +173,12 @@ class TestTraditionalMetricsEngine:
             "Different topic entirely about databases.",  # Very low similarity
         ]
 
-        with patch.object(engine, "compute_cosine_similarity", side_effect=[0.2, 0.9, 0.1]):
-            with patch.object(engine, "compute_jaccard_similarity", side_effect=[0.1, 0.8, 0.0]):
+        with patch.object(engine, "compute_cosine_similarity_batch", return_value=[0.2, 0.9, 0.1]):
+            with patch.object(
+                engine, "compute_jaccard_similarity_batch", return_value=[0.1, 0.8, 0.0]
+            ):
                 with patch.object(
-                    engine, "compute_semantic_similarity", side_effect=[0.3, 0.95, 0.1]
+                    engine, "compute_semantic_similarity_batch", return_value=[0.3, 0.95, 0.1]
                 ):
                     best_scores = engine.find_best_match(agent_output, references)
 
@@ -620,6 +622,164 @@ class TestPeerReadEvaluation:
         assert result.similarity_scores["cosine"] == 0.75
 
 
+class TestTraditionalMetricsBatch:
+    """Tests for batched Tier 1 evaluation."""
+
+    @pytest.fixture(params=["corpus-model", "no-model"])
+    def engine(self, request):
+        """Engine with and without a corpus TF-IDF model, never with BERTScore."""
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        vectorizer = None
+        if request.param == "corpus-model":
+            vectorizer = TfidfVectorizer(stop_words="english").fit(
+                [
+                    "Solid methodology and convincing results.",
+                    "Weak evaluation with missing baselines.",
+                    "Clear writing but limited novelty.",
+                ]
+            )
+        engine = TraditionalMetricsEngine(tfidf_vectorizer=vectorizer)
+        with patch.object(engine, "_get_bertscore_model", return_value=None):
+            yield engine
+
+    def test_batch_matches_single_evaluation_in_input_order(self, engine):
+        """Each batched result equals the single-item evaluation of the same input."""
+        # Arrange
+        from app.data_models.evaluation_models import Tier1BatchItem
+
+        paper_a = ["Solid methodology and convincing results.", "Limited novelty."]
+        paper_b = ["Weak evaluation with missing baselines."]
+        items = [
+            Tier1BatchItem(
+                agent_output="Convincing results, solid methodology.", reference_texts=paper_a
+            ),
+            Tier1BatchItem(agent_output="Missing baselines.", reference_texts=paper_b),
+            Tier1BatchItem(agent_output="Clear writing.", reference_texts=paper_a),
+            Tier1BatchItem(agent_output="", reference_texts=paper_b),
+            Tier1BatchItem(agent_output="No references.", reference_texts=[]),
+        ]
+
+        # Act
+        batch = engine.evaluate_traditional_metrics_batch(items)
+
+        # Assert
+        assert batch.reference_groups == 3
+        assert len(batch.results) == len(items)
+        for item, result in zip(items, batch.results, strict=True):
+            expected = engine.evaluate_traditional_metrics(
+                item.agent_output, item.reference_texts, item.start_time, item.end_time
+            )
+            assert result.cosine_score == pytest.approx(expected.cosine_score)
+            assert result.jaccard_score == pytest.approx(expected.jaccard_score)
+            assert result.semantic_score == pytest.approx(expected.semantic_score)
+            assert result.overall_score == pytest.approx(expected.overall_score)
+
+    def test_module_batch_uses_engine_from_settings(self):
+        """The module-level batch function builds its engine from the given settings."""
+        from app.config.judge_settings import JudgeSettings
+        from app.judge import traditional_metrics
+
+        settings = JudgeSettings(tier1_tfidf_corpus_model=False, tier1_jaccard_mode="minhash")
+
+        with patch.dict(traditional_metrics._shared_engines, clear=True):
+            engine = traditional_metrics._get_shared_engine(settings)
+            assert traditional_metrics._get_shared_engine(settings) is engine
+
+        assert engine._vectorizer is None
+        assert engine._minhasher is not None
+
+    def test_batch_reports_throughput(self, engine):
+        """Batch result carries elapsed time and items per second."""
+        from app.data_models.evaluation_models import Tier1BatchItem
+
+        items = [Tier1BatchItem(agent_output="Solid work.", reference_texts=["Solid."])] * 4
+
+        batch = engine.evaluate_traditional_metrics_batch(items)
+
+        assert batch.reference_groups == 1
+        assert batch.elapsed_seconds >= 0.0
+        assert batch.items_per_second >= 0.0
+
+
+class TestSimilarityMatrix:
+    """Tests for the single-pass multi-metric similarity extractor."""
+
+    @pytest.fixture
+    def engine(self):
+        """Fixture providing an engine without BERTScore."""
+        engine = TraditionalMetricsEngine()
+        with patch.object(engine, "_get_bertscore_model", return_value=None):
+            yield engine
+
+    def test_matrix_has_one_row_per_reference_and_best_vector(self, engine):
+        """Per-reference rows keep input order; best is the per-metric maximum."""
+        # Arrange
+        output = "Strong methodology with clear presentation."
+        references = [
+            "Poor methodology and unclear results.",
+            "Strong methodology with clear presentation.",
+            "",
+        ]
+
+        # Act
+        matrix = engine.compute_similarity_matrix(output, references, enhanced=True)
+
+        # Assert
+        assert len(matrix.per_reference) == 3
+        assert matrix.per_reference[1].jaccard == 1.0
+        assert matrix.per_reference[2].cosine == 0.0
+        assert matrix.best.jaccard == max(row.jaccard for row in matrix.per_reference)
+        assert matrix.best.levenshtein == 1.0
+
+    def test_unrequested_metrics_are_not_computed(self, engine):
+        """Only requested metrics run; the others are reported as 0.0."""
+        with patch.object(engine, "compute_semantic_similarity_batch") as mock_semantic:
+            matrix = engine.compute_similarity_matrix("good paper", ["good paper"], ["jaccard"])
+
+        mock_semantic.assert_not_called()
+        assert matrix.best.jaccard == 1.0
+        assert matrix.best.cosine == 0.0
+
+    def test_unknown_metric_raises(self, engine):
+        """Unknown metric names are rejected."""
+        with pytest.raises(ValueError, match="bleu"):
+            engine.compute_similarity_matrix("a", ["b"], ["bleu"])
+
+    def test_batch_metrics_match_pairwise_metrics(self, engine):
+        """Batched Jaccard and Levenshtein equal the single-pair methods."""
+        output = "The paper presents a novel approach"
+        references = ["This work introduces a new approach", "A novel paper", "   "]
+
+        jaccard = engine.compute_jaccard_similarity_batch(output, references)
+        levenshtein = engine.compute_levenshtein_similarity_batch(output, references)
+
+        assert jaccard == [engine.compute_jaccard_similarity(output, r) for r in references]
+        assert levenshtein == [engine.compute_levenshtein_similarity(output, r) for r in references]
+
+    def test_create_evaluation_result_matches_once(self):
+        """create_evaluation_result computes the best match a single time."""
+        from app.data_models.peerread_models import PeerReadReview
+        from app.judge.traditional_metrics import create_evaluation_result
+
+        reviews = [
+            PeerReadReview(comments="Solid methodology and clear results.", recommendation="4")
+        ]
+        with (
+            patch.object(TraditionalMetricsEngine, "_get_bertscore_model", return_value=None),
+            patch.object(
+                TraditionalMetricsEngine,
+                "find_best_match",
+                autospec=True,
+                side_effect=TraditionalMetricsEngine.find_best_match,
+            ) as mock_best_match,
+        ):
+            result = create_evaluation_result("p1", "Solid methodology overall.", reviews)
+
+        assert mock_best_match.call_count == 1
+        assert 0.0 <= result.overall_similarity <= 1.0
+
+
 # MARK: Property-based tests using Hypothesis
 
 
@@ -913,6 +1073,66 @@ class TestBERTScoreReenablement:
         assert score == 0.65
         mock_lev.assert_called_once_with("text a", "text b")
 
+    def test_batch_scores_all_references_in_one_call(self, engine):
+        """compute_semantic_similarity_batch should score all references in one score call."""
+        # Arrange
+        mock_scorer = Mock()
+        mock_f1 = Mock()
+        mock_f1.tolist.return_value = [0.8, 0.6]
+        mock_scorer.score.return_value = (Mock(), Mock(), mock_f1)
+
+        # Act
+        with patch.object(engine, "_get_bertscore_model", return_value=mock_scorer):
+            scores = engine.compute_semantic_similarity_batch(
+                "Strong paper", ["Strong paper overall", "Weak", ""]
+            )
+
+        # Assert
+        mock_scorer.score.assert_called_once()
+        cands, refs = mock_scorer.score.call_args.args
+        assert cands == ["Strong paper", "Strong paper"]
+        assert sorted(refs) == ["Strong paper overall", "Weak"]
+        # Sorted by length, so the short reference is scored first
+        assert scores == [0.6, 0.8, 0.0]
+
+    def test_corpus_scores_keep_input_order_across_buckets(self, engine):
+        """compute_semantic_similarity_corpus should scatter bucketed scores back in order."""
+        # Arrange
+        mock_scorer = Mock()
+
+        def score(cands, refs, batch_size):
+            f1 = Mock()
+            f1.tolist.return_value = [len(c) + len(r) for c, r in zip(cands, refs, strict=True)]
+            return Mock(), Mock(), f1
+
+        mock_scorer.score.side_effect = score
+        groups = [("aaaa", ["bbbbbbbb", "b"]), ("cc", ["dd"])]
+
+        # Act
+        with patch.object(engine, "_get_bertscore_model", return_value=mock_scorer):
+            scores = engine.compute_semantic_similarity_corpus(groups, batch_size=2)
+
+        # Assert
+        assert scores == [[12.0, 5.0], [4.0]]
+        assert mock_scorer.score.call_count == 2
+
+    def test_corpus_falls_back_to_levenshtein_on_failure(self, engine):
+        """compute_semantic_similarity_corpus should fall back to Levenshtein per pair."""
+        # Arrange
+        mock_scorer = Mock()
+        mock_scorer.score.side_effect = RuntimeError("CUDA out of memory")
+
+        # Act
+        with patch.object(engine, "_get_bertscore_model", return_value=mock_scorer):
+            with patch.object(
+                engine, "compute_levenshtein_similarity", return_value=0.4
+            ) as mock_lev:
+                scores = engine.compute_semantic_similarity_corpus([("text a", ["text b"])])
+
+        # Assert
+        assert scores == [[0.4]]
+        mock_lev.assert_called_once_with("text a", "text b")
+
     @pytest.mark.network
     def test_bertscore_real_model_download(self):
         """Validate real BERTScore model download from HuggingFace.
@@ -928,3 +1148,41 @@ class TestBERTScoreReenablement:
             ["This work introduces a new method"],
         )
         assert 0.0 <= float(f1.mean().item()) <= 1.0
+
+
+class TestScoreBackends:
+    """Tier1Result.score_backends names the implementation that actually scored."""
+
+    @pytest.fixture
+    def failing_bertscore(self):
+        """Engine whose loaded BERTScore model fails at scoring time."""
+        scorer = Mock()
+        scorer.score.side_effect = RuntimeError("CUDA out of memory")
+        engine = TraditionalMetricsEngine()
+        with patch.object(engine, "_get_bertscore_model", return_value=scorer):
+            yield engine
+
+    def test_fallbacks_are_reported(self, failing_bertscore):
+        """Stop-word-only text falls back to word overlap; failed BERTScore to Levenshtein."""
+        result = failing_bertscore.evaluate_traditional_metrics("the and of", ["of the"], 0.0, 0.1)
+
+        name = failing_bertscore._edit_distance.name
+        assert result.score_backends["cosine"] == "word-overlap"
+        assert result.score_backends["semantic"] == f"levenshtein-{name}"
+
+    def test_batch_reports_backends_per_item(self, failing_bertscore):
+        """Each batched result names the cosine backend used for its own output."""
+        from app.data_models.evaluation_models import Tier1BatchItem
+
+        batch = failing_bertscore.evaluate_traditional_metrics_batch(
+            [
+                Tier1BatchItem(
+                    agent_output="Convincing results.",
+                    reference_texts=["Solid methodology and convincing results."],
+                ),
+                Tier1BatchItem(agent_output="the and of", reference_texts=["of the"]),
+            ]
+        )
+
+        assert [r.score_backends["cosine"] for r in batch.results] == ["tfidf", "word-overlap"]
+        assert batch.results[0].score_backends["jaccard"] == "exact"
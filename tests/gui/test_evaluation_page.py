@@ -315,6 +315,7 @@ class TestEvaluationPageRenderingSnapshots:
                     "time_score": 0.85,
                     "task_success": 1.0,
                     "overall_score": 0.8,
+                    "score_backends": {},
                 },
                 "tier2": {
                     "technical_accuracy": 0.88,
@@ -324,6 +325,9 @@ class TestEvaluationPageRenderingSnapshots:
                     "model_used": "gpt-4",
                     "api_cost": 0.05,
                     "fallback_used": False,
+                    "cache_hits": [],
+                    "judge_mode": "per_criterion",
+                    "hedge_winners": {},
                 },
                 "tier3": {
                     "path_convergence": 0.85,
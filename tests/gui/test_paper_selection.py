@@ -98,7 +98,7 @@ class TestPeerReadReviewIntToStrCoercion:
 class TestLoadAvailablePapers:
     """Tests for loading available papers for the dropdown.
 
-    Arrange: Mock PeerReadLoader.load_papers to return test papers
+    Arrange: Mock PeerReadLoader.iter_papers to stream test papers
     Act: Call the GUI helper that collects available papers
     Expected: Returns list of (paper_id, title, abstract) tuples
     """
@@ -118,9 +118,7 @@ class TestLoadAvailablePapers:
 
         with patch("gui.pages.run_app.PeerReadLoader") as mock_loader_cls:
             mock_loader = mock_loader_cls.return_value
-            mock_loader.load_papers.return_value = papers
-            mock_loader.config.venues = ["acl_2017"]
-            mock_loader.config.splits = ["train"]
+            mock_loader.iter_papers.return_value = iter(papers)
 
             result = _load_available_papers()
 
@@ -128,16 +126,16 @@ class TestLoadAvailablePapers:
         assert result[0].paper_id == "42"
         assert result[0].title == "Attention Is All You Need"
 
-    def test_load_available_papers_returns_empty_on_file_not_found(self) -> None:
-        """Returns empty list when dataset not downloaded (FileNotFoundError)."""
+    def test_load_available_papers_returns_empty_when_not_downloaded(self, tmp_path) -> None:
+        """Returns empty list when dataset not downloaded."""
+        from app.config.peerread_config import PeerReadConfig
+        from app.data_utils.datasets_peerread import PeerReadLoader
         from gui.pages.run_app import _load_available_papers
 
-        with patch("gui.pages.run_app.PeerReadLoader") as mock_loader_cls:
-            mock_loader = mock_loader_cls.return_value
-            mock_loader.load_papers.side_effect = FileNotFoundError("not found")
-            mock_loader.config.venues = ["acl_2017"]
-            mock_loader.config.splits = ["train"]
+        loader = PeerReadLoader(PeerReadConfig(venues=["acl_2017"], splits=["train"]))
+        loader.cache_dir = tmp_path / "missing"
 
+        with patch("gui.pages.run_app.PeerReadLoader", return_value=loader):
             result = _load_available_papers()
 
         assert result == []
@@ -151,10 +149,8 @@ class TestLoadAvailablePapers:
 
         with patch("gui.pages.run_app.PeerReadLoader") as mock_loader_cls:
             mock_loader = mock_loader_cls.return_value
-            # Return paper_a from all venues/splits to test deduplication
-            mock_loader.load_papers.side_effect = [[paper_a], [paper_a, paper_b]]
-            mock_loader.config.venues = ["acl_2017", "conll_2016"]
-            mock_loader.config.splits = ["train"]
+            # Stream paper_a from two venues/splits to test deduplication
+            mock_loader.iter_papers.return_value = iter([paper_a, paper_a, paper_b])
 
             result = _load_available_papers()
 
@@ -0,0 +1,104 @@
+"""Tests for the configurable BERTScore inference backend."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.config.judge_settings import JudgeSettings
+from app.judge.bertscore_backend import BERTScoreBackend, apply_bertscore_backend
+from app.judge.traditional_metrics import TraditionalMetricsEngine
+
+PARITY_PAIRS = [
+    (
+        "The paper presents a novel attention mechanism with convincing experiments.",
+        "This work introduces a new attention model and evaluates it thoroughly.",
+    ),
+    (
+        "The evaluation is weak and baselines are missing.",
+        "Strong results on three benchmarks with clear ablations.",
+    ),
+]
+
+
+@pytest.fixture(autouse=True)
+def _reset_bertscore_cache():
+    """Reset the class-level BERTScore cache between tests."""
+    TraditionalMetricsEngine._bertscore_instance = None
+    TraditionalMetricsEngine._bertscore_instance_backend = None
+    TraditionalMetricsEngine._bertscore_init_failed = False
+    yield
+    TraditionalMetricsEngine._bertscore_instance = None
+    TraditionalMetricsEngine._bertscore_instance_backend = None
+    TraditionalMetricsEngine._bertscore_init_failed = False
+
+
+class TestBERTScoreBackend:
+    """Test backend configuration and application."""
+
+    def test_from_settings_reads_tier1_bertscore_fields(self):
+        """Backend options come from tier1_bertscore_* settings."""
+        settings = JudgeSettings(
+            tier1_bertscore_precision="int8",
+            tier1_bertscore_threads=2,
+            tier1_bertscore_max_length=256,
+        )
+
+        backend = BERTScoreBackend.from_settings(settings)
+
+        assert backend == BERTScoreBackend(
+            model_type="distilbert-base-uncased", precision="int8", num_threads=2, max_length=256
+        )
+        assert backend.cache_tag == "_int8_max256"
+        assert BERTScoreBackend(num_threads=4).cache_tag == ""
+
+    def test_default_backend_leaves_scorer_untouched(self):
+        """The fp32 default applies no changes."""
+        scorer = Mock()
+
+        assert apply_bertscore_backend(scorer, BERTScoreBackend()) is scorer
+        assert scorer.method_calls == []
+
+    def test_engine_builds_scorer_with_backend(self):
+        """The engine loads the configured model and applies the backend once."""
+        backend = BERTScoreBackend(model_type="roberta-base", max_length=128)
+        engine = TraditionalMetricsEngine(bertscore_backend=backend)
+
+        with (
+            patch("app.judge.traditional_metrics.BERTScorer") as mock_bert_cls,
+            patch(
+                "app.judge.traditional_metrics.apply_bertscore_backend",
+                side_effect=lambda scorer, _: scorer,
+            ) as mock_apply,
+        ):
+            first = engine._get_bertscore_model()
+            second = engine._get_bertscore_model()
+
+        assert first is second
+        mock_bert_cls.assert_called_once_with(model_type="roberta-base", lang="en")
+        mock_apply.assert_called_once_with(mock_bert_cls.return_value, backend)
+
+    def test_int8_quantizes_linear_layers_and_caps_length(self):
+        """int8 swaps Linear layers for dynamically quantized ones."""
+        torch = pytest.importorskip("torch")
+        scorer = Mock()
+        scorer._model = torch.nn.Sequential(torch.nn.Linear(8, 8))
+        scorer._tokenizer = Mock(model_max_length=512)
+
+        apply_bertscore_backend(scorer, BERTScoreBackend(precision="int8", max_length=128))
+
+        assert "quantized" in type(scorer._model[0]).__module__
+        assert scorer._tokenizer.model_max_length == 128
+
+    @pytest.mark.network
+    def test_int8_scores_match_fp32(self):
+        """int8 BERTScore F1 stays within 0.02 of fp32 on review-like text.
+
+        Run with: pytest -m network tests/judge/test_bertscore_backend.py
+        """
+        fp32 = TraditionalMetricsEngine(bertscore_backend=BERTScoreBackend())
+        fp32_scores = [fp32.compute_semantic_similarity(a, b) for a, b in PARITY_PAIRS]
+
+        int8 = TraditionalMetricsEngine(bertscore_backend=BERTScoreBackend(precision="int8"))
+        int8_scores = [int8.compute_semantic_similarity(a, b) for a, b in PARITY_PAIRS]
+
+        assert int8_scores == pytest.approx(fp32_scores, abs=0.02)
@@ -0,0 +1,230 @@
+"""Tests for BERTScore warm-up and the shared BERTScore model server."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from app.judge.bertscore_backend import BERTScoreBackend
+from app.judge.bertscore_server import (
+    RemoteBERTScorer,
+    connect_bertscore_server,
+    get_remote_bertscorer,
+    serve_bertscore,
+    stop_bertscore_server,
+)
+from app.judge.traditional_metrics import TraditionalMetricsEngine, start_bertscore_warmup
+
+
+@pytest.fixture(autouse=True)
+def _reset_bertscore_cache():
+    """Reset the class-level BERTScore cache between tests."""
+    TraditionalMetricsEngine._bertscore_instance = None
+    TraditionalMetricsEngine._bertscore_instance_backend = None
+    TraditionalMetricsEngine._bertscore_init_failed = False
+    yield
+    TraditionalMetricsEngine._bertscore_instance = None
+    TraditionalMetricsEngine._bertscore_instance_backend = None
+    TraditionalMetricsEngine._bertscore_init_failed = False
+
+
+def _mock_scorer() -> Mock:
+    """Scorer giving F1 0.9 to identical pairs and 0.1 otherwise."""
+    scorer = Mock()
+    scorer.score.side_effect = lambda cands, refs, batch_size: (
+        np.full(len(cands), 0.5),
+        np.full(len(cands), 0.5),
+        np.array([0.9 if c == r else 0.1 for c, r in zip(cands, refs, strict=True)]),
+    )
+    return scorer
+
+
+@pytest.fixture
+def running_server(tmp_path):
+    """Serve a mock scorer in a background thread; yields (socket_path, scorer)."""
+    socket_path = str(tmp_path / "bs.sock")
+    scorer = _mock_scorer()
+    with patch.object(TraditionalMetricsEngine, "_get_bertscore_model", return_value=scorer):
+        thread = threading.Thread(
+            target=serve_bertscore, args=(socket_path, BERTScoreBackend()), daemon=True
+        )
+        thread.start()
+        client = RemoteBERTScorer(socket_path)
+        for _ in range(100):
+            try:
+                client.ping()
+                break
+            except (OSError, EOFError):
+                threading.Event().wait(0.05)
+    yield socket_path, scorer
+    stop_bertscore_server(socket_path)
+    thread.join(timeout=5)
+
+
+class TestBERTScoreWarmup:
+    """Test background model loading."""
+
+    def test_warmup_loads_model_once_in_background(self):
+        """Warm-up loads the shared instance; later engines reuse it."""
+        with patch("app.judge.traditional_metrics.BERTScorer") as mock_bert_cls:
+            start_bertscore_warmup().join(timeout=5)
+            scorer = TraditionalMetricsEngine()._get_bertscore_model()
+
+        mock_bert_cls.assert_called_once_with(model_type="distilbert-base-uncased", lang="en")
+        assert scorer is mock_bert_cls.return_value
+
+
+class TestSharedBERTScoreServer:
+    """Test the socket server and its client."""
+
+    def test_remote_scorer_round_trip(self, running_server):
+        """Scores come back from the server in pair order."""
+        socket_path, scorer = running_server
+        client = RemoteBERTScorer(socket_path)
+
+        _, _, f1 = client.score(["a", "b"], ["a", "c"], batch_size=8)
+
+        assert f1.tolist() == [0.9, 0.1]
+        scorer.score.assert_called_once_with(["a", "b"], ["a", "c"], batch_size=8)
+
+    def test_engine_scores_through_server(self, running_server):
+        """An engine configured with a socket uses the server, not a local model."""
+        socket_path, _ = running_server
+        backend = BERTScoreBackend(server_socket=socket_path)
+
+        with (
+            patch("app.judge.bertscore_server._global_clients", {}),
+            patch("app.judge.traditional_metrics.BERTScorer") as mock_bert_cls,
+        ):
+            engine = TraditionalMetricsEngine(bertscore_backend=backend)
+            scores = engine.compute_semantic_similarity_batch("same", ["same", "other"])
+
+        assert scores == [0.9, 0.1]
+        mock_bert_cls.assert_not_called()
+
+    def test_engine_falls_back_to_local_model_without_server(self):
+        """An unreachable server falls back to loading the model in-process."""
+        backend = BERTScoreBackend(server_socket="/nonexistent/bs.sock")
+
+        with (
+            patch("app.judge.traditional_metrics.get_remote_bertscorer", return_value=None),
+            patch("app.judge.traditional_metrics.BERTScorer") as mock_bert_cls,
+        ):
+            scorer = TraditionalMetricsEngine(bertscore_backend=backend)._get_bertscore_model()
+
+        assert scorer is mock_bert_cls.return_value
+
+    def test_server_with_other_backend_is_not_used(self, running_server):
+        """A server running other model options is rejected, not silently used."""
+        socket_path, scorer = running_server
+        backend = BERTScoreBackend(precision="int8", server_socket=socket_path)
+
+        with pytest.raises(RuntimeError, match="serves 'distilbert-base-uncased'"):
+            connect_bertscore_server(socket_path, backend, spawn=False)
+        with patch("app.judge.bertscore_server._global_clients", {}):
+            assert get_remote_bertscorer(backend) is None
+        scorer.score.assert_not_called()
+
+    def test_wrong_key_is_rejected(self, running_server):
+        """Clients without the server's key cannot score."""
+        from multiprocessing.connection import AuthenticationError, Client
+
+        socket_path, _ = running_server
+
+        with pytest.raises((AuthenticationError, EOFError, OSError)):
+            Client(socket_path, family="AF_UNIX", authkey=b"wrong").send(("ping",))
+
+    def test_second_server_refuses_to_start(self, running_server):
+        """A server started on a live socket returns without replacing it."""
+        socket_path, scorer = running_server
+
+        serve_bertscore(socket_path, BERTScoreBackend())
+
+        _, _, f1 = RemoteBERTScorer(socket_path).score(["a"], ["a"])
+        assert f1.tolist() == [0.9]
+        scorer.score.assert_called_once()
+
+    def test_stopped_server_is_restarted_between_calls(self, tmp_path):
+        """A server that exited (idle timeout or crash) is respawned on the next call."""
+        socket_path = str(tmp_path / "bs.sock")
+        servers: list[threading.Thread] = []
+
+        def _spawn(path: str, backend: BERTScoreBackend) -> None:
+            thread = threading.Thread(target=serve_bertscore, args=(path, backend), daemon=True)
+            thread.start()
+            servers.append(thread)
+
+        with (
+            patch.object(
+                TraditionalMetricsEngine, "_get_bertscore_model", return_value=_mock_scorer()
+            ),
+            patch("app.judge.bertscore_server._spawn_server", side_effect=_spawn),
+            patch("app.judge.bertscore_server._POLL_INTERVAL", 0.01),
+        ):
+            client = connect_bertscore_server(socket_path, timeout=10)
+            first = client.score(["a"], ["a"])[2].tolist()
+            stop_bertscore_server(socket_path)
+            servers[0].join(timeout=5)
+
+            second = client.score(["a"], ["b"])[2].tolist()
+            stop_bertscore_server(socket_path)
+            servers[1].join(timeout=5)
+
+        assert (first, second) == ([0.9], [0.1])
+        assert len(servers) == 2
+
+    def test_engine_loads_local_model_when_server_cannot_restart(self, running_server):
+        """Once the server is gone for good, scoring continues with an in-process model."""
+        socket_path, _ = running_server
+        backend = BERTScoreBackend(server_socket=socket_path)
+
+        with (
+            patch("app.judge.bertscore_server._global_clients", {}),
+            patch("app.judge.traditional_metrics.BERTScorer") as mock_bert_cls,
+        ):
+            mock_bert_cls.return_value = _mock_scorer()
+            engine = TraditionalMetricsEngine(bertscore_backend=backend)
+            assert engine.compute_semantic_similarity_batch("a", ["a"]) == [0.9]
+            stop_bertscore_server(socket_path)
+            with (
+                patch("app.judge.bertscore_server._spawn_server"),
+                patch("app.judge.bertscore_server._SERVER_READY_TIMEOUT", 0.2),
+                patch("app.judge.bertscore_server._POLL_INTERVAL", 0.01),
+                engine._recording_backends() as used,
+            ):
+                scores = engine.compute_semantic_similarity_batch("a", ["a", "b"])
+
+        assert scores == [0.9, 0.1]
+        assert used == {"semantic": "bertscore"}
+        mock_bert_cls.assert_called_once()
+
+    def test_concurrent_connects_spawn_one_server(self, tmp_path):
+        """Callers racing to connect start a single server and all reach it."""
+        socket_path = str(tmp_path / "bs.sock")
+        servers: list[threading.Thread] = []
+
+        def _spawn(path: str, backend: BERTScoreBackend) -> None:
+            thread = threading.Thread(target=serve_bertscore, args=(path, backend), daemon=True)
+            thread.start()
+            servers.append(thread)
+
+        with (
+            patch.object(
+                TraditionalMetricsEngine, "_get_bertscore_model", return_value=_mock_scorer()
+            ),
+            patch("app.judge.bertscore_server._spawn_server", side_effect=_spawn),
+            patch("app.judge.bertscore_server._POLL_INTERVAL", 0.01),
+            ThreadPoolExecutor(max_workers=6) as pool,
+        ):
+            clients = list(
+                pool.map(lambda _: connect_bertscore_server(socket_path, timeout=10), range(6))
+            )
+            scores = [client.score(["a"], ["a"])[2].tolist() for client in clients]
+            stop_bertscore_server(socket_path)
+            for thread in servers:
+                thread.join(timeout=5)
+
+        assert len(servers) == 1
+        assert scores == [[0.9]] * 6
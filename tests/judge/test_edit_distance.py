@@ -0,0 +1,92 @@
+"""Tests for the pluggable edit-distance backends."""
+
+import pytest
+import textdistance
+from hypothesis import given
+from hypothesis import strategies as st
+
+from app.judge.edit_distance import (
+    EditDistanceBackend,
+    available_edit_distance_backends,
+    banded_levenshtein,
+    get_edit_distance_backend,
+)
+from app.judge.traditional_metrics import TraditionalMetricsEngine
+
+short_text = st.text(alphabet="abc ", max_size=15)
+
+
+class TestBandedLevenshtein:
+    """Test the early-exit banded dynamic program."""
+
+    @given(short_text, short_text, st.integers(min_value=0, max_value=15))
+    def test_matches_full_distance_within_band(self, a, b, max_distance):
+        """Distances within the band are exact; larger ones report None."""
+        distance = int(textdistance.levenshtein.distance(a, b))
+
+        result = banded_levenshtein(a, b, max_distance)
+
+        assert result == (distance if distance <= max_distance else None)
+
+    def test_exits_early_on_length_difference(self):
+        """Length differences beyond the band need no dynamic program."""
+        assert banded_levenshtein("a" * 10, "a" * 1000, max_distance=5) is None
+
+
+class TestEditDistanceBackends:
+    """Test backend selection and normalized similarity."""
+
+    def test_textdistance_always_available_and_auto_picks_first(self):
+        """textdistance is the last-resort backend; auto picks the fastest installed."""
+        available = available_edit_distance_backends()
+
+        assert available[-1] == "textdistance"
+        assert get_edit_distance_backend("auto").name == available[0]
+
+    def test_unknown_backend_raises(self):
+        """Unknown backend names are rejected."""
+        with pytest.raises(ValueError, match="Unknown edit-distance backend"):
+            get_edit_distance_backend("bogus")  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize("name", available_edit_distance_backends())
+    def test_backends_agree_with_textdistance(self, name):
+        """Every installed backend returns textdistance's normalized similarity."""
+        backend = get_edit_distance_backend(name)
+        a, b = "the quick brown fox", "the quick brown fox jumps"
+
+        assert backend.normalized_similarity(a, b) == pytest.approx(
+            textdistance.levenshtein.normalized_similarity(a, b)
+        )
+        assert backend.normalized_similarity("", "") == 1.0
+
+    @pytest.mark.parametrize("name", available_edit_distance_backends())
+    def test_min_similarity_cuts_off_dissimilar_pairs(self, name):
+        """Pairs below the cutoff score 0.0; near-duplicates keep their exact score."""
+        backend = get_edit_distance_backend(name)
+
+        assert backend.normalized_similarity("abcdefghij", "zyxwvutsrq", 0.9) == 0.0
+        assert backend.normalized_similarity("abcdefghij", "abcdefghik", 0.9) == 0.9
+
+
+class TestEngineEditDistanceBackend:
+    """Test backend use and reporting in the Tier 1 engine."""
+
+    def test_engine_uses_configured_backend_and_records_it(self, no_bertscore_download):
+        """Levenshtein scores come from the configured backend, named in Tier1Result."""
+        calls: list[tuple[str, str]] = []
+
+        def distance(a: str, b: str, max_distance: int | None) -> int | None:
+            calls.append((a, b))
+            return 0
+
+        engine = TraditionalMetricsEngine(
+            edit_distance_backend=EditDistanceBackend("stub", distance)
+        )
+
+        similarity = engine.compute_levenshtein_similarity("Some Text", "other text")
+        result = engine.evaluate_traditional_metrics("review", ["reference"], 0.0, 0.1)
+
+        assert similarity == 1.0
+        assert calls[0] == ("some text", "other text")
+        assert result.score_backends["levenshtein"] == "stub"
+        assert result.score_backends["semantic"] == "levenshtein-stub"
@@ -0,0 +1,120 @@
+"""Tests for the persistent reference embedding cache used by Tier 1 BERTScore."""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from app.judge.embedding_cache import (
+    ReferenceEmbeddingCache,
+    TokenEmbeddings,
+    encode_texts,
+    greedy_match_f1,
+    scorer_namespace,
+)
+from app.judge.traditional_metrics import TraditionalMetricsEngine
+
+
+def _embeddings(*vectors: list[float]) -> TokenEmbeddings:
+    """Build normalized token embeddings with uniform weights."""
+    matrix = np.array(vectors, dtype=np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    return TokenEmbeddings(matrix, np.full(len(vectors), 1 / len(vectors), dtype=np.float32))
+
+
+@pytest.fixture
+def scorer():
+    """Mock BERTScorer with a stable configuration hash."""
+    mock_scorer = Mock()
+    mock_scorer.hash = "distilbert-base-uncased_L5_no-idf_version=0.3.13"
+    return mock_scorer
+
+
+class TestGreedyMatchF1:
+    """Test F1 computation from precomputed embeddings."""
+
+    def test_identical_embeddings_score_one(self):
+        """A text matched against itself has F1 1.0."""
+        emb = _embeddings([1.0, 0.0], [0.0, 1.0])
+        assert greedy_match_f1(emb, emb) == pytest.approx(1.0)
+
+    def test_orthogonal_embeddings_score_zero(self):
+        """Fully orthogonal token vectors give F1 0.0."""
+        assert greedy_match_f1(_embeddings([1.0, 0.0]), _embeddings([0.0, 1.0])) == 0.0
+
+    @pytest.mark.network
+    def test_matches_bertscorer_score(self):
+        """Cached-embedding F1 equals BERTScorer.score on the same model."""
+        bert_score = pytest.importorskip("bert_score")
+        bert_scorer = bert_score.BERTScorer(model_type="distilbert-base-uncased", lang="en")
+        candidate = "The paper proposes a novel attention mechanism for long documents."
+        reference = "This work introduces a new attention method for processing long texts."
+
+        cand_emb, ref_emb = encode_texts(bert_scorer, [candidate, reference])
+        _, _, f1 = bert_scorer.score([candidate], [reference])
+
+        assert greedy_match_f1(cand_emb, ref_emb) == pytest.approx(f1.item(), abs=1e-4)
+
+
+class TestReferenceEmbeddingCache:
+    """Test storage and cache-through encoding."""
+
+    def test_entries_survive_a_new_cache_instance(self, tmp_path: Path):
+        """Stored embeddings are read back from disk by a fresh instance."""
+        # Arrange
+        emb = _embeddings([0.6, 0.8], [1.0, 0.0])
+        ReferenceEmbeddingCache(tmp_path).put("model", "Solid review.", emb)
+
+        # Act
+        loaded = ReferenceEmbeddingCache(tmp_path).get("model", "Solid review.")
+
+        # Assert
+        assert loaded is not None
+        np.testing.assert_allclose(loaded.embedding, emb.embedding)
+        np.testing.assert_allclose(loaded.idf, emb.idf)
+        assert ReferenceEmbeddingCache(tmp_path).get("other-model", "Solid review.") is None
+
+    def test_get_or_encode_encodes_only_misses(self, tmp_path: Path, scorer):
+        """Cached references are not re-encoded; duplicates are encoded once."""
+        # Arrange
+        cache = ReferenceEmbeddingCache(tmp_path)
+        with patch(
+            "app.judge.embedding_cache.encode_texts",
+            side_effect=lambda _, texts: [_embeddings([1.0, float(len(t))]) for t in texts],
+        ) as mock_encode:
+            cache.get_or_encode(scorer, ["first"])
+
+            # Act
+            result = cache.get_or_encode(scorer, ["first", "second", "second"])
+
+        # Assert
+        assert mock_encode.call_args_list[1].args[1] == ["second"]
+        assert len(result) == 3
+        assert result[1] is result[2]
+
+
+class TestEngineWithEmbeddingCache:
+    """Test that the engine scores from cached reference embeddings."""
+
+    def test_only_agent_output_is_encoded_when_references_are_cached(self, tmp_path, scorer):
+        """With a warm cache the scorer never scores pairs directly."""
+        # Arrange
+        cache = ReferenceEmbeddingCache(tmp_path)
+        cache.put(scorer_namespace(scorer), "x", _embeddings([1.0, 0.0]))
+        engine = TraditionalMetricsEngine(embedding_cache=cache)
+
+        # Act
+        with (
+            patch.object(engine, "_get_bertscore_model", return_value=scorer),
+            patch(
+                "app.judge.embedding_cache.encode_texts",
+                return_value=[_embeddings([1.0, 0.0])],
+            ) as mock_encode,
+        ):
+            scores = engine.compute_semantic_similarity_batch("agent review", ["x"])
+
+        # Assert
+        assert scores == [pytest.approx(1.0)]
+        mock_encode.assert_called_once_with(scorer, ["agent review"])
+        scorer.score.assert_not_called()
@@ -0,0 +1,144 @@
+"""Tests for the persistent LLM-judge response cache."""
+
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from pydantic_ai import Agent
+
+from app.config.app_env import AppEnv
+from app.config.judge_settings import JudgeSettings
+from app.data_models.evaluation_models import (
+    ConstructivenessAssessment,
+    PlanningRationalityAssessment,
+    TechnicalAccuracyAssessment,
+)
+from app.judge.judge_cache import JudgeCache, get_judge_cache, judge_cache_key
+from app.judge.llm_evaluation_managers import LLMJudgeEngine
+
+OUTPUTS = {
+    TechnicalAccuracyAssessment: TechnicalAccuracyAssessment(
+        factual_correctness=4, methodology_understanding=4, domain_knowledge=4, explanation="ok"
+    ),
+    ConstructivenessAssessment: ConstructivenessAssessment(
+        actionable_feedback=5, balanced_critique=5, improvement_guidance=5, explanation="ok"
+    ),
+    PlanningRationalityAssessment: PlanningRationalityAssessment(
+        logical_flow=3, decision_quality=3, resource_efficiency=3, explanation="ok"
+    ),
+}
+
+
+class TestJudgeCacheKey:
+    """Test cache key construction."""
+
+    def test_whitespace_normalized_but_inputs_distinguished(self):
+        """Formatting-only prompt changes share a key; any other input changes it."""
+        base = judge_cache_key("openai", "gpt-4o-mini", "constructiveness", "sys", "a  b\n")
+
+        assert judge_cache_key("openai", "gpt-4o-mini", "constructiveness", "sys", " a b") == base
+        assert judge_cache_key("openai", "gpt-4o", "constructiveness", "sys", "a b") != base
+        assert judge_cache_key("openai", "gpt-4o-mini", "constructiveness", "sys2", "a b") != base
+
+
+class TestJudgeCache:
+    """Test storage, expiry and eviction."""
+
+    def test_round_trip_and_ttl(self, tmp_path):
+        """Stored outputs are returned until they expire."""
+        cache = JudgeCache(tmp_path / "judge.db", ttl_seconds=60, max_entries=10)
+        cache.put("k", "openai", "m", "constructiveness", '{"x": 1}')
+
+        assert cache.get("k") == '{"x": 1}'
+        with patch("app.judge.judge_cache.time.time", return_value=10**12):
+            assert cache.get("k") is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Above max_entries, the least recently read entries are dropped."""
+        cache = JudgeCache(tmp_path / "judge.db", ttl_seconds=60, max_entries=2)
+        now = time.time()
+        with patch("app.judge.judge_cache.time.time", side_effect=[now - 3, now - 2, now - 1, now]):
+            cache.put("old", "p", "m", "t", "1")
+            cache.put("new", "p", "m", "t", "2")
+            cache.get("old")
+            cache.put("newest", "p", "m", "t", "3")
+
+        assert len(cache) == 2
+        assert cache.get("new") is None
+        assert cache.get("old") == "1"
+
+    def test_disabled_or_bypassed_returns_none(self, tmp_path):
+        """No cache is opened unless enabled and not bypassed."""
+        path = str(tmp_path / "judge.db")
+
+        assert get_judge_cache(JudgeSettings(tier2_cache_path=path)) is None
+        assert (
+            get_judge_cache(
+                JudgeSettings(
+                    tier2_cache_enabled=True, tier2_cache_bypass=True, tier2_cache_path=path
+                )
+            )
+            is None
+        )
+
+
+class TestEngineJudgeCache:
+    """Test cache use in LLMJudgeEngine."""
+
+    @staticmethod
+    def _engine(tmp_path, **overrides) -> LLMJudgeEngine:
+        settings = JudgeSettings(
+            tier2_provider="openai",
+            tier2_cache_enabled=True,
+            tier2_cache_path=str(tmp_path / "judge.db"),
+            **overrides,
+        )
+        env_config = AppEnv(OPENAI_API_KEY="sk-test-key", GITHUB_API_KEY="")
+        return LLMJudgeEngine(settings, env_config=env_config)
+
+    @staticmethod
+    def _agent() -> Mock:
+        async def run(prompt, output_type):
+            return Mock(output=OUTPUTS[output_type])
+
+        agent = Mock(spec=Agent)
+        agent.run = AsyncMock(side_effect=run)
+        return agent
+
+    async def test_repeat_evaluation_served_from_cache(self, tmp_path):
+        """An identical evaluation makes no LLM calls, flags hits and costs nothing."""
+        trace = {"agent_interactions": [], "tool_calls": []}
+        first_engine = self._engine(tmp_path)
+        agent = self._agent()
+
+        with patch.object(first_engine, "create_judge_agent", return_value=agent):
+            first = await first_engine.evaluate_comprehensive("paper", "good review", trace)
+        second_engine = self._engine(tmp_path)
+        with patch.object(second_engine, "create_judge_agent") as create_agent:
+            second = await second_engine.evaluate_comprehensive("paper", "good\n\n review", trace)
+
+        assert agent.run.await_count == 3
+        create_agent.assert_not_called()
+        assert first.cache_hits == []
+        assert second.cache_hits == [
+            "constructiveness",
+            "planning_rationality",
+            "technical_accuracy",
+        ]
+        assert second.overall_score == pytest.approx(first.overall_score)
+        assert second.api_cost == 0.0
+
+    async def test_refresh_ignores_cached_entries(self, tmp_path):
+        """With tier2_cache_refresh, assessments are re-run and re-stored."""
+        engine = self._engine(tmp_path)
+        with patch.object(engine, "create_judge_agent", return_value=self._agent()):
+            await engine.assess_constructiveness("review")
+        refreshing = self._engine(tmp_path, tier2_cache_refresh=True)
+        agent = self._agent()
+
+        with patch.object(refreshing, "create_judge_agent", return_value=agent):
+            score = await refreshing.assess_constructiveness("review")
+
+        assert agent.run.await_count == 1
+        assert score == 1.0
+        assert refreshing._cache_hits == []
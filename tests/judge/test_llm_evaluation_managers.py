@@ -5,17 +5,30 @@ Test the Tier 2 evaluation using LLM assessment with fallback mechanisms
 and cost optimization strategies. Added STORY-001 tests for provider selection.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 from pydantic_ai import Agent
+from pydantic_ai.exceptions import UnexpectedModelBehavior
 
 from app.config.app_env import AppEnv
 from app.config.judge_settings import JudgeSettings
-from app.data_models.evaluation_models import Tier2Result
-from app.judge.llm_evaluation_managers import LLMJudgeEngine
+from app.data_models.evaluation_models import (
+    ConstructivenessAssessment,
+    FusedJudgeAssessment,
+    PlanningRationalityAssessment,
+    TechnicalAccuracyAssessment,
+    Tier2Result,
+)
+from app.judge.llm_evaluation_managers import (
+    JudgeAgentPool,
+    JudgeLatencyTracker,
+    LLMJudgeEngine,
+)
+from app.llms.rate_limiter import get_rate_limited_client
 
 
 @pytest.fixture
@@ -841,6 +854,7 @@ class TestApiKeyForwarding:
                 model_name="gpt-4o-mini",
                 assessment_type="technical_accuracy",
                 api_key="sk-real-key-123",
+                http_client=engine.agent_pool.http_client("openai"),
             )
 
     @pytest.mark.asyncio
@@ -859,9 +873,245 @@ class TestApiKeyForwarding:
                 model_name="gpt-4o-mini",
                 assessment_type="constructiveness",
                 api_key="ghp-github-key-456",
+                http_client=engine.agent_pool.http_client("github"),
             )
 
 
+class TestJudgeAgentPool:
+    """Test reuse of judge agents and HTTP clients."""
+
+    async def test_agents_built_once_and_share_provider_client(self):
+        """Repeated assessments and new engines reuse agents; one client per provider."""
+        settings = JudgeSettings(tier2_provider="openai")
+        env_config = AppEnv(OPENAI_API_KEY="sk-test")
+        first = LLMJudgeEngine(settings, env_config=env_config)
+        second = LLMJudgeEngine(settings, env_config=env_config)
+
+        with patch("app.judge.llm_evaluation_managers.create_evaluation_agent") as mock_create:
+            mock_create.side_effect = lambda **kwargs: Mock(spec=Agent)
+            agent = await first.create_judge_agent("technical_accuracy")
+            again = await second.create_judge_agent("technical_accuracy")
+            other = await first.create_judge_agent("constructiveness")
+
+        assert agent is again
+        assert other is not agent
+        assert mock_create.call_count == 2
+        clients = {call.kwargs["http_client"] for call in mock_create.call_args_list}
+        assert clients == {first.agent_pool.http_client("openai")}
+
+    def test_agents_and_client_shared_across_event_loops(self):
+        """Successive event loops reuse pooled agents and the provider's shared client."""
+        pool = JudgeAgentPool()
+        factory = Mock(side_effect=lambda: Mock(spec=Agent))
+
+        async def use_pool():
+            return pool.get_agent(("openai",), factory), pool.http_client("openai")
+
+        first = asyncio.run(use_pool())
+        second = asyncio.run(use_pool())
+
+        assert first == second
+        assert first[1] is get_rate_limited_client("openai")
+        factory.assert_called_once()
+
+
+class TestFusedJudgeMode:
+    """Test the single-call fused Tier 2 mode."""
+
+    TECHNICAL = TechnicalAccuracyAssessment(
+        factual_correctness=5, methodology_understanding=5, domain_knowledge=5, explanation="ok"
+    )
+    CONSTRUCTIVENESS = ConstructivenessAssessment(
+        actionable_feedback=3, balanced_critique=3, improvement_guidance=3, explanation="ok"
+    )
+    PLANNING = PlanningRationalityAssessment(
+        logical_flow=4, decision_quality=4, resource_efficiency=4, explanation="ok"
+    )
+
+    @pytest.fixture
+    def fused_engine(self):
+        """Engine configured for the fused judge mode."""
+        settings = JudgeSettings(tier2_provider="openai", tier2_judge_mode="fused")
+        env_config = AppEnv(OPENAI_API_KEY="sk-test-key", GITHUB_API_KEY="")
+        return LLMJudgeEngine(settings, env_config=env_config)
+
+    def _agent(self, fused_error: Exception | None = None) -> Mock:
+        outputs = {
+            TechnicalAccuracyAssessment: self.TECHNICAL,
+            ConstructivenessAssessment: self.CONSTRUCTIVENESS,
+            PlanningRationalityAssessment: self.PLANNING,
+            FusedJudgeAssessment: FusedJudgeAssessment(
+                technical_accuracy=self.TECHNICAL,
+                constructiveness=self.CONSTRUCTIVENESS,
+                planning_rationality=self.PLANNING,
+            ),
+        }
+
+        async def run(prompt, output_type):
+            if output_type is FusedJudgeAssessment and fused_error is not None:
+                raise fused_error
+            return Mock(output=outputs[output_type])
+
+        agent = Mock(spec=Agent)
+        agent.run = AsyncMock(side_effect=run)
+        return agent
+
+    async def test_single_call_returns_per_criterion_scores(self, fused_engine, sample_data):
+        """One fused call yields the same scores as three per-criterion calls."""
+        agent = self._agent()
+
+        with patch.object(fused_engine, "create_judge_agent", return_value=agent):
+            result = await fused_engine.evaluate_comprehensive(**sample_data)
+
+        assert agent.run.await_count == 1
+        assert agent.run.await_args.kwargs["output_type"] is FusedJudgeAssessment
+        assert result.judge_mode == "fused"
+        assert result.technical_accuracy == pytest.approx(1.0)
+        assert result.constructiveness == pytest.approx(0.6)
+        assert result.planning_rationality == pytest.approx(0.8)
+        assert result.fallback_used is False
+
+    async def test_invalid_output_falls_back_to_per_criterion_calls(
+        self, fused_engine, sample_data
+    ):
+        """Output validation failure reruns the three per-criterion assessments."""
+        agent = self._agent(UnexpectedModelBehavior("Exceeded maximum retries for output"))
+
+        with patch.object(fused_engine, "create_judge_agent", return_value=agent):
+            result = await fused_engine.evaluate_comprehensive(**sample_data)
+
+        assert agent.run.await_count == 4
+        assert result.judge_mode == "per_criterion"
+        assert result.technical_accuracy == pytest.approx(1.0)
+        assert result.fallback_used is False
+
+    async def test_timeout_uses_heuristic_fallbacks_without_retrying(
+        self, fused_engine, sample_data
+    ):
+        """Timeouts are not retried per criterion; heuristic fallbacks score instead."""
+        agent = self._agent(TimeoutError("judge timed out"))
+
+        with (
+            patch.object(fused_engine, "create_judge_agent", return_value=agent),
+            patch.object(
+                fused_engine.fallback_engine, "compute_semantic_similarity", return_value=0.3
+            ),
+        ):
+            result = await fused_engine.evaluate_comprehensive(**sample_data)
+
+        assert agent.run.await_count == 1
+        assert result.judge_mode == "fused"
+        assert result.technical_accuracy == pytest.approx(0.3)
+        assert result.fallback_used is True
+
+
+class TestJudgeHedging:
+    """Test hedged judge requests to the fallback provider."""
+
+    OUTPUTS = {
+        TechnicalAccuracyAssessment: TechnicalAccuracyAssessment(
+            factual_correctness=5, methodology_understanding=5, domain_knowledge=5, explanation="ok"
+        ),
+        ConstructivenessAssessment: ConstructivenessAssessment(
+            actionable_feedback=5, balanced_critique=5, improvement_guidance=5, explanation="ok"
+        ),
+        PlanningRationalityAssessment: PlanningRationalityAssessment(
+            logical_flow=5, decision_quality=5, resource_efficiency=5, explanation="ok"
+        ),
+    }
+
+    @pytest.fixture
+    def hedged_engine(self):
+        """Engine hedging from openai to github after 10 ms without enough samples."""
+        settings = JudgeSettings(
+            tier2_provider="openai",
+            tier2_hedge_enabled=True,
+            tier2_hedge_delay_seconds=0.01,
+        )
+        env_config = AppEnv(OPENAI_API_KEY="sk-test-key", GITHUB_API_KEY="ghp-test-key")
+        engine = LLMJudgeEngine(settings, env_config=env_config)
+        engine.latency_tracker = JudgeLatencyTracker()
+        return engine
+
+    def _agent(self, delay: float = 0.0, error: Exception | None = None) -> Mock:
+        async def run(prompt, output_type):
+            await asyncio.sleep(delay)
+            if error is not None:
+                raise error
+            return Mock(output=self.OUTPUTS[output_type])
+
+        agent = Mock(spec=Agent)
+        agent.run = AsyncMock(side_effect=run)
+        return agent
+
+    @staticmethod
+    def _route(primary: Mock, fallback: Mock):
+        return lambda assessment_type, use_fallback=False: fallback if use_fallback else primary
+
+    async def test_slow_primary_is_hedged_and_fallback_wins(self, hedged_engine, sample_data):
+        """A primary slower than the hedge delay loses to the fallback."""
+        primary, fallback = self._agent(delay=10), self._agent()
+
+        with patch.object(
+            hedged_engine, "create_judge_agent", side_effect=self._route(primary, fallback)
+        ):
+            result = await hedged_engine.evaluate_comprehensive(**sample_data)
+
+        assert fallback.run.await_count == 3
+        assert result.hedge_winners == dict.fromkeys(
+            ["constructiveness", "planning_rationality", "technical_accuracy"],
+            "github/gpt-4o-mini",
+        )
+        assert result.overall_score == pytest.approx(1.0)
+        assert result.fallback_used is False
+
+    async def test_fast_primary_is_not_hedged(self, hedged_engine):
+        """A primary answering within the hedge delay never reaches the fallback."""
+        primary, fallback = self._agent(), self._agent()
+
+        with patch.object(
+            hedged_engine, "create_judge_agent", side_effect=self._route(primary, fallback)
+        ):
+            score = await hedged_engine.assess_constructiveness("review")
+
+        assert score == 1.0
+        fallback.run.assert_not_called()
+        assert hedged_engine._hedge_winners == {"constructiveness": "openai/gpt-4o-mini"}
+
+    async def test_failing_primary_fails_over_immediately(self, hedged_engine):
+        """A primary error sends the request to the fallback without waiting."""
+        hedged_engine.settings.tier2_hedge_delay_seconds = 10
+        primary = self._agent(error=RuntimeError("503 Service Unavailable"))
+        fallback = self._agent()
+
+        with patch.object(
+            hedged_engine, "create_judge_agent", side_effect=self._route(primary, fallback)
+        ):
+            score = await asyncio.wait_for(hedged_engine.assess_constructiveness("review"), 1)
+
+        assert score == 1.0
+        assert hedged_engine._hedge_winners == {"constructiveness": "github/gpt-4o-mini"}
+
+    def test_hedge_delay_follows_latency_percentile(self, hedged_engine):
+        """Once enough samples exist, the hedge delay is the configured percentile."""
+        for seconds in range(1, 10):
+            hedged_engine.latency_tracker.record("openai", "gpt-4o-mini", float(seconds))
+        assert hedged_engine._hedge_delay() == 0.01
+
+        hedged_engine.latency_tracker.record("openai", "gpt-4o-mini", 10.0)
+
+        assert hedged_engine._hedge_delay() == 10.0
+        hedged_engine.settings.tier2_hedge_percentile = 0.5
+        assert hedged_engine._hedge_delay() == 5.0
+
+    def test_hedging_disabled_without_fallback_key(self):
+        """Hedging needs a valid API key for the fallback provider."""
+        settings = JudgeSettings(tier2_provider="openai", tier2_hedge_enabled=True)
+        env_config = AppEnv(OPENAI_API_KEY="sk-test-key", GITHUB_API_KEY="")
+
+        assert LLMJudgeEngine(settings, env_config=env_config).hedging_enabled is False
+
+
 # STORY-002: chat_model inheritance and cross-provider fallback tests
 class TestStory002ChatModelInheritance:
     """Test suite for STORY-002: chat_model parameter and model inheritance."""
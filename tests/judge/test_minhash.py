@@ -0,0 +1,96 @@
+"""Tests for MinHash/LSH approximate Jaccard similarity."""
+
+import pytest
+
+from app.config.judge_settings import JudgeSettings
+from app.judge.minhash import (
+    MinHasher,
+    MinHashLSH,
+    minhasher_from_settings,
+    num_perm_for_error,
+)
+from app.judge.traditional_metrics import TraditionalMetricsEngine
+
+WORDS = [f"w{i}" for i in range(200)]
+# Reason: 100 shared words out of 200 distinct -> exact Jaccard 0.5
+TEXT_A = " ".join(WORDS[:150])
+TEXT_B = " ".join(WORDS[50:])
+UNRELATED = " ".join(f"x{i}" for i in range(150))
+
+
+class TestMinHasher:
+    """Test signature estimates against exact Jaccard."""
+
+    def test_num_perm_for_error(self):
+        """Signature length follows 1 / (4 * error^2)."""
+        assert num_perm_for_error(0.05) == 100
+        assert num_perm_for_error(0.025) == 400
+        with pytest.raises(ValueError):
+            num_perm_for_error(0.5)
+
+    def test_estimate_within_error_bound(self):
+        """Estimates stay within four standard errors of the exact value."""
+        hasher = MinHasher(num_perm_for_error(0.025))
+
+        matrix = hasher.estimate_matrix([TEXT_A], [TEXT_B, TEXT_A, UNRELATED])
+
+        assert matrix[0, 0] == pytest.approx(0.5, abs=0.1)
+        assert matrix[0, 1] == 1.0
+        assert matrix[0, 2] == pytest.approx(0.0, abs=0.1)
+
+    def test_reference_signatures_are_cached(self):
+        """Each distinct text is hashed once."""
+        hasher = MinHasher(64)
+
+        first = hasher.text_signature(TEXT_B)
+
+        assert hasher.text_signature(TEXT_B) is first
+
+
+class TestMinHashLSH:
+    """Test top-k candidate retrieval."""
+
+    def test_top_k_returns_similar_texts_first(self):
+        """Near-duplicates rank first; unrelated texts are not candidates."""
+        index = MinHashLSH(MinHasher(128), threshold=0.3)
+        index.add("same", TEXT_A)
+        index.add("half", TEXT_B)
+        index.add("other", UNRELATED)
+
+        results = index.top_k(TEXT_A, k=2)
+
+        assert [key for key, _ in results] == ["same", "half"]
+        assert results[0][1] == 1.0
+        assert len(index) == 3
+
+
+class TestEngineMinHashMode:
+    """Test the approximate Jaccard mode of the Tier 1 engine."""
+
+    def test_exact_is_default(self):
+        """Without opting in, no hasher is configured."""
+        assert minhasher_from_settings(JudgeSettings()) is None
+
+    def test_minhash_mode_shares_hasher_sized_by_error(self):
+        """The configured error bound sets the signature length; the hasher is shared."""
+        settings = JudgeSettings(tier1_jaccard_mode="minhash", tier1_jaccard_max_error=0.05)
+
+        hasher = minhasher_from_settings(settings)
+
+        assert hasher is not None
+        assert hasher.num_perm == 100
+        assert minhasher_from_settings(settings) is hasher
+
+    def test_engine_estimates_close_to_exact(self):
+        """Batch and matrix Jaccard in minhash mode approximate the exact scores."""
+        exact = TraditionalMetricsEngine()
+        approx = TraditionalMetricsEngine(minhasher=MinHasher(num_perm_for_error(0.025)))
+        refs = [TEXT_B, UNRELATED, ""]
+
+        exact_scores = exact.compute_jaccard_similarity_batch(TEXT_A, refs)
+        approx_scores = approx.compute_jaccard_similarity_batch(TEXT_A, refs)
+        approx_matrix = approx._jaccard_matrix([TEXT_A], refs)
+
+        assert approx_scores == pytest.approx(exact_scores, abs=0.1)
+        assert approx_matrix[0].tolist() == approx_scores
+        assert approx_scores[2] == 0.0
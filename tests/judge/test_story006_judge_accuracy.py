@@ -203,8 +203,10 @@ class TestCosineScoreClamping:
         """AC5: Cosine score is clamped to 1.0 before Tier1Result validation."""
         engine = TraditionalMetricsEngine()
 
-        # Patch compute_cosine_similarity to return a value > 1.0 (FP error simulation)
-        with patch.object(engine, "compute_cosine_similarity", return_value=1.0000000000000002):
+        # Patch the batched cosine to return a value > 1.0 (FP error simulation)
+        with patch.object(
+            engine, "compute_cosine_similarity_batch", return_value=[1.0000000000000002]
+        ):
             # Must not raise Pydantic ValidationError
             result = engine.evaluate_traditional_metrics(
                 agent_output="some review text",
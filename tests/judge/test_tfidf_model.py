@@ -0,0 +1,101 @@
+"""Tests for the corpus-fitted TF-IDF model and batched cosine scoring."""
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from app.config.peerread_config import PeerReadConfig
+from app.judge.tfidf_model import fit_tfidf_model, load_tfidf_vectorizer
+from app.judge.traditional_metrics import TraditionalMetricsEngine
+
+CORPUS = [
+    "The paper proposes a novel attention model for machine translation.",
+    "Experiments are weak and the baselines are outdated.",
+    "Clear writing, strong results on parsing benchmarks.",
+    "The methodology is unclear and the evaluation lacks ablations.",
+]
+
+
+@pytest.fixture
+def fitted_vectorizer() -> TfidfVectorizer:
+    """Vectorizer fitted on a small review corpus."""
+    return TfidfVectorizer(stop_words="english", ngram_range=(1, 2)).fit(CORPUS)
+
+
+class TestCosineSimilarityBatch:
+    """Test one-output-against-all-references cosine scoring."""
+
+    def test_batch_matches_pairwise_scores(self, fitted_vectorizer):
+        """Batched sparse scores equal the per-pair cosine with the same vectorizer."""
+        # Arrange
+        engine = TraditionalMetricsEngine(tfidf_vectorizer=fitted_vectorizer)
+        output = "Strong results, but the evaluation lacks ablations."
+        references = [CORPUS[1], CORPUS[3], ""]
+
+        # Act
+        batch = engine.compute_cosine_similarity_batch(output, references)
+
+        # Assert
+        expected = [engine.compute_cosine_similarity(output, ref) for ref in references]
+        assert batch == pytest.approx(expected)
+        assert batch[2] == 0.0
+
+    def test_corpus_vectorizer_is_never_refitted(self, fitted_vectorizer):
+        """The hot path only transforms with the corpus-fitted vectorizer."""
+        # Arrange
+        engine = TraditionalMetricsEngine(tfidf_vectorizer=fitted_vectorizer)
+
+        # Act
+        with patch.object(fitted_vectorizer, "fit", side_effect=AssertionError("refit")):
+            with patch.object(
+                fitted_vectorizer, "fit_transform", side_effect=AssertionError("refit")
+            ):
+                scores = engine.compute_cosine_similarity_batch(CORPUS[0], CORPUS)
+
+        # Assert
+        assert scores[0] == pytest.approx(1.0)
+        assert all(0.0 <= score <= 1.0 + 1e-9 for score in scores)
+
+    def test_without_corpus_model_fits_on_compared_texts(self):
+        """Without a fitted model the batch still scores identical texts as 1.0."""
+        engine = TraditionalMetricsEngine()
+
+        scores = engine.compute_cosine_similarity_batch(CORPUS[0], [CORPUS[0], CORPUS[1]])
+
+        assert scores[0] == pytest.approx(1.0)
+        assert scores[1] < 0.5
+
+
+class TestFitTfidfModel:
+    """Test fitting and persisting the corpus model."""
+
+    def test_fit_persists_a_loadable_model(self, tmp_path: Path):
+        """Fitted model is saved and loads back as a transform-ready vectorizer."""
+        # Arrange
+        papers = [
+            SimpleNamespace(reviews=[SimpleNamespace(comments=text) for text in CORPUS[:2]]),
+            SimpleNamespace(reviews=[SimpleNamespace(comments=text) for text in CORPUS[2:]]),
+        ]
+        loader = Mock()
+        loader.iter_papers.return_value = papers
+        config = PeerReadConfig(
+            venues=["acl_2017"], splits=["train"], cache_directory=str(tmp_path)
+        )
+        model_path = tmp_path / "models" / "tfidf.joblib"
+
+        # Act
+        with patch("app.judge.tfidf_model.PeerReadLoader", return_value=loader):
+            fitted = fit_tfidf_model(config, path=model_path)
+        vectorizer = load_tfidf_vectorizer(model_path)
+
+        # Assert
+        assert fitted == len(CORPUS)
+        assert vectorizer is not None
+        assert "attention" in vectorizer.vocabulary_
+
+    def test_missing_model_loads_as_none(self, tmp_path: Path):
+        """No fitted model means the engine falls back to per-call fitting."""
+        assert load_tfidf_vectorizer(tmp_path / "missing.joblib") is None
@@ -0,0 +1,211 @@
+"""Tests for the pluggable Tier 1/Tier 3 executors."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.config.judge_settings import JudgeSettings
+from app.data_models.evaluation_models import GraphTraceData, Tier3Result
+from app.judge.graph_analysis import GraphAnalysisEngine
+from app.judge.tier_executor import (
+    ProcessTierExecutor,
+    ThreadTierExecutor,
+    get_tier_executor,
+)
+
+
+@pytest.fixture
+def trace_data():
+    """Small single-agent trace that Tier 3 can analyse."""
+    return GraphTraceData(
+        execution_id="exec-1",
+        agent_interactions=[],
+        tool_calls=[
+            {"tool_name": "get_peerread_paper", "agent_id": "agent-1", "success": True},
+            {"tool_name": "generate_review", "agent_id": "agent-1", "success": True},
+        ],
+        timing_data={"start": 0.0, "end": 5.0},
+        coordination_events=[],
+    )
+
+
+class TestThreadTierExecutor:
+    """Test the default thread executor."""
+
+    async def test_runs_callable_with_args(self):
+        """The in-process callable runs in a thread with the given arguments."""
+        executor = ThreadTierExecutor()
+
+        result = await executor.run("tier1", lambda a, b: a + b, 2, 3, timeout=1.0)
+
+        assert result == 5
+        executor.shutdown()
+
+    async def test_timeout_raises(self):
+        """Work exceeding the timeout raises TimeoutError."""
+        executor = ThreadTierExecutor()
+
+        with pytest.raises(TimeoutError):
+            await executor.run("tier3", time.sleep, 0.5, timeout=0.05)
+        executor.shutdown()
+
+
+class TestProcessTierExecutor:
+    """Test worker recycling without starting real processes."""
+
+    @staticmethod
+    def _fake_worker(poll_result: bool, reply: tuple | None = None) -> Mock:
+        worker = Mock()
+        worker.conn.poll.return_value = poll_result
+        worker.conn.recv.return_value = reply
+        return worker
+
+    async def test_timeout_kills_and_replaces_worker(self):
+        """A timed-out worker is killed and a fresh one takes its place."""
+        stuck = self._fake_worker(poll_result=False)
+        fresh = self._fake_worker(poll_result=True, reply=("ok", "done"))
+
+        with patch("app.judge.tier_executor._Worker", side_effect=[stuck, fresh]):
+            executor = ProcessTierExecutor(max_workers=1, settings=JudgeSettings())
+            with pytest.raises(TimeoutError):
+                await executor.run("tier3", Mock(), "trace", timeout=0.01)
+            result = await executor.run("tier3", Mock(), "trace", timeout=0.01)
+
+        stuck.kill.assert_called_once()
+        fresh.conn.send.assert_called_with(("tier3", ("trace",), None))
+        assert result == "done"
+
+    async def test_worker_error_is_reraised_and_worker_kept(self):
+        """Exceptions raised in the worker propagate; the worker stays in the pool."""
+        worker = self._fake_worker(poll_result=True, reply=("error", ValueError("bad trace")))
+
+        with patch("app.judge.tier_executor._Worker", return_value=worker):
+            executor = ProcessTierExecutor(max_workers=1, settings=JudgeSettings())
+            with pytest.raises(ValueError, match="bad trace"):
+                await executor.run("tier3", Mock(), "trace", timeout=1.0)
+
+        worker.kill.assert_not_called()
+        assert executor._idle.get_nowait() is worker
+
+    async def test_warm_up_counts_against_timeout_and_keeps_worker(self):
+        """A worker still warming up times the call out but is not killed."""
+        warming = self._fake_worker(poll_result=True)
+        warming.wait_ready.return_value = False
+
+        with patch("app.judge.tier_executor._Worker", return_value=warming):
+            executor = ProcessTierExecutor(max_workers=1, settings=JudgeSettings())
+            with pytest.raises(TimeoutError, match="warming up"):
+                await executor.run("tier1", Mock(), "output", timeout=0.01)
+
+        warming.wait_ready.assert_called_once()
+        assert warming.wait_ready.call_args.args[0] <= 0.01
+        warming.kill.assert_not_called()
+        warming.conn.send.assert_not_called()
+        assert executor._idle.get_nowait() is warming
+
+    async def test_call_settings_are_sent_to_worker(self):
+        """Per-call settings travel with the task to the worker."""
+        worker = self._fake_worker(poll_result=True, reply=("ok", "done"))
+        settings = JudgeSettings(tier1_jaccard_mode="minhash")
+
+        with patch("app.judge.tier_executor._Worker", return_value=worker):
+            executor = ProcessTierExecutor(max_workers=1, settings=JudgeSettings())
+            await executor.run("tier3", Mock(), "trace", timeout=1.0, settings=settings)
+
+        worker.conn.send.assert_called_once_with(("tier3", ("trace",), settings))
+
+    @staticmethod
+    def _busy_worker() -> Mock:
+        """Worker whose call blocks until its process is killed, then sees EOF."""
+        killed = threading.Event()
+        worker = Mock()
+        worker.process.kill.side_effect = killed.set
+        worker.conn.poll.side_effect = killed.wait
+        worker.conn.recv.side_effect = EOFError
+        return worker
+
+    @staticmethod
+    async def _wait_until(condition) -> None:
+        for _ in range(500):
+            if condition():
+                return
+            await asyncio.sleep(0.01)
+        raise AssertionError("condition not reached")
+
+    async def test_cancelled_call_kills_and_replaces_worker(self):
+        """Cancelling the awaiting coroutine stops the worker's work."""
+        busy = self._busy_worker()
+        fresh = self._fake_worker(poll_result=True, reply=("ok", "done"))
+
+        with patch("app.judge.tier_executor._Worker", side_effect=[busy, fresh]):
+            executor = ProcessTierExecutor(max_workers=1, settings=JudgeSettings())
+            call = asyncio.create_task(executor.run("tier3", Mock(), "trace", timeout=5.0))
+            await self._wait_until(lambda: executor._busy)
+            call.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await call
+            await self._wait_until(lambda: not executor._idle.empty())
+
+        busy.process.kill.assert_called_once()
+        busy.kill.assert_called_once()
+        assert executor._idle.get_nowait() is fresh
+
+    async def test_shutdown_kills_busy_workers_without_replacing_them(self):
+        """Replacing the executor stops work in progress instead of orphaning it."""
+        busy = self._busy_worker()
+
+        with patch("app.judge.tier_executor._Worker", return_value=busy) as worker_cls:
+            executor = ProcessTierExecutor(max_workers=1, settings=JudgeSettings())
+            call = asyncio.create_task(executor.run("tier3", Mock(), "trace", timeout=5.0))
+            await self._wait_until(lambda: executor._busy)
+            executor.shutdown()
+            with pytest.raises(EOFError):
+                await call
+
+        busy.process.kill.assert_called_once()
+        busy.kill.assert_called_once()
+        worker_cls.assert_called_once()
+        assert executor._idle.empty()
+
+    @pytest.mark.integration
+    async def test_real_worker_runs_tier3(self, trace_data):
+        """A spawned worker computes the same Tier 3 result as the in-process engine."""
+        settings = JudgeSettings(tiers_enabled=[3])
+        executor = ProcessTierExecutor(max_workers=1, settings=settings)
+        try:
+            result = await executor.run("tier3", Mock(), trace_data, timeout=60.0)
+        finally:
+            executor.shutdown()
+
+        expected = GraphAnalysisEngine(settings).evaluate_graph_metrics(trace_data)
+        assert isinstance(result, Tier3Result)
+        assert result.overall_score == pytest.approx(expected.overall_score)
+
+
+class TestGetTierExecutor:
+    """Test the shared executor factory."""
+
+    def test_shared_and_recreated_on_change(self):
+        """Same settings reuse the executor; different sizes create a new one."""
+        first = get_tier_executor(JudgeSettings(tier_executor_workers=2))
+        again = get_tier_executor(JudgeSettings(tier_executor_workers=2))
+        resized = get_tier_executor(JudgeSettings(tier_executor_workers=3))
+
+        assert first is again
+        assert isinstance(resized, ThreadTierExecutor)
+        assert resized is not first
+
+    def test_process_executor_ignores_engine_settings(self):
+        """Process workers are reused across settings that only change the engines."""
+        with patch("app.judge.tier_executor.ProcessTierExecutor") as executor_cls:
+            first = get_tier_executor(JudgeSettings(tier_executor="process"))
+            again = get_tier_executor(
+                JudgeSettings(tier_executor="process", tier1_jaccard_mode="minhash")
+            )
+            get_tier_executor(JudgeSettings())
+
+        assert first is again
+        executor_cls.assert_called_once()
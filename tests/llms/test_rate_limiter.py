@@ -0,0 +1,169 @@
+"""Tests for the process-wide provider rate limiter."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.llms.rate_limiter import (
+    LoopLocalTransport,
+    ProviderRateLimiter,
+    RateLimitedTransport,
+    get_rate_limited_client,
+    parse_retry_after,
+    run_closing_clients,
+)
+
+
+class _StubTransport(httpx.AsyncBaseTransport):
+    """Transport answering every request with a fixed response."""
+
+    def __init__(self, status_code: int, headers: dict[str, str] | None = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(self.status_code, headers=self.headers)
+
+
+class TestParseRetryAfter:
+    """Test Retry-After header parsing."""
+
+    def test_parses_seconds_and_rejects_garbage(self):
+        """Delta-seconds are parsed; missing or invalid values give None."""
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after("-3") == 0.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+    def test_parses_http_date(self):
+        """Past HTTP dates mean no wait."""
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class TestProviderRateLimiter:
+    """Test AIMD concurrency, token buckets and queue-wait metrics."""
+
+    def test_rate_limit_halves_once_per_burst_and_success_recovers(self):
+        """A burst of 429s halves the limit once; successes raise it additively."""
+        limiter = ProviderRateLimiter("p", max_concurrency=8)
+
+        limiter.record_rate_limit()
+        limiter.record_rate_limit()
+
+        assert limiter.stats().concurrency_limit == 4
+        assert limiter.stats().rate_limited == 2
+        for _ in range(5):
+            limiter.record_success()
+        assert limiter.stats().concurrency_limit == 5
+
+    async def test_uncapped_by_default_until_rate_limited(self):
+        """Without max_concurrency nothing queues; a 429 starts AIMD at half the in-flight count."""
+        limiter = ProviderRateLimiter("p")
+
+        for _ in range(40):
+            await limiter.acquire()
+        assert limiter.stats().concurrency_limit is None
+        assert limiter.stats().in_flight == 40
+
+        limiter.record_rate_limit()
+
+        assert limiter.stats().concurrency_limit == 20
+
+    def test_retry_after_sets_cooldown(self):
+        """Retry-After pauses the limiter for the given time."""
+        limiter = ProviderRateLimiter("p")
+
+        limiter.record_rate_limit(retry_after=30)
+
+        assert 29 < limiter.cooldown_remaining() <= 30
+
+    async def test_concurrency_limit_queues_requests(self):
+        """Requests above the concurrency limit wait and are counted as queued."""
+        limiter = ProviderRateLimiter("p", max_concurrency=1)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.01)
+        assert limiter.stats().queued == 1
+        limiter.release()
+        waited = await waiter
+
+        assert waited > 0
+        assert limiter.stats().in_flight == 1
+        assert limiter.stats().max_queue_wait == pytest.approx(waited)
+
+    async def test_request_bucket_delays_over_budget_requests(self):
+        """Once the requests/min budget is spent, the next request waits for a refill."""
+        limiter = ProviderRateLimiter("p", requests_per_minute=2)
+        sleep = AsyncMock(side_effect=lambda delay: limiter._requests.take(-1))
+
+        with patch("app.llms.rate_limiter.asyncio.sleep", new=sleep):
+            for _ in range(3):
+                await limiter.acquire()
+                limiter.release()
+
+        assert sleep.await_count == 1
+        assert sleep.await_args.args[0] == pytest.approx(30, rel=0.01)
+
+
+class TestRateLimitedTransport:
+    """Test response handling of the rate-limited transport."""
+
+    async def test_429_response_feeds_limiter(self):
+        """A 429 with Retry-After halves the limit and pauses the provider."""
+        limiter = ProviderRateLimiter("p", max_concurrency=4)
+        transport = RateLimitedTransport(limiter, _StubTransport(429, {"retry-after": "10"}))
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.get("https://example.com/v1/chat")
+
+        assert response.status_code == 429
+        assert limiter.stats().concurrency_limit == 2
+        assert limiter.stats().in_flight == 0
+        assert limiter.cooldown_remaining() > 9
+
+
+class TestSharedClient:
+    """Test the per-provider client and its per-loop connection pools."""
+
+    def test_one_client_per_provider(self):
+        """Models of a provider share one client."""
+        assert get_rate_limited_client("p") is get_rate_limited_client("p")
+        assert get_rate_limited_client("q") is not get_rate_limited_client("p")
+
+    def test_one_pool_per_loop_closed_by_aclose_on_that_loop(self):
+        """Each event loop gets its own inner transport; aclose closes only that loop's."""
+        pools: list[_StubTransport] = []
+
+        def new_pool() -> _StubTransport:
+            pool = _StubTransport(200)
+            pool.aclose = AsyncMock()
+            pools.append(pool)
+            return pool
+
+        transport = LoopLocalTransport(new_pool)
+        client = httpx.AsyncClient(transport=transport)
+
+        async def send_twice_and_close() -> None:
+            await client.get("https://example.com/a")
+            await client.get("https://example.com/b")
+            await transport.aclose()
+
+        asyncio.run(send_twice_and_close())
+        asyncio.run(send_twice_and_close())
+
+        assert len(pools) == 2
+        for pool in pools:
+            pool.aclose.assert_awaited_once()
+
+    def test_run_closing_clients_closes_loop_pools(self):
+        """The loop owner's wrapper closes the shared clients' pools before the loop ends."""
+        pools = AsyncMock()
+
+        with patch.dict("app.llms.rate_limiter._global_pools", {"p": pools}, clear=True):
+            result = run_closing_clients(asyncio.sleep(0, result="done"))
+
+        assert result == "done"
+        pools.aclose.assert_awaited_once()
@@ -76,8 +76,13 @@ def test_similarity_result_structure(no_bertscore_download):
         end_time=0.1,
     )
     dumped = result.model_dump()
+    # Reason: the edit-distance backend depends on which native libraries are installed
+    score_backends = dumped.pop("score_backends")
 
     # Assert with snapshot
+    assert score_backends["cosine"] == "tfidf"
+    assert score_backends["jaccard"] == "exact"
+    assert set(score_backends) == {"cosine", "jaccard", "semantic", "levenshtein"}
     assert dumped == snapshot(
         {
             "cosine_score": 0.7765145304745156,
@@ -11,11 +11,12 @@ from unittest.mock import Mock, patch
 import pytest
 from pydantic_ai import ModelRetry
 
-from app.data_models.peerread_models import PeerReadPaper
+from app.data_models.peerread_models import PaperSearchHit, PeerReadPaper
 from app.tools.peerread_tools import add_peerread_tools_to_agent
 from conftest import capture_registered_tools
 
 
+@pytest.mark.usefixtures("isolated_markdown_cache")
 class TestReadPaperPdfUrlGuard:
     """Test URL rejection guard in read_paper_pdf."""
 
@@ -53,7 +54,7 @@ class TestReadPaperPdfUrlGuard:
         pdf_file = tmp_path / "test.pdf"
         pdf_file.write_bytes(b"%PDF-1.4 fake content")
 
-        with patch("app.tools.peerread_tools.MarkItDown") as mock_md:
+        with patch("app.data_utils.pdf_markdown.MarkItDown") as mock_md:
             mock_converter = Mock()
             mock_result = Mock()
             mock_result.text_content = "Extracted text"
@@ -228,6 +229,7 @@ class TestGetPaperContent:
             )
 
 
+@pytest.mark.usefixtures("isolated_markdown_cache")
 class TestReadPaperPdfErrors:
     """Test error cases in read_paper_pdf function."""
 
@@ -255,7 +257,7 @@ class TestReadPaperPdfErrors:
         pdf_file = tmp_path / "corrupt.pdf"
         pdf_file.write_bytes(b"%PDF-1.4 corrupted")
 
-        with patch("app.tools.peerread_tools.MarkItDown") as mock_markitdown:
+        with patch("app.data_utils.pdf_markdown.MarkItDown") as mock_markitdown:
             mock_converter = Mock()
             mock_converter.convert.side_effect = Exception("Conversion failed")
             mock_markitdown.return_value = mock_converter
@@ -296,6 +298,55 @@ class TestTruncatePaperContent:
         assert "..." in result or len(body) > len(result)  # Body truncated
 
 
+class TestSearchPeerreadPapersTool:
+    """Test search_peerread_papers tool registered on agent."""
+
+    @pytest.mark.asyncio
+    async def test_search_tool_returns_ranked_hits(self):
+        """search_peerread_papers returns hits from the search index."""
+        tools = capture_registered_tools(add_peerread_tools_to_agent)
+        search_tool = tools["search_peerread_papers"]
+        hit = PaperSearchHit(paper_id="104", title="Test", score=1.5, snippet="Test abstract")
+
+        with (
+            patch("app.tools.peerread_tools.load_peerread_config") as mock_config,
+            patch("app.tools.peerread_tools.PeerReadLoader"),
+            patch("app.tools.peerread_tools.get_paper_search_index") as mock_get_index,
+        ):
+            mock_config.return_value.max_papers_per_query = 100
+            mock_index = Mock()
+            mock_index.is_stale.return_value = False
+            mock_index.search.return_value = [hit]
+            mock_get_index.return_value = mock_index
+
+            result = await search_tool(None, "attention", limit=5)
+
+            assert result == [hit]
+            mock_index.search.assert_called_once_with("attention", limit=5)
+            mock_index.refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_tool_refreshes_stale_index(self):
+        """Papers the search index lacks are indexed before searching."""
+        tools = capture_registered_tools(add_peerread_tools_to_agent)
+        search_tool = tools["search_peerread_papers"]
+
+        with (
+            patch("app.tools.peerread_tools.load_peerread_config") as mock_config,
+            patch("app.tools.peerread_tools.PeerReadLoader") as mock_loader_cls,
+            patch("app.tools.peerread_tools.get_paper_search_index") as mock_get_index,
+        ):
+            mock_config.return_value.max_papers_per_query = 100
+            mock_index = Mock()
+            mock_index.is_stale.return_value = True
+            mock_index.search.return_value = []
+            mock_get_index.return_value = mock_index
+
+            await search_tool(None, "attention", limit=5)
+
+            mock_index.refresh.assert_called_once_with(mock_loader_cls.return_value)
+
+
 class TestGetPeerreadPaperTool:
     """Test get_peerread_paper and query_peerread_papers tools registered on agent."""
 